@@ -18,6 +18,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 import argparse
+import sys
 
 from functools import partial
 from pathlib import Path
@@ -35,12 +36,44 @@ from ahriman.models.log_handler import LogHandler
 __all__: list[str] = []
 
 
-def _parser(*, color: bool = False) -> argparse.ArgumentParser:
+def _command(parser: argparse.ArgumentParser, argv: list[str]) -> str | None:
+    """
+    guess command name from command line arguments before subcommands are added to the parser
+
+    Args:
+        parser(argparse.ArgumentParser): command line parser with global options only
+        argv(list[str]): command line arguments
+
+    Returns:
+        str | None: command name if it can be guessed and ``None`` otherwise
+    """
+    # pylint: disable=protected-access
+    options = parser._option_string_actions
+
+    arguments = iter(argv)
+    for argument in arguments:
+        if parser.fromfile_prefix_chars is not None and argument[:1] in parser.fromfile_prefix_chars:
+            return None  # arguments are read from file
+        if not argument.startswith("-"):
+            return argument
+
+        # abbreviated, grouped and options with values (e.g. --option=value) are not supported
+        if (action := options.get(argument)) is None:
+            return None
+        if action.nargs != 0:
+            next(arguments, None)  # skip option value
+
+    return None
+
+
+def _parser(*, color: bool = False, argv: list[str] | None = None) -> argparse.ArgumentParser:
     """
     command line parser generator
 
     Args:
         color(bool, optional): enable colors in help messages (Default value = False)
+        argv(list[str] | None, optional): command line arguments. If set, only handlers which might provide the
+            requested command are loaded. Otherwise, parser for all known commands is generated (Default value = None)
 
     Returns:
         argparse.ArgumentParser: command line parser for the application
@@ -93,7 +126,10 @@ Start web service (requires additional configuration):
 
     subparsers = parser.add_subparsers(title="command", help="command to run", dest="command")
 
-    for handler in implementations(ahriman.application.handlers, Handler):
+    # loading all handlers is expensive, because each of them imports its own dependencies, thus only handlers
+    # which might provide the requested command are loaded if it can be guessed
+    command = _command(parser, argv) if argv is not None else None
+    for handler in implementations(ahriman.application.handlers, Handler, hint=command):
         for subparser_parser in handler.arguments:
             subparser = subparser_parser(subparsers)
             subparser.color = color
@@ -105,6 +141,10 @@ Start web service (requires additional configuration):
     subparsers._choices_actions = sorted(subparsers._choices_actions, key=lambda action: action.dest)
     subparsers.choices = dict(sorted(subparsers.choices.items()))
 
+    # the command has been guessed wrong (e.g. unknown command), generate full parser in order to show correct error
+    if command is not None and command not in subparsers.choices:
+        return _parser(color=color)
+
     return parser
 
 
@@ -115,8 +155,9 @@ def run() -> int:
     Returns:
         int: application status code
     """
-    parser = _parser(color=True)
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    parser = _parser(color=True, argv=argv)
+    args = parser.parse_args(argv)
 
     if args.command is None:  # in case of empty command we would like to print help message
         parser.exit(status=2, message=parser.format_help())
@@ -18,6 +18,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from ahriman.application.application.application_packages import ApplicationPackages
 from ahriman.application.application.application_repository import ApplicationRepository
@@ -148,15 +149,23 @@ class Application(ApplicationPackages, ApplicationRepository):
                 if dependency not in satisfied_packages
             }
 
+        def resolve(dependency: tuple[str, str | None]) -> Package:
+            package_name, packager = dependency
+            if (source_dir := self.repository.paths.cache_for(package_name)).is_dir():
+                # there is local cache, load package from it
+                return Package.from_build(source_dir, self.repository.repository_id.architecture, packager)
+            return Package.from_aur(package_name, packager, include_provides=True)
+
         def new_packages(root: Package) -> dict[str, Package]:
             portion = {root.base: root}
             while missing := missing_dependencies(portion.values()):
-                for package_name, packager in missing.items():
-                    if (source_dir := self.repository.paths.cache_for(package_name)).is_dir():
-                        # there is local cache, load package from it
-                        leaf = Package.from_build(source_dir, self.repository.repository_id.architecture, packager)
-                    else:
-                        leaf = Package.from_aur(package_name, packager, include_provides=True)
+                # resolve the whole level at once, reusing packages which have been already loaded during this run
+                unresolved = [dependency for dependency in missing.items() if dependency not in resolved]
+                for dependency, leaf in zip(unresolved, executor.map(resolve, unresolved)):
+                    resolved[dependency] = leaf
+
+                for dependency in missing.items():
+                    leaf = resolved[dependency]
                     portion[leaf.base] = leaf
 
                     # register package in the database
@@ -165,12 +174,14 @@ class Application(ApplicationPackages, ApplicationRepository):
             return portion
 
         known_packages = self._known_packages()
+        resolved: dict[tuple[str, str | None], Package] = {}
         with_dependencies: dict[str, Package] = {}
-        for package in packages:
-            with self.in_package_context(package.base, package.version):  # use the same context for the logger
-                try:
-                    with_dependencies |= new_packages(package)
-                except Exception:
-                    self.logger.exception("could not process dependencies of %s, skip the package", package.base)
+        with ThreadPoolExecutor() as executor:
+            for package in packages:
+                with self.in_package_context(package.base, package.version):  # use the same context for the logger
+                    try:
+                        with_dependencies |= new_packages(package)
+                    except Exception:
+                        self.logger.exception("could not process dependencies of %s, skip the package", package.base)
 
         return list(with_dependencies.values())
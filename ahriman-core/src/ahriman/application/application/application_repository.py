@@ -18,11 +18,12 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from ahriman.application.application.application_properties import ApplicationProperties
 from ahriman.application.application.workers import Updater
+from ahriman.core.alpm.remote import AUR
 from ahriman.core.build_tools.sources import Sources
-from ahriman.core.exceptions import UnknownPackageError
 from ahriman.models.package import Package
 from ahriman.models.packagers import Packagers
 from ahriman.models.result import Result
@@ -41,24 +42,31 @@ class ApplicationRepository(ApplicationProperties):
             packages(Iterable[Package]): list of packages to retrieve changes
         """
         for package in packages:
-            last_commit_sha = self.reporter.package_changes_get(package.base).last_commit_sha
-            if last_commit_sha is None:
+            known = self.reporter.package_changes_get(package.base)
+            if known.last_commit_sha is None:
                 continue  # skip check in case if we can't calculate diff
 
-            if (changes := self.repository.package_changes(package, last_commit_sha)) is not None:
+            changes = self.repository.package_changes(package, known.last_commit_sha, known.head_commit_sha)
+            if changes is not None:
                 self.reporter.package_changes_update(package.base, changes)
 
-    def clean(self, *, cache: bool, chroot: bool, manual: bool, packages: bool, pacman: bool) -> None:
+    def clean(self, *, archives: bool = False, cache: bool, chroot: bool, manual: bool, packages: bool,
+              pacman: bool) -> None:
         """
         run all clean methods. Warning: some functions might not be available for non-root user
 
         Args:
+            archives(bool, optional): remove older versions of packages from archive according to the archive
+                rotation settings (Default value = False)
             cache(bool): clear directory with package caches
             chroot(bool): clear build chroot
             manual(bool): clear directory with manually added packages' bases
             packages(bool): clear directory with built packages
             pacman(bool): clear directory with pacman databases
         """
+        if archives:
+            keep_built_packages = self.configuration.getint("archive", "keep_built_packages", fallback=0)
+            self.repository.clear_archives(keep_built_packages)
         if cache:
             self.repository.clear_cache()
         if chroot:
@@ -89,13 +97,15 @@ class ApplicationRepository(ApplicationProperties):
         Args:
             packages(Iterable[str]): only sign specified packages
         """
-        # copy to prebuilt directory
+        archives = []
         for package in self.repository.packages(packages):
             for archive in package.packages.values():
                 if archive.filepath is None:
                     self.logger.warning("filepath is empty for %s", package.base)
                     continue  # avoid mypy warning
-                self.repository.sign.process_sign_package(archive.filepath, None)
+                archives.append(archive.filepath)
+        # sign all packages at once
+        self.repository.sign.process_sign_packages(archives, None)
         # sign repository database if set
         self.repository.sign.process_sign_repository(self.repository.repo.repo_path)
         # process triggers
@@ -108,31 +118,33 @@ class ApplicationRepository(ApplicationProperties):
         Returns:
             list[str]: unknown package archive list
         """
-        def has_local(probe: Package) -> bool:
-            cache_dir = self.repository.paths.cache_for(probe.base)
-            return cache_dir.is_dir() and not Sources.has_remotes(cache_dir)
-
-        def unknown_aur(probe: Package) -> list[str]:
-            packages: list[str] = []
-            for single in probe.packages:
-                try:
-                    _ = Package.from_aur(single, None)
-                except UnknownPackageError:
-                    packages.append(single)
-            return packages
-
-        def unknown_local(probe: Package) -> list[str]:
+        def unknown_local(probe: Package) -> list[str] | None:
             cache_dir = self.repository.paths.cache_for(probe.base)
+            if not cache_dir.is_dir() or Sources.has_remotes(cache_dir):
+                return None  # local package not found
             local = Package.from_build(cache_dir, self.architecture, None)
             packages = set(probe.packages.keys()).difference(local.packages.keys())
             return list(packages)
 
+        packages = self.repository.packages()
+        # local checks require reading sources from disk and calling git, thus they are run in parallel
+        with ThreadPoolExecutor() as executor:
+            local_unknown = list(executor.map(unknown_local, packages))
+
+        # packages without local sources are checked in AUR by using batched requests
+        aur_packages = [
+            package_name
+            for package, unknown in zip(packages, local_unknown)
+            if unknown is None
+            for package_name in package.packages
+        ]
+        known = {package.name for package in AUR.multiinfo(*aur_packages)}
+
         result = []
-        for package in self.repository.packages():
-            if has_local(package):
-                result.extend(unknown_local(package))  # there is local package
-            else:
-                result.extend(unknown_aur(package))  # local package not found
+        for package, unknown in zip(packages, local_unknown):
+            if unknown is None:
+                unknown = [package_name for package_name in package.packages if package_name not in known]
+            result.extend(unknown)
         return result
 
     def update(self, updates: Iterable[Package], packagers: Packagers | None = None, *,
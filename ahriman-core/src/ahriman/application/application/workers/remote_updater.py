@@ -17,13 +17,24 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import requests
+import statistics
+import time
+
 from collections import deque
 from collections.abc import Iterable
+from functools import cached_property
+from typing import Any, ClassVar
 
 from ahriman.application.application.workers.updater import Updater
 from ahriman.core.configuration import Configuration
 from ahriman.core.http import SyncAhrimanClient
+from ahriman.core.status import Client
 from ahriman.core.tree import Tree
+from ahriman.core.utils import utcnow
+from ahriman.models.build_status import BuildStatusEnum
+from ahriman.models.event import EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.package import Package
 from ahriman.models.packagers import Packagers
 from ahriman.models.repository_id import RepositoryId
@@ -35,24 +46,40 @@ class RemoteUpdater(Updater):
     """
     remote update worker
 
+    All packages are processed by single :func:`update()` call, which splits them into dependency independent chunks
+    and schedules chunks to the least loaded workers. The load of the worker is the sum of the expected build durations
+    of the processes, which are still running on this worker. The scheduler waits until all processes are finished
+    and then collects per-package results from the status API.
+
     Attributes:
+        DURATIONS_INTERVAL(int): (class attribute) interval in seconds of the build history used for estimations
+        POLL_INTERVAL(float): (class attribute) interval in seconds between worker processes status checks
         configuration(Configuration): configuration instance
+        reporter(Client): status client instance, used to retrieve build statistics and build results
         repository_id(RepositoryId): repository unique identifier
         workers(list[Worker]): worker identifiers
     """
 
-    def __init__(self, workers: list[Worker], repository_id: RepositoryId, configuration: Configuration) -> None:
+    DURATIONS_INTERVAL: ClassVar[int] = 30 * EventRollup.BUCKET
+    POLL_INTERVAL: ClassVar[float] = 10.0
+
+    def __init__(self, workers: list[Worker], repository_id: RepositoryId, configuration: Configuration,
+                 reporter: Client) -> None:
         """
         Args:
             workers(list[Worker]): worker identifiers
             repository_id(RepositoryId): repository unique identifier
             configuration(Configuration): configuration instance
+            reporter(Client): status client instance
         """
         self.workers = workers
         self.repository_id = repository_id
         self.configuration = configuration
+        self.reporter = reporter
 
-        self._clients: deque[tuple[Worker, SyncAhrimanClient]] = deque()
+        self._clients: dict[Worker, SyncAhrimanClient] = {}
+        self._processes: dict[Worker, dict[str, list[Package]]] = {}
+        self._unreachable: set[Worker] = set()
 
     @property
     def clients(self) -> dict[Worker, SyncAhrimanClient]:
@@ -64,6 +91,61 @@ class RemoteUpdater(Updater):
         """
         return dict(self._clients)
 
+    @cached_property
+    def durations(self) -> dict[str, float]:
+        """
+        historical build durations extracted from the daily audit log rollups. Only the last
+        :attr:`DURATIONS_INTERVAL` seconds are taken into account
+
+        Returns:
+            dict[str, float]: map of package base to its average build duration in seconds
+        """
+        from_date = EventRollup.bucket(utcnow().timestamp()) - self.DURATIONS_INTERVAL
+
+        rollups: dict[str, EventRollup] = {}
+        try:
+            for rollup in self.reporter.event_rollup_get(EventType.PackageUpdated, None, from_date):
+                if (previous := rollups.get(rollup.object_id)) is not None:
+                    rollup = previous.merge(rollup)
+                rollups[rollup.object_id] = rollup
+        except Exception:
+            self.logger.exception("could not load build durations")
+
+        return {
+            package_base: mean
+            for package_base, rollup in rollups.items()
+            if (mean := rollup.mean) is not None
+        }
+
+    @property
+    def workers_load(self) -> dict[Worker, float]:
+        """
+        estimated load of the reachable workers, i.e. sum of the expected build durations of the packages, which are
+        being processed by the worker
+
+        Returns:
+            dict[Worker, float]: map of the worker to its current estimated load
+        """
+        return {
+            worker: sum(self.estimate(packages) for packages in self._processes.get(worker, {}).values())
+            for worker in self.workers
+            if worker not in self._unreachable
+        }
+
+    @staticmethod
+    def _process_url(worker: Worker, process_id: str) -> str:
+        """
+        get url for process status
+
+        Args:
+            worker(Worker): worker identifier
+            process_id(str): remote process identifier
+
+        Returns:
+            str: full url for web service to check process status
+        """
+        return f"{worker.address}/api/v1/service/process/{process_id}"
+
     @staticmethod
     def _update_url(worker: Worker) -> str:
         """
@@ -77,29 +159,128 @@ class RemoteUpdater(Updater):
         """
         return f"{worker.address}/api/v1/service/add"
 
-    def next_worker(self) -> tuple[Worker, SyncAhrimanClient]:
+    def collect(self, packages: Iterable[Package], started: int) -> Result:
+        """
+        collect build results of the packages from the status API
+
+        Args:
+            packages(Iterable[Package]): list of processed packages
+            started(int): timestamp of the update start. Statuses which have been set before are ignored
+
+        Returns:
+            Result: build result of the packages
+        """
+        result = Result()
+        for package in packages:
+            try:
+                statuses = self.reporter.package_get(package.base)
+            except Exception:
+                self.logger.exception("could not load status of %s", package.base)
+                statuses = []
+
+            match statuses:
+                case [(remote, status)] if status.status == BuildStatusEnum.Success and status.timestamp >= started:
+                    result.add_updated(remote)
+                case _:
+                    result.add_failed(package)
+
+        return result
+
+    def dispatch(self, packages: list[Package], payload: dict[str, Any]) -> bool:
+        """
+        send packages to the least loaded reachable worker. In case if the worker is unreachable, the packages will be
+        sent to the next one
+
+        Args:
+            packages(list[Package]): list of packages to build
+            payload(dict[str, Any]): base request payload
+
+        Returns:
+            bool: ``True`` if packages have been sent to any worker and ``False`` otherwise
+        """
+        payload = payload | {"packages": [package.base for package in packages]}
+
+        while (selected := self.next_worker()) is not None:
+            worker, client = selected
+            try:
+                response = client.make_request("POST", self._update_url(worker), params=self.repository_id.query(),
+                                               json=payload)
+                process_id = response.json()["process_id"]
+            except Exception:
+                self.logger.exception("could not send packages to worker %s, skip it", worker.identifier)
+                self._unreachable.add(worker)
+                continue
+
+            self.logger.info("packages %s have been sent to worker %s as process %s",
+                             payload["packages"], worker.identifier, process_id)
+            self._processes.setdefault(worker, {})[process_id] = packages
+            return True
+
+        return False
+
+    def estimate(self, packages: Iterable[Package]) -> float:
+        """
+        estimate build duration of the packages. Packages which have never been built are considered to take the
+        median of known durations
+
+        Args:
+            packages(Iterable[Package]): list of packages to estimate
+
+        Returns:
+            float: expected build duration in seconds
+        """
+        default = statistics.median(self.durations.values()) if self.durations else 1.0
+        return sum(self.durations.get(package.base, default) for package in packages)
+
+    def is_process_alive(self, worker: Worker, process_id: str) -> bool:
+        """
+        check if process is alive on the worker
+
+        Args:
+            worker(Worker): worker identifier
+            process_id(str): remote process id
+
+        Returns:
+            bool: ``True`` in case if remote process is alive and ``False`` otherwise
+        """
+        try:
+            response = self._clients[worker].make_request("GET", self._process_url(worker, process_id))
+        except requests.HTTPError as ex:
+            status_code = ex.response.status_code if ex.response is not None else None
+            if status_code == 404:
+                return False
+            raise
+
+        response_json = response.json()
+        is_alive: bool = response_json["is_alive"]
+
+        return is_alive
+
+    def next_worker(self) -> tuple[Worker, SyncAhrimanClient] | None:
         """
-        generate next not-used web client. In case if all clients have been already used, it yields next not used client
+        get the least loaded reachable worker. In case if there are multiple workers with the same load, the first
+        one in the list will be used
 
         Returns:
-            tuple[Worker, SyncAhrimanClient]: worker and constructed client instance for the web
+            tuple[Worker, SyncAhrimanClient] | None: worker and constructed client instance for the web if there is
+            any reachable worker left and ``None`` otherwise
         """
-        # check if there is not used yet worker
-        worker = next((worker for worker in self.workers if worker not in self.clients), None)
-        if worker is not None:
+        load = self.workers_load
+        if not load:
+            return None
+
+        worker = min(load, key=lambda candidate: load[candidate])
+        if (client := self._clients.get(worker)) is None:
             client = SyncAhrimanClient(self.configuration, "status")
             client.address = worker.address
-        else:
-            worker, client = self._clients.popleft()
-
-        # register worker in the queue
-        self._clients.append((worker, client))
+            self._clients[worker] = client
 
         return worker, client
 
     def partition(self, packages: Iterable[Package]) -> list[list[Package]]:
         """
-        split packages into partitions to be processed by this worker
+        split packages into partitions to be processed by this worker. Because all packages are scheduled between
+        workers by single :func:`update()` call, this method always returns single partition
 
         Args:
             packages(Iterable[Package]): list of packages to partition
@@ -107,12 +288,40 @@ class RemoteUpdater(Updater):
         Returns:
             list[list[Package]]: packages partitioned by this worker type
         """
-        return Tree.partition(packages, count=len(self.workers))
+        packages = list(packages)
+        return [packages] if packages else []
+
+    def poll(self) -> list[list[Package]]:
+        """
+        check status of the dispatched processes. Finished processes are removed from the workers load. In case if
+        worker is unreachable, all its processes are removed and returned back to be dispatched again
+
+        Returns:
+            list[list[Package]]: list of the packages, which have been sent to unreachable workers
+        """
+        lost: list[list[Package]] = []
+
+        for worker, processes in list(self._processes.items()):
+            try:
+                finished = [process_id for process_id in processes if not self.is_process_alive(worker, process_id)]
+            except Exception:
+                self.logger.exception("worker %s is unreachable, dispatch its packages again", worker.identifier)
+                self._unreachable.add(worker)
+                lost.extend(self._processes.pop(worker).values())
+                continue
+
+            for process_id in finished:
+                del processes[process_id]
+            if not processes:
+                del self._processes[worker]
+
+        return lost
 
     def update(self, updates: Iterable[Package], packagers: Packagers | None = None, *,
                bump_pkgrel: bool = False) -> Result:
         """
-        run package updates
+        run package updates. The packages are split into chunks, which are sent to the least loaded workers. This
+        method blocks until all chunks are processed
 
         Args:
             updates(Iterable[Package]): list of packages to update
@@ -123,16 +332,35 @@ class RemoteUpdater(Updater):
         Returns:
             Result: update result
         """
+        updates = list(updates)
         payload = {
             "increment": False,  # force disable increment because it doesn't work yet
             "packager": packagers.default if packagers is not None else None,
-            "packages": [package.base for package in updates],
             "patches": [],  # might be used later
             "refresh": True,
         }
+        started = int(utcnow().timestamp())
+
+        # longest chunks go first, so greedy assignment to the least loaded workers gives balanced load
+        partitions = [partition for partition in Tree.partition(updates, count=len(self.workers)) if partition]
+        pending = deque(sorted(partitions, key=self.estimate, reverse=True))
+
+        result = Result()
+        while pending or self._processes:
+            while pending:
+                packages = pending.popleft()
+                if not self.dispatch(packages, payload):
+                    self.logger.error("no reachable workers left, mark packages %s as failed",
+                                      [package.base for package in packages])
+                    for package in packages:
+                        result.add_failed(package)
+
+            if not self._processes:
+                break
 
-        worker, client = self.next_worker()
-        client.make_request("POST", self._update_url(worker), params=self.repository_id.query(), json=payload)
-        # we don't block here for process
+            time.sleep(self.POLL_INTERVAL)
+            pending.extend(self.poll())
 
-        return Result()
+        failed = {package.base for package in result.failed}
+        dispatched = [package for package in updates if package.base not in failed]
+        return result.merge(self.collect(dispatched, started))
@@ -58,7 +58,7 @@ class Updater(LazyLogging):
         if workers:
             # there is something we could use as remote workers
             from ahriman.application.application.workers.remote_updater import RemoteUpdater
-            return RemoteUpdater(workers, repository_id, configuration)
+            return RemoteUpdater(workers, repository_id, configuration, repository.reporter)
 
         # and finally no workers available, just use local service
         from ahriman.application.application.workers.local_updater import LocalUpdater
@@ -18,17 +18,31 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 import argparse
+import os
+import sqlite3
 import tarfile
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
 from pwd import getpwuid
+from tempfile import TemporaryDirectory
+from typing import Any
 
 from ahriman.application.handlers.handler import Handler, SubParserAction
 from ahriman.core.configuration import Configuration
 from ahriman.core.database import SQLite
+from ahriman.core.module_loader import optional_module
+from ahriman.models.backup_component import BackupComponent
+from ahriman.models.backup_file import BackupFile
+from ahriman.models.backup_manifest import BackupManifest
 from ahriman.models.repository_id import RepositoryId
 
 
+zstd = optional_module("compression.zstd")
+
+
 class Backup(Handler):
     """
     backup packages handler
@@ -48,10 +62,29 @@ class Backup(Handler):
             configuration(Configuration): configuration instance
             report(bool): force enable or disable reporting
         """
+        previous = BackupManifest()
+        if args.incremental is not None:
+            with tarfile.open(args.incremental) as archive:
+                previous = BackupManifest.from_archive(archive) or previous
+
         backup_paths = Backup.get_paths(configuration)
-        with tarfile.open(args.path, mode="w") as archive:  # well we don't actually use compression
-            for backup_path in backup_paths:
-                archive.add(backup_path)
+        database_path = SQLite.database_path(configuration)
+
+        with TemporaryDirectory(ignore_cleanup_errors=True) as dir_name:
+            # live database is replaced by its consistent snapshot
+            sources = {path: path for root in backup_paths for path in Backup.walk(root)}
+            if database_path in sources:
+                sources[database_path] = Backup.database_snapshot(database_path, Path(dir_name))
+
+            manifest = Backup.manifest(sources, backup_paths, previous, args.jobs)
+
+            with tarfile.open(args.path, **Backup.compression_options(args.compression, args.jobs)) as archive:
+                manifest.write(archive)
+                unchanged = manifest.unchanged(previous)
+                for path, source in sources.items():
+                    if Backup.archive_name(path) in unchanged:
+                        continue
+                    Backup.archive_add(archive, path, source)
 
     @staticmethod
     def _set_repo_backup_parser(root: SubParserAction) -> argparse.ArgumentParser:
@@ -67,11 +100,93 @@ class Backup(Handler):
         parser = root.add_parser("repo-backup", help="backup repository data",
                                  description="backup repository settings and database")
         parser.add_argument("path", help="path of the output archive", type=Path)
+        parser.add_argument("-c", "--compression", help="compress archive by using specified algorithm",
+                            choices=["bz2", "gz", "xz", "zst"])
+        parser.add_argument("-i", "--incremental", help="path of the previous archive. If set, only files which have "
+                            "been changed since the previous backup will be stored", type=Path)
+        parser.add_argument("-j", "--jobs", help="number of threads used for files hashing and zstd compression",
+                            type=int)
         parser.set_defaults(architecture="", lock=None, report=False, repository="", unsafe=True)
         return parser
 
     @staticmethod
-    def get_paths(configuration: Configuration) -> set[Path]:
+    def archive_add(archive: tarfile.TarFile, path: Path, source: Path) -> None:
+        """
+        add single path to the archive. Unlike :func:`tarfile.TarFile.add()`, the content is read from the
+        ``source`` file, while metadata (e.g. owner and permissions) are taken from the original ``path``
+
+        Args:
+            archive(tarfile.TarFile): archive opened for writing
+            path(Path): original path to the file
+            source(Path): path to the file from which content will be read
+        """
+        member = archive.gettarinfo(path, arcname=Backup.archive_name(path))
+        if member is None:  # unsupported file type, e.g. socket
+            return
+        if member.islnk():  # link target might be skipped by incremental backup, so store it as regular file
+            member.type = tarfile.REGTYPE
+            member.linkname = ""
+
+        if not member.isreg():
+            archive.addfile(member)
+            return
+
+        member.size = source.stat().st_size
+        with source.open("rb") as content:
+            archive.addfile(member, content)
+
+    @staticmethod
+    def archive_name(path: Path) -> str:
+        """
+        generate name of the archive member for the path
+
+        Args:
+            path(Path): absolute path to the file
+
+        Returns:
+            str: archive member name, which is the path without leading root
+        """
+        return str(path.relative_to(path.anchor))
+
+    @staticmethod
+    def compression_options(compression: str | None, jobs: int | None) -> dict[str, Any]:
+        """
+        generate archive options for the specified compression
+
+        Args:
+            compression(str | None): compression algorithm if any
+            jobs(int | None): number of compression threads if supported
+
+        Returns:
+            dict[str, Any]: keyword arguments for :func:`tarfile.open()`
+        """
+        if compression is None:
+            return {"mode": "w"}
+        options: dict[str, Any] = {"mode": f"w:{compression}"}
+        # zstd is the only algorithm in standard library which supports multithreaded compression
+        if compression == "zst" and zstd is not None:
+            options["options"] = {zstd.CompressionParameter.nb_workers: jobs or os.cpu_count() or 1}
+        return options
+
+    @staticmethod
+    def database_snapshot(database_path: Path, root: Path) -> Path:
+        """
+        create consistent snapshot of the live database by using sqlite online backup API
+
+        Args:
+            database_path(Path): path to the database
+            root(Path): directory in which snapshot will be created
+
+        Returns:
+            Path: path to the created snapshot
+        """
+        snapshot = root / database_path.name
+        with closing(sqlite3.connect(database_path)) as source, closing(sqlite3.connect(snapshot)) as target:
+            source.backup(target)
+        return snapshot
+
+    @staticmethod
+    def get_paths(configuration: Configuration) -> dict[Path, BackupComponent]:
         """
         extract paths to back up
 
@@ -79,28 +194,84 @@ class Backup(Handler):
             configuration(Configuration): configuration instance
 
         Returns:
-            set[Path]: map of the filesystem paths
+            dict[Path, BackupComponent]: map of the filesystem paths to their components
         """
         # configuration files
         root, _ = configuration.check_loaded()
-        paths = set(configuration.includes)
-        paths.add(root)
+        paths = dict.fromkeys(configuration.includes, BackupComponent.Configuration)
+        paths[root] = BackupComponent.Configuration
 
         # database
-        paths.add(SQLite.database_path(configuration))
+        paths[SQLite.database_path(configuration)] = BackupComponent.Database
 
         # local caches
         repository_paths = configuration.repository_paths
         if repository_paths.cache.is_dir():
-            paths.add(repository_paths.cache)
+            paths[repository_paths.cache] = BackupComponent.Cache
 
         # gnupg home with imported keys
         uid, _ = repository_paths.root_owner
         system_user = getpwuid(uid)
         gnupg_home = Path(system_user.pw_dir) / ".gnupg"
         if gnupg_home.is_dir():
-            paths.add(gnupg_home)
+            paths[gnupg_home] = BackupComponent.GnuPG
 
         return paths
 
+    @staticmethod
+    def manifest(sources: dict[Path, Path], backup_paths: dict[Path, BackupComponent], previous: BackupManifest,
+                 jobs: int | None) -> BackupManifest:
+        """
+        generate manifest of the backup. Digests of regular files are calculated in parallel
+
+        Args:
+            sources(dict[Path, Path]): map of the backed up paths to the actual files to be read
+            backup_paths(dict[Path, BackupComponent]): map of the components roots
+            previous(BackupManifest): manifest of the previous backup
+            jobs(int | None): number of hashing threads
+
+        Returns:
+            BackupManifest: backup manifest
+        """
+        components: dict[BackupComponent, list[str]] = {}
+        for path, component in backup_paths.items():
+            components.setdefault(component, []).append(Backup.archive_name(path))
+
+        regular_files = {
+            Backup.archive_name(path): source
+            for path, source in sources.items()
+            if source.is_file() and not source.is_symlink()
+        }
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            files = dict(zip(
+                regular_files,
+                executor.map(
+                    lambda pair: BackupFile.from_path(pair[1], previous.files.get(pair[0])),
+                    regular_files.items(),
+                ),
+            ))
+
+        return BackupManifest(components, files)
+
+    @staticmethod
+    def walk(path: Path) -> Iterator[Path]:
+        """
+        list path and all its children including directories. Unlike :func:`ahriman.core.utils.walk()`, symlinks
+        are not followed, but yielded as is
+
+        Args:
+            path(Path): root path
+
+        Yields:
+            Path: root path and all its children
+        """
+        if not path.exists() and not path.is_symlink():
+            return
+        yield path
+        if path.is_symlink() or not path.is_dir():
+            return
+        for root, directories, files in path.walk():
+            for name in directories + files:
+                yield root / name
+
     arguments = [_set_repo_backup_parser]
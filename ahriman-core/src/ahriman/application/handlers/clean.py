@@ -44,8 +44,8 @@ class Clean(Handler):
         """
         application = Application(repository_id, configuration, report=report)
         application.on_start()
-        application.clean(cache=args.cache, chroot=args.chroot, manual=args.manual, packages=args.packages,
-                          pacman=args.pacman)
+        application.clean(archives=args.archives, cache=args.cache, chroot=args.chroot, manual=args.manual,
+                          packages=args.packages, pacman=args.pacman)
 
     @staticmethod
     def _set_service_clean_parser(root: SubParserAction) -> argparse.ArgumentParser:
@@ -63,6 +63,9 @@ class Clean(Handler):
                                  epilog="The subcommand clears every temporary directories (builds, caches etc). "
                                         "Normally you should not run this command manually. Also in case if "
                                         "you are going to clear the chroot directories you will need root privileges.")
+        parser.add_argument("--archives", help="remove older versions of packages from archive according to the "
+                                               "archive rotation settings",
+                            action=argparse.BooleanOptionalAction, default=False)
         parser.add_argument("--cache", help="clear directory with package caches",
                             action=argparse.BooleanOptionalAction, default=False)
         parser.add_argument("--chroot", help="clear build chroot", action=argparse.BooleanOptionalAction, default=False)
@@ -58,8 +58,7 @@ class Copy(Handler):
         packages = source_application.repository.packages(args.package)
         Copy.check_status(args.exit_code, packages)
 
-        for package in packages:
-            Copy.copy_package(package, application, source_application)
+        Copy.copy_packages(packages, application, source_application)
 
         # run update
         application.update([])
@@ -88,30 +87,33 @@ class Copy(Handler):
         return parser
 
     @staticmethod
-    def copy_package(package: Package, application: Application, source_application: Application) -> None:
+    def copy_packages(packages: list[Package], application: Application, source_application: Application) -> None:
         """
-        copy package ``package`` from source repository to target repository
+        copy packages ``packages`` from source repository to target repository
 
         Args:
-            package(Package): package to copy
+            packages(list[Package]): packages to copy
             application(Application): application instance of the target repository
             source_application(Application): application instance of the source repository
         """
         # copy files
         source_paths = [
             str(source_application.repository.paths.repository / source.filename)
+            for package in packages
             for source in package.packages.values()
             if source.filename is not None
         ]
         application.add(source_paths, PackageSource.Archive)
 
         # copy metadata
-        application.reporter.package_changes_update(
-            package.base, source_application.reporter.package_changes_get(package.base)
-        )
-        application.reporter.package_dependencies_update(
-            package.base, source_application.reporter.package_dependencies_get(package.base)
-        )
-        application.reporter.package_update(package, BuildStatusEnum.Pending)
+        application.reporter.package_changes_update_many([
+            (package.base, source_application.reporter.package_changes_get(package.base))
+            for package in packages
+        ])
+        application.reporter.package_dependencies_update_many([
+            (package.base, source_application.reporter.package_dependencies_get(package.base))
+            for package in packages
+        ])
+        application.reporter.package_update_many(packages, BuildStatusEnum.Pending)
 
     arguments = [_set_package_copy_parser]
@@ -24,11 +24,8 @@ from collections.abc import Callable
 from multiprocessing import Pool
 from typing import ClassVar, TypeVar
 
-from ahriman.application.lock import Lock
 from ahriman.core.configuration import Configuration
 from ahriman.core.exceptions import ExitCode, MissingArchitectureError, MultipleArchitecturesError
-from ahriman.core.log.log_loader import LogLoader
-from ahriman.core.repository import Explorer
 from ahriman.core.types import ExplicitBool
 from ahriman.models.repository_id import RepositoryId
 
@@ -73,6 +70,11 @@ class Handler:
         Returns:
             bool: ``True`` on success, ``False`` otherwise
         """
+        # lock and logging implementations depend on the most of the core package, thus they are imported only if
+        # the command is going to be run, but not when the command line parser is generated
+        from ahriman.application.lock import Lock
+        from ahriman.core.log.log_loader import LogLoader
+
         try:
             configuration = Configuration.from_path(args.configuration, repository_id)
 
@@ -169,6 +171,8 @@ class Handler:
         Raises:
             MissingArchitectureError: if no architecture set and automatic detection is not allowed or failed
         """
+        from ahriman.core.repository import Explorer
+
         # preparse systemd repository-id argument
         # we are using unescaped values, so / is not allowed here, because it is impossible to separate if from dashes
         if args.repository_id is not None:
@@ -24,6 +24,10 @@ from pathlib import Path
 
 from ahriman.application.handlers.handler import Handler, SubParserAction
 from ahriman.core.configuration import Configuration
+from ahriman.core.exceptions import OptionError
+from ahriman.core.utils import enum_values
+from ahriman.models.backup_component import BackupComponent
+from ahriman.models.backup_manifest import BackupManifest
 from ahriman.models.repository_id import RepositoryId
 
 
@@ -47,7 +51,9 @@ class Restore(Handler):
             report(bool): force enable or disable reporting
         """
         with tarfile.open(args.path) as archive:
-            archive.extractall(path=args.output, filter="data")
+            manifest = BackupManifest.from_archive(archive)
+            members = Restore.members(archive, manifest, args.component)
+            archive.extractall(path=args.output, members=members, filter="data")
 
     @staticmethod
     def _set_repo_restore_parser(root: SubParserAction) -> argparse.ArgumentParser:
@@ -63,8 +69,37 @@ class Restore(Handler):
         parser = root.add_parser("repo-restore", help="restore repository data",
                                  description="restore settings and database")
         parser.add_argument("path", help="path of the input archive", type=Path)
+        parser.add_argument("-c", "--component", help="restore only specified components. Incremental archives "
+                            "must be restored in order after the full one", action="append", type=BackupComponent,
+                            choices=enum_values(BackupComponent))
         parser.add_argument("-o", "--output", help="root path of the extracted files", type=Path, default=Path("/"))
         parser.set_defaults(architecture="", lock=None, report=False, repository="", unsafe=True)
         return parser
 
+    @staticmethod
+    def members(archive: tarfile.TarFile, manifest: BackupManifest | None,
+                components: list[BackupComponent] | None) -> list[tarfile.TarInfo]:
+        """
+        extract archive members to be restored
+
+        Args:
+            archive(tarfile.TarFile): opened backup archive
+            manifest(BackupManifest | None): archive manifest if any
+            components(list[BackupComponent] | None): components to be restored. If none set, all members will be
+                extracted
+
+        Returns:
+            list[tarfile.TarInfo]: list of archive members to be extracted
+
+        Raises:
+            OptionError: if components are set, but archive has no manifest
+        """
+        members = [member for member in archive.getmembers() if member.name != BackupManifest.FILENAME]
+        if not components:
+            return members
+        if manifest is None:
+            raise OptionError(components)
+
+        return [member for member in members if manifest.component(member.name) in components]
+
     arguments = [_set_repo_restore_parser]
@@ -19,6 +19,7 @@
 #
 import argparse
 import datetime
+import functools
 import itertools
 
 from collections.abc import Callable
@@ -30,6 +31,7 @@ from ahriman.core.configuration import Configuration
 from ahriman.core.formatters import EventStatsPrinter, PackageStatsPrinter, RepositoryStatsPrinter
 from ahriman.core.utils import enum_values, pretty_datetime
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.repository_id import RepositoryId
 
 
@@ -60,6 +62,20 @@ class Statistics(Handler):
         if (value := args.to_date) is not None:
             to_date = datetime.datetime.fromisoformat(value).timestamp()
 
+        # rollups are aggregated by day, thus they can be used only if whole days are requested without pagination
+        # and there is no timeline chart, which requires each event
+        if (args.limit == -1 and args.offset == 0
+                and EventRollup.is_aligned(from_date) and EventRollup.is_aligned(to_date)
+                and (args.package is None or args.chart is None)):
+            rollups = application.reporter.event_rollup_get(args.event, args.package, from_date, to_date)
+            match args.package:
+                case None:
+                    RepositoryStatsPrinter(repository_id, application.reporter.statistics())(verbose=True)
+                    Statistics.rollups_per_package(args.event, rollups, args.chart)
+                case _:
+                    Statistics.rollup_stats(args.event, rollups)
+            return
+
         events = application.reporter.event_get(args.event, args.package, from_date, to_date, args.limit, args.offset)
 
         match args.package:
@@ -150,6 +166,45 @@ class Statistics(Handler):
 
         plt.savefig(path)
 
+    @staticmethod
+    def rollup_stats(event_type: str, rollups: list[EventRollup]) -> None:
+        """
+        calculate event stats from aggregated events
+
+        Args:
+            event_type(str): event type
+            rollups(list[EventRollup]): list of aggregated events
+        """
+        took = functools.reduce(EventRollup.merge, rollups, EventRollup(event=event_type, object_id="", created=0))
+        EventStatsPrinter(f"{event_type} duration, s", took)(verbose=True)
+
+    @staticmethod
+    def rollups_per_package(event_type: str, rollups: list[EventRollup], chart_path: Path | None) -> None:
+        """
+        calculate overall statistics from aggregated events
+
+        Args:
+            event_type(str): event type
+            rollups(list[EventRollup]): list of aggregated events
+            chart_path(Path): path to save plot if any
+        """
+        key: Callable[[EventRollup], str] = lambda rollup: rollup.object_id
+        by_object_id = {
+            object_id: sum(rollup.count for rollup in related)
+            for object_id, related in itertools.groupby(sorted(rollups, key=key), key=key)
+        }
+
+        # distribution per package
+        PackageStatsPrinter(by_object_id)(verbose=True)
+        EventStatsPrinter(f"{event_type} frequency", list(by_object_id.values()))(verbose=True)
+
+        # event statistics
+        Statistics.rollup_stats(event_type, rollups)
+
+        # chart if enabled
+        if chart_path is not None:
+            Statistics.plot_packages(event_type, by_object_id, chart_path)
+
     @staticmethod
     def stats_for_package(event_type: str, events: list[Event], chart_path: Path | None) -> None:
         """
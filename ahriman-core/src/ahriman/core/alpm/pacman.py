@@ -22,6 +22,7 @@ import shutil
 import tarfile
 
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from pathlib import Path
 from pyalpm import DB, Package, SIG_DATABASE_OPTIONAL, SIG_PACKAGE_OPTIONAL  # type: ignore[import-not-found]
@@ -167,16 +168,20 @@ class Pacman(LazyLogging):
 
     def database_sync(self, handle: PacmanHandle, *, force: bool) -> None:
         """
-        sync local database
+        sync local databases. Databases are processed concurrently, however, operations on pyalpm handle itself are
+        still serialized, thus effectively only files databases are downloaded in parallel
 
         Args:
             handle(PacmanHandle): pacman handle which will be used for database sync
             force(bool): force database synchronization (same as ``pacman -Syy``)
         """
         self.logger.info("refresh ahriman's home pacman database (force refresh %s)", force)
+        databases = [PacmanDatabase(database, self.configuration) for database in handle.get_syncdbs()]
+
         transaction = handle.init_transaction()
-        for database in handle.get_syncdbs():
-            PacmanDatabase(database, self.configuration).sync(force=force)
+        with ThreadPoolExecutor(max_workers=max(len(databases), 1)) as executor:
+            # consume iterator in order to wait for completion
+            list(executor.map(lambda database: database.sync(force=force), databases))
         transaction.release()
 
     def files(self, packages: Iterable[str]) -> dict[str, set[str]]:
@@ -20,15 +20,19 @@
 import os
 import shutil
 
-from email.utils import parsedate_to_datetime
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
 from pathlib import Path
 from pyalpm import DB  # type: ignore[import-not-found]
+from tempfile import NamedTemporaryFile
+from threading import Lock
 from typing import ClassVar
 from urllib.parse import urlparse
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.exceptions import PacmanError
 from ahriman.core.http import SyncHttpClient
+from ahriman.core.utils import filelock
 
 
 class PacmanDatabase(SyncHttpClient):
@@ -36,14 +40,20 @@ class PacmanDatabase(SyncHttpClient):
     implementation for database sync, because pyalpm is not always enough
 
     Attributes:
-        LAST_MODIFIED_HEADER(str): last modified header name
+        CHUNK_SIZE(int): (class attribute) size of the chunk which is used for downloading files
+        IF_MODIFIED_SINCE_HEADER(str): (class attribute) conditional request header name
+        LAST_MODIFIED_HEADER(str): (class attribute) last modified header name
         database(DB): pyalpm database object
         repository_paths(RepositoryPaths): repository paths instance
         sync_files_database(bool): sync files database
     """
 
+    CHUNK_SIZE: ClassVar[int] = 1024 * 1024
+    IF_MODIFIED_SINCE_HEADER: ClassVar[str] = "If-Modified-Since"
     LAST_MODIFIED_HEADER: ClassVar[str] = "Last-Modified"
 
+    _alpm_lock: ClassVar[Lock] = Lock()
+
     def __init__(self, database: DB, configuration: Configuration) -> None:
         """
         Args:
@@ -69,54 +79,48 @@ class PacmanDatabase(SyncHttpClient):
         """
         shutil.copy(remote_path, local_path)
 
-    def download(self, url: str, local_path: Path) -> None:
+    def download(self, url: str, local_path: Path, *, force: bool) -> bool:
         """
-        download remote file and store it to local path with the correct last modified headers
+        download remote file and store it to local path with the correct last modified headers. Unless ``force`` is
+        set, the request is conditional, i.e. the file will not be downloaded if it is not newer than the local copy
 
         Args:
             url(str): remote url to request file
             local_path(Path): path to locally stored file
-
-        Raises:
-            PacmanError: in case if no last-modified header was found
-        """
-        response = self.make_request("GET", url, stream=True)
-        if self.LAST_MODIFIED_HEADER not in response.headers:
-            raise PacmanError("No last-modified header found")
-
-        with local_path.open("wb") as local_file:
-            for chunk in response.iter_content(chunk_size=1024):
-                local_file.write(chunk)
-
-        # set correct (a,m)time for the file
-        remote_changed = parsedate_to_datetime(response.headers[self.LAST_MODIFIED_HEADER]).timestamp()
-        os.utime(local_path, (remote_changed, remote_changed))
-
-    def is_outdated(self, url: str, local_path: Path) -> bool:
-        """
-        check if local file is outdated
-
-        Args:
-            url(str): remote url to request last modified header
-            local_path(Path): path to locally stored file
+            force(bool): download file even if local copy is up-to-date
 
         Returns:
-            bool: ``True`` in case if remote file is newer than local file
+            bool: ``True`` in case if file has been downloaded and ``False`` if local copy is up-to-date
 
         Raises:
             PacmanError: in case if no last-modified header was found
         """
-        if not local_path.is_file():
-            return True  # no local file found, requires to update
+        headers = {}
+        if not force and local_path.is_file():
+            headers[self.IF_MODIFIED_SINCE_HEADER] = formatdate(local_path.stat().st_mtime, usegmt=True)
 
-        response = self.make_request("HEAD", url)
+        response = self.make_request("GET", url, headers=headers, stream=True)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return False
         if self.LAST_MODIFIED_HEADER not in response.headers:
             raise PacmanError("No last-modified header found")
 
-        remote_changed = parsedate_to_datetime(response.headers["Last-Modified"]).timestamp()
-        local_changed = local_path.stat().st_mtime
+        # write to the temporary file first, so readers will never see partially downloaded database
+        with NamedTemporaryFile(dir=local_path.parent, prefix=f".{local_path.name}.", delete=False) as local_file:
+            temporary_path = Path(local_file.name)
+        try:
+            with temporary_path.open("wb") as local_file:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    local_file.write(chunk)
+
+            # set correct (a,m)time for the file
+            remote_changed = parsedate_to_datetime(response.headers[self.LAST_MODIFIED_HEADER]).timestamp()
+            os.utime(temporary_path, (remote_changed, remote_changed))
+            temporary_path.replace(local_path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
 
-        return remote_changed > local_changed
+        return True
 
     def sync(self, *, force: bool) -> None:
         """
@@ -154,10 +158,10 @@ class PacmanDatabase(SyncHttpClient):
 
         match remote_uri.scheme:
             case "http" | "https":
-                if not force and not self.is_outdated(url, local_path):
-                    return
-
-                self.download(url, local_path)
+                # lock file, so concurrent processes will not download the same database twice
+                with filelock(local_path):
+                    if self.download(url, local_path, force=force):
+                        self.logger.info("files database %s has been updated", self.database.name)
 
             case "file":
                 # just copy file as it is relatively cheap operation, no need to check timestamps
@@ -168,9 +172,11 @@ class PacmanDatabase(SyncHttpClient):
 
     def sync_packages(self, *, force: bool) -> None:
         """
-        sync packages by using built-in pyalpm methods
+        sync packages by using built-in pyalpm methods. Because pyalpm handle is not thread-safe, this method is
+        serialized across all instances
 
         Args:
             force(bool): force database synchronization (same as ``pacman -Syy``)
         """
-        self.database.update(force)
+        with self._alpm_lock:
+            self.database.update(force)
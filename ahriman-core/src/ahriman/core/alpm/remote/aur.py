@@ -17,6 +17,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import itertools
+
+from collections.abc import Iterable
 from typing import Any, ClassVar
 
 from ahriman.core.alpm.pacman import Pacman
@@ -33,11 +36,13 @@ class AUR(Remote):
         DEFAULT_AUR_URL(str): (class attribute) default AUR url
         DEFAULT_RPC_URL(str): (class attribute) default AUR RPC url
         DEFAULT_RPC_VERSION(str): (class attribute) default AUR RPC version
+        MAX_INFO_ARGUMENTS(int): (class attribute) maximal amount of packages requested in single info request
     """
 
     DEFAULT_AUR_URL: ClassVar[str] = "https://aur.archlinux.org"
     DEFAULT_RPC_URL: ClassVar[str] = f"{DEFAULT_AUR_URL}/rpc"
     DEFAULT_RPC_VERSION: ClassVar[str] = "5"
+    MAX_INFO_ARGUMENTS: ClassVar[int] = 100
 
     @classmethod
     def remote_git_url(cls, package_base: str, repository: str) -> str:
@@ -130,6 +135,26 @@ class AUR(Remote):
         except StopIteration:
             raise UnknownPackageError(package_name) from None
 
+    def package_multiinfo(self, package_names: Iterable[str], *, pacman: Pacman | None) -> list[AURPackage]:
+        """
+        get packages info by their names skipping unknown ones. Packages are requested in batches by using multiple
+        ``arg[]`` query parameters
+
+        Args:
+            package_names(Iterable[str]): package names to search
+            pacman(Pacman | None): alpm wrapper instance, required for official repositories search
+
+        Returns:
+            list[AURPackage]: list of found packages
+        """
+        url = f"{self.DEFAULT_RPC_URL}/v{self.DEFAULT_RPC_VERSION}/info"
+
+        result = []
+        for chunk in itertools.batched(dict.fromkeys(package_names), self.MAX_INFO_ARGUMENTS):
+            response = self.make_request("GET", url, params=[("arg[]", package_name) for package_name in chunk])
+            result.extend(self.parse_response(response.json()))
+        return result
+
     def package_provided_by(self, package_name: str, *, pacman: Pacman | None) -> list[AURPackage]:
         """
         get package list which provide the specified package name
@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+from collections.abc import Iterable
+
 from ahriman.core.alpm.pacman import Pacman
 from ahriman.core.exceptions import UnknownPackageError
 from ahriman.core.http import SyncHttpClient
@@ -69,6 +71,23 @@ class Remote(SyncHttpClient):
                 return next(iter(provided_by))
             raise
 
+    @classmethod
+    def multiinfo(cls, *package_names: str, pacman: Pacman | None = None) -> list[AURPackage]:
+        """
+        get packages info by their names. Unlike :func:`info()`, this method doesn't raise exception for unknown
+        packages, but just skips them; and it also might use single request for all packages if it is supported by the
+        implementation
+
+        Args:
+            *package_names(str): package names to search
+            pacman(Pacman | None, optional): alpm wrapper instance, required for official repositories search
+                (Default value = None)
+
+        Returns:
+            list[AURPackage]: list of found packages
+        """
+        return cls().package_multiinfo(package_names, pacman=pacman)
+
     @classmethod
     def multisearch(cls, *keywords: str, pacman: Pacman | None = None,
                     search_by: str | None = None) -> list[AURPackage]:
@@ -170,6 +189,26 @@ class Remote(SyncHttpClient):
         """
         raise NotImplementedError
 
+    def package_multiinfo(self, package_names: Iterable[str], *, pacman: Pacman | None) -> list[AURPackage]:
+        """
+        get packages info by their names skipping unknown ones. Default implementation just calls
+        :func:`package_info()` for each package
+
+        Args:
+            package_names(Iterable[str]): package names to search
+            pacman(Pacman | None): alpm wrapper instance, required for official repositories search
+
+        Returns:
+            list[AURPackage]: list of found packages
+        """
+        result = []
+        for package_name in package_names:
+            try:
+                result.append(self.package_info(package_name, pacman=pacman))
+            except UnknownPackageError:
+                continue
+        return result
+
     def package_provided_by(self, package_name: str, *, pacman: Pacman | None) -> list[AURPackage]:
         """
         get package list which provide the specified package name
@@ -17,6 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+from collections.abc import Iterable
 from pathlib import Path
 
 from ahriman.core.exceptions import BuildError
@@ -66,9 +67,22 @@ class Repo(LazyLogging):
         Args:
             path(Path): path to archive to add
         """
+        self.add_packages([path])
+
+    def add_packages(self, paths: Iterable[Path]) -> None:
+        """
+        add new packages to repository by using single process call
+
+        Args:
+            paths(Iterable[Path]): paths to archives to add
+        """
+        paths = list(paths)
+        if not paths:
+            return
+
         check_output(
-            "repo-add", *self.sign_args, "--remove", str(self.repo_path), str(path),
-            exception=BuildError.from_process(path.name),
+            "repo-add", *self.sign_args, "--remove", str(self.repo_path), *map(str, paths),
+            exception=BuildError.from_process(" ".join(path.name for path in paths)),
             cwd=self.root,
             logger=self.logger,
             user=self.uid,
@@ -89,14 +103,29 @@ class Repo(LazyLogging):
             package_name(str): package name to remove
             filename(Path): package filename to remove
         """
-        # remove package and signature (if any) from filesystem
-        for full_path in self.root.glob(f"{filename.name}*"):
-            full_path.unlink()
+        self.remove_packages([(package_name, filename)])
+
+    def remove_packages(self, packages: Iterable[tuple[str, Path]]) -> None:
+        """
+        remove packages from repository by using single process call
+
+        Args:
+            packages(Iterable[tuple[str, Path]]): list of package names and their filenames to remove
+        """
+        packages = list(packages)
+        if not packages:
+            return
+
+        # remove packages and signatures (if any) from filesystem
+        for _, filename in packages:
+            for full_path in self.root.glob(f"{filename.name}*"):
+                full_path.unlink()
 
-        # remove package from registry
+        # remove packages from registry
+        package_names = list(dict.fromkeys(package_name for package_name, _ in packages))
         check_output(
-            "repo-remove", *self.sign_args, str(self.repo_path), package_name,
-            exception=BuildError.from_process(package_name),
+            "repo-remove", *self.sign_args, str(self.repo_path), *package_names,
+            exception=BuildError.from_process(" ".join(package_names)),
             cwd=self.root,
             logger=self.logger,
             user=self.uid,
@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from ahriman.core.configuration import Configuration
+from ahriman.core.log import LazyLogging
+from ahriman.core.utils import check_output
+from ahriman.models.repository_id import RepositoryId
+from ahriman.models.repository_paths import RepositoryPaths
+
+
+class ChrootManager(LazyLogging):
+    """
+    build chroot lifecycle manager. If enabled, the root chroot is updated only once and then each package is built
+    in its fresh snapshot instead of updating root chroot before every build. Snapshots themselves are created by the
+    devtools wrapper, which uses btrfs subvolumes or reflinks if available and falls back to plain copy otherwise
+
+    Attributes:
+        archbuild_flags(list[str]): command flags for archbuild command
+        build_command(list[str]): devtools wrapper command
+        devtools_configs(Path): path to local directory with devtools configuration files
+        enabled(bool): whether chroot snapshots are enabled or not
+        is_updated(bool): whether the root chroot has been already updated
+        paths(RepositoryPaths): repository paths instance
+        repository_id(RepositoryId): repository unique identifier
+        uid(int): uid of the repository owner user
+
+    Examples:
+        The manager is supposed to be shared between build tasks of the same run, e.g.::
+
+            >>> chroot = ChrootManager(configuration, repository_id, paths)
+            >>> chroot.update()
+            >>>
+            >>> for package in packages:
+            >>>     Task(package, configuration, repository_id, paths, chroot).build(sources_dir)
+
+        In case if the root chroot update has been failed, the packages will be built as usual.
+    """
+
+    def __init__(self, configuration: Configuration, repository_id: RepositoryId, paths: RepositoryPaths) -> None:
+        """
+        Args:
+            configuration(Configuration): configuration instance
+            repository_id(RepositoryId): repository unique identifier
+            paths(RepositoryPaths): repository paths instance
+        """
+        self.paths = paths
+        self.uid, _ = paths.root_owner
+        self.repository_id = repository_id
+
+        self.archbuild_flags = configuration.getlist("build", "archbuild_flags", fallback=[])
+        self.build_command = configuration.getlist("build", "devtools_wrapper")
+        self.devtools_configs = configuration.getpath("build", "devtools_configs")
+        self.enabled = configuration.getboolean("build", "chroot_snapshots", fallback=False)
+        if configuration.getlist("build", "build_command", fallback=[]):
+            self.enabled = False  # legacy build command doesn't support snapshots
+
+        self.is_updated = False
+
+    def snapshot_flags(self) -> list[str]:
+        """
+        get devtools wrapper flags for the package build
+
+        Returns:
+            list[str]: flags to build package in the fresh snapshot of the root chroot if it has been updated and
+            empty list otherwise
+        """
+        if not self.is_updated:
+            return []
+        # the name of the snapshot is the same as the default makechrootpkg working copy,
+        # because it is used later to scan package dependencies
+        return ["-s", self.paths.build_root.name]
+
+    def update(self) -> None:
+        """
+        create or update the root chroot if it hasn't been updated yet. This method does nothing if snapshots are
+        disabled. In case of failure, snapshots will be disabled for this instance
+        """
+        if not self.enabled or self.is_updated:
+            return
+
+        command = self.build_command + [
+            "-r", self.repository_id.name,
+            "-a", self.repository_id.architecture,
+            "-c", str(self.devtools_configs),
+            "-u",
+            "--",
+            "-r", str(self.paths.chroot),
+        ] + self.archbuild_flags
+        self.logger.info("using %s to update root chroot", command)
+
+        try:
+            check_output(*command, cwd=self.paths.root, logger=self.logger, user=self.uid)
+        except Exception:
+            self.logger.exception("could not update root chroot, snapshots will not be used")
+            self.enabled = False  # do not try to update it again
+            return
+
+        self.is_updated = True
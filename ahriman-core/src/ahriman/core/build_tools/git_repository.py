@@ -0,0 +1,290 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+import re
+import subprocess
+
+from pathlib import Path
+from types import TracebackType
+from typing import ClassVar, IO, Literal, Self
+
+from ahriman.core.exceptions import CalledProcessError
+from ahriman.core.log import LazyLogging
+
+
+class GitRepository(LazyLogging):
+    """
+    lightweight reader of the local git repository. References and remotes are resolved directly from the repository
+    files, whereas objects are read through the single persistent ``git cat-file --batch`` process, which is spawned
+    on the first request and is kept alive until :func:`close()` call
+
+    Attributes:
+        MAX_SYMBOLIC_DEPTH(int): (class attribute) maximal amount of nested symbolic references to follow
+        OBJECT_NAME(re.Pattern[str]): (class attribute) regular expression for full object names
+        REMOTE_SECTION(re.Pattern[str]): (class attribute) regular expression for remote sections in git config
+        git_dir(Path): path to git directory
+        sources_dir(Path): local path to git repository
+
+    Examples:
+        The class is supposed to be used as context manager, e.g.::
+
+            >>> with GitRepository(sources_dir) as repository:
+            >>>     commit_sha = repository.ref("HEAD")
+            >>>     pkgbuild = repository.read(commit_sha, Path("PKGBUILD"))
+
+        Methods which work with the repository files return ``None`` in case if the repository layout is not
+        supported (e.g. reftable storage or linked worktrees), thus caller should fall back to the git command.
+    """
+
+    MAX_SYMBOLIC_DEPTH: ClassVar[int] = 5
+    OBJECT_NAME: ClassVar[re.Pattern[str]] = re.compile(r"^([0-9a-f]{40}|[0-9a-f]{64})$")
+    REMOTE_SECTION: ClassVar[re.Pattern[str]] = re.compile(r"^\s*\[\s*remote(?:\s+\"(.+)\"|\.(\S+))\s*\]")
+
+    def __init__(self, sources_dir: Path) -> None:
+        """
+        Args:
+            sources_dir(Path): local path to git repository
+        """
+        self.sources_dir = sources_dir
+        self.git_dir = sources_dir / ".git"
+
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> Self:
+        """
+        enter repository context
+
+        Returns:
+            Self: always instance of self
+        """
+        return self
+
+    def __exit__(self, exc_type: type[Exception] | None, exc_val: Exception | None,
+                 exc_tb: TracebackType) -> Literal[False]:
+        """
+        stop batch process if any
+
+        Args:
+            exc_type(type[Exception] | None): exception type name if any
+            exc_val(Exception | None): exception raised if any
+            exc_tb(TracebackType): exception traceback if any
+
+        Returns:
+            Literal[False]: always ``False`` (do not suppress any exception)
+        """
+        self.close()
+        return False
+
+    @staticmethod
+    def _channels(process: subprocess.Popen[bytes]) -> tuple[IO[bytes], IO[bytes]]:
+        """
+        extract input and output channels of the process
+
+        Args:
+            process(subprocess.Popen[bytes]): running process
+
+        Returns:
+            tuple[IO[bytes], IO[bytes]]: process stdin and stdout channels
+        """
+        if process.stdin is None or process.stdout is None:  # never happens actually, just for mypy
+            raise ValueError("process channels are not available")
+        return process.stdin, process.stdout
+
+    def _batch(self) -> subprocess.Popen[bytes]:
+        """
+        get batch process, spawning it if it hasn't been started yet
+
+        Returns:
+            subprocess.Popen[bytes]: running ``git cat-file --batch`` process
+        """
+        if self._process is None:
+            self.logger.debug("start batch git process at %s", self.sources_dir)
+            self._process = subprocess.Popen(["git", "cat-file", "--batch"], cwd=self.sources_dir,
+                                             stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        return self._process
+
+    def _packed_refs(self) -> dict[str, str]:
+        """
+        read packed references
+
+        Returns:
+            dict[str, str]: map of reference name to its object name
+        """
+        packed_refs = self.git_dir / "packed-refs"
+        if not packed_refs.is_file():
+            return {}
+
+        result = {}
+        for line in packed_refs.read_text(encoding="utf8").splitlines():
+            if line.startswith(("#", "^")):  # skip header and peeled tags
+                continue
+            object_name, _, ref_name = line.partition(" ")
+            result[ref_name] = object_name
+        return result
+
+    def _resolve(self, ref_name: str, packed_refs: dict[str, str]) -> str | None:
+        """
+        resolve reference, following symbolic references if any
+
+        Args:
+            ref_name(str): full reference name
+            packed_refs(dict[str, str]): packed references
+
+        Returns:
+            str | None: object name if reference can be resolved and ``None`` otherwise
+        """
+        for _ in range(self.MAX_SYMBOLIC_DEPTH):
+            path = self.git_dir / ref_name
+            if path.is_file():
+                value = path.read_text(encoding="utf8").strip()
+            elif (value := packed_refs.get(ref_name)) is None:
+                return None
+
+            if not value.startswith("ref: "):
+                return value if self.OBJECT_NAME.fullmatch(value) else None
+            ref_name = value.removeprefix("ref: ")
+
+        return None
+
+    def cat_file(self, object_name: str) -> bytes | None:
+        """
+        read object content by using batch process
+
+        Args:
+            object_name(str): object name in any format supported by git, e.g. ``<commit>:<path>``
+
+        Returns:
+            bytes | None: object content if it exists and ``None`` otherwise
+
+        Raises:
+            CalledProcessError: if batch process has been terminated unexpectedly
+        """
+        if "\n" in object_name:
+            return None  # batch protocol is line based, such names can't be requested
+
+        process = self._batch()
+        stdin, stdout = self._channels(process)
+        try:
+            stdin.write(f"{object_name}\n".encode("utf8"))
+            stdin.flush()
+            header = stdout.readline().decode("utf8")
+        except BrokenPipeError:
+            header = ""
+        if not header:
+            self.close()
+            raise CalledProcessError(process.returncode or 1, process.args, "batch process has been terminated")
+
+        # valid header is <object name> <type> <size>, otherwise it is <name> missing or <name> ambiguous
+        *_, size = header.split()
+        if not size.isdigit():
+            return None
+
+        content = stdout.read(int(size))
+        stdout.read(1)  # object content is always terminated by new line
+        return content
+
+    def close(self) -> None:
+        """
+        stop batch process if it is running
+        """
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+        stdin, stdout = self._channels(process)
+        stdin.close()  # process will exit on EOF
+        process.wait()
+        stdout.close()
+
+    def has_object(self, object_name: str) -> bool:
+        """
+        check if object exists in the repository, acts as ``git cat-file -e``
+
+        Args:
+            object_name(str): object name in any format supported by git
+
+        Returns:
+            bool: ``True`` in case if object exists and ``False`` otherwise
+        """
+        return self.cat_file(object_name) is not None
+
+    def read(self, commit_sha: str, path: Path) -> str | None:
+        """
+        read file content from the specified commit
+
+        Args:
+            commit_sha(str): commit hash to read from
+            path(Path): path to file inside the repository
+
+        Returns:
+            str | None: file content at specified commit if available
+        """
+        content = self.cat_file(f"{commit_sha}:{path}")
+        if content is None:
+            return None
+        return content.decode("utf8", errors="backslashreplace").rstrip("\n")
+
+    def ref(self, ref_name: str = "HEAD") -> str | None:
+        """
+        resolve reference from the repository files by using the same rules as ``git rev-parse`` does
+
+        Args:
+            ref_name(str, optional): reference name, either full (e.g. ``refs/heads/master``) or short
+                (e.g. ``origin/master``) (Default value = "HEAD")
+
+        Returns:
+            str | None: object name of the reference if it can be resolved from files and ``None`` otherwise
+        """
+        if not self.git_dir.is_dir():
+            return None  # linked worktrees and submodules are not supported
+
+        candidates = [
+            ref_name,
+            f"refs/{ref_name}",
+            f"refs/tags/{ref_name}",
+            f"refs/heads/{ref_name}",
+            f"refs/remotes/{ref_name}",
+            f"refs/remotes/{ref_name}/HEAD",
+        ]
+        packed_refs = self._packed_refs()
+        for candidate in candidates:
+            if (object_name := self._resolve(candidate, packed_refs)) is not None:
+                return object_name
+
+        return None
+
+    def remotes(self) -> list[str] | None:
+        """
+        read configured remotes from the repository configuration
+
+        Returns:
+            list[str] | None: list of remote names if configuration can be read and ``None`` otherwise
+        """
+        config = self.git_dir / "config"
+        if not config.is_file():
+            return None
+
+        result = []
+        for line in config.read_text(encoding="utf8").splitlines():
+            if (match := self.REMOTE_SECTION.match(line)) is None:
+                continue
+            name = match.group(1) or match.group(2)
+            if name not in result:
+                result.append(name)
+        return result
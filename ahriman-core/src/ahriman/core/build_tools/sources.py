@@ -21,8 +21,10 @@ import shutil
 
 from collections.abc import Iterator
 from pathlib import Path
-from typing import ClassVar
+from types import TracebackType
+from typing import ClassVar, Literal, Self
 
+from ahriman.core.build_tools.git_repository import GitRepository
 from ahriman.core.exceptions import CalledProcessError
 from ahriman.core.log import LazyLogging
 from ahriman.core.utils import check_output, utcnow, walk
@@ -36,7 +38,9 @@ from ahriman.models.repository_paths import RepositoryPaths
 
 class Sources(LazyLogging):
     """
-    helper to download package sources (PKGBUILD etc...) and perform some operations with git
+    helper to download package sources (PKGBUILD etc...) and perform some operations with git. Read-only operations
+    (references, remotes and objects lookup) are performed by repository readers, which are shared between calls of
+    the same instance and which are stopped on context exit
 
     Attributes:
         DEFAULT_BRANCH(str): (class attribute) default branch to process git repositories.
@@ -51,6 +55,37 @@ class Sources(LazyLogging):
         "init.defaultBranch": DEFAULT_BRANCH,
     }
 
+    def __init__(self) -> None:
+        """
+        default constructor
+        """
+        self._repositories: dict[Path, GitRepository] = {}
+
+    def __enter__(self) -> Self:
+        """
+        enter sources context
+
+        Returns:
+            Self: always instance of self
+        """
+        return self
+
+    def __exit__(self, exc_type: type[Exception] | None, exc_val: Exception | None,
+                 exc_tb: TracebackType) -> Literal[False]:
+        """
+        stop all repository readers
+
+        Args:
+            exc_type(type[Exception] | None): exception type name if any
+            exc_val(Exception | None): exception raised if any
+            exc_tb(TracebackType): exception traceback if any
+
+        Returns:
+            Literal[False]: always ``False`` (do not suppress any exception)
+        """
+        self.close()
+        return False
+
     @staticmethod
     def changes(source_dir: Path, last_commit_sha: str) -> Changes:
         """
@@ -61,16 +96,16 @@ class Sources(LazyLogging):
             last_commit_sha(str): last known commit hash
 
         Returns:
-            Changes: changes from the last commit if available
+            Changes: changes from the last commit to the current HEAD if available
         """
-        instance = Sources()
-
-        diff = None
-        if instance.fetch_until(source_dir, commit_sha=last_commit_sha) is not None:
-            diff = instance.diff(source_dir, last_commit_sha)
-        pkgbuild = instance.read(source_dir, "HEAD", Path("PKGBUILD"))
+        with Sources() as instance:
+            diff = None
+            if instance.fetch_until(source_dir, commit_sha=last_commit_sha) is not None:
+                diff = instance.diff(source_dir, last_commit_sha)
+            head_commit_sha = instance.head(source_dir)
+            pkgbuild = instance.read(source_dir, head_commit_sha, Path("PKGBUILD"))
 
-        return Changes(last_commit_sha, diff, pkgbuild)
+        return Changes(last_commit_sha, diff, pkgbuild, head_commit_sha)
 
     @staticmethod
     def extend_architectures(sources_dir: Path, architecture: str) -> list[PkgbuildPatch]:
@@ -102,37 +137,37 @@ class Sources(LazyLogging):
         Returns:
             str | None: current commit sha if available
         """
-        instance = Sources()
-        # local directory exists and there is .git directory
-        is_initialized_git = (sources_dir / ".git").is_dir()
-        if is_initialized_git and not instance.has_remotes(sources_dir):
-            # there is git repository, but no remote configured so far
-            instance.logger.info("skip update at %s because there are no branches configured", sources_dir)
-            return instance.head(sources_dir)
-
-        branch = remote.branch or instance.DEFAULT_BRANCH
-        if is_initialized_git:
-            instance.logger.info("update HEAD to remote at %s using branch %s", sources_dir, branch)
-            instance.fetch_until(sources_dir, branch=branch)
-        elif remote.git_url is not None:
-            instance.logger.info("clone remote %s to %s using branch %s", remote.git_url, sources_dir, branch)
-            check_output(*instance.git(), "clone", "--quiet", "--depth", "1", "--branch", branch, "--single-branch",
-                         remote.git_url, str(sources_dir), cwd=sources_dir.parent, logger=instance.logger)
-        else:
-            # it will cause an exception later
-            instance.logger.error("%s is not initialized, but no remote provided", sources_dir)
-
-        # and now force reset to our branch
-        check_output(*instance.git(), "checkout", "--force", branch, cwd=sources_dir, logger=instance.logger)
-        check_output(*instance.git(), "reset", "--quiet", "--hard", f"origin/{branch}",
-                     cwd=sources_dir, logger=instance.logger)
+        with Sources() as instance:
+            # local directory exists and there is .git directory
+            is_initialized_git = (sources_dir / ".git").is_dir()
+            if is_initialized_git and not instance.has_remotes(sources_dir):
+                # there is git repository, but no remote configured so far
+                instance.logger.info("skip update at %s because there are no branches configured", sources_dir)
+                return instance.head(sources_dir)
+
+            branch = remote.branch or instance.DEFAULT_BRANCH
+            if is_initialized_git:
+                instance.logger.info("update HEAD to remote at %s using branch %s", sources_dir, branch)
+                instance.fetch_until(sources_dir, branch=branch)
+            elif remote.git_url is not None:
+                instance.logger.info("clone remote %s to %s using branch %s", remote.git_url, sources_dir, branch)
+                check_output(*instance.git(), "clone", "--quiet", "--depth", "1", "--branch", branch,
+                             "--single-branch", remote.git_url, str(sources_dir),
+                             cwd=sources_dir.parent, logger=instance.logger)
+            else:
+                # it will cause an exception later
+                instance.logger.error("%s is not initialized, but no remote provided", sources_dir)
+
+            # and now force reset to our branch, checkout with -B flag does the same as checkout and hard reset
+            check_output(*instance.git(), "checkout", "--quiet", "--force", "-B", branch, f"origin/{branch}",
+                         cwd=sources_dir, logger=instance.logger)
 
-        # move content if required
-        # we are using full path to source directory in order to make append possible
-        pkgbuild_dir = remote.pkgbuild_dir or sources_dir.resolve()
-        instance.move((sources_dir / pkgbuild_dir).resolve(), sources_dir)
+            # move content if required
+            # we are using full path to source directory in order to make append possible
+            pkgbuild_dir = remote.pkgbuild_dir or sources_dir.resolve()
+            instance.move((sources_dir / pkgbuild_dir).resolve(), sources_dir)
 
-        return instance.head(sources_dir)
+            return instance.head(sources_dir)
 
     @staticmethod
     def has_remotes(sources_dir: Path) -> bool:
@@ -145,9 +180,11 @@ class Sources(LazyLogging):
         Returns:
             bool: ``True`` in case if there is any remote and false otherwise
         """
-        instance = Sources()
-        remotes = check_output(*instance.git(), "remote", cwd=sources_dir, logger=instance.logger)
-        return bool(remotes)
+        with Sources() as instance:
+            if (remotes := instance.repository(sources_dir).remotes()) is not None:
+                return bool(remotes)
+            remotes_list = check_output(*instance.git(), "remote", cwd=sources_dir, logger=instance.logger)
+            return bool(remotes_list)
 
     @staticmethod
     def init(sources_dir: Path) -> None:
@@ -158,16 +195,21 @@ class Sources(LazyLogging):
             sources_dir(Path): local path to sources
         """
         instance = Sources()
-        if not (sources_dir / ".git").is_dir():
+        is_initialized_git = (sources_dir / ".git").is_dir()
+        if not is_initialized_git:
             # skip initializing in case if it was already
             check_output(*instance.git(), "init", "--quiet", "--initial-branch", instance.DEFAULT_BRANCH,
                          cwd=sources_dir, logger=instance.logger)
 
         # extract local files...
         files = ["PKGBUILD", ".SRCINFO"] + [str(path) for path in Pkgbuild.local_files(sources_dir)]
-        instance.add(sources_dir, *files)
-        # ...and commit them
-        instance.commit(sources_dir)
+        added = instance.add(sources_dir, *files)
+        # ...and commit them. In case of empty repository there is no need to check index, because it contains
+        # exactly added files
+        if is_initialized_git or not added:
+            instance.commit(sources_dir)
+        else:
+            instance.commit(sources_dir, check_changes=False)
 
     @staticmethod
     def load(sources_dir: Path, package: Package, patches: list[PkgbuildPatch], paths: RepositoryPaths) -> str | None:
@@ -232,7 +274,7 @@ class Sources(LazyLogging):
         git_url, branch = remote.git_source()
         check_output(*instance.git(), "push", "--quiet", git_url, branch, cwd=sources_dir, logger=instance.logger)
 
-    def add(self, sources_dir: Path, *pattern: str, intent_to_add: bool = False) -> None:
+    def add(self, sources_dir: Path, *pattern: str, intent_to_add: bool = False) -> list[Path]:
         """
         track found files via git
 
@@ -241,21 +283,34 @@ class Sources(LazyLogging):
             *pattern(str): glob patterns
             intent_to_add(bool, optional): record only the fact that it will be added later, acts as
                 --intent-to-add git flag (Default value = False)
+
+        Returns:
+            list[Path]: list of files which have been added to index
         """
         # glob directory to find files which match the specified patterns
         found_files: list[Path] = []
         for glob in pattern:
             found_files.extend(sources_dir.glob(glob))
         if not found_files:
-            return  # no additional files found
+            return []  # no additional files found
         self.logger.info("found matching files %s", found_files)
         # add them to index
         args = ["--intent-to-add"] if intent_to_add else []
         check_output(*self.git(), "add", *args, *[str(fn.relative_to(sources_dir)) for fn in found_files],
                      cwd=sources_dir, logger=self.logger)
 
+        return found_files
+
+    def close(self) -> None:
+        """
+        stop all repository readers
+        """
+        for repository in self._repositories.values():
+            repository.close()
+        self._repositories.clear()
+
     def commit(self, sources_dir: Path, message: str | None = None,
-               commit_author: tuple[str, str] | None = None) -> bool:
+               commit_author: tuple[str, str] | None = None, *, check_changes: bool = True) -> bool:
         """
         commit changes
 
@@ -264,11 +319,13 @@ class Sources(LazyLogging):
             message(str | None, optional): optional commit message if any. If none set, message will be generated
                 according to the current timestamp (Default value = None)
             commit_author(tuple[str, str] | None, optional): optional commit author if any (Default value = None)
+            check_changes(bool, optional): check if there are staged changes before commit. This check can be
+                skipped if caller knows that index has been changed (Default value = True)
 
         Returns:
             bool: ``True`` in case if changes have been committed and ``False`` otherwise
         """
-        if not self.has_changes(sources_dir):
+        if check_changes and not self.has_changes(sources_dir):
             return False  # nothing to commit
 
         if message is None:
@@ -328,12 +385,10 @@ class Sources(LazyLogging):
                 command += ["origin", branch]
             check_output(*command, cwd=sources_dir, logger=self.logger)  # fetch one more level
 
-            try:
-                # check if there is an object in current git directory
-                check_output(*self.git(), "cat-file", "-e", commit_sha, cwd=sources_dir, logger=self.logger)
+            # check if there is an object in current git directory
+            if self.repository(sources_dir).has_object(commit_sha):
                 return commit_sha  # found the required commit
-            except CalledProcessError:
-                commits_count += 1  # increase depth
+            commits_count += 1  # increase depth
 
         # no commits found at the requested depth
         return None
@@ -382,7 +437,9 @@ class Sources(LazyLogging):
         Returns:
             str: HEAD commit hash
         """
-        # we might want to parse git files instead though
+        if (commit_sha := self.repository(sources_dir).ref(ref_name)) is not None:
+            return commit_sha
+        # reference can't be resolved from files, e.g. it is commit sha or repository uses unsupported layout
         return check_output(*self.git(), "rev-parse", ref_name, cwd=sources_dir, logger=self.logger)
 
     def move(self, pkgbuild_dir: Path, sources_dir: Path) -> None:
@@ -429,7 +486,25 @@ class Sources(LazyLogging):
             str | None: file content at specified commit if available
         """
         try:
-            return check_output(*self.git(), "show", f"{commit_sha}:{path}", cwd=sources_dir, logger=self.logger)
+            content = self.repository(sources_dir).read(commit_sha, path)
         except CalledProcessError:
             self.logger.exception("failed to read file %s at %s", path, commit_sha)
             return None
+
+        if content is None:
+            self.logger.error("file %s is not found at %s", path, commit_sha)
+        return content
+
+    def repository(self, sources_dir: Path) -> GitRepository:
+        """
+        get repository reader for the specified path
+
+        Args:
+            sources_dir(Path): local path to git repository
+
+        Returns:
+            GitRepository: repository reader, which is shared between calls of this instance
+        """
+        if (repository := self._repositories.get(sources_dir)) is None:
+            repository = self._repositories[sources_dir] = GitRepository(sources_dir)
+        return repository
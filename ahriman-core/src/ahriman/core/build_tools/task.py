@@ -19,12 +19,15 @@
 #
 from collections.abc import Iterator
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
+from ahriman.core.build_tools.chroot_manager import ChrootManager
 from ahriman.core.build_tools.sources import Sources
 from ahriman.core.configuration import Configuration
 from ahriman.core.exceptions import BuildError
 from ahriman.core.log import LazyLogging
 from ahriman.core.utils import check_output, package_like
+from ahriman.models.metrics_timer import MetricsTimer
 from ahriman.models.package import Package
 from ahriman.models.pkgbuild_patch import PkgbuildPatch
 from ahriman.models.repository_id import RepositoryId
@@ -38,6 +41,7 @@ class Task(LazyLogging):
     Attributes:
         archbuild_flags(list[str]): command flags for archbuild command
         build_command(list[str]): build command
+        chroot(ChrootManager | None): build chroot manager if any
         devtools_configs(Path): path to local directory with devtools configuration files
         include_debug_packages(bool): whether to include debug packages or not
         make_flags(str): MAKEFLAGS variable for makepkg command
@@ -46,22 +50,27 @@ class Task(LazyLogging):
         package(Package): package definitions
         paths(RepositoryPaths): repository paths instance
         repository_id(RepositoryId): repository unique identifier
+        timings(dict[str, float]): time in seconds spent on the build steps, e.g. VCS version calculation
         uid(int): uid of the repository owner user
+        vcs_host_pkgver(bool): calculate VCS packages version on the host if possible
     """
 
     def __init__(self, package: Package, configuration: Configuration, repository_id: RepositoryId,
-                 paths: RepositoryPaths) -> None:
+                 paths: RepositoryPaths, chroot: ChrootManager | None = None) -> None:
         """
         Args:
             package(Package): package definitions
             configuration(Configuration): configuration instance
             repository_id(RepositoryId): repository unique identifier
             paths(RepositoryPaths): repository paths instance
+            chroot(ChrootManager | None, optional): build chroot manager. If set, the package will be built in
+                the chroot snapshot in case if the root chroot has been updated (Default value = None)
         """
         self.package = package
         self.paths = paths
         self.uid, _ = paths.root_owner
         self.repository_id = repository_id
+        self.chroot = chroot
 
         self.archbuild_flags = configuration.getlist("build", "archbuild_flags", fallback=[])
         self.build_command = configuration.getlist("build", "devtools_wrapper")
@@ -73,6 +82,9 @@ class Task(LazyLogging):
         self.make_flags = configuration.get("build", "make_flags", fallback=None)
         self.makepkg_flags = configuration.getlist("build", "makepkg_flags", fallback=[])
         self.makechrootpkg_flags = configuration.getlist("build", "makechrootpkg_flags", fallback=[])
+        self.vcs_host_pkgver = configuration.getboolean("build", "vcs_host_pkgver", fallback=False)
+
+        self.timings: dict[str, float] = {}
 
     def _package_archives(self, sources_dir: Path, source_files: list[Path]) -> list[Path]:
         """
@@ -104,6 +116,39 @@ class Task(LazyLogging):
             if self.include_debug_packages or not package.name.startswith(debug_package_prefix)
         ]
 
+    def _pkgver_host(self, sources_dir: Path) -> bool:
+        """
+        update VCS package version by running makepkg on the host. Unlike dry run inside the chroot, makepkg will fail
+        if any of the package dependencies is not installed on the host, thus it is safe to call this method for any
+        package. Sources are fetched into the same directory, which is used by the build itself, so they will be
+        reused later
+
+        Args:
+            sources_dir(Path): path to where sources are
+
+        Returns:
+            bool: ``True`` in case if version has been updated and ``False`` otherwise
+        """
+        command = ["makepkg", "--nobuild", "--noprepare", "--nocheck"]
+        self.logger.info("using %s for %s", command, self.package.base)
+
+        with TemporaryDirectory(ignore_cleanup_errors=True) as build_dir:
+            try:
+                check_output(
+                    *command,
+                    exception=BuildError.from_process(self.package.base),
+                    cwd=sources_dir,
+                    logger=self.logger,
+                    user=self.uid,
+                    environment={"BUILDDIR": build_dir, "SRCDEST": str(sources_dir)},
+                )
+            except BuildError:
+                self.logger.warning("could not calculate version of %s on the host, fallback to chroot",
+                                    self.package.base)
+                return False
+
+        return True
+
     def build(self, sources_dir: Path, *, dry_run: bool = False, **kwargs: str | None) -> list[Path]:
         """
         run package build
@@ -122,8 +167,10 @@ class Task(LazyLogging):
                 "-r", self.repository_id.name,
                 "-a", self.repository_id.architecture,
                 "-c", str(self.devtools_configs),
-                "--",
             ]
+            if self.chroot is not None:
+                command.extend(self.chroot.snapshot_flags())
+            command.append("--")
 
         command.extend(["-r", str(self.paths.chroot)] + self.archbuild_flags)  # archbuild flags
         command.extend(["--", "-D", str(self.paths.archive)] + self.makechrootpkg_flags)  # makechrootpkg flags
@@ -169,7 +216,7 @@ class Task(LazyLogging):
         """
         last_commit_sha = Sources.load(sources_dir, self.package, patches, self.paths)
         if self.package.is_vcs:  # if package is VCS, then make sure to update PKGBUILD to the latest version
-            self.build(sources_dir, dry_run=True)
+            self.pkgver(sources_dir)
 
         if local_version is None:  # there is no local package or pkgrel increment is disabled
             return last_commit_sha
@@ -182,3 +229,20 @@ class Task(LazyLogging):
             patch.write(sources_dir / "PKGBUILD")
 
         return last_commit_sha
+
+    def pkgver(self, sources_dir: Path) -> None:
+        """
+        update VCS package version. If enabled by configuration, the version will be calculated on the host first,
+        otherwise (or if it failed) dry run inside the build chroot will be used. Time spent is stored in
+        :attr:`timings` under ``pkgver_host`` or ``pkgver_chroot`` key respectively
+
+        Args:
+            sources_dir(Path): path to where sources are
+        """
+        with MetricsTimer() as timer:
+            if self.vcs_host_pkgver and self._pkgver_host(sources_dir):
+                self.timings["pkgver_host"] = timer.elapsed
+                return
+
+            self.build(sources_dir, dry_run=True)
+            self.timings["pkgver_chroot"] = timer.elapsed
@@ -200,6 +200,10 @@ CONFIGURATION_SCHEMA: ConfigurationSchema = {
                     "empty": False,
                 },
             },
+            "chroot_snapshots": {
+                "type": "boolean",
+                "coerce": "boolean",
+            },
             "devtools_configs": {
                 "type": "path",
                 "coerce": "absolute_path",
@@ -290,6 +294,10 @@ CONFIGURATION_SCHEMA: ConfigurationSchema = {
                 "coerce": "integer",
                 "min": 0,
             },
+            "vcs_host_pkgver": {
+                "type": "boolean",
+                "coerce": "boolean",
+            },
             "workers": {
                 "type": "list",
                 "coerce": "list",
@@ -337,6 +345,11 @@ CONFIGURATION_SCHEMA: ConfigurationSchema = {
                 "type": "string",
                 "empty": False,
             },
+            "max_workers": {
+                "type": "integer",
+                "coerce": "integer",
+                "min": 1,
+            },
         },
     },
     "status": {
@@ -397,6 +410,11 @@ CONFIGURATION_SCHEMA: ConfigurationSchema = {
                     "min": 0,
                 },
             },
+            "compression_min_size": {
+                "type": "integer",
+                "coerce": "integer",
+                "min": 0,
+            },
             "cors_allow_headers": {
                 "type": "list",
                 "coerce": "list",
@@ -454,6 +472,11 @@ CONFIGURATION_SCHEMA: ConfigurationSchema = {
                 "min": 0,
                 "max": 65535,
             },
+            "response_buffer_size": {
+                "type": "integer",
+                "coerce": "integer",
+                "min": 0,
+            },
             "service_only": {
                 "type": "boolean",
                 "coerce": "boolean",
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from sqlite3 import Connection
+
+from ahriman.core.configuration import Configuration
+from ahriman.core.database.operations.logs_operations import LogsOperations
+
+
+__all__ = ["migrate_data", "steps"]
+
+
+steps = [
+    """
+    create table logs_chunks (
+        package_base text not null,
+        version text not null,
+        repository text not null,
+        process_id text not null,
+        line_offset integer not null,
+        lines integer not null,
+        created_first real not null,
+        created_last real not null,
+        content blob not null
+    )
+    """,
+    """
+    create index logs_chunks_package_base_version_repository
+    on logs_chunks (package_base, version, repository)
+    """,
+]
+
+
+def migrate_data(connection: Connection, configuration: Configuration) -> None:
+    """
+    perform data migration
+
+    Args:
+        connection(Connection): database connection
+        configuration(Configuration): configuration instance
+    """
+    del configuration
+
+    migrate_logs(connection)
+
+
+def migrate_logs(connection: Connection) -> None:
+    """
+    compress existing log records
+
+    Args:
+        connection(Connection): database connection
+    """
+    processes = connection.execute(
+        """
+        select distinct package_base, version, repository, process_id from logs
+        """).fetchall()
+
+    for process in processes:
+        LogsOperations.logs_compress(connection, process, LogsOperations.LOGS_CHUNK_SIZE, partial=True)
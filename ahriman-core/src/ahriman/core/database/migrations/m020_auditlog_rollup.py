@@ -0,0 +1,59 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+__all__ = ["steps"]
+
+
+steps = [
+    """
+    create index auditlog_repository_event_created
+    on auditlog (repository, event, created)
+    """,
+    """
+    create table auditlog_rollup (
+        created integer not null,
+        repository text not null,
+        event text not null,
+        object_id text not null,
+        count integer not null,
+        took_count integer not null,
+        took_sum real not null,
+        took_squares real not null,
+        took_min real,
+        took_max real,
+        unique (created, repository, event, object_id)
+    )
+    """,
+    """
+    create index auditlog_rollup_repository_event_created
+    on auditlog_rollup (repository, event, created)
+    """,
+    """
+    insert into auditlog_rollup
+    (created, repository, event, object_id, count, took_count, took_sum, took_squares, took_min, took_max)
+    select
+        (created / 86400) * 86400 as bucket, repository, event, object_id,
+        count(*), count(json_extract(data, '$.took')),
+        coalesce(sum(json_extract(data, '$.took')), 0),
+        coalesce(sum(json_extract(data, '$.took') * json_extract(data, '$.took')), 0),
+        min(json_extract(data, '$.took')), max(json_extract(data, '$.took'))
+    from auditlog
+    group by bucket, repository, event, object_id
+    """,
+]
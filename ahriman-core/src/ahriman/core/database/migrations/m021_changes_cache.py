@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from sqlite3 import Connection
+
+from ahriman.core.configuration import Configuration
+from ahriman.core.database.operations.changes_operations import ChangesOperations
+
+
+__all__ = ["migrate_data", "steps"]
+
+
+steps = [
+    """
+    alter table package_changes rename to package_changes_
+    """,
+    """
+    create table package_changes (
+        package_base text not null,
+        repository text not null,
+        last_commit_sha text not null,
+        head_commit_sha text,
+        changes blob,
+        pkgbuild blob,
+        unique (package_base, repository)
+    )
+    """,
+]
+
+
+def migrate_data(connection: Connection, configuration: Configuration) -> None:
+    """
+    perform data migration
+
+    Args:
+        connection(Connection): database connection
+        configuration(Configuration): configuration instance
+    """
+    del configuration
+
+    migrate_changes(connection)
+
+
+def migrate_changes(connection: Connection) -> None:
+    """
+    compress existing package changes
+
+    Args:
+        connection(Connection): database connection
+    """
+    for row in connection.execute("""select * from package_changes_""").fetchall():
+        connection.execute(
+            """
+            insert into package_changes
+            (package_base, repository, last_commit_sha, changes, pkgbuild)
+            values
+            (:package_base, :repository, :last_commit_sha, :changes, :pkgbuild)
+            """,
+            {
+                "package_base": row["package_base"],
+                "repository": row["repository"],
+                "last_commit_sha": row["last_commit_sha"],
+                "changes": ChangesOperations.changes_compress(row["changes"] or None),
+                "pkgbuild": ChangesOperations.changes_compress(row["pkgbuild"] or None),
+            })
+
+    connection.execute("""drop table package_changes_""")
@@ -17,9 +17,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import zlib
+
+from collections.abc import Iterable
 from sqlite3 import Connection
 
 from ahriman.core.database.operations.operations import Operations
+from ahriman.core.utils import partition
 from ahriman.models.changes import Changes
 from ahriman.models.repository_id import RepositoryId
 
@@ -27,8 +31,42 @@ from ahriman.models.repository_id import RepositoryId
 class ChangesOperations(Operations):
     """
     operations for source files changes
+
+    Changes are stored together with the commit range they have been calculated for, i.e. the last built commit and
+    the sources HEAD, thus they can be reused until the remote sources are updated. Both diff and PKGBUILD are stored
+    compressed.
     """
 
+    @staticmethod
+    def changes_compress(content: str | None) -> bytes | None:
+        """
+        compress text content
+
+        Args:
+            content(str | None): text to compress
+
+        Returns:
+            bytes | None: compressed content if any
+        """
+        if content is None:
+            return None
+        return zlib.compress(content.encode("utf8"))
+
+    @staticmethod
+    def changes_decompress(content: bytes | None) -> str | None:
+        """
+        decompress text content
+
+        Args:
+            content(bytes | None): compressed content
+
+        Returns:
+            str | None: decompressed text if any
+        """
+        if content is None:
+            return None
+        return zlib.decompress(content).decode("utf8") or None
+
     def changes_get(self, package_base: str, repository_id: RepositoryId | None = None) -> Changes:
         """
         get changes for the specific package base if available
@@ -45,10 +83,15 @@ class ChangesOperations(Operations):
         def run(connection: Connection) -> Changes:
             return next(
                 (
-                    Changes(row["last_commit_sha"], row["changes"] or None, row["pkgbuild"] or None)
+                    Changes(
+                        last_commit_sha=row["last_commit_sha"],
+                        changes=self.changes_decompress(row["changes"]),
+                        pkgbuild=self.changes_decompress(row["pkgbuild"]),
+                        head_commit_sha=row["head_commit_sha"],
+                    )
                     for row in connection.execute(
                         """
-                        select last_commit_sha, changes, pkgbuild from package_changes
+                        select last_commit_sha, head_commit_sha, changes, pkgbuild from package_changes
                         where package_base = :package_base and repository = :repository
                         """,
                         {
@@ -71,28 +114,53 @@ class ChangesOperations(Operations):
             changes(Changes): package changes (as in patch format)
             repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
         """
+        self.changes_insert_many([(package_base, changes)], repository_id)
+
+    def changes_insert_many(self, changes: Iterable[tuple[str, Changes]],
+                            repository_id: RepositoryId | None = None) -> None:
+        """
+        insert changes of multiple packages in single transaction. Changes without last commit hash set are removed
+
+        Args:
+            changes(Iterable[tuple[str, Changes]]): list of package bases and their changes (as in patch format)
+            repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
+        """
         repository_id = repository_id or self._repository_id
 
+        inserted, removed = partition(changes, lambda pair: pair[1].last_commit_sha is not None)
+
         def run(connection: Connection) -> None:
-            connection.execute(
+            connection.executemany(
                 """
                 insert into package_changes
-                (package_base, last_commit_sha, changes, pkgbuild, repository)
+                (package_base, last_commit_sha, head_commit_sha, changes, pkgbuild, repository)
                 values
-                (:package_base, :last_commit_sha, :changes, :pkgbuild, :repository)
+                (:package_base, :last_commit_sha, :head_commit_sha, :changes, :pkgbuild, :repository)
                 on conflict (package_base, repository) do update set
-                last_commit_sha = :last_commit_sha, changes = :changes, pkgbuild = coalesce(:pkgbuild, pkgbuild)
+                last_commit_sha = :last_commit_sha, head_commit_sha = :head_commit_sha, changes = :changes,
+                pkgbuild = coalesce(:pkgbuild, pkgbuild)
                 """,
-                {
-                    "package_base": package_base,
-                    "last_commit_sha": changes.last_commit_sha,
-                    "changes": changes.changes,
-                    "pkgbuild": changes.pkgbuild,
-                    "repository": repository_id.id,
-                })
+                [
+                    {
+                        "package_base": package_base,
+                        "last_commit_sha": package_changes.last_commit_sha,
+                        "head_commit_sha": package_changes.head_commit_sha,
+                        "changes": self.changes_compress(package_changes.changes),
+                        "pkgbuild": self.changes_compress(package_changes.pkgbuild),
+                        "repository": repository_id.id,
+                    }
+                    for package_base, package_changes in inserted
+                ])
+            connection.executemany(
+                """delete from package_changes where package_base = :package_base and repository = :repository""",
+                [
+                    {
+                        "package_base": package_base,
+                        "repository": repository_id.id,
+                    }
+                    for package_base, _ in removed
+                ])
 
-        if changes.last_commit_sha is None:
-            return self.changes_remove(package_base, repository_id)
         return self.with_connection(run, commit=True)
 
     def changes_remove(self, package_base: str | None, repository_id: RepositoryId | None = None) -> None:
@@ -17,6 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+from collections.abc import Iterable
 from sqlite3 import Connection
 
 from ahriman.core.database.operations.operations import Operations
@@ -71,10 +72,21 @@ class DependenciesOperations(Operations):
             dependencies(Dependencies): package dependencies
             repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
         """
+        self.dependencies_insert_many([(package_base, dependencies)], repository_id)
+
+    def dependencies_insert_many(self, dependencies: Iterable[tuple[str, Dependencies]],
+                                 repository_id: RepositoryId | None = None) -> None:
+        """
+        insert dependencies of multiple packages in single transaction
+
+        Args:
+            dependencies(Iterable[tuple[str, Dependencies]]): list of package bases and their dependencies
+            repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
+        """
         repository_id = repository_id or self._repository_id
 
         def run(connection: Connection) -> None:
-            connection.execute(
+            connection.executemany(
                 """
                 insert into package_dependencies
                 (package_base, repository, dependencies)
@@ -83,11 +95,14 @@ class DependenciesOperations(Operations):
                 on conflict (package_base, repository) do update set
                 dependencies = :dependencies
                 """,
-                {
-                    "package_base": package_base,
-                    "repository": repository_id.id,
-                    "dependencies": dependencies.paths,
-                })
+                [
+                    {
+                        "package_base": package_base,
+                        "repository": repository_id.id,
+                        "dependencies": package_dependencies.paths,
+                    }
+                    for package_base, package_dependencies in dependencies
+                ])
 
         return self.with_connection(run, commit=True)
 
@@ -21,12 +21,13 @@ from sqlite3 import Connection
 
 from ahriman.core.database.operations.operations import Operations
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.repository_id import RepositoryId
 
 
 class EventOperations(Operations):
     """
-    operations for audit log table
+    operations for audit log tables
     """
 
     def event_get(self, event: str | EventType | None = None, object_id: str | None = None,
@@ -78,6 +79,51 @@ class EventOperations(Operations):
 
         return self.with_connection(run)
 
+    def event_rollup_get(self, event: str | EventType | None = None, object_id: str | None = None,
+                         from_date: int | float | None = None, to_date: int | float | None = None,
+                         repository_id: RepositoryId | None = None) -> list[EventRollup]:
+        """
+        get list of events aggregated by time buckets with filters applied. Dates are compared with bucket start,
+        thus results are exact only if dates are aligned to the bucket boundaries
+
+        Args:
+            event(str | EventType | None, optional): filter by event type (Default value = None)
+            object_id(str | None, optional): filter by event object (Default value = None)
+            from_date(int | float | None, optional): minimal bucket start date, inclusive (Default value = None)
+            to_date(int | float | None, optional): maximal bucket start date, exclusive (Default value = None)
+            repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
+
+        Returns:
+            list[EventRollup]: list of aggregated audit log events
+        """
+        repository_id = repository_id or self._repository_id
+
+        def run(connection: Connection) -> list[EventRollup]:
+            return [
+                EventRollup.from_json(row)
+                for row in connection.execute(
+                    """
+                    select created, event, object_id, count, took_count, took_sum, took_squares, took_min, took_max
+                    from auditlog_rollup
+                    where (:event is null or event = :event)
+                      and (:object_id is null or object_id = :object_id)
+                      and (:from_date is null or created >= :from_date)
+                      and (:to_date is null or created < :to_date)
+                      and repository = :repository
+                    order by created asc
+                    """,
+                    {
+                        "event": event,
+                        "object_id": object_id,
+                        "repository": repository_id.id,
+                        "from_date": from_date,
+                        "to_date": to_date,
+                    }
+                )
+            ]
+
+        return self.with_connection(run)
+
     def event_insert(self, event: Event, repository_id: RepositoryId | None = None) -> None:
         """
         insert audit log event
@@ -104,5 +150,29 @@ class EventOperations(Operations):
                     "message": event.message,
                     "data": event.data,
                 })
+            # update aggregated view, which is used for statistics
+            took = event.get("took")
+            connection.execute(
+                """
+                insert into auditlog_rollup
+                (created, repository, event, object_id, count, took_count, took_sum, took_squares, took_min, took_max)
+                values
+                (:created, :repository, :event, :object_id, 1, :took is not null, coalesce(:took, 0),
+                coalesce(:took * :took, 0), :took, :took)
+                on conflict (created, repository, event, object_id) do update set
+                  count = count + 1,
+                  took_count = took_count + excluded.took_count,
+                  took_sum = took_sum + excluded.took_sum,
+                  took_squares = took_squares + excluded.took_squares,
+                  took_min = min(coalesce(took_min, excluded.took_min), coalesce(excluded.took_min, took_min)),
+                  took_max = max(coalesce(took_max, excluded.took_max), coalesce(excluded.took_max, took_max))
+                """,
+                {
+                    "created": EventRollup.bucket(event.created),
+                    "repository": repository_id.id,
+                    "event": event.event,
+                    "object_id": event.object_id,
+                    "took": took if isinstance(took, int | float) else None,
+                })
 
         return self.with_connection(run, commit=True)
@@ -17,18 +17,178 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import itertools
+import json
+import zlib
+
+from collections.abc import Iterator
+from pathlib import Path
 from sqlite3 import Connection
+from typing import Any, ClassVar
 
+from ahriman.core.configuration import Configuration
 from ahriman.core.database.operations.operations import Operations
 from ahriman.models.log_record import LogRecord
+from ahriman.models.log_record_id import LogRecordId
 from ahriman.models.repository_id import RepositoryId
 
 
 class LogsOperations(Operations):
     """
     logs operations
+
+    Log records are inserted into the ``logs`` table one by one. As soon as the process collects
+    :attr:`LOGS_CHUNK_SIZE` uncompressed records, they are moved to the ``logs_chunks`` table as single compressed
+    chunk, which also stores offset of the first line and amount of lines in it.
+
+    Attributes:
+        LOGS_CHUNK_SIZE(int): (class attribute) amount of log records in single compressed chunk
+        LOGS_COUNTERS_SIZE(int): (class attribute) maximal amount of processes for which amount of uncompressed
+            records is cached
     """
 
+    LOGS_CHUNK_SIZE: ClassVar[int] = 1000
+    LOGS_COUNTERS_SIZE: ClassVar[int] = 128
+
+    def __init__(self, path: Path, configuration: Configuration) -> None:
+        """
+        Args:
+            path(Path): path to the database file
+            configuration(Configuration): configuration instance
+        """
+        Operations.__init__(self, path, configuration)
+        # amount of uncompressed records for each process. It is only a hint, because records might be changed by
+        # other instances, but it is always corrected on compression. The least recently used processes are evicted
+        self._logs_uncompressed: dict[tuple[str, str, str, str], int] = {}
+
+    def _logs_counters_remove(self, repository: str, package_base: str | None = None,
+                              version: str | None = None) -> None:
+        """
+        remove cached amount of uncompressed records, so they will be counted again on the next insert
+
+        Args:
+            repository(str): repository identifier
+            package_base(str | None, optional): package base to remove counters. If not set, counters for all
+                packages will be removed (Default value = None)
+            version(str | None, optional): package version. If set it will remove only counters belonging to another
+                version (Default value = None)
+        """
+        self._logs_uncompressed = {
+            key: uncompressed
+            for key, uncompressed in self._logs_uncompressed.items()
+            if key[2] != repository
+            or (package_base is not None and key[0] != package_base)
+            or (version is not None and key[1] == version)
+        }
+
+    def _logs_counters_update(self, key: tuple[str, str, str, str], uncompressed: int) -> None:
+        """
+        update cached amount of uncompressed records for the process
+
+        Args:
+            key(tuple[str, str, str, str]): package base, version, repository and process identifier
+            uncompressed(int): amount of uncompressed records. If zero, the counter is removed, because there is
+                nothing to count anymore
+        """
+        self._logs_uncompressed.pop(key, None)  # move key to the end
+        if uncompressed > 0:
+            self._logs_uncompressed[key] = uncompressed
+
+        while len(self._logs_uncompressed) > self.LOGS_COUNTERS_SIZE:
+            self._logs_uncompressed.pop(next(iter(self._logs_uncompressed)))
+
+    @staticmethod
+    def logs_chunk_compress(records: list[tuple[float, str]]) -> bytes:
+        """
+        serialize and compress log records
+
+        Args:
+            records(list[tuple[float, str]]): list of log records creation time and message
+
+        Returns:
+            bytes: compressed chunk content
+        """
+        return zlib.compress(json.dumps(records).encode("utf8"))
+
+    @staticmethod
+    def logs_chunk_decompress(content: bytes) -> list[tuple[float, str]]:
+        """
+        decompress and deserialize log records
+
+        Args:
+            content(bytes): compressed chunk content
+
+        Returns:
+            list[tuple[float, str]]: list of log records creation time and message
+        """
+        return [(created, message) for created, message in json.loads(zlib.decompress(content))]
+
+    @staticmethod
+    def logs_compress(connection: Connection, parameters: dict[str, Any], chunk_size: int, *,
+                      partial: bool) -> int:
+        """
+        move uncompressed log records of the process into compressed chunks
+
+        Args:
+            connection(Connection): database connection
+            parameters(dict[str, Any]): process identifier, i.e. ``package_base``, ``version``, ``repository``
+                and ``process_id``
+            chunk_size(int): amount of records in single chunk
+            partial(bool): if set, the remaining records will be compressed into the last (smaller) chunk. Otherwise,
+                they will be kept uncompressed
+
+        Returns:
+            int: amount of records which are left uncompressed
+        """
+        rows = connection.execute(
+            """
+            select rowid, created, message from logs
+            where package_base = :package_base
+              and version = :version
+              and repository = :repository
+              and process_id = :process_id
+            order by created, rowid
+            """,
+            parameters).fetchall()
+        line_offset = connection.execute(
+            """
+            select coalesce(sum(lines), 0) as lines from logs_chunks
+            where package_base = :package_base
+              and version = :version
+              and repository = :repository
+              and process_id = :process_id
+            """,
+            parameters).fetchone()["lines"]
+
+        for chunk in itertools.batched(rows, chunk_size):
+            if len(chunk) < chunk_size and not partial:
+                return len(chunk)  # keep tail uncompressed
+
+            connection.execute(
+                """
+                insert into logs_chunks
+                (package_base, version, repository, process_id, line_offset, lines,
+                created_first, created_last, content)
+                values
+                (:package_base, :version, :repository, :process_id, :line_offset, :lines,
+                :created_first, :created_last, :content)
+                """,
+                parameters | {
+                    "line_offset": line_offset,
+                    "lines": len(chunk),
+                    "created_first": chunk[0]["created"],
+                    "created_last": chunk[-1]["created"],
+                    "content": LogsOperations.logs_chunk_compress([(row["created"], row["message"]) for row in chunk]),
+                })
+            connection.executemany(
+                """
+                delete from logs where rowid = :rowid
+                """,
+                chunk)
+            line_offset += len(chunk)
+
+        return 0
+
     def logs_get(self, package_base: str, version: str | None = None, process_id: str | None = None,
                  limit: int = -1, offset: int = 0, repository_id: RepositoryId | None = None) -> list[LogRecord]:
         """
@@ -45,33 +205,7 @@ class LogsOperations(Operations):
         Return:
             list[LogRecord]: sorted package log records
         """
-        repository_id = repository_id or self._repository_id
-
-        def run(connection: Connection) -> list[LogRecord]:
-            return [
-                LogRecord.from_json(package_base, row)
-                for row in connection.execute(
-                    """
-                    select created, message, version, process_id from (
-                        select * from logs
-                        where package_base = :package_base
-                          and repository = :repository
-                          and (:version is null or version = :version)
-                          and (:process_id is null or process_id = :process_id)
-                        order by created desc limit :limit offset :offset
-                    ) order by created asc
-                    """,
-                    {
-                        "package_base": package_base,
-                        "version": version,
-                        "process_id": process_id,
-                        "repository": repository_id.id,
-                        "limit": limit,
-                        "offset": offset,
-                    })
-            ]
-
-        return self.with_connection(run)
+        return list(self.logs_iterate(package_base, version, process_id, limit, offset, repository_id))
 
     def logs_insert(self, log_record: LogRecord, repository_id: RepositoryId | None = None) -> None:
         """
@@ -82,6 +216,13 @@ class LogsOperations(Operations):
             repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
         """
         repository_id = repository_id or self._repository_id
+        parameters = {
+            "package_base": log_record.log_record_id.package_base,
+            "version": log_record.log_record_id.version,
+            "repository": repository_id.id,
+            "process_id": log_record.log_record_id.process_id,
+        }
+        key = (parameters["package_base"], parameters["version"], parameters["repository"], parameters["process_id"])
 
         def run(connection: Connection) -> None:
             connection.execute(
@@ -91,14 +232,109 @@ class LogsOperations(Operations):
                 values
                 (:package_base, :version, :created, :message, :repository, :process_id)
                 """,
-                {
-                    "package_base": log_record.log_record_id.package_base,
-                    "repository": repository_id.id,
-                } | log_record.view()
+                parameters | log_record.view()
             )
 
+            if (uncompressed := self._logs_uncompressed.get(key)) is None:
+                # records are counted only once per process, later the counter is updated in place
+                uncompressed = connection.execute(
+                    """
+                    select count(*) as count from logs
+                    where package_base = :package_base
+                      and version = :version
+                      and repository = :repository
+                      and process_id = :process_id
+                    """,
+                    parameters).fetchone()["count"]
+            else:
+                uncompressed += 1
+
+            if uncompressed >= self.LOGS_CHUNK_SIZE:
+                uncompressed = self.logs_compress(connection, parameters, self.LOGS_CHUNK_SIZE, partial=False)
+            self._logs_counters_update(key, uncompressed)
+
         return self.with_connection(run, commit=True)
 
+    def logs_iterate(self, package_base: str, version: str | None = None, process_id: str | None = None,
+                     limit: int = -1, offset: int = 0,
+                     repository_id: RepositoryId | None = None) -> Iterator[LogRecord]:
+        """
+        iterate over logs for specified package base. Both compressed chunks and uncompressed records are treated as
+        segments, so pagination is performed by database, which selects only segments containing requested records.
+        Chunks are decompressed lazily one by one during iteration
+
+        Args:
+            package_base(str): package base to extract logs
+            version(str | None, optional): package version to filter (Default value = None)
+            process_id(str | None, optional): process identifier to filter (Default value = None)
+            limit(int, optional): limit records to the specified count, -1 means unlimited (Default value = -1)
+            offset(int, optional): records offset (Default value = 0)
+            repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
+
+        Yields:
+            LogRecord: package log records sorted by creation time
+        """
+        repository_id = repository_id or self._repository_id
+
+        def run(connection: Connection) -> list[dict[str, Any]]:
+            # rank is the amount of records in this and all newer segments, i.e. position of the oldest record
+            # of the segment counting from the newest one
+            return connection.execute(
+                """
+                with segments as (
+                  select rowid, 0 as source, version, process_id, line_offset as position, lines,
+                    created_last as created, null as message
+                  from logs_chunks
+                  where package_base = :package_base
+                    and repository = :repository
+                    and (:version is null or version = :version)
+                    and (:process_id is null or process_id = :process_id)
+                  union all
+                  select rowid, 1 as source, version, process_id, rowid as position, 1 as lines,
+                    created, message
+                  from logs
+                  where package_base = :package_base
+                    and repository = :repository
+                    and (:version is null or version = :version)
+                    and (:process_id is null or process_id = :process_id)
+                ),
+                ranked as (
+                  select *, sum(lines) over (
+                    order by created desc, source desc, position desc rows unbounded preceding
+                  ) as rank
+                  from segments
+                )
+                select ranked.source, ranked.version, ranked.process_id, ranked.lines, ranked.created,
+                  ranked.message, ranked.rank, logs_chunks.content
+                from ranked
+                left join logs_chunks on ranked.source = 0 and logs_chunks.rowid = ranked.rowid
+                where ranked.rank > :offset
+                  and (:limit < 0 or ranked.rank - ranked.lines < :offset + :limit)
+                order by ranked.created, ranked.source, ranked.position
+                """,
+                {
+                    "package_base": package_base,
+                    "version": version,
+                    "process_id": process_id,
+                    "repository": repository_id.id,
+                    "limit": limit,
+                    "offset": offset,
+                }).fetchall()
+
+        for segment in self.with_connection(run):
+            log_record_id = LogRecordId(package_base, segment["version"], segment["process_id"])
+            if segment["content"] is None:
+                yield LogRecord(log_record_id, segment["created"], segment["message"])
+                continue
+
+            # segment might be only partially included into the page, thus it is required to skip records
+            # outside of it. Rank of the record is calculated as segment rank minus its index
+            for index, (created, message) in enumerate(self.logs_chunk_decompress(segment["content"])):
+                rank = segment["rank"] - index
+                if rank <= offset or 0 <= limit < rank - offset:
+                    continue
+                yield LogRecord(log_record_id, created, message)
+
     def logs_remove(self, package_base: str, version: str | None, repository_id: RepositoryId | None = None) -> None:
         """
         remove log records for the specified package
@@ -110,6 +346,12 @@ class LogsOperations(Operations):
         """
         repository_id = repository_id or self._repository_id
 
+        parameters = {
+            "package_base": package_base,
+            "version": version,
+            "repository": repository_id.id,
+        }
+
         def run(connection: Connection) -> None:
             connection.execute(
                 """
@@ -118,14 +360,18 @@ class LogsOperations(Operations):
                   and repository = :repository
                   and (:version is null or version <> :version)
                 """,
-                {
-                    "package_base": package_base,
-                    "version": version,
-                    "repository": repository_id.id,
-                }
-            )
+                parameters)
+            connection.execute(
+                """
+                delete from logs_chunks
+                where package_base = :package_base
+                  and repository = :repository
+                  and (:version is null or version <> :version)
+                """,
+                parameters)
 
-        return self.with_connection(run, commit=True)
+        self.with_connection(run, commit=True)
+        self._logs_counters_remove(repository_id.id, package_base, version)
 
     def logs_rotate(self, keep_last_records: int, repository_id: RepositoryId | None = None) -> None:
         """
@@ -137,19 +383,49 @@ class LogsOperations(Operations):
         """
         repository_id = repository_id or self._repository_id
 
+        # processes and their records from both compressed and uncompressed storage
+        records = """
+            with records as (
+              select package_base, version, repository, process_id, created from logs
+              where repository = :repository
+              union all
+              select package_base, version, repository, process_id, created_last as created from logs_chunks
+              where repository = :repository
+            )
+        """
+        duplicates = """
+            select package_base, version, repository, process_id from records
+            where (package_base, version, repository, created) in (
+              select package_base, version, repository, max(created) from records
+              group by package_base, version, repository
+            )
+        """
+        older = """
+            select package_base, repository, process_id from (
+              select package_base, repository, process_id, row_number() over (partition by package_base order by max(created) desc) as rn
+              from records
+              group by package_base, repository, process_id
+            )
+            where rn > :offset
+        """
+
         def remove_duplicates(connection: Connection) -> None:
+            # the same process is kept in both tables, because it is always the one with the latest record
             connection.execute(
-                """
+                records + """
                 delete from logs
                 where repository = :repository
-                  and (package_base, version, repository, process_id) not in (
-                    select package_base, version, repository, process_id from logs
-                    where (package_base, version, repository, created) in (
-                      select package_base, version, repository, max(created) from logs
-                      where repository = :repository
-                      group by package_base, version, repository
-                    )
-                  )
+                  and (package_base, version, repository, process_id) not in (""" + duplicates + """)
+                """,
+                {
+                    "repository": repository_id.id,
+                }
+            )
+            connection.execute(
+                records + """
+                delete from logs_chunks
+                where repository = :repository
+                  and (package_base, version, repository, process_id) not in (""" + duplicates + """)
                 """,
                 {
                     "repository": repository_id.id,
@@ -157,18 +433,21 @@ class LogsOperations(Operations):
             )
 
         def remove_older(connection: Connection) -> None:
+            # removal from the first table doesn't change order of the processes which are kept
             connection.execute(
-                """
+                records + """
                 delete from logs
-                where (package_base, repository, process_id) in (
-                  select package_base, repository, process_id from (
-                    select package_base, repository, process_id, row_number() over (partition by package_base order by max(created) desc) as rn
-                    from logs
-                    where repository = :repository
-                    group by package_base, repository, process_id
-                  )
-                  where rn > :offset
-                )
+                where (package_base, repository, process_id) in (""" + older + """)
+                """,
+                {
+                    "offset": keep_last_records,
+                    "repository": repository_id.id,
+                }
+            )
+            connection.execute(
+                records + """
+                delete from logs_chunks
+                where (package_base, repository, process_id) in (""" + older + """)
                 """,
                 {
                     "offset": keep_last_records,
@@ -180,4 +459,6 @@ class LogsOperations(Operations):
             remove_duplicates(connection)
             remove_older(connection)
 
-        return self.with_connection(run, commit=True)
+        self.with_connection(run, commit=True)
+        # it is easier to count records of the remaining processes again, than to find out which ones were removed
+        self._logs_counters_remove(repository_id.id)
@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable
 from sqlite3 import Connection
 
 from ahriman.core.database.operations.operations import Operations
@@ -151,72 +151,73 @@ class PackageOperations(Operations):
             package_list)
 
     @staticmethod
-    def _packages_get_select_package_bases(connection: Connection, repository_id: RepositoryId) -> dict[str, Package]:
+    def _packages_get_select(connection: Connection, package_base: str | None, limit: int, offset: int,
+                             repository_id: RepositoryId) -> list[tuple[Package, BuildStatus]]:
         """
-        select package bases from the table
+        select package bases together with their statuses and packages in single query
 
         Args:
             connection(Connection): database connection
+            package_base(str | None): package base to select. If none set, all package bases will be selected
+            limit(int): limit package bases to the specified count, -1 means unlimited
+            offset(int): package bases offset
             repository_id(RepositoryId): repository unique identifier
 
         Returns:
-            dict[str, Package]: map of the package base to its descriptor (without packages themselves)
-        """
-        return {
-            row["package_base"]: Package(
-                base=row["package_base"],
-                version=row["version"],
-                remote=RemoteSource.from_json(row),
-                packages={},
-                packager=row["packager"] or None,
-            ) for row in connection.execute(
-                """select * from package_bases where repository = :repository""",
-                {"repository": repository_id.id}
-            )
-        }
-
-    @staticmethod
-    def _packages_get_select_packages(connection: Connection, packages: dict[str, Package],
-                                      repository_id: RepositoryId) -> dict[str, Package]:
-        """
-        select packages from the table
-
-        Args:
-            connection(Connection): database connection
-            packages(dict[str, Package]): packages descriptor map
-            repository_id(RepositoryId): repository unique identifier
-
-        Returns:
-            dict[str, Package]: map of the package base to its descriptor including individual packages
+            list[tuple[Package, BuildStatus]]: list of package properties and their statuses
         """
+        packages: dict[str, tuple[Package, BuildStatus]] = {}
+        # columns are listed explicitly, because package base and repository columns are present in multiple tables,
+        # but only ones from package_bases table are guaranteed to be not null
         for row in connection.execute(
-                """select * from packages where repository = :repository""",
-                {"repository": repository_id.id}
+                """
+                select package_bases.package_base, package_bases.version, package_bases.branch,
+                  package_bases.git_url, package_bases.path, package_bases.web_url, package_bases.source,
+                  package_bases.packager, package_bases.repository,
+                  package_statuses.status, package_statuses.last_updated, package_statuses.is_held,
+                  packages.package, packages.architecture, packages.archive_size, packages.build_date,
+                  packages.depends, packages.description, packages.filename, packages."groups",
+                  packages.installed_size, packages.licenses, packages.provides, packages.url,
+                  packages.make_depends, packages.opt_depends, packages.check_depends
+                from (
+                  select * from package_bases
+                  where (:package_base is null or package_base = :package_base)
+                    and repository = :repository
+                  order by package_base limit :limit offset :offset
+                ) as package_bases
+                left join package_statuses
+                  on package_statuses.package_base = package_bases.package_base
+                    and package_statuses.repository = package_bases.repository
+                left join packages
+                  on packages.package_base = package_bases.package_base
+                    and packages.repository = package_bases.repository
+                order by package_bases.package_base
+                """,
+                {
+                    "package_base": package_base,
+                    "limit": limit,
+                    "offset": offset,
+                    "repository": repository_id.id,
+                }
         ):
             if row["package_base"] not in packages:
-                continue  # normally must never happen though
-            packages[row["package_base"]].packages[row["package"]] = PackageDescription.from_json(row)
-        return packages
-
-    @staticmethod
-    def _packages_get_select_statuses(connection: Connection, repository_id: RepositoryId) -> dict[str, BuildStatus]:
-        """
-        select package build statuses from the table
-
-        Args:
-            connection(Connection): database connection
-            repository_id(RepositoryId): repository unique identifier
-
-        Returns:
-            dict[str, BuildStatus]: map of the package base to its status
-        """
-        return {
-            row["package_base"]: BuildStatus(row["status"], row["last_updated"], is_held=bool(row["is_held"]))
-            for row in connection.execute(
-                """select * from package_statuses where repository = :repository""",
-                {"repository": repository_id.id}
-            )
-        }
+                package = Package(
+                    base=row["package_base"],
+                    version=row["version"],
+                    remote=RemoteSource.from_json(row),
+                    packages={},
+                    packager=row["packager"] or None,
+                )
+                status = BuildStatus()
+                if row["status"] is not None:  # status might be missing, e.g. for just added packages
+                    status = BuildStatus(row["status"], row["last_updated"], is_held=bool(row["is_held"]))
+                packages[row["package_base"]] = package, status
+
+            if row["package"] is not None:  # package base without packages
+                package, _ = packages[row["package_base"]]
+                package.packages[row["package"]] = PackageDescription.from_json(row)
+
+        return list(packages.values())
 
     def package_hold_update(self, package_base: str, repository_id: RepositoryId | None = None, *,
                             enabled: bool) -> None:
@@ -266,35 +267,46 @@ class PackageOperations(Operations):
             package(Package): package properties
             repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
         """
+        self.package_update_many([package], repository_id)
+
+    def package_update_many(self, packages: Iterable[Package], repository_id: RepositoryId | None = None) -> None:
+        """
+        update multiple packages in single transaction
+
+        Args:
+            packages(Iterable[Package]): list of package properties
+            repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
+        """
         repository_id = repository_id or self._repository_id
 
         def run(connection: Connection) -> None:
-            self._package_update_insert_base(connection, package, repository_id)
-            self._package_update_insert_packages(connection, package, repository_id)
-            self._package_remove_packages(connection, package.base, package.packages.keys(), repository_id)
+            for package in packages:
+                self._package_update_insert_base(connection, package, repository_id)
+                self._package_update_insert_packages(connection, package, repository_id)
+                self._package_remove_packages(connection, package.base, package.packages.keys(), repository_id)
 
         return self.with_connection(run, commit=True)
 
-    def packages_get(self, repository_id: RepositoryId | None = None) -> list[tuple[Package, BuildStatus]]:
+    def packages_get(self, package_base: str | None = None, limit: int = -1, offset: int = 0,
+                     repository_id: RepositoryId | None = None) -> list[tuple[Package, BuildStatus]]:
         """
         get package list and their build statuses from database
 
         Args:
+            package_base(str | None, optional): package base to search. If none set, all package bases will be
+                returned (Default value = None)
+            limit(int, optional): limit package bases to the specified count, -1 means unlimited
+                (Default value = -1)
+            offset(int, optional): package bases offset (Default value = 0)
             repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
 
         Return:
-            list[tuple[Package, BuildStatus]]: list of package properties and their statuses
+            list[tuple[Package, BuildStatus]]: list of package properties and their statuses ordered by package base
         """
         repository_id = repository_id or self._repository_id
 
-        def run(connection: Connection) -> Iterator[tuple[Package, BuildStatus]]:
-            packages = self._packages_get_select_package_bases(connection, repository_id)
-            statuses = self._packages_get_select_statuses(connection, repository_id)
-            per_package_base = self._packages_get_select_packages(connection, packages, repository_id)
-            for package_base, package in per_package_base.items():
-                yield package, statuses.get(package_base, BuildStatus())
-
-        return self.with_connection(lambda connection: list(run(connection)))
+        return self.with_connection(
+            lambda connection: self._packages_get_select(connection, package_base, limit, offset, repository_id))
 
     def status_update(self, package_base: str, status: BuildStatus, repository_id: RepositoryId | None = None) -> None:
         """
@@ -305,10 +317,21 @@ class PackageOperations(Operations):
             status(BuildStatus): new build status
             repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
         """
+        self.status_update_many([(package_base, status)], repository_id)
+
+    def status_update_many(self, statuses: Iterable[tuple[str, BuildStatus]],
+                           repository_id: RepositoryId | None = None) -> None:
+        """
+        insert statuses of multiple package bases in single transaction
+
+        Args:
+            statuses(Iterable[tuple[str, BuildStatus]]): list of package bases and their new build statuses
+            repository_id(RepositoryId, optional): repository unique identifier override (Default value = None)
+        """
         repository_id = repository_id or self._repository_id
 
         def run(connection: Connection) -> None:
-            connection.execute(
+            connection.executemany(
                 """
                 insert into package_statuses
                 (package_base, status, last_updated, repository)
@@ -318,11 +341,14 @@ class PackageOperations(Operations):
                 status = :status, last_updated = :last_updated
                 where status != :status
                 """,
-                {
-                    "package_base": package_base,
-                    "status": status.status.value,
-                    "last_updated": status.timestamp,
-                    "repository": repository_id.id,
-                })
+                [
+                    {
+                        "package_base": package_base,
+                        "status": status.status.value,
+                        "last_updated": status.timestamp,
+                        "repository": repository_id.id,
+                    }
+                    for package_base, status in statuses
+                ])
 
         return self.with_connection(run, commit=True)
@@ -17,7 +17,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
-import json
 import sqlite3
 
 from pathlib import Path
@@ -35,6 +34,7 @@ from ahriman.core.database.operations import (
     PackageOperations,
     PatchOperations,
 )
+from ahriman.core.json_serializer import json_dumps, json_loads
 from ahriman.models.repository_id import RepositoryId
 
 
@@ -98,9 +98,9 @@ class SQLite(
         perform database migrations
         """
         # custom types support
-        sqlite3.register_adapter(dict, json.dumps)
-        sqlite3.register_adapter(list, json.dumps)
-        sqlite3.register_converter("json", json.loads)
+        sqlite3.register_adapter(dict, lambda value: json_dumps(value).decode("utf8"))
+        sqlite3.register_adapter(list, lambda value: json_dumps(value).decode("utf8"))
+        sqlite3.register_converter("json", json_loads)
 
         if not self._configuration.getboolean("settings", "apply_migrations", fallback=True):
             return
@@ -18,6 +18,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 from ahriman.core.formatters.string_printer import StringPrinter
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.property import Property
 from ahriman.models.series_statistics import SeriesStatistics
 
@@ -27,17 +28,18 @@ class EventStatsPrinter(StringPrinter):
     print event statistics
 
     Attributes:
-        statistics(SeriesStatistics): statistics object
+        statistics(SeriesStatistics | EventRollup): statistics object
     """
 
-    def __init__(self, event_type: str, events: list[float | int]) -> None:
+    def __init__(self, event_type: str, events: list[float | int] | EventRollup) -> None:
         """
         Args:
             event_type(str): event type used for this statistics
-            events(list[float | int]): event values to build statistics
+            events(list[float | int] | EventRollup): event values to build statistics or already aggregated events,
+                in which case durations statistics is used
         """
         StringPrinter.__init__(self, event_type)
-        self.statistics = SeriesStatistics(events)
+        self.statistics = events if isinstance(events, EventRollup) else SeriesStatistics(events)
 
     def properties(self) -> list[Property]:
         """
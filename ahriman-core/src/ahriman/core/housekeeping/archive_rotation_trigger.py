@@ -87,13 +87,8 @@ class ArchiveRotationTrigger(Trigger):
         if self.keep_built_packages == 0:
             return
 
-        to_remove = repository.package_archives(package.base)
-
-        for single in to_remove[:-self.keep_built_packages]:
-            self.logger.info("removing version %s of package %s", single.version, single.base)
-            for archive in single.packages.values():
-                for path in self.paths.archive_for(single.base).glob(f"{archive.filename}*"):
-                    path.unlink()
+        index = repository.package_archives_index(package.base)
+        index.rotate(self.repository_id.architecture, self.keep_built_packages)
 
     def on_result(self, result: Result, packages: list[Package]) -> None:
         """
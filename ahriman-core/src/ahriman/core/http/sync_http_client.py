@@ -27,6 +27,7 @@ from urllib3.util.retry import Retry
 
 from ahriman import __version__
 from ahriman.core.configuration import Configuration
+from ahriman.core.json_serializer import json_dumps
 from ahriman.core.log import LazyLogging
 
 
@@ -189,6 +190,10 @@ class SyncHttpClient(LazyLogging):
 
         if additional_headers := self.headers():
             headers = additional_headers | (headers or {})
+        if json is not None:  # serialize payload here, because requests library uses the slow standard encoder
+            data = json_dumps(json)
+            headers = (headers or {}) | {"Content-Type": "application/json"}
+            json = None
 
         try:
             response = session.request(method, url, params=params, data=data, headers=headers, files=files, json=json,
@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+import json
+
+from dataclasses import is_dataclass
+from typing import Any
+
+from ahriman.core.module_loader import optional_module
+from ahriman.core.utils import dataclass_view
+
+
+__all__ = ["json_dumps", "json_loads"]
+
+
+orjson = optional_module("orjson")
+
+
+def _default(value: Any) -> Any:
+    """
+    convert objects which are not supported by JSON encoder natively
+
+    Args:
+        value(Any): object to convert
+
+    Returns:
+        Any: JSON-friendly representation of the object
+
+    Raises:
+        TypeError: if object cannot be serialized
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return dataclass_view(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_encoder = json.JSONEncoder(default=_default, separators=(",", ":"))
+
+
+def json_dumps(value: Any) -> bytes:
+    """
+    serialize object to compact JSON. If ``orjson`` library is available, it will be used as encoder, otherwise
+    standard :mod:`json` module is used. Dataclasses (e.g. models) are not serialized natively, because ``None``
+    fields must be removed. Instead, they are converted by :func:`ahriman.core.utils.dataclass_view()` first, i.e.
+    there is no difference in performance between passing model and its view. Note, however, that models with custom
+    ``view()`` method must be converted by caller
+
+    Args:
+        value(Any): object to serialize
+
+    Returns:
+        bytes: serialized object
+
+    Raises:
+        TypeError: if object cannot be serialized
+
+    Examples:
+        The function accepts either plain JSON objects or models, e.g.::
+
+            >>> json_dumps({"status": "success"})
+            >>> json_dumps(package)  # same as json_dumps(package.view())
+    """
+    if orjson is not None:
+        try:
+            # dataclasses are passed to the default function, which removes empty fields
+            return orjson.dumps(value, default=_default,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS)
+        except orjson.JSONEncodeError:
+            pass  # fallback to the standard library, e.g. strings with surrogates or integers out of range
+    return _encoder.encode(value).encode("utf8")
+
+
+def json_loads(content: bytes | str) -> Any:
+    """
+    deserialize JSON document
+
+    Args:
+        content(bytes | str): JSON document
+
+    Returns:
+        Any: deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
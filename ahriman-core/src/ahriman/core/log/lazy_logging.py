@@ -21,7 +21,6 @@ import contextlib
 import logging
 
 from collections.abc import Iterator
-from functools import cached_property
 from typing import Any
 
 from ahriman.core.log.log_context import LogContext
@@ -30,13 +29,17 @@ from ahriman.models.log_record_id import LogRecordId
 
 class LazyLogging:
     """
-    wrapper for the logger library inspired by scala lazy logging module
+    wrapper for the logger library inspired by scala lazy logging module. The class defines empty slots, so it can be
+    used as base class for slotted classes (e.g. models)
     """
 
-    @cached_property
+    __slots__ = ()
+
+    @property
     def logger(self) -> logging.Logger:
         """
-        get class logger instance
+        get class logger instance. Loggers are cached by :func:`logging.getLogger()`, thus it is not required to keep
+        it as instance attribute
 
         Returns:
             logging.Logger: class logger instance
@@ -21,6 +21,7 @@ import inspect
 
 from collections.abc import Iterator
 from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
 from pkgutil import ModuleInfo, walk_packages
 from types import ModuleType
@@ -49,13 +50,38 @@ def _modules(module_root: Path, prefix: str) -> Iterator[ModuleInfo]:
             yield module_info
 
 
-def implementations(root_module: ModuleType, base_class: type[T]) -> Iterator[type[T]]:
+def _module_contains(module_name: str, hint: str) -> bool:
+    """
+    check if module contains string without importing it
+
+    Args:
+        module_name(str): fully qualified module name
+        hint(str): string to lookup. Since string literals are stored as is in both source and compiled files, the
+            string is looked up without quotes
+
+    Returns:
+        bool: ``True`` in case if module contains the string or it is impossible to check and ``False`` otherwise
+    """
+    spec = find_spec(module_name)
+    if spec is None or spec.origin is None:
+        return True
+
+    try:
+        return hint.encode("utf8") in Path(spec.origin).read_bytes()
+    except OSError:
+        return True
+
+
+def implementations(root_module: ModuleType, base_class: type[T], *, hint: str | None = None) -> Iterator[type[T]]:
     """
     extract implementations of the ``base_class`` from the module
 
     Args:
         root_module(ModuleType): root module
         base_class(type[T]): base class type
+        hint(str | None, optional): if set, only modules which contain this string will be imported. Note, however,
+            that modules are filtered by their content, thus the result might contain unrelated implementations
+            (Default value = None)
 
     Yields:
         type[T]: found implementations
@@ -69,6 +95,8 @@ def implementations(root_module: ModuleType, base_class: type[T]) -> Iterator[ty
 
     for module_root in root_module.__path__:
         for module_info in _modules(Path(module_root), prefix):
+            if hint is not None and not _module_contains(module_info.name, hint):
+                continue
             module = import_module(module_info.name)
 
             for _, attribute in inspect.getmembers(module, is_base_class):
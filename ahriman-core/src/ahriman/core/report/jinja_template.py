@@ -18,11 +18,15 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 import datetime
+import hashlib
 import jinja2
+import json
 
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any, ClassVar
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.sign.gpg import GPG
@@ -62,6 +66,10 @@ class JinjaTemplate:
         * repository - repository name, string, required
         * rss_url - optional link to the RSS feed, string, optional
 
+    Jinja environments are shared between all instances with the same templates search path, thus templates are
+    compiled only once per process. Reports written by :func:`write_report()` are rendered and written only if their
+    content has been changed since the last write.
+
     Attributes:
         default_pgp_key(str | None): default PGP key
         homepage(str | None): homepage link if any (for footer)
@@ -72,6 +80,10 @@ class JinjaTemplate:
         templates(list[Path]): list of directories with templates
     """
 
+    _environments: ClassVar[dict[tuple[Path, ...], jinja2.Environment]] = {}
+    _environments_lock: ClassVar[Lock] = Lock()
+    _reports: ClassVar[dict[Path, tuple[str, jinja2.Template]]] = {}
+
     def __init__(self, repository_id: RepositoryId, configuration: Configuration, section: str) -> None:
         """
         Args:
@@ -88,6 +100,27 @@ class JinjaTemplate:
         self.rss_url = configuration.get(section, "rss_url", fallback=None)
         self.sign_targets, self.default_pgp_key = GPG.sign_options(configuration)
 
+    @classmethod
+    def environment(cls, templates: list[Path]) -> jinja2.Environment:
+        """
+        get jinja environment for the specified templates search path. The environment is created only once, so
+        compiled templates are cached for the life of the process
+
+        Args:
+            templates(list[Path]): list of directories with templates
+
+        Returns:
+            jinja2.Environment: jinja environment instance
+        """
+        key = tuple(templates)
+        with cls._environments_lock:
+            if (environment := cls._environments.get(key)) is None:
+                # idea comes from https://stackoverflow.com/a/38642558
+                loader = jinja2.FileSystemLoader(searchpath=templates)
+                environment = jinja2.Environment(trim_blocks=True, lstrip_blocks=True, autoescape=True, loader=loader)
+                cls._environments[key] = environment
+        return environment
+
     @staticmethod
     def format_datetime(timestamp: datetime.datetime | float | int | None) -> str:
         """
@@ -115,24 +148,34 @@ class JinjaTemplate:
         comparator: Callable[[dict[str, str]], Comparable] = lambda item: item["filename"]
         return sorted(content, key=comparator)
 
-    def make_html(self, result: Result, template_name: Path | str) -> str:
+    @staticmethod
+    def write(path: Path, text: str) -> None:
         """
-        generate report for the specified packages
+        write text to the file atomically, so readers will never see partially written file
 
         Args:
-            result(Result): build result
-            template_name(Path | str): name of the template or path to it (legacy configuration)
+            path(Path): path to the output file
+            text(str): file content
         """
-        templates = self.templates[:]
-        if isinstance(template_name, Path):
-            templates.append(template_name.parent)
-            template_name = template_name.name
+        with NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as output_file:
+            temporary_path = Path(output_file.name)
+        try:
+            temporary_path.write_text(text, encoding="utf8")
+            temporary_path.chmod(0o644)  # temporary files are created with owner only permissions
+            temporary_path.replace(path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
 
-        # idea comes from https://stackoverflow.com/a/38642558
-        loader = jinja2.FileSystemLoader(searchpath=templates)
-        environment = jinja2.Environment(trim_blocks=True, lstrip_blocks=True, autoescape=True, loader=loader)
-        template = environment.get_template(template_name)
+    def make_context(self, result: Result) -> dict[str, Any]:
+        """
+        generate template variables for the specified packages except for generation time
+
+        Args:
+            result(Result): build result
 
+        Returns:
+            dict[str, Any]: template variables
+        """
         content = [
             {
                 "architecture": properties.architecture or "",
@@ -151,14 +194,65 @@ class JinjaTemplate:
             } for base in result.success for package, properties in base.packages.items()
         ]
 
-        return template.render(
-            homepage=self.homepage,
-            last_update=self.format_datetime(utcnow()),
-            link_path=self.link_path,
-            has_package_signed=SignSettings.Packages in self.sign_targets,
-            has_repo_signed=SignSettings.Repository in self.sign_targets,
-            packages=self.sort_content(content),
-            pgp_key=self.default_pgp_key,
-            repository=self.name,
-            rss_url=self.rss_url,
-        )
+        return {
+            "homepage": self.homepage,
+            "link_path": self.link_path,
+            "has_package_signed": SignSettings.Packages in self.sign_targets,
+            "has_repo_signed": SignSettings.Repository in self.sign_targets,
+            "packages": self.sort_content(content),
+            "pgp_key": self.default_pgp_key,
+            "repository": self.name,
+            "rss_url": self.rss_url,
+        }
+
+    def make_html(self, result: Result, template_name: Path | str) -> str:
+        """
+        generate report for the specified packages
+
+        Args:
+            result(Result): build result
+            template_name(Path | str): name of the template or path to it (legacy configuration)
+
+        Returns:
+            str: rendered template
+        """
+        template = self.template_get(template_name)
+        return template.render(last_update=self.format_datetime(utcnow()), **self.make_context(result))
+
+    def template_get(self, template_name: Path | str) -> jinja2.Template:
+        """
+        load template by its name
+
+        Args:
+            template_name(Path | str): name of the template or path to it (legacy configuration)
+
+        Returns:
+            jinja2.Template: compiled template
+        """
+        templates = self.templates[:]
+        if isinstance(template_name, Path):
+            templates.append(template_name.parent)
+            template_name = template_name.name
+
+        return self.environment(templates).get_template(template_name)
+
+    def write_report(self, result: Result, template_name: Path | str, path: Path) -> None:
+        """
+        generate report for the specified packages and write it to the file. The report will be rendered only if
+        either template variables or template itself have been changed since the last write
+
+        Args:
+            result(Result): build result
+            template_name(Path | str): name of the template or path to it (legacy configuration)
+            path(Path): path to the output file
+        """
+        # jinja environment returns the same template object unless the template has been changed
+        template = self.template_get(template_name)
+        context = self.make_context(result)
+        digest = hashlib.sha256(json.dumps(context, sort_keys=True, default=str).encode("utf8")).hexdigest()
+
+        if path.is_file() and self._reports.get(path) == (digest, template):
+            return  # nothing has been changed since the last write
+
+        self.write(path, template.render(last_update=self.format_datetime(utcnow()), **context))
+        self._reports[path] = (digest, template)
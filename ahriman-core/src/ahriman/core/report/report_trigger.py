@@ -30,6 +30,7 @@ class ReportTrigger(Trigger):
     report trigger
 
     Attributes:
+        reports(dict[str, Report]): loaded report generators for each target
         targets(list[str]): report target list
     """
 
@@ -354,6 +355,7 @@ class ReportTrigger(Trigger):
         """
         Trigger.__init__(self, repository_id, configuration)
         self.targets = self.configuration_sections(configuration)
+        self.reports: dict[str, Report] = {}
 
     @classmethod
     def configuration_sections(cls, configuration: Configuration) -> list[str]:
@@ -377,5 +379,6 @@ class ReportTrigger(Trigger):
             packages(list[Package]): list of all available packages
         """
         for target in self.targets:
-            runner = Report.load(self.repository_id, self.configuration, target)
+            if (runner := self.reports.get(target)) is None:
+                runner = self.reports[target] = Report.load(self.repository_id, self.configuration, target)
             runner.run(result, packages)
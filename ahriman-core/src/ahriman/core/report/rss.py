@@ -124,6 +124,4 @@ class RSS(Report, JinjaTemplate):
             packages(list[Package]): list of packages to generate report
             result(Result): build result
         """
-        result = self.content(packages)
-        rss = self.make_html(result, self.template)
-        self.report_path.write_text(rss, encoding="utf8")
+        self.write_report(self.content(packages), self.template, self.report_path)
@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+import json
+
+from collections.abc import Iterable
+from functools import cmp_to_key
+from pathlib import Path
+from pyalpm import vercmp  # type: ignore[import-not-found]
+from typing import Any, ClassVar
+
+from ahriman.core.log import LazyLogging
+from ahriman.core.utils import filelock
+from ahriman.models.package import Package
+
+
+class ArchiveIndex(LazyLogging):
+    """
+    index of the archived packages for the single package base. The index is stored next to the archives and allows
+    to query known versions without reading package archives
+
+    Attributes:
+        FILENAME(str): (class attribute) name of the index file
+        directory(Path): path to archive directory of the package base
+        path(Path): path to the index file
+    """
+
+    FILENAME: ClassVar[str] = ".index.json"
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Args:
+            directory(Path): path to archive directory of the package base
+        """
+        self.directory = directory
+        self.path = directory / self.FILENAME
+
+    @property
+    def exists(self) -> bool:
+        """
+        check if index file has been already created
+
+        Returns:
+            bool: ``True`` in case if index file exists and ``False`` otherwise
+        """
+        return self.path.is_file()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """
+        read index from the file. This method must be called under lock
+
+        Returns:
+            dict[str, dict[str, Any]]: map of archive filename to its properties
+        """
+        if not self.exists:
+            return {}
+        index: dict[str, dict[str, Any]] = json.loads(self.path.read_text(encoding="utf8"))
+        return index
+
+    def _write(self, index: dict[str, dict[str, Any]]) -> None:
+        """
+        write index to the file. This method must be called under lock
+
+        Args:
+            index(dict[str, dict[str, Any]]): map of archive filename to its properties
+        """
+        self.path.write_text(json.dumps(index, sort_keys=True), encoding="utf8")
+
+    def add(self, packages: Iterable[Package]) -> None:
+        """
+        append packages to the index
+
+        Args:
+            packages(Iterable[Package]): list of archived packages
+        """
+        with filelock(self.path):
+            index = self._read()
+            for package in packages:
+                for description in package.packages.values():
+                    if description.filename is None:
+                        continue
+                    index[description.filename] = {
+                        "architecture": description.architecture,
+                        "version": package.version,
+                    }
+            self._write(index)
+
+    def remove(self, filenames: Iterable[str]) -> None:
+        """
+        remove archives from the index
+
+        Args:
+            filenames(Iterable[str]): list of archive filenames to remove
+        """
+        with filelock(self.path):
+            index = self._read()
+            for filename in filenames:
+                index.pop(filename, None)
+            self._write(index)
+
+    def rotate(self, architecture: str, keep_built_packages: int) -> list[Path]:
+        """
+        remove older versions of the package from the archive, keeping only specified amount of the latest ones
+
+        Args:
+            architecture(str): repository architecture
+            keep_built_packages(int): number of the last versions to keep
+
+        Returns:
+            list[Path]: list of removed files
+        """
+        removed: list[Path] = []
+        if keep_built_packages <= 0:
+            return removed
+
+        versions = self.versions(architecture)
+        for version in list(versions)[:-keep_built_packages]:
+            self.logger.info("removing version %s from %s", version, self.directory)
+            for filename in versions[version]:
+                for path in self.directory.glob(f"{filename}*"):
+                    path.unlink(missing_ok=True)
+                    removed.append(path)
+
+            self.remove(versions[version])
+
+        return removed
+
+    def versions(self, architecture: str) -> dict[str, list[str]]:
+        """
+        get known versions, which support the specified architecture
+
+        Args:
+            architecture(str): repository architecture
+
+        Returns:
+            dict[str, list[str]]: map of version to archive filenames belonging to this version, sorted by version by
+            ascension
+        """
+        if not self.exists:
+            return {}
+
+        with filelock(self.path):
+            index = self._read()
+
+        versions: dict[str, list[str]] = {}
+        unsupported: set[str] = set()
+        for filename, properties in index.items():
+            version = properties["version"]
+            versions.setdefault(version, []).append(filename)
+            if properties["architecture"] not in ("any", architecture):
+                unsupported.add(version)
+
+        return {
+            version: sorted(versions[version])
+            for version in sorted(versions.keys() - unsupported, key=cmp_to_key(vercmp))
+        }
@@ -21,6 +21,7 @@ import shutil
 
 from pathlib import Path
 
+from ahriman.core.repository.archive_index import ArchiveIndex
 from ahriman.core.repository.repository_properties import RepositoryProperties
 
 
@@ -29,6 +30,25 @@ class Cleaner(RepositoryProperties):
     trait to clean common repository objects
     """
 
+    def clear_archives(self, keep_built_packages: int) -> None:
+        """
+        remove older versions of all packages from archive
+
+        Args:
+            keep_built_packages(int): number of the last versions to keep
+        """
+        self.logger.info("rotate packages archive")
+        if keep_built_packages <= 0:
+            return  # rotation is disabled
+
+        root = self.paths.archive / "packages"
+        if not root.is_dir():
+            return
+
+        for archive in filter(lambda path: path.is_dir(), root.glob("*/*")):
+            index = self.package_archives_index(archive.name)
+            index.rotate(self.repository_id.architecture, keep_built_packages)
+
     def clear_cache(self) -> None:
         """
         clear cache directory
@@ -68,6 +88,21 @@ class Cleaner(RepositoryProperties):
         self.logger.info("clear build queue")
         self.database.build_queue_clear(None)
 
+    def package_archives_index(self, package_base: str) -> ArchiveIndex:
+        """
+        get index of the archived packages for the package base
+
+        Args:
+            package_base(str): package base
+
+        Returns:
+            ArchiveIndex: archive index instance
+
+        Raises:
+            NotImplementedError: not implemented method
+        """
+        raise NotImplementedError
+
     def packages_built(self) -> list[Path]:
         """
         get list of files in built packages directory
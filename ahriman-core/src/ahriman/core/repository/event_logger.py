@@ -20,6 +20,7 @@
 import contextlib
 
 from collections.abc import Iterator
+from typing import Any
 
 from ahriman.core.status import Client
 from ahriman.models.event import Event, EventType
@@ -55,7 +56,7 @@ class EventLogger:
 
     @contextlib.contextmanager
     def in_event(self, package_base: str, event: EventType, message: str | None = None,
-                 failure: EventType | None = None) -> Iterator[None]:
+                 failure: EventType | None = None) -> Iterator[dict[str, Any]]:
         """
         perform action in package context and log event with time elapsed
 
@@ -65,6 +66,10 @@ class EventLogger:
             message(str | None, optional): optional message describing the action (Default value = None)
             failure(EventType | None, optional): event type to be logged on exception (Default value = None)
 
+        Yields:
+            dict[str, Any]: additional event metadata, which can be updated by the action and will be added to the
+            successful event
+
         Examples:
             This method must be used to perform action in context with time measurement::
 
@@ -72,12 +77,16 @@ class EventLogger:
                 >>>     do_something()
 
             Additional parameter ``failure`` can be set in order to emit an event on exception occurred. If none set
-            (default), then no event will be recorded on exception
+            (default), then no event will be recorded on exception. Metadata can be extended from the action itself::
+
+                >>> with self.in_event(package_base, EventType.PackageUpdated) as metadata:
+                >>>     metadata["key"] = do_something()
         """
+        metadata: dict[str, Any] = {}
         with MetricsTimer() as timer:
             try:
-                yield
-                self.reporter.event_add(Event(event, package_base, message, took=timer.elapsed))
+                yield metadata
+                self.reporter.event_add(Event(event, package_base, message, took=timer.elapsed, **metadata))
             except Exception:
                 if failure is not None:
                     self.reporter.event_add(Event(failure, package_base, took=timer.elapsed))
@@ -17,17 +17,22 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import contextvars
 import shutil
 
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any
 
+from ahriman.core.build_tools.chroot_manager import ChrootManager
 from ahriman.core.build_tools.package_archive import PackageArchive
 from ahriman.core.build_tools.task import Task
 from ahriman.core.repository.cleaner import Cleaner
 from ahriman.core.repository.package_info import PackageInfo
-from ahriman.core.utils import atomic_move, filelock, safe_filename, symlink_relative
+from ahriman.core.utils import atomic_move, filelock, package_like, safe_filename, symlink_relative
+from ahriman.models.build_status import BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.event import EventType
 from ahriman.models.package import Package
@@ -57,8 +62,8 @@ class Executor(PackageInfo, Cleaner):
             atomic_move(self.paths.packages / description.filename, self.paths.packages / safe)
             description.filename = safe
 
-    def _package_build(self, package: Package, path: Path, packager: str | None,
-                       local_version: str | None) -> str | None:
+    def _package_build(self, package: Package, path: Path, packager: str | None, local_version: str | None,
+                       metadata: dict[str, Any] | None = None, chroot: ChrootManager | None = None) -> str | None:
         """
         build single package
 
@@ -67,6 +72,9 @@ class Executor(PackageInfo, Cleaner):
             path(Path): path to directory with package files
             packager(str | None): packager identifier used for this package
             local_version(str | None): local version of the package
+            metadata(dict[str, Any] | None, optional): event metadata, which will be updated with the build steps
+                timings (Default value = None)
+            chroot(ChrootManager | None, optional): build chroot manager shared between packages (Default value = None)
 
         Returns:
             str | None: current commit sha if available
@@ -74,9 +82,11 @@ class Executor(PackageInfo, Cleaner):
         self.reporter.set_building(package.base)
 
         default_packager = self.configuration.get("build", "packager", fallback=None)
-        task = Task(package, self.configuration, self.repository_id, self.paths)
+        task = Task(package, self.configuration, self.repository_id, self.paths, chroot)
         patches = self.reporter.package_patches_get(package.base, None)
         commit_sha = task.init(path, patches, local_version)
+        if metadata is not None:
+            metadata.update(task.timings)
 
         loaded_package = Package.from_build(path, self.repository_id.architecture, None)
         if prebuilt := self.package_archives_lookup(loaded_package):
@@ -122,30 +132,42 @@ class Executor(PackageInfo, Cleaner):
         except Exception:
             self.logger.exception("could not remove base %s", package_base)
 
-    def _package_update(self, filename: str | None, package_base: str, packager_key: str | None) -> None:
+    def _package_sign(self, package: Package, packager_key: str | None) -> list[Path]:
         """
-        update built package in repository database
+        sign all built archives of the package base
 
         Args:
-            filename(str | None): archive filename
-            package_base(str): package base name
+            package(Package): package built archives of which have to be signed
             packager_key(str | None): packager key identifier
+
+        Returns:
+            list[Path]: list of archives and their signatures
         """
-        if filename is None:
-            self.logger.warning("received empty package filename for base %s", package_base)
-            return  # suppress type checking, it never can be none actually
+        archives = []
+        for description in package.packages.values():
+            if description.filename is None:
+                self.logger.warning("received empty package filename for base %s", package.base)
+                continue  # suppress type checking, it never can be none actually
+            # in theory, it might be NOT packages directory, but we suppose it is
+            archives.append(self.paths.packages / description.filename)
+
+        return self.sign.process_sign_packages(archives, packager_key)
 
-        # in theory, it might be NOT packages directory, but we suppose it is
-        full_path = self.paths.packages / filename
-        files = self.sign.process_sign_package(full_path, packager_key)
+    def _package_update(self, package_base: str, files: list[Path]) -> None:
+        """
+        update built package in repository database
 
+        Args:
+            package_base(str): package base name
+            files(list[Path]): list of archives and their signatures
+        """
         for src in files:
             dst = self.paths.ensure_exists(self.paths.archive_for(package_base)) / src.name
             atomic_move(src, dst)  # move package to archive directory
             if not (symlink := self.paths.repository / dst.name).exists():
                 symlink_relative(symlink, dst)  # create link to archive
 
-        self.repo.add(self.paths.repository / filename)
+        self.repo.add_packages(self.paths.repository / src.name for src in files if package_like(src))
 
     def process_build(self, updates: Iterable[Package], packagers: Packagers | None = None, *,
                       bump_pkgrel: bool = False) -> Result:
@@ -164,15 +186,21 @@ class Executor(PackageInfo, Cleaner):
         packagers = packagers or Packagers()
         local_versions = {package.base: package.version for package in self.packages()}
 
+        # root chroot is shared between all packages, thus it is updated only once per run
+        chroot = ChrootManager(self.configuration, self.repository_id, self.paths)
+
         result = Result()
         for single in updates:
             with self.in_package_context(single.base, local_versions.get(single.base)), \
                     TemporaryDirectory(ignore_cleanup_errors=True) as dir_name:
                 try:
-                    with self.in_event(single.base, EventType.PackageUpdated, failure=EventType.PackageUpdateFailed):
+                    with self.in_event(single.base, EventType.PackageUpdated,
+                                       failure=EventType.PackageUpdateFailed) as metadata:
+                        chroot.update()
                         packager = self.packager(packagers, single.base)
                         local_version = local_versions.get(single.base) if bump_pkgrel else None
-                        commit_sha = self._package_build(single, Path(dir_name), packager.packager_id, local_version)
+                        commit_sha = self._package_build(single, Path(dir_name), packager.packager_id, local_version,
+                                                         metadata, chroot)
 
                         # update commit hash for changes keeping current diff if there is any
                         changes = self.reporter.package_changes_get(single.base)
@@ -265,26 +293,48 @@ class Executor(PackageInfo, Cleaner):
         packagers = packagers or Packagers()
 
         result = Result()
-        for local in updates:
-            with self.in_package_context(local.base, local_versions.get(local.base)):
-                try:
-                    packager = self.packager(packagers, local.base)
-
-                    for description in local.packages.values():
-                        self._archive_rename(description, local.base)
-                        self._package_update(description.filename, local.base, packager.key)
-                    self.reporter.set_success(local)
-                    result.add_updated(local)
-
-                    current_package_archives: set[str] = set()
-                    if local.base in current_packages:
-                        current_package_archives = set(current_packages[local.base].packages.keys())
-                    removed_packages.extend(current_package_archives.difference(local.packages))
-
-                except Exception:
-                    self.reporter.set_failed(local.base)
-                    result.add_failed(local)
-                    self.logger.exception("could not process %s", local.base)
+        # signing is performed in background, so the next package will be signed while the current one is being
+        # moved to the repository
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            signed: dict[str, Future[list[Path]]] = {}
+            for local in updates:
+                with self.in_package_context(local.base, local_versions.get(local.base)):
+                    try:
+                        packager = self.packager(packagers, local.base)
+
+                        for description in local.packages.values():
+                            self._archive_rename(description, local.base)
+                        # run in copy of the current context in order to keep package log context
+                        signed[local.base] = executor.submit(
+                            contextvars.copy_context().run, self._package_sign, local, packager.key)
+                    except Exception:
+                        result.add_failed(local)
+                        self.logger.exception("could not process %s", local.base)
+
+            for local in updates:
+                if local.base not in signed:
+                    continue  # package has been already failed
+
+                with self.in_package_context(local.base, local_versions.get(local.base)):
+                    try:
+                        self._package_update(local.base, signed[local.base].result())
+                        self.package_archives_index(local.base).add([local])
+                        result.add_updated(local)
+
+                        current_package_archives: set[str] = set()
+                        if local.base in current_packages:
+                            current_package_archives = set(current_packages[local.base].packages.keys())
+                        removed_packages.extend(current_package_archives.difference(local.packages))
+
+                    except Exception:
+                        result.add_failed(local)
+                        self.logger.exception("could not process %s", local.base)
+
+        # report statuses of the whole batch at once
+        if updated := result.success:
+            self.reporter.package_update_many(updated, BuildStatusEnum.Success)
+        if failed := result.failed:
+            self.reporter.package_status_update_many([package.base for package in failed], BuildStatusEnum.Failed)
 
         self.clear_packages()
         self.process_remove(removed_packages)
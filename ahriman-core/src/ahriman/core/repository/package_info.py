@@ -28,6 +28,7 @@ from ahriman.core.alpm.pacman import Pacman
 from ahriman.core.build_tools.sources import Sources
 from ahriman.core.configuration import Configuration
 from ahriman.core.log import LazyLogging
+from ahriman.core.repository.archive_index import ArchiveIndex
 from ahriman.core.status import Client
 from ahriman.core.utils import list_flatmap, package_like
 from ahriman.models.changes import Changes
@@ -152,6 +153,26 @@ class PackageInfo(LazyLogging):
             key=cmp_to_key(comparator),
         )
 
+    def package_archives_index(self, package_base: str) -> ArchiveIndex:
+        """
+        get index of the archived packages for the package base. In case if there is no index yet (e.g. archives
+        have been created before index was introduced), it will be created from package archives
+
+        Args:
+            package_base(str): package base
+
+        Returns:
+            ArchiveIndex: archive index instance
+        """
+        archive = self.paths.archive_for(package_base)
+        index = ArchiveIndex(archive)
+
+        if not index.exists and archive.is_dir():
+            self.logger.info("create archive index for %s", package_base)
+            index.add(self.load_archives(filter(package_like, archive.iterdir()), latest_only=False))
+
+        return index
+
     def package_archives_lookup(self, package: Package) -> list[Path]:
         """
         check if there is a rebuilt package already
@@ -172,25 +193,31 @@ class PackageInfo(LazyLogging):
 
         return []
 
-    def package_changes(self, package: Package, last_commit_sha: str) -> Changes | None:
+    def package_changes(self, package: Package, last_commit_sha: str,
+                        head_commit_sha: str | None = None) -> Changes | None:
         """
         extract package change for the package since last commit if available
 
         Args:
             package(Package): package properties
             last_commit_sha(str): last known commit hash
+            head_commit_sha(str | None, optional): sources HEAD at which the known changes have been calculated if
+                any. If it is equal to the current HEAD, the changes will not be calculated again (Default value = None)
 
         Returns:
-            Changes | None: changes if available
+            Changes | None: changes if available and ``None`` if there are no new changes
         """
         with TemporaryDirectory(ignore_cleanup_errors=True) as dir_name:
             dir_path = Path(dir_name)
             patches = self.reporter.package_patches_get(package.base, None)
             current_commit_sha = Sources.load(dir_path, package, patches, self.paths)
 
-            if current_commit_sha != last_commit_sha:
-                return Sources.changes(dir_path, last_commit_sha)
-            return None
+            if current_commit_sha == last_commit_sha:
+                return None  # no new commits
+            if head_commit_sha is not None and current_commit_sha == head_commit_sha:
+                self.logger.info("changes of %s since %s are already known", package.base, last_commit_sha)
+                return None  # changes for this commit range have been already calculated
+            return Sources.changes(dir_path, last_commit_sha)
 
     def packages(self, filter_packages: Iterable[str] | None = None) -> list[Package]:
         """
@@ -18,6 +18,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from ahriman.core.build_tools.package_version import PackageVersion
 from ahriman.core.build_tools.sources import Sources
@@ -142,8 +144,7 @@ class UpdateHandler(PackageInfo, Cleaner):
         packages = {local.base: local for local in self.packages()}
         local_versions = {package_base: package.version for package_base, package in packages.items()}
 
-        result: list[Package] = []
-        for cache_dir in self.paths.cache.iterdir():
+        def load_remote(cache_dir: Path) -> Package | None:
             with self.in_package_context(cache_dir.name, local_versions.get(cache_dir.name)):
                 try:
                     source = RemoteSource(
@@ -159,16 +160,27 @@ class UpdateHandler(PackageInfo, Cleaner):
 
                     local = packages.get(remote.base)
                     if local is None:
-                        continue  # we don't add packages automatically
+                        return None  # we don't add packages automatically
                     if local.remote.is_remote:
-                        continue  # avoid checking AUR packages
+                        return None  # avoid checking AUR packages
 
                     if PackageVersion(local).is_outdated(remote, self.configuration, calculate_version=vcs):
-                        self.reporter.set_pending(local.base)
-                        self.event(local.base, EventType.PackageOutdated, "Locally pulled sources are outdated")
-                        result.append(remote)
+                        return remote
                 except Exception:
                     self.logger.exception("could not process package at %s", cache_dir)
+            return None
+
+        result: list[Package] = []
+        # fetching sources and calculating versions are mostly waiting for subprocesses, thus they are run in
+        # parallel, whereas results are processed in the same order as directories are listed
+        with ThreadPoolExecutor() as executor:
+            for remote in executor.map(load_remote, sorted(self.paths.cache.iterdir())):
+                if remote is None:
+                    continue
+
+                self.reporter.set_pending(remote.base)
+                self.event(remote.base, EventType.PackageOutdated, "Locally pulled sources are outdated")
+                result.append(remote)
 
         return result
 
@@ -17,6 +17,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import contextvars
+import itertools
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ahriman.core.configuration import Configuration
@@ -33,6 +38,7 @@ class GPG(SyncHttpClient):
     Attributes:
         configuration(Configuration): configuration instance
         default_key(str | None): default PGP key ID to use
+        max_workers(int): maximal amount of concurrently running sign processes
         targets(set[SignSettings]): list of targets to sign (repository, package etc.)
     """
 
@@ -44,6 +50,7 @@ class GPG(SyncHttpClient):
         SyncHttpClient.__init__(self)
         self.configuration = configuration
         self.targets, self.default_key = self.sign_options(configuration)
+        self.max_workers = configuration.getint("sign", "max_workers", fallback=4)
 
     @property
     def repository_sign_args(self) -> list[str]:
@@ -61,18 +68,23 @@ class GPG(SyncHttpClient):
         return ["--sign", "--key", self.default_key]
 
     @staticmethod
-    def sign_command(path: Path, key: str) -> list[str]:
+    def sign_command(path: Path, key: str, homedir: str | None = None) -> list[str]:
         """
         gpg command to run
 
         Args:
             path(Path): path to file to sign
             key(str): PGP key ID
+            homedir(str | None, optional): gpg home directory with already running agent. If set, the command will
+                neither look up home directory nor start the agent (Default value = None)
 
         Returns:
             list[str]: gpg command with all required arguments
         """
-        return ["gpg", "-u", key, "-b", str(path)]
+        command = ["gpg"]
+        if homedir is not None:
+            command.extend(["--homedir", homedir, "--no-autostart"])
+        return command + ["-u", key, "-b", str(path)]
 
     @staticmethod
     def sign_options(configuration: Configuration) -> tuple[set[SignSettings], str | None]:
@@ -107,6 +119,17 @@ class GPG(SyncHttpClient):
         """
         return filepath.parent / f"{filepath.name}.sig"
 
+    def agent_launch(self) -> str:
+        """
+        start gpg-agent if it is not running yet
+
+        Returns:
+            str: gpg home directory which is served by the agent
+        """
+        homedir = check_output("gpgconf", "--list-dirs", "homedir", logger=self.logger)
+        check_output("gpgconf", "--launch", "gpg-agent", logger=self.logger)
+        return homedir
+
     def key_download(self, server: str, key: str) -> str:
         """
         download key from public PGP server
@@ -172,23 +195,51 @@ class GPG(SyncHttpClient):
         key_body = self.key_download(server, key)
         check_output("gpg", "--import", input_data=key_body, logger=self.logger)
 
-    def process(self, path: Path, key: str) -> list[Path]:
+    def process(self, path: Path, key: str, homedir: str | None = None) -> list[Path]:
         """
         gpg command wrapper
 
         Args:
             path(Path): path to file to sign
             key(str): PGP key ID
+            homedir(str | None, optional): gpg home directory with already running agent (Default value = None)
 
         Returns:
             list[Path]: list of generated files including original file
         """
         check_output(
-            *GPG.sign_command(path, key),
+            *GPG.sign_command(path, key, homedir),
             exception=BuildError.from_process(path.name),
             logger=self.logger)
         return [path, self.signature(path)]
 
+    def process_many(self, paths: Iterable[Path], key: str) -> list[Path]:
+        """
+        sign multiple files with the same key. gpg is not able to create detached signatures for several files in single
+        call (``--detach-sign`` accepts only one input file), thus one process per file is still spawned. In order to
+        reduce overhead, the agent is launched once before signing and all processes are bound to its home directory,
+        so they share the same agent session (and unlocked key) and are run concurrently
+
+        Args:
+            paths(Iterable[Path]): paths to files to sign
+            key(str): PGP key ID
+
+        Returns:
+            list[Path]: list of generated files including original files
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+
+        homedir = self.agent_launch()
+        with ThreadPoolExecutor(max_workers=max(min(self.max_workers, len(paths)), 1)) as executor:
+            # each task runs in copy of the caller context in order to keep log context (e.g. package base)
+            signed = [
+                executor.submit(contextvars.copy_context().run, self.process, path, key, homedir)
+                for path in paths
+            ]
+            return list(itertools.chain.from_iterable(future.result() for future in signed))
+
     def process_sign_package(self, path: Path, packager_key: str | None) -> list[Path]:
         """
         sign package if required by configuration and signature doesn't exist
@@ -200,18 +251,39 @@ class GPG(SyncHttpClient):
         Returns:
             list[Path]: list of generated files including original file
         """
-        if (signature := self.signature(path)).is_file():
-            # the file was already signed before, just use its signature
-            return [path, signature]
+        return self.process_sign_packages([path], packager_key)
+
+    def process_sign_packages(self, paths: Iterable[Path], packager_key: str | None) -> list[Path]:
+        """
+        sign packages if required by configuration and signatures don't exist
+
+        Args:
+            paths(Iterable[Path]): paths to files to sign
+            packager_key(str | None): optional packager key to sign
+
+        Returns:
+            list[Path]: list of generated files including original files
+        """
+        result: list[Path] = []
+        unsigned: list[Path] = []
+        for path in paths:
+            if (signature := self.signature(path)).is_file():
+                # the file was already signed before, just use its signature
+                result.extend([path, signature])
+            else:
+                unsigned.append(path)
+
+        if not unsigned:
+            return result
 
         if SignSettings.Packages not in self.targets:
-            return [path]
+            return result + unsigned
 
         key = packager_key or self.default_key
         if key is None:
-            self.logger.error("no default key set, skip package %s sign", path)
-            return [path]
-        return self.process(path, key)
+            self.logger.error("no default key set, skip packages %s sign", ", ".join(path.name for path in unsigned))
+            return result + unsigned
+        return result + self.process_many(unsigned, key)
 
     def process_sign_repository(self, path: Path) -> list[Path]:
         """
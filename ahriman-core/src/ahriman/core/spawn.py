@@ -20,11 +20,16 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing
 import uuid
 
-from collections.abc import Callable, Iterable
-from multiprocessing import Process, Queue
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from multiprocessing import Queue
+from multiprocessing.process import BaseProcess
+from queue import Empty
 from threading import Lock, Thread
+from typing import ClassVar
 
 from ahriman.core.log import LazyLogging
 from ahriman.models.metrics_timer import MetricsTimer
@@ -38,12 +43,33 @@ class Spawn(Thread, LazyLogging):
     helper to spawn external ahriman process
     MUST NOT be used directly, the only one usage allowed is to spawn process from web services
 
+    Child processes are forked from the warm forkserver, which has already imported the heavy application modules.
+    Actions for the same repository are executed one by one in order of their submission, whereas actions for
+    different repositories are run in parallel. Child processes which have exited without reporting their status
+    (e.g. killed by signal) are reaped periodically, so they do not block the repository queue.
+
     Attributes:
-        active(dict[str, Process]): map of active child processes required to avoid zombies
+        POLL_INTERVAL(float): (class attribute) interval in seconds between checks of exited child processes
+        PRELOAD_MODULES(list[str]): (class attribute) modules which are imported by forkserver in advance
+        active(dict[str, BaseProcess]): map of active (either running or waiting) child processes required to avoid
+            zombies
         command_arguments(list[str]): base command line arguments
+        context(multiprocessing.context.BaseContext): multiprocessing context used to spawn child processes
+        pending(dict[RepositoryId, deque[str]]): queue of process identifiers for each repository. The first element
+            of each queue is the currently running process
         queue(Queue[ProcessStatus | None]): multiprocessing queue to read updates from processes
     """
 
+    POLL_INTERVAL: ClassVar[float] = 1.0
+    PRELOAD_MODULES: ClassVar[list[str]] = [
+        "ahriman.application.application",
+        "ahriman.application.handlers.handler",
+        "ahriman.core.alpm.pacman",
+        "ahriman.core.configuration",
+        "ahriman.core.repository",
+        "ahriman.core.triggers",
+    ]
+
     def __init__(self, args_parser: argparse.ArgumentParser, command_arguments: list[str]) -> None:
         """
         Args:
@@ -55,10 +81,14 @@ class Spawn(Thread, LazyLogging):
         self.args_parser = args_parser
         self.command_arguments = command_arguments
 
+        self.context = multiprocessing.get_context("forkserver")
+        self.context.set_forkserver_preload(self.PRELOAD_MODULES)
+
         self._lock = Lock()
-        self.active: dict[str, Process] = {}
+        self.active: dict[str, BaseProcess] = {}
+        self.pending: dict[RepositoryId, deque[str]] = {}
         # stupid pylint does not know that it is possible
-        self.queue: Queue[ProcessStatus | None] = Queue()  # pylint: disable=unsubscriptable-object
+        self.queue: Queue[ProcessStatus | None] = self.context.Queue()  # pylint: disable=unsubscriptable-object
 
     @staticmethod
     def boolean_action_argument(name: str, value: bool) -> str:
@@ -94,6 +124,72 @@ class Spawn(Thread, LazyLogging):
 
         queue.put(ProcessStatus(process_id, result, consumed_time))
 
+    def _next_process(self, process_id: str) -> str | None:
+        """
+        remove finished process from the repository queue and extract the next one. This method must be called
+        under lock
+
+        Args:
+            process_id(str): identifier of the finished process
+
+        Returns:
+            str | None: identifier of the next process for the same repository if any
+        """
+        for repository_id, waiting in self.pending.items():
+            if not waiting or waiting[0] != process_id:
+                continue
+
+            waiting.popleft()
+            if not waiting:
+                del self.pending[repository_id]
+                return None
+            return waiting[0]
+
+        return None
+
+    def _process_finish(self, process_id: str) -> BaseProcess | None:
+        """
+        remove finished process and start the next queued process for the same repository. Processes which could
+        not be started are dropped from the queue
+
+        Args:
+            process_id(str): identifier of the finished process
+
+        Returns:
+            BaseProcess | None: finished process if it was known
+        """
+        with self._lock:
+            process = self.active.pop(process_id, None)
+
+            next_process_id = self._next_process(process_id)
+            while next_process_id is not None:
+                try:
+                    self.active[next_process_id].start()
+                    break
+                except Exception:
+                    self.logger.exception("could not start process %s", next_process_id)
+                    self.active.pop(next_process_id, None)
+                    next_process_id = self._next_process(next_process_id)
+
+        if process is not None:
+            process.join()
+        return process
+
+    def _process_statuses(self) -> Iterator[ProcessStatus | None]:
+        """
+        read all statuses which are currently available in the queue. This method blocks until either the first
+        status is read or poll interval is reached
+
+        Yields:
+            ProcessStatus | None: process status or ``None`` if the thread must be terminated
+        """
+        try:
+            yield self.queue.get(timeout=self.POLL_INTERVAL)
+            while True:
+                yield self.queue.get_nowait()
+        except Empty:
+            pass
+
     def _spawn_process(self, repository_id: RepositoryId, command: str, *args: str,
                        **kwargs: str | list[str] | None) -> str:
         """
@@ -132,13 +228,26 @@ class Spawn(Thread, LazyLogging):
         parsed = self.args_parser.parse_args(arguments)
 
         callback = parsed.handler.call
-        process = Process(target=self.process,
-                          args=(callback, parsed, repository_id, process_id, self.queue),
-                          daemon=True)
-        process.start()
+        process = self.context.Process(target=self.process,
+                                       args=(callback, parsed, repository_id, process_id, self.queue),
+                                       daemon=True)
 
         with self._lock:
             self.active[process_id] = process
+            waiting = self.pending.setdefault(repository_id, deque())
+            waiting.append(process_id)
+            # the process will be started once all previous processes for this repository are finished
+            if len(waiting) == 1:
+                try:
+                    process.start()
+                except Exception:
+                    self.active.pop(process_id, None)
+                    self._next_process(process_id)
+                    raise
+            else:
+                self.logger.info("process %s has been queued after %s process(es) for repository %s",
+                                 process_id, len(waiting) - 1, repository_id)
+
         return process_id
 
     def has_process(self, process_id: str) -> bool:
@@ -149,7 +258,7 @@ class Spawn(Thread, LazyLogging):
             process_id(str): process id to be checked as returned by :func:`_spawn_process()`
 
         Returns:
-            bool: ``True`` in case if process still counts as active and ``False`` otherwise
+            bool: ``True`` in case if process is either running or waiting for its turn and ``False`` otherwise
         """
         with self._lock:
             return process_id in self.active
@@ -286,15 +395,23 @@ class Spawn(Thread, LazyLogging):
         """
         thread run method
         """
-        for terminated in iter(self.queue.get, None):
-            self.logger.info("process %s has been terminated with status %s, consumed time %ss",
-                             terminated.process_id, terminated.status, terminated.consumed_time)
-
+        while True:
+            # exited processes must be collected before reading the queue, because child process always flushes
+            # its status before exit. Thus, if process is still active after reading, it has not reported anything
             with self._lock:
-                process = self.active.pop(terminated.process_id, None)
-
-            if process is not None:
-                process.join()
+                exited = [process_id for process_id, process in self.active.items() if process.exitcode is not None]
+
+            for terminated in self._process_statuses():
+                if terminated is None:
+                    return
+                self.logger.info("process %s has been terminated with status %s, consumed time %ss",
+                                 terminated.process_id, terminated.status, terminated.consumed_time)
+                self._process_finish(terminated.process_id)
+
+            for process_id in exited:
+                if (process := self._process_finish(process_id)) is not None:
+                    self.logger.error("process %s has exited with code %s without reporting status",
+                                      process_id, process.exitcode)
 
     def stop(self) -> None:
         """
@@ -20,12 +20,15 @@
 # pylint: disable=too-many-public-methods
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from ahriman.core.configuration import Configuration
 from ahriman.core.database import SQLite
 from ahriman.models.build_status import BuildStatus, BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.dependencies import Dependencies
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.internal_status import InternalStatus
 from ahriman.models.log_record import LogRecord
 from ahriman.models.package import Package
@@ -120,6 +123,25 @@ class Client:
         """
         raise NotImplementedError
 
+    def event_rollup_get(self, event: str | EventType | None, object_id: str | None,
+                         from_date: int | float | None = None, to_date: int | float | None = None) -> list[EventRollup]:
+        """
+        retrieve list of events aggregated by day
+
+        Args:
+            event(str | EventType | None): filter by event type
+            object_id(str | None): filter by event object
+            from_date(int | float | None, optional): minimal creation date, inclusive (Default value = None)
+            to_date(int | float | None, optional): maximal creation date, exclusive (Default value = None)
+
+        Returns:
+            list[EventRollup]: list of aggregated audit log events
+
+        Raises:
+            NotImplementedError: not implemented method
+        """
+        raise NotImplementedError
+
     def logs_rotate(self, keep_last_records: int) -> None:
         """
         remove older logs from storage
@@ -156,6 +178,17 @@ class Client:
         """
         raise NotImplementedError
 
+    def package_changes_update_many(self, changes: Iterable[tuple[str, Changes]]) -> None:
+        """
+        update changes of multiple packages at once. Default implementation calls :func:`package_changes_update()`
+        for each package
+
+        Args:
+            changes(Iterable[tuple[str, Changes]]): list of package bases and their changes descriptors
+        """
+        for package_base, package_changes in changes:
+            self.package_changes_update(package_base, package_changes)
+
     def package_dependencies_get(self, package_base: str) -> Dependencies:
         """
         get package dependencies
@@ -184,6 +217,17 @@ class Client:
         """
         raise NotImplementedError
 
+    def package_dependencies_update_many(self, dependencies: Iterable[tuple[str, Dependencies]]) -> None:
+        """
+        update dependencies of multiple packages at once. Default implementation calls
+        :func:`package_dependencies_update()` for each package
+
+        Args:
+            dependencies(Iterable[tuple[str, Dependencies]]): list of package bases and their dependencies descriptors
+        """
+        for package_base, package_dependencies in dependencies:
+            self.package_dependencies_update(package_base, package_dependencies)
+
     def package_get(self, package_base: str | None) -> list[tuple[Package, BuildStatus]]:
         """
         get package status
@@ -321,6 +365,18 @@ class Client:
         """
         raise NotImplementedError
 
+    def package_status_update_many(self, package_bases: Iterable[str], status: BuildStatusEnum) -> None:
+        """
+        update build status of multiple packages at once. Default implementation calls
+        :func:`package_status_update()` for each package
+
+        Args:
+            package_bases(Iterable[str]): package bases to update
+            status(BuildStatusEnum): current packages build status
+        """
+        for package_base in package_bases:
+            self.package_status_update(package_base, status)
+
     def package_update(self, package: Package, status: BuildStatusEnum) -> None:
         """
         add new package or update existing one with status
@@ -334,6 +390,18 @@ class Client:
         """
         raise NotImplementedError
 
+    def package_update_many(self, packages: Iterable[Package], status: BuildStatusEnum) -> None:
+        """
+        add new packages or update existing ones with status at once. Default implementation calls
+        :func:`package_update()` for each package
+
+        Args:
+            packages(Iterable[Package]): list of packages properties
+            status(BuildStatusEnum): current packages build status
+        """
+        for package in packages:
+            self.package_update(package, status)
+
     def set_building(self, package_base: str) -> None:
         """
         set package status to building
@@ -17,12 +17,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+from collections.abc import Iterable
+
 from ahriman.core.database import SQLite
 from ahriman.core.status import Client
 from ahriman.models.build_status import BuildStatus, BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.dependencies import Dependencies
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.log_record import LogRecord
 from ahriman.models.package import Package
 from ahriman.models.pkgbuild_patch import PkgbuildPatch
@@ -75,6 +78,22 @@ class LocalClient(Client):
         """
         return self.database.event_get(event, object_id, from_date, to_date, limit, offset, self.repository_id)
 
+    def event_rollup_get(self, event: str | EventType | None, object_id: str | None,
+                         from_date: int | float | None = None, to_date: int | float | None = None) -> list[EventRollup]:
+        """
+        retrieve list of events aggregated by day
+
+        Args:
+            event(str | EventType | None): filter by event type
+            object_id(str | None): filter by event object
+            from_date(int | float | None, optional): minimal creation date, inclusive (Default value = None)
+            to_date(int | float | None, optional): maximal creation date, exclusive (Default value = None)
+
+        Returns:
+            list[EventRollup]: list of aggregated audit log events
+        """
+        return self.database.event_rollup_get(event, object_id, from_date, to_date, self.repository_id)
+
     def logs_rotate(self, keep_last_records: int) -> None:
         """
         remove older logs from storage
@@ -106,6 +125,15 @@ class LocalClient(Client):
         """
         self.database.changes_insert(package_base, changes, self.repository_id)
 
+    def package_changes_update_many(self, changes: Iterable[tuple[str, Changes]]) -> None:
+        """
+        update changes of multiple packages in single transaction
+
+        Args:
+            changes(Iterable[tuple[str, Changes]]): list of package bases and their changes descriptors
+        """
+        self.database.changes_insert_many(changes, self.repository_id)
+
     def package_dependencies_get(self, package_base: str) -> Dependencies:
         """
         get package dependencies
@@ -128,6 +156,15 @@ class LocalClient(Client):
         """
         self.database.dependencies_insert(package_base, dependencies, self.repository_id)
 
+    def package_dependencies_update_many(self, dependencies: Iterable[tuple[str, Dependencies]]) -> None:
+        """
+        update dependencies of multiple packages in single transaction
+
+        Args:
+            dependencies(Iterable[tuple[str, Dependencies]]): list of package bases and their dependencies descriptors
+        """
+        self.database.dependencies_insert_many(dependencies, self.repository_id)
+
     def package_get(self, package_base: str | None) -> list[tuple[Package, BuildStatus]]:
         """
         get package status
@@ -138,10 +175,7 @@ class LocalClient(Client):
         Returns:
             list[tuple[Package, BuildStatus]]: list of current package description and status if it has been found
         """
-        packages = self.database.packages_get(self.repository_id)
-        if package_base is None:
-            return packages
-        return [(package, status) for package, status in packages if package.base == package_base]
+        return self.database.packages_get(package_base, repository_id=self.repository_id)
 
     def package_hold_update(self, package_base: str, *, enabled: bool) -> None:
         """
@@ -246,6 +280,18 @@ class LocalClient(Client):
         """
         self.database.status_update(package_base, BuildStatus(status), self.repository_id)
 
+    def package_status_update_many(self, package_bases: Iterable[str], status: BuildStatusEnum) -> None:
+        """
+        update build status of multiple packages in single transaction
+
+        Args:
+            package_bases(Iterable[str]): package bases to update
+            status(BuildStatusEnum): current packages build status
+        """
+        build_status = BuildStatus(status)
+        self.database.status_update_many(
+            [(package_base, build_status) for package_base in package_bases], self.repository_id)
+
     def package_update(self, package: Package, status: BuildStatusEnum) -> None:
         """
         add new package or update existing one with status
@@ -259,3 +305,17 @@ class LocalClient(Client):
         """
         self.database.package_update(package, self.repository_id)
         self.database.status_update(package.base, BuildStatus(status), self.repository_id)
+
+    def package_update_many(self, packages: Iterable[Package], status: BuildStatusEnum) -> None:
+        """
+        add new packages or update existing ones with status. Packages and their statuses are written by single
+        transaction each
+
+        Args:
+            packages(Iterable[Package]): list of packages properties
+            status(BuildStatusEnum): current packages build status
+        """
+        packages = list(packages)
+        build_status = BuildStatus(status)
+        self.database.package_update_many(packages, self.repository_id)
+        self.database.status_update_many([(package.base, build_status) for package in packages], self.repository_id)
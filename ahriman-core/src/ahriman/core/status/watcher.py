@@ -18,6 +18,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 # pylint: disable=too-many-public-methods
+import asyncio
+
 from asyncio import Lock
 from dataclasses import replace
 from typing import Self
@@ -31,6 +33,7 @@ from ahriman.models.build_status import BuildStatus, BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.dependencies import Dependencies
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.log_record import LogRecord
 from ahriman.models.package import Package
 from ahriman.models.pkgbuild_patch import PkgbuildPatch
@@ -62,6 +65,33 @@ class Watcher(LazyLogging):
         self._known: dict[str, tuple[Package, BuildStatus]] = {}
         self.status = BuildStatus()
 
+        self._archives_lock = Lock()
+        self._archives: dict[str, tuple[int | None, list[Package]]] = {}
+
+    def _package_archives_load(self, package_base: str) -> list[Package]:
+        """
+        load package archives from cache if the archive directory has not been modified since the last call and
+        from filesystem otherwise. This method is blocking, thus it must be called outside of the event loop
+
+        Args:
+            package_base(str): package base
+
+        Returns:
+            list[Package]: list of built package for this package base
+        """
+        directory = self.package_info.paths.archive_for(package_base)
+        try:
+            modified: int | None = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            modified = None
+
+        cached_modified, archives = self._archives.get(package_base, (None, []))
+        if modified is None or cached_modified != modified:
+            archives = self.package_info.package_archives(package_base)
+            self._archives[package_base] = (modified, archives)
+
+        return archives
+
     async def event_add(self, event: Event) -> None:
         """
         create new event
@@ -90,6 +120,23 @@ class Watcher(LazyLogging):
         """
         return self.client.event_get(event, object_id, from_date, to_date, limit, offset)
 
+    async def event_rollup_get(self, event: str | EventType | None, object_id: str | None,
+                               from_date: int | float | None = None,
+                               to_date: int | float | None = None) -> list[EventRollup]:
+        """
+        retrieve list of events aggregated by day
+
+        Args:
+            event(str | EventType | None): filter by event type
+            object_id(str | None): filter by event object
+            from_date(int | float | None, optional): minimal creation date, inclusive (Default value = None)
+            to_date(int | float | None, optional): maximal creation date, exclusive (Default value = None)
+
+        Returns:
+            list[EventRollup]: list of aggregated audit log events
+        """
+        return self.client.event_rollup_get(event, object_id, from_date, to_date)
+
     async def load(self) -> None:
         """
         load packages from local database
@@ -109,17 +156,24 @@ class Watcher(LazyLogging):
         """
         self.client.logs_rotate(keep_last_records)
 
-    async def package_archives(self, package_base: str) -> list[Package]:
+    async def package_archives(self, package_base: str, limit: int = -1, offset: int = 0) -> list[Package]:
         """
         get known package archives
 
         Args:
             package_base(str): package base
+            limit(int, optional): limit records to the specified count, -1 means unlimited (Default value = -1)
+            offset(int, optional): records offset (Default value = 0)
 
         Returns:
             list[Package]: list of built package for this package base
         """
-        return self.package_info.package_archives(package_base)
+        # archives loading uses single alpm handle, thus we only allow single loader at the time
+        async with self._archives_lock:
+            archives = await asyncio.to_thread(self._package_archives_load, package_base)
+
+        stop = offset + limit if limit >= 0 else None
+        return archives[offset:stop]
 
     async def package_changes_get(self, package_base: str) -> Changes:
         """
@@ -279,6 +333,7 @@ class Watcher(LazyLogging):
         """
         async with self._lock:
             self._known.pop(package_base, None)
+        self._archives.pop(package_base, None)
         self.client.package_remove(package_base)
 
         await self.event_bus.broadcast(EventType.PackageRemoved, package_base)
@@ -309,6 +364,7 @@ class Watcher(LazyLogging):
         async with self._lock:
             _, current_status = self._known.get(package.base, (package, BuildStatus()))
             self._known[package.base] = (package, BuildStatus(status, is_held=current_status.is_held))
+        self._archives.pop(package.base, None)
         self.client.package_update(package, status)
 
         await self.event_bus.broadcast(
@@ -29,6 +29,7 @@ from ahriman.models.build_status import BuildStatus, BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.dependencies import Dependencies
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.internal_status import InternalStatus
 from ahriman.models.log_record import LogRecord
 from ahriman.models.package import Package
@@ -218,6 +219,38 @@ class WebClient(Client, SyncAhrimanClient):
 
         return []
 
+    def event_rollup_get(self, event: str | EventType | None, object_id: str | None,
+                         from_date: int | float | None = None, to_date: int | float | None = None) -> list[EventRollup]:
+        """
+        retrieve list of events aggregated by day
+
+        Args:
+            event(str | EventType | None): filter by event type
+            object_id(str | None): filter by event object
+            from_date(int | float | None, optional): minimal creation date, inclusive (Default value = None)
+            to_date(int | float | None, optional): maximal creation date, exclusive (Default value = None)
+
+        Returns:
+            list[EventRollup]: list of aggregated audit log events
+        """
+        query = self.repository_id.query()
+        if event is not None:
+            query.append(("event", str(event)))
+        if object_id is not None:
+            query.append(("object_id", object_id))
+        if from_date is not None:
+            query.append(("from_date", str(from_date)))
+        if to_date is not None:
+            query.append(("to_date", str(to_date)))
+
+        with contextlib.suppress(Exception):
+            response = self.make_request("GET", f"{self._events_url()}/rollup", params=query)
+            response_json = response.json()
+
+            return [EventRollup.from_json(rollup) for rollup in response_json]
+
+        return []
+
     def logs_rotate(self, keep_last_records: int) -> None:
         """
         remove older logs from storage
@@ -20,17 +20,22 @@
 import mimetypes
 import requests
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.upload.http_upload import HttpUpload
 from ahriman.core.upload.upload import Upload
-from ahriman.core.utils import walk
+from ahriman.core.utils import package_like, walk
 from ahriman.models.package import Package
 from ahriman.models.repository_id import RepositoryId
 
 
+T = TypeVar("T")
+
+
 class GitHub(Upload, HttpUpload):
     """
     upload files to GitHub releases
@@ -40,6 +45,7 @@ class GitHub(Upload, HttpUpload):
         github_release_tag(str): GitHub release tag
         github_release_tag_name(str): GitHub release tag name
         github_repository(str): GitHub repository name
+        max_workers(int): maximal amount of concurrent asset requests
     """
 
     def __init__(self, repository_id: RepositoryId, configuration: Configuration, section: str) -> None:
@@ -61,6 +67,24 @@ class GitHub(Upload, HttpUpload):
         else:
             self.github_release_tag_name = self.github_release_tag = repository_id.architecture
 
+        self.max_workers = configuration.getint(section, "max_workers", fallback=4)
+
+    @staticmethod
+    def is_immutable(name: str, built_packages: set[str]) -> bool:
+        """
+        check if remote file can be treated as immutable one, i.e. it is package archive (or its signature) which has
+        not been rebuilt during the current run. Archive names contain full version, thus they are never changed in place
+
+        Args:
+            name(str): file name
+            built_packages(set[str]): list of file names which have just been built
+
+        Returns:
+            bool: ``True`` in case if checksum of the file can be taken from remote, ``False`` otherwise
+        """
+        path = Path(name.removesuffix(".sig"))
+        return package_like(path) and path.name not in built_packages
+
     def asset_remove(self, release: dict[str, Any], name: str) -> None:
         """
         remove asset from the release by name
@@ -103,10 +127,10 @@ class GitHub(Upload, HttpUpload):
             remote_files(dict[str, str]): map of the remote files and its checksum
         """
         local_filenames = {local_file.name for local_file in local_files}
-        for remote_file in remote_files:
-            if remote_file in local_filenames:
-                continue
-            self.asset_remove(release, remote_file)
+        self.run_concurrently(
+            lambda remote_file: self.asset_remove(release, remote_file),
+            (remote_file for remote_file in remote_files if remote_file not in local_filenames),
+        )
 
     def files_upload(self, release: dict[str, Any], local_files: dict[Path, str], remote_files: dict[str, str]) -> None:
         """
@@ -117,24 +141,47 @@ class GitHub(Upload, HttpUpload):
             local_files(dict[Path, str]): map of local file paths to its checksum
             remote_files(dict[str, str]): map of the remote files and its checksum
         """
-        for local_file, checksum in local_files.items():
-            remote_checksum = remote_files.get(local_file.name)
-            if remote_checksum == checksum:
-                continue
-            self.asset_upload(release, local_file)
+        self.run_concurrently(
+            lambda local_file: self.asset_upload(release, local_file),
+            (
+                local_file
+                for local_file, checksum in local_files.items()
+                if remote_files.get(local_file.name) != checksum
+            ),
+        )
 
-    def get_local_files(self, path: Path) -> dict[Path, str]:
+    def get_local_files(self, path: Path, remote_files: dict[str, str] | None = None,
+                        built_packages: list[Package] | None = None) -> dict[Path, str]:
         """
-        get all local files and their calculated checksums
+        get all local files and their calculated checksums. If both remote files and built packages are supplied, the
+        checksums of the unchanged package archives will be taken from the remote instead of calculating them
 
         Args:
             path(Path): local path to sync
+            remote_files(dict[str, str] | None, optional): map of the remote files and its checksum
+                (Default value = None)
+            built_packages(list[Package] | None, optional): list of packages which has just been built
+                (Default value = None)
 
         Returns:
             dict[Path, str]: map of path objects to its checksum
         """
+        remote_files = remote_files or {}
+        built_filenames = {
+            description.filename
+            for package in built_packages or []
+            for description in package.packages.values()
+            if description.filename is not None
+        }
+
+        def checksum(local_file: Path) -> str:
+            if (remote_checksum := remote_files.get(local_file.name)) is not None \
+                    and built_packages is not None and self.is_immutable(local_file.name, built_filenames):
+                return remote_checksum
+            return self.calculate_hash_cached(local_file)
+
         return {
-            local_file: self.calculate_hash(local_file)
+            local_file: checksum(local_file)
             for local_file in walk(path)
         }
 
@@ -182,6 +229,20 @@ class GitHub(Upload, HttpUpload):
         """
         self.make_request("POST", release["url"], json={"body": body})
 
+    def run_concurrently(self, action: Callable[[T], None], items: Iterable[T]) -> None:
+        """
+        run action for each item using thread pool
+
+        Args:
+            action(Callable[[T], None]): action to be called for each item
+            items(Iterable[T]): items to process
+        """
+        _ = self.session  # make sure that session is created before spawning threads
+        with ThreadPoolExecutor(max_workers=max(self.max_workers, 1)) as executor:
+            # consume results in order to raise exceptions if any
+            for _ in executor.map(action, items):
+                pass
+
     def sync(self, path: Path, built_packages: list[Package]) -> None:
         """
         sync data to remote server
@@ -194,10 +255,17 @@ class GitHub(Upload, HttpUpload):
         if release is None:
             release = self.release_create()
 
+            built_packages_filter: list[Package] | None = None  # new release, all files must be checked
+        else:
+            built_packages_filter = built_packages
+
         body: str = release.get("body") or ""
         remote_files = self.get_hashes(body)
-        local_files = self.get_local_files(path)
+        local_files = self.get_local_files(path, remote_files, built_packages_filter)
 
         self.files_upload(release, local_files, remote_files)
         self.files_remove(release, local_files, remote_files)
-        self.release_update(release, self.get_body(local_files))
+
+        new_body = self.get_body(local_files)
+        if new_body != body:
+            self.release_update(release, new_body)
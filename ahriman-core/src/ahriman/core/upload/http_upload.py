@@ -20,6 +20,7 @@
 import hashlib
 
 from pathlib import Path
+from typing import ClassVar
 
 from ahriman.core.http import SyncHttpClient
 
@@ -27,8 +28,14 @@ from ahriman.core.http import SyncHttpClient
 class HttpUpload(SyncHttpClient):
     """
     helper for the http based uploads
+
+    Attributes:
+        _hashes(dict[tuple[int, int, int, int], str]): (class attribute) cache of the calculated checksums, indexed by
+            device, inode, size and modification time of the file
     """
 
+    _hashes: ClassVar[dict[tuple[int, int, int, int], str]] = {}
+
     @staticmethod
     def calculate_hash(path: Path) -> str:
         """
@@ -41,9 +48,26 @@ class HttpUpload(SyncHttpClient):
             str: calculated checksum of the file
         """
         with path.open("rb") as local_file:
-            md5 = hashlib.md5(local_file.read(), usedforsecurity=False)
+            md5 = hashlib.file_digest(local_file, lambda: hashlib.md5(usedforsecurity=False))
             return md5.hexdigest()
 
+    @classmethod
+    def calculate_hash_cached(cls, path: Path) -> str:
+        """
+        calculate file checksum, but reuse previously calculated value if file has not been changed since then
+
+        Args:
+            path(Path): path to local file
+
+        Returns:
+            str: calculated checksum of the file
+        """
+        stat = path.stat()
+        key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if (md5 := cls._hashes.get(key)) is None:
+            md5 = cls._hashes[key] = cls.calculate_hash(path)
+        return md5
+
     @staticmethod
     def get_body(local_files: dict[Path, str]) -> str:
         """
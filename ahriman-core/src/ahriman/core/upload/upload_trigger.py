@@ -59,6 +59,11 @@ class UploadTrigger(Trigger):
                     "coerce": "integer",
                     "min": 0,
                 },
+                "max_workers": {
+                    "type": "integer",
+                    "coerce": "integer",
+                    "min": 1,
+                },
                 "owner": {
                     "type": "string",
                     "required": True,
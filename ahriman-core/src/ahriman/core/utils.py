@@ -28,9 +28,10 @@ import re
 import selectors
 import shutil
 import subprocess
+import sys
 
 from collections.abc import Callable, Iterable, Iterator, Mapping
-from dataclasses import asdict
+from dataclasses import fields, is_dataclass
 from enum import Enum
 from filelock import FileLock
 from pathlib import Path
@@ -51,6 +52,7 @@ __all__ = [
     "filelock",
     "filter_json",
     "full_version",
+    "intern_all",
     "list_flatmap",
     "minmax",
     "owner",
@@ -239,7 +241,22 @@ def dataclass_view(instance: Any) -> dict[str, Any]:
     Returns:
         dict[str, Any]: JSON representation of the dataclass with empty field removed
     """
-    return asdict(instance, dict_factory=lambda fields: {key: value for key, value in fields if value is not None})
+    # unlike dataclasses.asdict, this implementation doesn't copy leaf values, which are immutable for models anyway.
+    # Tuples are converted to lists, because they are only used as compact immutable lists by models
+    def convert(value: Any) -> Any:
+        if isinstance(value, list | tuple):
+            return [convert(item) for item in value]
+        if isinstance(value, dict):
+            return {convert(key): convert(item) for key, item in value.items()}
+        if is_dataclass(value) and not isinstance(value, type):
+            return dataclass_view(value)
+        return value
+
+    return {
+        field.name: convert(value)
+        for field in fields(instance)
+        if (value := getattr(instance, field.name)) is not None
+    }
 
 
 def enum_values(enum: type[Enum]) -> list[str]:
@@ -334,6 +351,20 @@ def full_version(epoch: str | int | None, pkgver: str, pkgrel: str) -> str:
     return f"{prefix}{pkgver}-{pkgrel}"
 
 
+def intern_all(source: Iterable[str]) -> tuple[str, ...]:
+    """
+    convert strings to immutable tuple of interned strings. This function is used by models which keep many repeated
+    values (e.g. dependencies), so that equal strings share the same object in memory
+
+    Args:
+        source(Iterable[str]): source strings
+
+    Returns:
+        tuple[str, ...]: tuple of interned strings in the same order
+    """
+    return tuple(sys.intern(value) for value in source)
+
+
 def list_flatmap(source: Iterable[T], extractor: Callable[[T], Iterable[R]]) -> list[R]:
     """
     extract elements from list of lists, flatten them and apply ``extractor``
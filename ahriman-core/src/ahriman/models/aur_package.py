@@ -21,14 +21,14 @@ import datetime
 import inflection
 
 from collections.abc import Callable
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, fields
 from pyalpm import Package  # type: ignore[import-not-found]
 from typing import Any, Self
 
-from ahriman.core.utils import filter_json, full_version, trim_package
+from ahriman.core.utils import filter_json, full_version, intern_all, trim_package
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AURPackage:
     """
     AUR package descriptor
@@ -49,15 +49,15 @@ class AURPackage:
         last_modified(datetime.datetime): timestamp of the last package submission
         url_path(str): AUR package path
         repository(str): repository name of the package
-        depends(list[str]): list of package dependencies
-        make_depends(list[str]): list of package make dependencies
-        opt_depends(list[str]): list of package optional dependencies
-        check_depends(list[str]): list of package test dependencies
-        conflicts(list[str]): conflicts list for the package
-        provides(list[str]): list of packages which this package provides
-        license(list[str]): list of package licenses
-        keywords(list[str]): list of package keywords
-        groups(list[str]): list of package groups
+        depends(tuple[str, ...]): list of package dependencies
+        make_depends(tuple[str, ...]): list of package make dependencies
+        opt_depends(tuple[str, ...]): list of package optional dependencies
+        check_depends(tuple[str, ...]): list of package test dependencies
+        conflicts(tuple[str, ...]): conflicts list for the package
+        provides(tuple[str, ...]): list of packages which this package provides
+        license(tuple[str, ...]): list of package licenses
+        keywords(tuple[str, ...]): list of package keywords
+        groups(tuple[str, ...]): list of package groups
 
     Examples:
         Mainly this class must be used from class methods instead of default :func:`__init__()`::
@@ -93,26 +93,29 @@ class AURPackage:
     maintainer: str | None = None
     submitter: str | None = None
     repository: str = "aur"
-    depends: list[str] = field(default_factory=list)
-    make_depends: list[str] = field(default_factory=list)
-    opt_depends: list[str] = field(default_factory=list)
-    check_depends: list[str] = field(default_factory=list)
-    conflicts: list[str] = field(default_factory=list)
-    provides: list[str] = field(default_factory=list)
-    license: list[str] = field(default_factory=list)
-    keywords: list[str] = field(default_factory=list)
-    groups: list[str] = field(default_factory=list)
+    depends: tuple[str, ...] = ()
+    make_depends: tuple[str, ...] = ()
+    opt_depends: tuple[str, ...] = ()
+    check_depends: tuple[str, ...] = ()
+    conflicts: tuple[str, ...] = ()
+    provides: tuple[str, ...] = ()
+    license: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
+    groups: tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
         """
         update packages lists accordingly
         """
-        object.__setattr__(self, "depends", [trim_package(package) for package in self.depends])
-        object.__setattr__(self, "make_depends", [trim_package(package) for package in self.make_depends])
-        object.__setattr__(self, "opt_depends", [trim_package(package) for package in self.opt_depends])
-        object.__setattr__(self, "check_depends", [trim_package(package) for package in self.check_depends])
-        object.__setattr__(self, "conflicts", [trim_package(package) for package in self.conflicts])
-        object.__setattr__(self, "provides", [trim_package(package) for package in self.provides])
+        object.__setattr__(self, "depends", intern_all(map(trim_package, self.depends)))
+        object.__setattr__(self, "make_depends", intern_all(map(trim_package, self.make_depends)))
+        object.__setattr__(self, "opt_depends", intern_all(map(trim_package, self.opt_depends)))
+        object.__setattr__(self, "check_depends", intern_all(map(trim_package, self.check_depends)))
+        object.__setattr__(self, "conflicts", intern_all(map(trim_package, self.conflicts)))
+        object.__setattr__(self, "provides", intern_all(map(trim_package, self.provides)))
+        object.__setattr__(self, "license", intern_all(self.license))
+        object.__setattr__(self, "keywords", intern_all(self.keywords))
+        object.__setattr__(self, "groups", intern_all(self.groups))
 
     @classmethod
     def from_json(cls, dump: dict[str, Any]) -> Self:
@@ -165,7 +168,7 @@ class AURPackage:
             conflicts=package.conflicts,
             provides=package.provides,
             license=package.licenses,
-            keywords=[],
+            keywords=(),
             groups=package.groups,
         )
 
@@ -204,7 +207,7 @@ class AURPackage:
             conflicts=dump["conflicts"],
             provides=dump["provides"],
             license=dump["licenses"],
-            keywords=[],
+            keywords=(),
             groups=dump["groups"],
         )
 
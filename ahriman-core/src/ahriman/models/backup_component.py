@@ -0,0 +1,37 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from enum import StrEnum
+
+
+class BackupComponent(StrEnum):
+    """
+    repository backup component enumeration
+
+    Attributes:
+        Cache(BackupComponent): local caches of the package sources
+        Configuration(BackupComponent): service configuration files
+        Database(BackupComponent): service database
+        GnuPG(BackupComponent): gnupg home directory with imported keys
+    """
+
+    Cache = "cache"
+    Configuration = "configuration"
+    Database = "database"
+    GnuPG = "gnupg"
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+import hashlib
+
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Self
+
+from ahriman.core.utils import dataclass_view, filter_json
+
+
+@dataclass(frozen=True, kw_only=True)
+class BackupFile:
+    """
+    backed up file descriptor
+
+    Attributes:
+        modified(int): file modification time in nanoseconds
+        sha256(str): SHA256 digest of the file content
+        size(int): file size in bytes
+    """
+
+    modified: int
+    sha256: str
+    size: int
+
+    @classmethod
+    def from_json(cls, dump: dict[str, Any]) -> Self:
+        """
+        construct file descriptor from the JSON dump
+
+        Args:
+            dump(dict[str, Any]): JSON dump body
+
+        Returns:
+            Self: file descriptor object
+        """
+        # filter to only known fields
+        known_fields = [pair.name for pair in fields(cls)]
+        return cls(**filter_json(dump, known_fields))
+
+    @classmethod
+    def from_path(cls, path: Path, previous: Self | None = None) -> Self:
+        """
+        construct file descriptor from the filesystem path. If the previous descriptor is set and file size and
+        modification time are the same, the digest will be copied from it instead of reading the file content
+
+        Args:
+            path(Path): path to the file
+            previous(Self | None, optional): descriptor of the same file from the previous backup
+                (Default value = None)
+
+        Returns:
+            Self: file descriptor object
+        """
+        stat = path.stat()
+        if previous is not None and previous.modified == stat.st_mtime_ns and previous.size == stat.st_size:
+            return cls(modified=stat.st_mtime_ns, sha256=previous.sha256, size=stat.st_size)
+
+        with path.open("rb") as file:
+            digest = hashlib.file_digest(file, "sha256")
+        return cls(modified=stat.st_mtime_ns, sha256=digest.hexdigest(), size=stat.st_size)
+
+    def view(self) -> dict[str, Any]:
+        """
+        generate json file descriptor view
+
+        Returns:
+            dict[str, Any]: json-friendly dictionary
+        """
+        return dataclass_view(self)
@@ -0,0 +1,149 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from __future__ import annotations
+
+import io
+import tarfile
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Self
+
+from ahriman.core.json_serializer import json_dumps, json_loads
+from ahriman.core.utils import dataclass_view
+from ahriman.models.backup_component import BackupComponent
+from ahriman.models.backup_file import BackupFile
+
+
+@dataclass(frozen=True)
+class BackupManifest:
+    """
+    repository backup manifest, which is stored as the first member of the archive
+
+    Attributes:
+        FILENAME(str): (class attribute) name of the manifest inside the archive
+        components(dict[BackupComponent, list[str]]): archive paths of the components roots
+        files(dict[str, BackupFile]): descriptors of all regular files at the moment of the backup. Unlike archive
+            members, this list also contains files which were not changed since previous backup
+
+    Examples:
+        Manifest can be used in order to find files which have not been changed since the previous backup::
+
+            >>> previous = BackupManifest.from_archive(archive) or BackupManifest()
+            >>> current = BackupManifest(files={name: BackupFile.from_path(path, previous.files.get(name))})
+            >>> print(current.unchanged(previous))
+    """
+
+    FILENAME: ClassVar[str] = ".ahriman-backup.json"
+
+    components: dict[BackupComponent, list[str]] = field(default_factory=dict)
+    files: dict[str, BackupFile] = field(default_factory=dict)
+
+    @classmethod
+    def from_archive(cls, archive: tarfile.TarFile) -> Self | None:
+        """
+        read manifest from the archive. Only the first member of the archive is read
+
+        Args:
+            archive(tarfile.TarFile): opened backup archive
+
+        Returns:
+            Self | None: manifest object if it is presented in the archive and ``None`` otherwise
+        """
+        member = archive.next()
+        if member is None or member.name != cls.FILENAME:
+            return None
+        content = archive.extractfile(member)
+        if content is None:
+            return None
+        return cls.from_json(json_loads(content.read()))
+
+    @classmethod
+    def from_json(cls, dump: dict[str, Any]) -> Self:
+        """
+        construct manifest from the JSON dump
+
+        Args:
+            dump(dict[str, Any]): JSON dump body
+
+        Returns:
+            Self: manifest object
+        """
+        return cls(
+            components={
+                BackupComponent(component): roots
+                for component, roots in dump.get("components", {}).items()
+            },
+            files={
+                name: BackupFile.from_json(descriptor)
+                for name, descriptor in dump.get("files", {}).items()
+            },
+        )
+
+    def component(self, name: str) -> BackupComponent | None:
+        """
+        find component to which archive member belongs
+
+        Args:
+            name(str): archive member name
+
+        Returns:
+            BackupComponent | None: component of the member if any
+        """
+        for component, roots in self.components.items():
+            if any(name == root or name.startswith(f"{root}/") for root in roots):
+                return component
+        return None
+
+    def unchanged(self, previous: BackupManifest) -> set[str]:
+        """
+        extract files which have not been changed since the previous backup
+
+        Args:
+            previous(BackupManifest): manifest of the previous backup
+
+        Returns:
+            set[str]: names of the files which have the same content as in the previous backup
+        """
+        return {
+            name
+            for name, descriptor in self.files.items()
+            if (stored := previous.files.get(name)) is not None and stored.sha256 == descriptor.sha256
+        }
+
+    def view(self) -> dict[str, Any]:
+        """
+        generate json manifest view
+
+        Returns:
+            dict[str, Any]: json-friendly dictionary
+        """
+        return dataclass_view(self)
+
+    def write(self, archive: tarfile.TarFile) -> None:
+        """
+        write manifest to the archive
+
+        Args:
+            archive(tarfile.TarFile): archive opened for writing
+        """
+        content = json_dumps(self.view())
+        member = tarfile.TarInfo(self.FILENAME)
+        member.size = len(content)
+        archive.addfile(member, io.BytesIO(content))
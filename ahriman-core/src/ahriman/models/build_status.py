@@ -43,7 +43,7 @@ class BuildStatusEnum(StrEnum):
     Success = "success"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildStatus:
     """
     build status holder
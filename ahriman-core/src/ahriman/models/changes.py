@@ -32,11 +32,13 @@ class Changes:
         last_commit_sha(str | None): last commit hash
         changes(str | None): package change since the last commit if available
         pkgbuild(str | None): original PKGBUILD content if available
+        head_commit_sha(str | None): commit hash of the sources HEAD at which changes have been calculated if available
     """
 
     last_commit_sha: str | None = None
     changes: str | None = None
     pkgbuild: str | None = None
+    head_commit_sha: str | None = None
 
     @classmethod
     def from_json(cls, dump: dict[str, Any]) -> Self:
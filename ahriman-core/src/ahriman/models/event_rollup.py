@@ -0,0 +1,199 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+import math
+
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, ClassVar, Self
+
+from ahriman.core.utils import filter_json
+from ahriman.models.event import EventType
+
+
+@dataclass(frozen=True, kw_only=True)
+class EventRollup:
+    """
+    audit log events aggregated by time bucket. Besides events count, it also exposes the same properties as
+    :class:`ahriman.models.series_statistics.SeriesStatistics` does, which are calculated for the events duration
+
+    Attributes:
+        BUCKET(int): (class attribute) bucket size in seconds
+        count(int): amount of events in bucket
+        created(int): bucket start timestamp
+        event(str | EventType): event type
+        object_id(str): object identifier
+        took_count(int): amount of events which have duration
+        took_max(float | None): maximal event duration if any
+        took_min(float | None): minimal event duration if any
+        took_squares(float): sum of squared event durations
+        took_sum(float): sum of event durations
+    """
+
+    BUCKET: ClassVar[int] = 86400
+
+    event: str | EventType
+    object_id: str
+    created: int
+    count: int = 0
+    took_count: int = 0
+    took_sum: float = 0.0
+    took_squares: float = 0.0
+    took_min: float | None = None
+    took_max: float | None = None
+
+    @property
+    def max(self) -> float | None:
+        """
+        get max duration
+
+        Returns:
+            float | None: ``None`` if there are no durations and maximal value otherwise
+        """
+        return self.took_max
+
+    @property
+    def mean(self) -> float | None:
+        """
+        get mean duration
+
+        Returns:
+            float | None: ``None`` if there are no durations and mean value otherwise
+        """
+        if self:
+            return self.took_sum / self.took_count
+        return None
+
+    @property
+    def min(self) -> float | None:
+        """
+        get min duration
+
+        Returns:
+            float | None: ``None`` if there are no durations and minimal value otherwise
+        """
+        return self.took_min
+
+    @property
+    def st_dev(self) -> float | None:
+        """
+        get standard deviation of durations
+
+        Returns:
+            float | None: ``None`` if there are no durations, 0 if there is single duration and standard deviation
+            otherwise
+        """
+        if not self:
+            return None
+        if self.took_count > 1:
+            variance = (self.took_squares - self.took_sum ** 2 / self.took_count) / (self.took_count - 1)
+            return math.sqrt(max(variance, 0.0))  # suppress rounding errors
+        return 0.0
+
+    @property
+    def total(self) -> int:
+        """
+        retrieve amount of durations
+
+        Returns:
+            int: amount of events which have duration
+        """
+        return self.took_count
+
+    @classmethod
+    def from_json(cls, dump: dict[str, Any]) -> Self:
+        """
+        construct rollup from the JSON dump
+
+        Args:
+            dump(dict[str, Any]): JSON dump body
+
+        Returns:
+            Self: rollup object
+        """
+        # filter to only known fields
+        known_fields = [pair.name for pair in fields(cls)]
+        return cls(**filter_json(dump, known_fields))
+
+    @staticmethod
+    def bucket(timestamp: int | float) -> int:
+        """
+        get bucket start for the specified timestamp
+
+        Args:
+            timestamp(int | float): event timestamp
+
+        Returns:
+            int: timestamp of the bucket start
+        """
+        return int(timestamp // EventRollup.BUCKET) * EventRollup.BUCKET
+
+    @staticmethod
+    def is_aligned(timestamp: int | float | None) -> bool:
+        """
+        check if timestamp can be used as rollups filter without loss of precision
+
+        Args:
+            timestamp(int | float | None): timestamp to check
+
+        Returns:
+            bool: ``True`` if timestamp is not set or it is start of the bucket and ``False`` otherwise
+        """
+        return timestamp is None or timestamp == EventRollup.bucket(timestamp)
+
+    def merge(self, other: Self) -> Self:
+        """
+        merge rollups. Event type and object identifier of the current object are kept, whereas the creation
+        timestamp is set to the earliest one
+
+        Args:
+            other(Self): rollup to merge with
+
+        Returns:
+            Self: merged rollup
+        """
+        durations_min = [value for value in (self.took_min, other.took_min) if value is not None]
+        durations_max = [value for value in (self.took_max, other.took_max) if value is not None]
+        return replace(
+            self,
+            created=min(self.created, other.created),
+            count=self.count + other.count,
+            took_count=self.took_count + other.took_count,
+            took_sum=self.took_sum + other.took_sum,
+            took_squares=self.took_squares + other.took_squares,
+            took_min=min(durations_min, default=None),
+            took_max=max(durations_max, default=None),
+        )
+
+    def view(self) -> dict[str, Any]:
+        """
+        generate json rollup view
+
+        Returns:
+            dict[str, Any]: json-friendly dictionary
+        """
+        return asdict(self)
+
+    def __bool__(self) -> bool:
+        """
+        check if there are durations in rollup
+
+        Returns:
+            bool: ``True`` if rollup contains durations and ``False`` otherwise
+        """
+        return bool(self.took_count)
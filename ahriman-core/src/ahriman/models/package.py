@@ -19,15 +19,15 @@
 #
 from __future__ import annotations
 
+import sys
+
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from pyalpm import vercmp  # type: ignore[import-not-found]
-from typing import Any, Self
+from typing import Any, Self, TYPE_CHECKING
 
-from ahriman.core.alpm.pacman import Pacman
 from ahriman.core.alpm.pacman_handle import PacmanHandle
-from ahriman.core.alpm.remote import AUR, Official, OfficialSyncdb
 from ahriman.core.log import LazyLogging
 from ahriman.core.utils import dataclass_view, full_version, list_flatmap, parse_version, srcinfo_property_list
 from ahriman.models.package_description import PackageDescription
@@ -36,7 +36,13 @@ from ahriman.models.pkgbuild import Pkgbuild
 from ahriman.models.remote_source import RemoteSource
 
 
-@dataclass(kw_only=True)
+# both alpm wrapper and remote clients require http client, which is not needed by the model itself. Thus, the
+# wrapper is only used for type hints, while remote clients are imported on demand
+if TYPE_CHECKING:
+    from ahriman.core.alpm.pacman import Pacman
+
+
+@dataclass(kw_only=True, slots=True)
 class Package(LazyLogging):
     """
     package properties representation
@@ -77,6 +83,13 @@ class Package(LazyLogging):
     packages: dict[str, PackageDescription]
     packager: str | None = None
 
+    def __post_init__(self) -> None:
+        """
+        intern packager name, which is usually shared between packages of the repository
+        """
+        if self.packager is not None:
+            self.packager = sys.intern(self.packager)
+
     @property
     def depends(self) -> list[str]:
         """
@@ -210,6 +223,8 @@ class Package(LazyLogging):
         Returns:
             Self: package properties
         """
+        from ahriman.core.alpm.remote import AUR
+
         package = AUR.info(name, include_provides=include_provides)
 
         remote = RemoteSource(
@@ -243,12 +258,15 @@ class Package(LazyLogging):
         """
         pkgbuild = Pkgbuild.from_file(path / "PKGBUILD")
 
+        def dependencies(key: str, properties: Pkgbuild) -> tuple[str, ...]:
+            return tuple(srcinfo_property_list(key, pkgbuild, properties, architecture=architecture))
+
         packages = {
             package: PackageDescription(
-                depends=srcinfo_property_list("depends", pkgbuild, properties, architecture=architecture),
-                make_depends=srcinfo_property_list("makedepends", pkgbuild, properties, architecture=architecture),
-                opt_depends=srcinfo_property_list("optdepends", pkgbuild, properties, architecture=architecture),
-                check_depends=srcinfo_property_list("checkdepends", pkgbuild, properties, architecture=architecture),
+                depends=dependencies("depends", properties),
+                make_depends=dependencies("makedepends", properties),
+                opt_depends=dependencies("optdepends", properties),
+                check_depends=dependencies("checkdepends", properties),
             )
             for package, properties in pkgbuild.packages().items()
         }
@@ -311,6 +329,8 @@ class Package(LazyLogging):
         Returns:
             Self: package properties
         """
+        from ahriman.core.alpm.remote import Official, OfficialSyncdb
+
         impl = OfficialSyncdb if use_syncdb else Official
         package = impl.info(name, pacman=pacman, include_provides=include_provides)
 
@@ -17,16 +17,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, fields
 from pathlib import Path
 from pyalpm import Package  # type: ignore[import-not-found]
 from typing import Any, Self
 
-from ahriman.core.utils import dataclass_view, filter_json, trim_package
+from ahriman.core.utils import dataclass_view, filter_json, intern_all, trim_package
 from ahriman.models.aur_package import AURPackage
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PackageDescription:
     """
     package specific properties
@@ -35,16 +35,16 @@ class PackageDescription:
         architecture(str | None): package architecture
         archive_size(int | None): package archive size
         build_date(int | None): package build date
-        check_depends(list[str]): package dependencies list used for check functions
-        depends(list[str]): package dependencies list
-        opt_depends(list[str]): optional package dependencies list
-        make_depends(list[str]): package dependencies list used for building
+        check_depends(tuple[str, ...]): package dependencies list used for check functions
+        depends(tuple[str, ...]): package dependencies list
+        opt_depends(tuple[str, ...]): optional package dependencies list
+        make_depends(tuple[str, ...]): package dependencies list used for building
         description(str | None): package description
         filename(str | None): package archive name
-        groups(list[str]): package groups
+        groups(tuple[str, ...]): package groups
         installed_size(int | None): package installed size
-        licenses(list[str]): package licenses list
-        provides(list[str]): list of provided packages
+        licenses(tuple[str, ...]): package licenses list
+        provides(tuple[str, ...]): list of provided packages
         url(str | None): package url
 
     Examples:
@@ -69,27 +69,30 @@ class PackageDescription:
     architecture: str | None = None
     archive_size: int | None = None
     build_date: int | None = None
-    depends: list[str] = field(default_factory=list)
-    make_depends: list[str] = field(default_factory=list)
-    opt_depends: list[str] = field(default_factory=list)
-    check_depends: list[str] = field(default_factory=list)
+    depends: tuple[str, ...] = ()
+    make_depends: tuple[str, ...] = ()
+    opt_depends: tuple[str, ...] = ()
+    check_depends: tuple[str, ...] = ()
     description: str | None = None
     filename: str | None = None
-    groups: list[str] = field(default_factory=list)
+    groups: tuple[str, ...] = ()
     installed_size: int | None = None
-    licenses: list[str] = field(default_factory=list)
-    provides: list[str] = field(default_factory=list)
+    licenses: tuple[str, ...] = ()
+    provides: tuple[str, ...] = ()
     url: str | None = None
 
     def __post_init__(self) -> None:
         """
-        update packages lists accordingly
+        update packages lists accordingly. Lists are stored as tuples of interned strings, because the same names are
+        repeated across thousands of packages
         """
-        self.depends = [trim_package(package) for package in self.depends]
-        self.make_depends = [trim_package(package) for package in self.make_depends]
-        self.opt_depends = [trim_package(package) for package in self.opt_depends]
-        self.check_depends = [trim_package(package) for package in self.check_depends]
-        self.provides = [trim_package(package) for package in self.provides]
+        self.depends = intern_all(map(trim_package, self.depends))
+        self.make_depends = intern_all(map(trim_package, self.make_depends))
+        self.opt_depends = intern_all(map(trim_package, self.opt_depends))
+        self.check_depends = intern_all(map(trim_package, self.check_depends))
+        self.groups = intern_all(self.groups)
+        self.licenses = intern_all(self.licenses)
+        self.provides = intern_all(map(trim_package, self.provides))
 
     @property
     def filepath(self) -> Path | None:
@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import sys
+
 from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, Self
@@ -26,7 +28,7 @@ from ahriman.core.utils import dataclass_view, filter_json
 from ahriman.models.package_source import PackageSource
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class RemoteSource:
     """
     remote package source properties
@@ -47,9 +49,13 @@ class RemoteSource:
 
     def __post_init__(self) -> None:
         """
-        convert source to enum type
+        convert source to enum type and intern values which are usually shared between packages
         """
         object.__setattr__(self, "source", PackageSource(self.source))
+        if self.path is not None:
+            object.__setattr__(self, "path", sys.intern(self.path))
+        if self.branch is not None:
+            object.__setattr__(self, "branch", sys.intern(self.branch))
 
     @property
     def is_remote(self) -> bool:
@@ -117,6 +117,34 @@ def test_with_dependencies(application: Application, package_ahriman: Package, p
     ], any_order=True)
 
 
+def test_with_dependencies_cached(application: Application, package_ahriman: Package,
+                                  package_python_schedule: Package, mocker: MockerFixture) -> None:
+    """
+    must load shared dependencies only once
+    """
+    dependency = MagicMock()
+    dependency.base = "python-installer"
+    dependency.depends_build = []
+    dependency.packages_full = ["python-installer"]
+
+    package_python_schedule.packager = package_ahriman.packager
+    for description in (*package_ahriman.packages.values(), *package_python_schedule.packages.values()):
+        description.depends = []
+        description.make_depends = ["python-installer"]
+        description.check_depends = []
+
+    mocker.patch("pathlib.Path.is_dir", return_value=False)
+    package_aur_mock = mocker.patch("ahriman.models.package.Package.from_aur", return_value=dependency)
+    mocker.patch("ahriman.application.application.Application._known_packages", return_value=set())
+    mocker.patch("ahriman.core.status.Client.set_unknown")
+
+    result = application.with_dependencies([package_ahriman, package_python_schedule], process_dependencies=True)
+    assert {package.base for package in result} == {
+        package_ahriman.base, package_python_schedule.base, "python-installer",
+    }
+    package_aur_mock.assert_called_once_with("python-installer", package_ahriman.packager, include_provides=True)
+
+
 def test_with_dependencies_exception(application: Application, package_ahriman: Package,
                                      package_python_schedule: Package, mocker: MockerFixture) -> None:
     """
@@ -5,8 +5,8 @@ from pytest_mock import MockerFixture
 from unittest.mock import call as MockCall
 
 from ahriman.application.application.application_repository import ApplicationRepository
-from ahriman.core.exceptions import UnknownPackageError
 from ahriman.core.tree import Leaf, Tree
+from ahriman.models.aur_package import AURPackage
 from ahriman.models.changes import Changes
 from ahriman.models.package import Package
 from ahriman.models.packagers import Packagers
@@ -18,14 +18,14 @@ def test_changes(application_repository: ApplicationRepository, package_ahriman:
     """
     must generate changes for the packages
     """
-    changes = Changes("sha", "change")
+    changes = Changes("sha", "change", None, "sha2")
     hashes_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_changes_get", return_value=changes)
     changes_mock = mocker.patch("ahriman.core.repository.Repository.package_changes", return_value=changes)
     report_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_changes_update")
 
     application_repository.changes([package_ahriman])
     hashes_mock.assert_called_once_with(package_ahriman.base)
-    changes_mock.assert_called_once_with(package_ahriman, changes.last_commit_sha)
+    changes_mock.assert_called_once_with(package_ahriman, changes.last_commit_sha, changes.head_commit_sha)
     report_mock.assert_called_once_with(package_ahriman.base, changes)
 
 
@@ -56,6 +56,17 @@ def test_changes_no_update(application_repository: ApplicationRepository, packag
     report_mock.assert_not_called()
 
 
+def test_clean_archives(application_repository: ApplicationRepository, mocker: MockerFixture) -> None:
+    """
+    must rotate archives
+    """
+    application_repository.configuration.set_option("archive", "keep_built_packages", "2")
+    clear_mock = mocker.patch("ahriman.core.repository.Repository.clear_archives")
+    application_repository.clean(archives=True, cache=False, chroot=False, manual=False, packages=False,
+                                 pacman=False)
+    clear_mock.assert_called_once_with(2)
+
+
 def test_clean_cache(application_repository: ApplicationRepository, mocker: MockerFixture) -> None:
     """
     must clean cache directory
@@ -116,17 +127,17 @@ def test_sign(application_repository: ApplicationRepository, package_ahriman: Pa
     """
     mocker.patch("ahriman.core.repository.repository.Repository.packages",
                  return_value=[package_ahriman, package_python_schedule])
-    sign_package_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_sign_package")
+    sign_package_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_sign_packages")
     sign_repository_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_sign_repository")
     on_result_mock = mocker.patch(
         "ahriman.application.application.application_repository.ApplicationRepository.on_result")
 
     application_repository.sign([])
-    sign_package_mock.assert_has_calls([
-        MockCall(pytest.helpers.anyvar(int), None),
-        MockCall(pytest.helpers.anyvar(int), None),
-        MockCall(pytest.helpers.anyvar(int), None),
-    ])
+    sign_package_mock.assert_called_once_with([
+        archive.filepath
+        for package in (package_ahriman, package_python_schedule)
+        for archive in package.packages.values()
+    ], None)
     sign_repository_mock.assert_called_once_with(application_repository.repository.repo.repo_path)
     on_result_mock.assert_called_once_with(Result())
 
@@ -140,8 +151,10 @@ def test_sign_skip(application_repository: ApplicationRepository, package_ahrima
     mocker.patch("ahriman.core.repository.repository.Repository.packages", return_value=[package_ahriman])
     mocker.patch("ahriman.application.application.application_repository.ApplicationRepository.update")
     mocker.patch("ahriman.application.application.application_repository.ApplicationRepository.on_result")
+    sign_package_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_sign_packages")
 
     application_repository.sign([])
+    sign_package_mock.assert_called_once_with([], None)
 
 
 def test_unknown_no_aur(application_repository: ApplicationRepository, package_ahriman: Package,
@@ -150,12 +163,13 @@ def test_unknown_no_aur(application_repository: ApplicationRepository, package_a
     must return empty list in case if there is locally stored PKGBUILD
     """
     mocker.patch("ahriman.core.repository.repository.Repository.packages", return_value=[package_ahriman])
-    mocker.patch("ahriman.models.package.Package.from_aur", side_effect=UnknownPackageError(package_ahriman.base))
+    info_mock = mocker.patch("ahriman.core.alpm.remote.AUR.multiinfo", return_value=[])
     mocker.patch("ahriman.models.package.Package.from_build", return_value=package_ahriman)
     mocker.patch("pathlib.Path.is_dir", return_value=True)
     mocker.patch("ahriman.core.build_tools.sources.Sources.has_remotes", return_value=False)
 
     assert not application_repository.unknown()
+    info_mock.assert_called_once_with()
 
 
 def test_unknown_no_aur_no_local(application_repository: ApplicationRepository, package_ahriman: Package,
@@ -164,7 +178,7 @@ def test_unknown_no_aur_no_local(application_repository: ApplicationRepository,
     must return list of packages missing in aur and in local storage
     """
     mocker.patch("ahriman.core.repository.repository.Repository.packages", return_value=[package_ahriman])
-    mocker.patch("ahriman.models.package.Package.from_aur", side_effect=UnknownPackageError(package_ahriman.base))
+    mocker.patch("ahriman.core.alpm.remote.AUR.multiinfo", return_value=[])
     mocker.patch("pathlib.Path.is_dir", return_value=False)
 
     packages = application_repository.unknown()
@@ -172,15 +186,33 @@ def test_unknown_no_aur_no_local(application_repository: ApplicationRepository,
 
 
 def test_unknown_no_local(application_repository: ApplicationRepository, package_ahriman: Package,
-                          mocker: MockerFixture) -> None:
+                          aur_package_ahriman: AURPackage, mocker: MockerFixture) -> None:
     """
     must return empty list in case if there is package in AUR
     """
     mocker.patch("ahriman.core.repository.repository.Repository.packages", return_value=[package_ahriman])
-    mocker.patch("ahriman.models.package.Package.from_aur")
+    info_mock = mocker.patch("ahriman.core.alpm.remote.AUR.multiinfo", return_value=[aur_package_ahriman])
     mocker.patch("pathlib.Path.is_dir", return_value=False)
 
     assert not application_repository.unknown()
+    info_mock.assert_called_once_with(*package_ahriman.packages.keys())
+
+
+def test_unknown_mixed(application_repository: ApplicationRepository, package_ahriman: Package,
+                       package_python_schedule: Package, mocker: MockerFixture) -> None:
+    """
+    must check packages with local sources locally and others in AUR
+    """
+    mocker.patch("ahriman.core.repository.repository.Repository.packages",
+                 return_value=[package_ahriman, package_python_schedule])
+    info_mock = mocker.patch("ahriman.core.alpm.remote.AUR.multiinfo", return_value=[])
+    mocker.patch("ahriman.models.package.Package.from_build", return_value=package_ahriman)
+    mocker.patch("pathlib.Path.is_dir", autospec=True,
+                 side_effect=lambda path: path.name == package_ahriman.base)
+    mocker.patch("ahriman.core.build_tools.sources.Sources.has_remotes", return_value=False)
+
+    assert application_repository.unknown() == list(package_python_schedule.packages.keys())
+    info_mock.assert_called_once_with(*package_python_schedule.packages.keys())
 
 
 def test_update(application_repository: ApplicationRepository, package_ahriman: Package, result: Result,
@@ -5,6 +5,7 @@ from ahriman.application.application.workers.local_updater import LocalUpdater
 from ahriman.application.application.workers.remote_updater import RemoteUpdater
 from ahriman.core.configuration import Configuration
 from ahriman.core.repository import Repository
+from ahriman.core.status import Client
 from ahriman.models.worker import Worker
 
 
@@ -23,18 +24,19 @@ def local_updater(repository: Repository) -> LocalUpdater:
 
 
 @pytest.fixture
-def remote_updater(configuration: Configuration) -> RemoteUpdater:
+def remote_updater(configuration: Configuration, local_client: Client) -> RemoteUpdater:
     """
     local updater fixture
 
     Args:
         configuration(Configuration): configuration fixture
+        local_client(Client): local status client fixture
 
     Returns:
         RemoteUpdater: remote updater test instance
     """
     _, repository_id = configuration.check_loaded()
-    return RemoteUpdater([Worker("remote1"), Worker("remote2")], repository_id, configuration)
+    return RemoteUpdater([Worker("remote1"), Worker("remote2")], repository_id, configuration, local_client)
 
 
 @pytest.fixture
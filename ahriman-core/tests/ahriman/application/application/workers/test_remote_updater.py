@@ -1,7 +1,14 @@
+import pytest
+import requests
+
 from pytest_mock import MockerFixture
+from unittest.mock import call as MockCall
 
 from ahriman.application.application.workers.remote_updater import RemoteUpdater
 from ahriman.core.http import SyncAhrimanClient
+from ahriman.models.build_status import BuildStatus, BuildStatusEnum
+from ahriman.models.event import EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.package import Package
 from ahriman.models.packagers import Packagers
 from ahriman.models.result import Result
@@ -13,11 +20,59 @@ def test_clients(remote_updater: RemoteUpdater) -> None:
     """
     worker = remote_updater.workers[0]
     client = SyncAhrimanClient()
-    remote_updater._clients.append((worker, client))
+    remote_updater._clients[worker] = client
 
     assert remote_updater.clients == {worker: client}
 
 
+def test_durations(remote_updater: RemoteUpdater, mocker: MockerFixture) -> None:
+    """
+    must extract average build durations from the recent rollups
+    """
+    event_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.event_rollup_get", return_value=[
+        EventRollup(event=EventType.PackageUpdated, object_id="ahriman", created=0, count=1, took_count=1,
+                    took_sum=1.0, took_squares=1.0, took_min=1.0, took_max=1.0),
+        EventRollup(event=EventType.PackageUpdated, object_id="ahriman", created=EventRollup.BUCKET, count=1,
+                    took_count=1, took_sum=3.0, took_squares=9.0, took_min=3.0, took_max=3.0),
+        EventRollup(event=EventType.PackageUpdated, object_id="python-schedule", created=0, count=1),
+    ])
+
+    assert remote_updater.durations == {"ahriman": 2.0}
+    event_mock.assert_called_once_with(EventType.PackageUpdated, None, pytest.helpers.anyvar(int, strict=True))
+    from_date = event_mock.call_args.args[2]
+    assert EventRollup.is_aligned(from_date)
+
+
+def test_durations_exception(remote_updater: RemoteUpdater, mocker: MockerFixture) -> None:
+    """
+    must return empty durations on exception
+    """
+    mocker.patch("ahriman.core.status.local_client.LocalClient.event_rollup_get", side_effect=Exception)
+    assert remote_updater.durations == {}
+
+
+def test_workers_load(remote_updater: RemoteUpdater, package_ahriman: Package) -> None:
+    """
+    must return load of reachable workers
+    """
+    worker1, worker2 = remote_updater.workers
+    remote_updater.durations = {package_ahriman.base: 2.0}
+    remote_updater._processes[worker1] = {"1": [package_ahriman], "2": [package_ahriman]}
+    assert remote_updater.workers_load == {worker1: 4.0, worker2: 0.0}
+
+    remote_updater._unreachable.add(worker1)
+    assert remote_updater.workers_load == {worker2: 0.0}
+
+
+def test_process_url(remote_updater: RemoteUpdater) -> None:
+    """
+    must generate process url correctly
+    """
+    worker = remote_updater.workers[0]
+    assert remote_updater._process_url(worker, "id").startswith(worker.address)
+    assert remote_updater._process_url(worker, "id").endswith("/api/v1/service/process/id")
+
+
 def test_update_url(remote_updater: RemoteUpdater) -> None:
     """
     must generate update url correctly
@@ -27,57 +82,295 @@ def test_update_url(remote_updater: RemoteUpdater) -> None:
     assert remote_updater._update_url(worker).endswith("/api/v1/service/add")
 
 
-def test_next_worker(remote_updater: RemoteUpdater) -> None:
+def test_collect(remote_updater: RemoteUpdater, package_ahriman: Package, package_python_schedule: Package,
+                 mocker: MockerFixture) -> None:
     """
-    must return next not used worker
+    must collect build results from status API
     """
-    assert remote_updater.next_worker()[0] == remote_updater.workers[0]
-    assert len(remote_updater.clients) == 1
-    assert remote_updater.workers[0] in remote_updater.clients
+    mocker.patch("ahriman.core.status.local_client.LocalClient.package_get", side_effect=[
+        [(package_ahriman, BuildStatus(BuildStatusEnum.Success, 42))],
+        [(package_python_schedule, BuildStatus(BuildStatusEnum.Failed, 42))],
+    ])
 
-    assert remote_updater.next_worker()[0] == remote_updater.workers[1]
-    assert remote_updater.workers[1] in remote_updater.clients
-    assert len(remote_updater.clients) == 2
+    result = remote_updater.collect([package_ahriman, package_python_schedule], 42)
+    assert result.success == [package_ahriman]
+    assert result.failed == [package_python_schedule]
 
 
-def test_next_worker_cycle(remote_updater: RemoteUpdater) -> None:
+def test_collect_outdated(remote_updater: RemoteUpdater, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
-    must return first used worker if no free workers left
+    must mark package as failed if its status has not been updated since start
     """
-    worker1, client1 = remote_updater.next_worker()
-    worker2, client2 = remote_updater.next_worker()
+    mocker.patch("ahriman.core.status.local_client.LocalClient.package_get",
+                 return_value=[(package_ahriman, BuildStatus(BuildStatusEnum.Success, 41))])
+    assert remote_updater.collect([package_ahriman], 42).failed == [package_ahriman]
 
-    assert remote_updater.next_worker() == (worker1, client1)
-    assert remote_updater.next_worker() == (worker2, client2)
-    assert remote_updater.next_worker() == (worker1, client1)
 
-
-def test_partition(remote_updater: RemoteUpdater, mocker: MockerFixture) -> None:
+def test_collect_exception(remote_updater: RemoteUpdater, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
-    must partition as tree partition
+    must mark package as failed if status could not be loaded
     """
-    resolve_mock = mocker.patch("ahriman.core.tree.Tree.partition")
-    remote_updater.partition([])
-    resolve_mock.assert_called_once_with([], count=2)
+    mocker.patch("ahriman.core.status.local_client.LocalClient.package_get", side_effect=Exception)
+    assert remote_updater.collect([package_ahriman], 42).failed == [package_ahriman]
 
 
-def test_update(remote_updater: RemoteUpdater, package_ahriman: Package, mocker: MockerFixture) -> None:
+def test_dispatch(remote_updater: RemoteUpdater, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
-    must process remote package updates
+    must send packages to the least loaded worker
     """
     worker, client = remote_updater.next_worker()
     worker_mock = mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.next_worker",
                                return_value=(worker, client))
-    request_mock = mocker.patch("ahriman.core.http.SyncAhrimanClient.make_request")
+    response_obj = requests.Response()
+    response_obj._content = """{"process_id": "id"}""".encode("utf8")
+    request_mock = mocker.patch("ahriman.core.http.SyncAhrimanClient.make_request", return_value=response_obj)
 
-    assert remote_updater.update([package_ahriman], Packagers("username"), bump_pkgrel=True) == Result()
+    assert remote_updater.dispatch([package_ahriman], {"refresh": True})
     worker_mock.assert_called_once_with()
     request_mock.assert_called_once_with("POST", remote_updater._update_url(worker),
                                          params=remote_updater.repository_id.query(),
                                          json={
-                                             "increment": False,
-                                             "packager": "username",
                                              "packages": [package_ahriman.base],
-                                             "patches": [],
                                              "refresh": True,
     })
+    assert remote_updater._processes == {worker: {"id": [package_ahriman]}}
+
+
+def test_dispatch_unreachable(remote_updater: RemoteUpdater, package_ahriman: Package,
+                              mocker: MockerFixture) -> None:
+    """
+    must dispatch packages to the next worker if the current one is unreachable
+    """
+    worker1, worker2 = remote_updater.workers
+    response_obj = requests.Response()
+    response_obj._content = """{"process_id": "id"}""".encode("utf8")
+    request_mock = mocker.patch("ahriman.core.http.SyncAhrimanClient.make_request",
+                                side_effect=[Exception, response_obj])
+
+    assert remote_updater.dispatch([package_ahriman], {})
+    assert request_mock.call_count == 2
+    assert worker1 in remote_updater._unreachable
+    assert remote_updater._processes == {worker2: {"id": [package_ahriman]}}
+
+
+def test_dispatch_no_workers(remote_updater: RemoteUpdater, package_ahriman: Package,
+                             mocker: MockerFixture) -> None:
+    """
+    must return False if there are no reachable workers
+    """
+    mocker.patch("ahriman.core.http.SyncAhrimanClient.make_request", side_effect=Exception)
+
+    assert not remote_updater.dispatch([package_ahriman], {})
+    assert not remote_updater.workers_load
+
+
+def test_estimate(remote_updater: RemoteUpdater, package_ahriman: Package, package_python_schedule: Package) -> None:
+    """
+    must estimate build duration
+    """
+    remote_updater.durations = {package_ahriman.base: 3.0, "random": 1.0}
+    assert remote_updater.estimate([package_ahriman]) == 3.0
+    assert remote_updater.estimate([package_ahriman, package_python_schedule]) == 5.0
+    assert remote_updater.estimate([]) == 0.0
+
+
+def test_estimate_empty(remote_updater: RemoteUpdater, package_ahriman: Package) -> None:
+    """
+    must use default estimate if no durations available
+    """
+    remote_updater.durations = {}
+    assert remote_updater.estimate([package_ahriman]) == 1.0
+
+
+def test_is_process_alive(remote_updater: RemoteUpdater, mocker: MockerFixture) -> None:
+    """
+    must check if process is alive
+    """
+    worker, _ = remote_updater.next_worker()
+    response_obj = requests.Response()
+    response_obj._content = """{"is_alive": true}""".encode("utf8")
+    request_mock = mocker.patch("ahriman.core.http.SyncAhrimanClient.make_request", return_value=response_obj)
+
+    assert remote_updater.is_process_alive(worker, "id")
+    request_mock.assert_called_once_with("GET", remote_updater._process_url(worker, "id"))
+
+
+def test_is_process_alive_unknown(remote_updater: RemoteUpdater, mocker: MockerFixture) -> None:
+    """
+    must correctly define if process is unknown
+    """
+    worker, _ = remote_updater.next_worker()
+    response = requests.Response()
+    response.status_code = 404
+    mocker.patch("ahriman.core.http.SyncAhrimanClient.make_request", side_effect=requests.HTTPError(response=response))
+
+    assert not remote_updater.is_process_alive(worker, "id")
+
+
+def test_is_process_alive_http_error(remote_updater: RemoteUpdater, mocker: MockerFixture) -> None:
+    """
+    must reraise http exception on process request
+    """
+    worker, _ = remote_updater.next_worker()
+    response = requests.Response()
+    response.status_code = 500
+    mocker.patch("ahriman.core.http.SyncAhrimanClient.make_request", side_effect=requests.HTTPError(response=response))
+
+    with pytest.raises(requests.HTTPError):
+        remote_updater.is_process_alive(worker, "id")
+
+
+def test_next_worker(remote_updater: RemoteUpdater, package_ahriman: Package) -> None:
+    """
+    must return the least loaded worker
+    """
+    worker1, worker2 = remote_updater.workers
+
+    assert remote_updater.next_worker()[0] == worker1
+    assert len(remote_updater.clients) == 1
+    assert worker1 in remote_updater.clients
+
+    remote_updater._processes[worker1] = {"id": [package_ahriman]}
+    assert remote_updater.next_worker()[0] == worker2
+    assert worker2 in remote_updater.clients
+    assert len(remote_updater.clients) == 2
+
+
+def test_next_worker_cached(remote_updater: RemoteUpdater) -> None:
+    """
+    must reuse already created clients
+    """
+    worker, client = remote_updater.next_worker()
+    assert remote_updater.next_worker() == (worker, client)
+
+
+def test_next_worker_unreachable(remote_updater: RemoteUpdater) -> None:
+    """
+    must skip unreachable workers
+    """
+    worker1, worker2 = remote_updater.workers
+    remote_updater._unreachable.add(worker1)
+    assert remote_updater.next_worker()[0] == worker2
+
+    remote_updater._unreachable.add(worker2)
+    assert remote_updater.next_worker() is None
+
+
+def test_partition(remote_updater: RemoteUpdater, package_ahriman: Package, package_python_schedule: Package) -> None:
+    """
+    must return all packages as single partition
+    """
+    assert remote_updater.partition([package_ahriman, package_python_schedule]) == [
+        [package_ahriman, package_python_schedule],
+    ]
+    assert remote_updater.partition([]) == []
+
+
+def test_poll(remote_updater: RemoteUpdater, package_ahriman: Package, package_python_schedule: Package,
+              mocker: MockerFixture) -> None:
+    """
+    must remove finished processes
+    """
+    worker1, worker2 = remote_updater.workers
+    remote_updater._processes = {worker1: {"1": [package_ahriman], "2": [package_python_schedule]}, worker2: {"3": []}}
+    mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.is_process_alive",
+                 side_effect=[False, True, False])
+
+    assert remote_updater.poll() == []
+    assert remote_updater._processes == {worker1: {"2": [package_python_schedule]}}
+
+
+def test_poll_unreachable(remote_updater: RemoteUpdater, package_ahriman: Package, package_python_schedule: Package,
+                          mocker: MockerFixture) -> None:
+    """
+    must return packages of the unreachable workers
+    """
+    worker1, worker2 = remote_updater.workers
+    remote_updater._processes = {worker1: {"1": [package_ahriman], "2": [package_python_schedule]}, worker2: {"3": []}}
+    mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.is_process_alive",
+                 side_effect=[True, Exception, True])
+
+    assert remote_updater.poll() == [[package_ahriman], [package_python_schedule]]
+    assert remote_updater._processes == {worker2: {"3": []}}
+    assert worker1 in remote_updater._unreachable
+
+
+def test_update(remote_updater: RemoteUpdater, package_ahriman: Package, package_python_schedule: Package,
+                mocker: MockerFixture) -> None:
+    """
+    must process remote package updates
+    """
+    worker = remote_updater.workers[0]
+    mocker.patch("ahriman.core.tree.Tree.partition", return_value=[[package_ahriman], [package_python_schedule], []])
+    remote_updater.durations = {package_ahriman.base: 1.0, package_python_schedule.base: 2.0}
+
+    def dispatch(packages: list[Package], _: dict[str, str]) -> bool:
+        remote_updater._processes.setdefault(worker, {})[packages[0].base] = packages
+        return True
+
+    dispatch_mock = mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.dispatch",
+                                 side_effect=dispatch)
+    poll_mock = mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.poll",
+                             side_effect=lambda: remote_updater._processes.clear() or [])
+    sleep_mock = mocker.patch("time.sleep")
+    collect_mock = mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.collect",
+                                return_value=Result(updated=[package_ahriman]))
+
+    result = remote_updater.update([package_ahriman, package_python_schedule], Packagers("username"))
+    assert result.success == [package_ahriman]
+    dispatch_mock.assert_has_calls([
+        MockCall([package_python_schedule], pytest.helpers.anyvar(dict)),
+        MockCall([package_ahriman], pytest.helpers.anyvar(dict)),
+    ])
+    assert dispatch_mock.call_args.args[1] == {
+        "increment": False,
+        "packager": "username",
+        "patches": [],
+        "refresh": True,
+    }
+    poll_mock.assert_called_once_with()
+    sleep_mock.assert_called_once_with(remote_updater.POLL_INTERVAL)
+    collect_mock.assert_called_once_with([package_ahriman, package_python_schedule], pytest.helpers.anyvar(int))
+
+
+def test_update_redispatch(remote_updater: RemoteUpdater, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must dispatch packages of the unreachable workers again
+    """
+    worker = remote_updater.workers[0]
+    mocker.patch("ahriman.core.tree.Tree.partition", return_value=[[package_ahriman]])
+
+    def dispatch(packages: list[Package], _: dict[str, str]) -> bool:
+        remote_updater._processes.setdefault(worker, {})["id"] = packages
+        return True
+
+    dispatch_mock = mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.dispatch",
+                                 side_effect=dispatch)
+    lost = iter([[[package_ahriman]], []])
+
+    def poll() -> list[list[Package]]:
+        remote_updater._processes.clear()
+        return next(lost)
+
+    mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.poll", side_effect=poll)
+    mocker.patch("time.sleep")
+    mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.collect",
+                 return_value=Result())
+
+    remote_updater.update([package_ahriman])
+    assert dispatch_mock.call_count == 2
+
+
+def test_update_no_workers(remote_updater: RemoteUpdater, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must mark packages as failed if there are no reachable workers
+    """
+    mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.dispatch", return_value=False)
+    collect_mock = mocker.patch("ahriman.application.application.workers.remote_updater.RemoteUpdater.collect",
+                                return_value=Result())
+    sleep_mock = mocker.patch("time.sleep")
+
+    result = remote_updater.update([package_ahriman])
+    assert result.failed == [package_ahriman]
+    sleep_mock.assert_not_called()
+    collect_mock.assert_called_once_with([], pytest.helpers.anyvar(int))
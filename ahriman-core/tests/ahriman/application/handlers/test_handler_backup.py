@@ -1,4 +1,8 @@
 import argparse
+import io
+import pytest
+import sqlite3
+import tarfile
 
 from pathlib import Path
 from pytest_mock import MockerFixture
@@ -6,6 +10,9 @@ from unittest.mock import MagicMock
 
 from ahriman.application.handlers.backup import Backup
 from ahriman.core.configuration import Configuration
+from ahriman.models.backup_component import BackupComponent
+from ahriman.models.backup_file import BackupFile
+from ahriman.models.backup_manifest import BackupManifest
 from ahriman.models.repository_paths import RepositoryPaths
 
 
@@ -20,6 +27,9 @@ def _default_args(args: argparse.Namespace) -> argparse.Namespace:
         argparse.Namespace: generated arguments for these test cases
     """
     args.path = Path("result.tar.gz")
+    args.compression = None
+    args.incremental = None
+    args.jobs = None
     return args
 
 
@@ -28,14 +38,193 @@ def test_run(args: argparse.Namespace, configuration: Configuration, mocker: Moc
     must run command
     """
     args = _default_args(args)
-    mocker.patch("ahriman.application.handlers.backup.Backup.get_paths", return_value=[Path("path")])
-    tarfile = MagicMock()
-    add_mock = tarfile.__enter__.return_value = MagicMock()
-    mocker.patch("ahriman.application.handlers.backup.tarfile.open", return_value=tarfile)
+    mocker.patch("ahriman.application.handlers.backup.Backup.get_paths",
+                 return_value={Path("/path"): BackupComponent.Configuration})
+    mocker.patch("ahriman.application.handlers.backup.Backup.walk", return_value=[Path("/path")])
+    manifest_mock = mocker.patch("ahriman.application.handlers.backup.Backup.manifest",
+                                 return_value=BackupManifest())
+    snapshot_mock = mocker.patch("ahriman.application.handlers.backup.Backup.database_snapshot")
+    add_mock = mocker.patch("ahriman.application.handlers.backup.Backup.archive_add")
+    archive_mock = MagicMock()
+    archive = archive_mock.__enter__.return_value = MagicMock()
+    open_mock = mocker.patch("ahriman.application.handlers.backup.tarfile.open", return_value=archive_mock)
 
     _, repository_id = configuration.check_loaded()
     Backup.run(args, repository_id, configuration, report=False)
-    add_mock.add.assert_called_once_with(Path("path"))
+    open_mock.assert_called_once_with(args.path, mode="w")
+    manifest_mock.assert_called_once_with(
+        {Path("/path"): Path("/path")}, {Path("/path"): BackupComponent.Configuration}, BackupManifest(), args.jobs)
+    snapshot_mock.assert_not_called()
+    archive.addfile.assert_called_once_with(pytest.helpers.anyvar(int), pytest.helpers.anyvar(int))
+    add_mock.assert_called_once_with(archive, Path("/path"), Path("/path"))
+
+
+def test_run_database(args: argparse.Namespace, configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must replace database by its snapshot
+    """
+    args = _default_args(args)
+    mocker.patch("ahriman.application.handlers.backup.Backup.get_paths",
+                 return_value={Path("/ahriman.db"): BackupComponent.Database})
+    mocker.patch("ahriman.core.database.SQLite.database_path", return_value=Path("/ahriman.db"))
+    mocker.patch("ahriman.application.handlers.backup.Backup.walk", return_value=[Path("/ahriman.db")])
+    mocker.patch("ahriman.application.handlers.backup.Backup.manifest", return_value=BackupManifest())
+    snapshot_mock = mocker.patch("ahriman.application.handlers.backup.Backup.database_snapshot",
+                                 return_value=Path("snapshot"))
+    add_mock = mocker.patch("ahriman.application.handlers.backup.Backup.archive_add")
+    archive_mock = MagicMock()
+    archive = archive_mock.__enter__.return_value = MagicMock()
+    mocker.patch("ahriman.application.handlers.backup.tarfile.open", return_value=archive_mock)
+
+    _, repository_id = configuration.check_loaded()
+    Backup.run(args, repository_id, configuration, report=False)
+    snapshot_mock.assert_called_once_with(Path("/ahriman.db"), pytest.helpers.anyvar(Path, strict=True))
+    add_mock.assert_called_once_with(archive, Path("/ahriman.db"), Path("snapshot"))
+
+
+def test_run_incremental(args: argparse.Namespace, configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must skip files which have not been changed since the previous backup
+    """
+    args = _default_args(args)
+    args.incremental = Path("previous.tar")
+    manifest = BackupManifest(files={"path": BackupFile(modified=1, sha256="sha", size=1)})
+    mocker.patch("ahriman.application.handlers.backup.Backup.get_paths",
+                 return_value={Path("/path"): BackupComponent.Configuration})
+    mocker.patch("ahriman.application.handlers.backup.Backup.walk", return_value=[Path("/path"), Path("/new")])
+    read_mock = mocker.patch("ahriman.models.backup_manifest.BackupManifest.from_archive", return_value=manifest)
+    manifest_mock = mocker.patch("ahriman.application.handlers.backup.Backup.manifest", return_value=manifest)
+    add_mock = mocker.patch("ahriman.application.handlers.backup.Backup.archive_add")
+    archive_mock = MagicMock()
+    archive = archive_mock.__enter__.return_value = MagicMock()
+    mocker.patch("ahriman.application.handlers.backup.tarfile.open", return_value=archive_mock)
+
+    _, repository_id = configuration.check_loaded()
+    Backup.run(args, repository_id, configuration, report=False)
+    read_mock.assert_called_once_with(archive)
+    manifest_mock.assert_called_once_with(pytest.helpers.anyvar(int), pytest.helpers.anyvar(int), manifest, args.jobs)
+    add_mock.assert_called_once_with(archive, Path("/new"), Path("/new"))
+
+
+def test_archive_add(tmp_path: Path) -> None:
+    """
+    must add file content from the source with metadata of the original path
+    """
+    path = tmp_path / "file"
+    path.write_text("content")
+    path.chmod(0o600)
+    source = tmp_path / "source"
+    source.write_text("source content")
+    content = io.BytesIO()
+
+    with tarfile.open(fileobj=content, mode="w") as archive:
+        Backup.archive_add(archive, path, source)
+
+    content.seek(0)
+    with tarfile.open(fileobj=content) as archive:
+        member = archive.getmember(Backup.archive_name(path))
+        assert member.mode == 0o600
+        assert archive.extractfile(member).read() == b"source content"
+
+
+def test_archive_add_directory(tmp_path: Path) -> None:
+    """
+    must add directory without its content
+    """
+    (tmp_path / "file").touch()
+    content = io.BytesIO()
+
+    with tarfile.open(fileobj=content, mode="w") as archive:
+        Backup.archive_add(archive, tmp_path, tmp_path)
+
+    content.seek(0)
+    with tarfile.open(fileobj=content) as archive:
+        assert [member.name for member in archive.getmembers()] == [Backup.archive_name(tmp_path)]
+        assert archive.getmembers()[0].isdir()
+
+
+def test_archive_add_hardlink(tmp_path: Path) -> None:
+    """
+    must store hardlinks as regular files
+    """
+    path = tmp_path / "file"
+    path.write_text("content")
+    link = tmp_path / "link"
+    link.hardlink_to(path)
+    content = io.BytesIO()
+
+    with tarfile.open(fileobj=content, mode="w") as archive:
+        Backup.archive_add(archive, path, path)
+        Backup.archive_add(archive, link, link)
+
+    content.seek(0)
+    with tarfile.open(fileobj=content) as archive:
+        member = archive.getmember(Backup.archive_name(link))
+        assert member.isreg()
+        assert archive.extractfile(member).read() == b"content"
+
+
+def test_archive_add_unsupported(mocker: MockerFixture) -> None:
+    """
+    must skip unsupported file types
+    """
+    archive = MagicMock()
+    archive.gettarinfo.return_value = None
+
+    Backup.archive_add(archive, Path("/socket"), Path("/socket"))
+    archive.addfile.assert_not_called()
+
+
+def test_archive_name() -> None:
+    """
+    must generate archive member name
+    """
+    assert Backup.archive_name(Path("/var/lib/ahriman/ahriman.db")) == "var/lib/ahriman/ahriman.db"
+
+
+def test_compression_options() -> None:
+    """
+    must generate archive options
+    """
+    assert Backup.compression_options(None, None) == {"mode": "w"}
+    assert Backup.compression_options("gz", 4) == {"mode": "w:gz"}
+
+
+def test_compression_options_zstd(mocker: MockerFixture) -> None:
+    """
+    must set number of compression threads for zstd
+    """
+    zstd_mock = mocker.patch("ahriman.application.handlers.backup.zstd")
+    assert Backup.compression_options("zst", 4) == {
+        "mode": "w:zst",
+        "options": {zstd_mock.CompressionParameter.nb_workers: 4},
+    }
+
+
+def test_compression_options_zstd_missing(mocker: MockerFixture) -> None:
+    """
+    must skip compression options if zstd module is not available
+    """
+    mocker.patch("ahriman.application.handlers.backup.zstd", None)
+    assert Backup.compression_options("zst", 4) == {"mode": "w:zst"}
+
+
+def test_database_snapshot(tmp_path: Path) -> None:
+    """
+    must create database snapshot
+    """
+    database_path = tmp_path / "ahriman.db"
+    connection = sqlite3.connect(database_path)
+    connection.execute("create table test (value integer)")
+    connection.execute("insert into test (value) values (42)")
+    connection.commit()
+    snapshot_root = tmp_path / "snapshot"
+    snapshot_root.mkdir()
+
+    snapshot = Backup.database_snapshot(database_path, snapshot_root)
+    connection.close()
+    assert snapshot == snapshot_root / database_path.name
+    assert sqlite3.connect(snapshot).execute("select value from test").fetchall() == [(42,)]
 
 
 def test_get_paths(configuration: Configuration, mocker: MockerFixture) -> None:
@@ -53,9 +242,42 @@ def test_get_paths(configuration: Configuration, mocker: MockerFixture) -> None:
     getpwuid_mock.assert_called_once_with(42)
     database_mock.assert_called_once_with(configuration)
     assert configuration.path in paths
+    assert paths[configuration.repository_paths.cache] == BackupComponent.Cache
     assert all(path.exists() for path in paths if path.name not in (".gnupg", "cache"))
 
 
+def test_manifest(tmp_path: Path) -> None:
+    """
+    must generate backup manifest
+    """
+    path = tmp_path / "file"
+    path.write_text("content")
+    (tmp_path / "link").symlink_to(path)
+    sources = {source: source for source in Backup.walk(tmp_path)}
+    previous = BackupManifest()
+
+    manifest = Backup.manifest(sources, {tmp_path: BackupComponent.Cache}, previous, 2)
+    assert manifest.components == {BackupComponent.Cache: [Backup.archive_name(tmp_path)]}
+    assert manifest.files == {Backup.archive_name(path): BackupFile.from_path(path)}
+
+
+def test_walk(tmp_path: Path) -> None:
+    """
+    must list path with all its children without following symlinks
+    """
+    directory = tmp_path / "directory"
+    directory.mkdir()
+    path = directory / "file"
+    path.touch()
+    link = tmp_path / "link"
+    link.symlink_to(directory)
+
+    assert set(Backup.walk(tmp_path)) == {tmp_path, directory, path, link}
+    assert list(Backup.walk(path)) == [path]
+    assert list(Backup.walk(link)) == [link]
+    assert not list(Backup.walk(tmp_path / "missing"))
+
+
 def test_disallow_multi_architecture_run() -> None:
     """
     must not allow multi architecture run
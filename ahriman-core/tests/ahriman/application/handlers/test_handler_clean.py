@@ -17,6 +17,7 @@ def _default_args(args: argparse.Namespace) -> argparse.Namespace:
     Returns:
         argparse.Namespace: generated arguments for these test cases
     """
+    args.archives = False
     args.cache = False
     args.chroot = False
     args.manual = False
@@ -37,5 +38,6 @@ def test_run(args: argparse.Namespace, configuration: Configuration, repository:
 
     _, repository_id = configuration.check_loaded()
     Clean.run(args, repository_id, configuration, report=False)
-    application_mock.assert_called_once_with(cache=False, chroot=False, manual=False, packages=False, pacman=False)
+    application_mock.assert_called_once_with(archives=False, cache=False, chroot=False, manual=False,
+                                             packages=False, pacman=False)
     on_start_mock.assert_called_once_with()
@@ -39,14 +39,14 @@ def test_run(args: argparse.Namespace, configuration: Configuration, repository:
     mocker.patch("ahriman.core.database.SQLite.load", return_value=database)
     mocker.patch("ahriman.core.repository.Repository.load", return_value=repository)
     mocker.patch("ahriman.core.repository.Repository.packages", return_value=[package_ahriman])
-    application_mock = mocker.patch("ahriman.application.handlers.copy.Copy.copy_package")
+    application_mock = mocker.patch("ahriman.application.handlers.copy.Copy.copy_packages")
     update_mock = mocker.patch("ahriman.application.application.Application.update")
     remove_mock = mocker.patch("ahriman.application.application.Application.remove")
     on_start_mock = mocker.patch("ahriman.application.application.Application.on_start")
 
     _, repository_id = configuration.check_loaded()
     Copy.run(args, repository_id, configuration, report=False)
-    application_mock.assert_called_once_with(package_ahriman, pytest.helpers.anyvar(int), pytest.helpers.anyvar(int))
+    application_mock.assert_called_once_with([package_ahriman], pytest.helpers.anyvar(int), pytest.helpers.anyvar(int))
     update_mock.assert_called_once_with([])
     remove_mock.assert_not_called()
     on_start_mock.assert_called_once_with()
@@ -62,7 +62,7 @@ def test_run_remove(args: argparse.Namespace, configuration: Configuration, repo
     mocker.patch("ahriman.core.database.SQLite.load", return_value=database)
     mocker.patch("ahriman.core.repository.Repository.load", return_value=repository)
     mocker.patch("ahriman.core.repository.Repository.packages", return_value=[package_ahriman])
-    mocker.patch("ahriman.application.handlers.copy.Copy.copy_package")
+    mocker.patch("ahriman.application.handlers.copy.Copy.copy_packages")
     mocker.patch("ahriman.application.application.Application.update")
     remove_mock = mocker.patch("ahriman.application.application.Application.remove")
 
@@ -89,22 +89,22 @@ def test_run_empty_exception(args: argparse.Namespace, configuration: Configurat
     check_mock.assert_called_once_with(True, [])
 
 
-def test_copy_package(package_ahriman: Package, application: Application, mocker: MockerFixture) -> None:
+def test_copy_packages(package_ahriman: Package, application: Application, mocker: MockerFixture) -> None:
     """
-    must copy package between repositories and its metadata
+    must copy packages between repositories and their metadata
     """
     add_mock = mocker.patch("ahriman.application.application.Application.add")
     changes_get_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_changes_get")
-    changes_update_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_changes_update")
+    changes_update_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_changes_update_many")
     deps_get_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_dependencies_get")
-    deps_update_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_dependencies_update")
-    package_update_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_update")
+    deps_update_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_dependencies_update_many")
+    package_update_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_update_many")
     path = application.repository.paths.repository / package_ahriman.packages[package_ahriman.base].filename
 
-    Copy.copy_package(package_ahriman, application, application)
+    Copy.copy_packages([package_ahriman], application, application)
     add_mock.assert_called_once_with([str(path)], PackageSource.Archive)
     changes_get_mock.assert_called_once_with(package_ahriman.base)
-    changes_update_mock.assert_called_once_with(package_ahriman.base, changes_get_mock.return_value)
+    changes_update_mock.assert_called_once_with([(package_ahriman.base, changes_get_mock.return_value)])
     deps_get_mock.assert_called_once_with(package_ahriman.base)
-    deps_update_mock.assert_called_once_with(package_ahriman.base, deps_get_mock.return_value)
-    package_update_mock.assert_called_once_with(package_ahriman, BuildStatusEnum.Pending)
+    deps_update_mock.assert_called_once_with([(package_ahriman.base, deps_get_mock.return_value)])
+    package_update_mock.assert_called_once_with([package_ahriman], BuildStatusEnum.Pending)
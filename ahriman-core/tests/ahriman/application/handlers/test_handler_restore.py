@@ -1,4 +1,6 @@
 import argparse
+import pytest
+import tarfile
 
 from pathlib import Path
 from pytest_mock import MockerFixture
@@ -6,6 +8,9 @@ from unittest.mock import MagicMock
 
 from ahriman.application.handlers.restore import Restore
 from ahriman.core.configuration import Configuration
+from ahriman.core.exceptions import OptionError
+from ahriman.models.backup_component import BackupComponent
+from ahriman.models.backup_manifest import BackupManifest
 
 
 def _default_args(args: argparse.Namespace) -> argparse.Namespace:
@@ -19,6 +24,7 @@ def _default_args(args: argparse.Namespace) -> argparse.Namespace:
         argparse.Namespace: generated arguments for these test cases
     """
     args.path = Path("result.tar.gz")
+    args.component = None
     args.output = Path.cwd()
     return args
 
@@ -28,13 +34,64 @@ def test_run(args: argparse.Namespace, configuration: Configuration, mocker: Moc
     must run command
     """
     args = _default_args(args)
-    tarfile = MagicMock()
-    extract_mock = tarfile.__enter__.return_value = MagicMock()
-    mocker.patch("ahriman.application.handlers.restore.tarfile.open", return_value=tarfile)
+    manifest = BackupManifest()
+    mocker.patch("ahriman.models.backup_manifest.BackupManifest.from_archive", return_value=manifest)
+    members_mock = mocker.patch("ahriman.application.handlers.restore.Restore.members", return_value=[])
+    archive_mock = MagicMock()
+    extract_mock = archive_mock.__enter__.return_value = MagicMock()
+    mocker.patch("ahriman.application.handlers.restore.tarfile.open", return_value=archive_mock)
 
     _, repository_id = configuration.check_loaded()
     Restore.run(args, repository_id, configuration, report=False)
-    extract_mock.extractall.assert_called_once_with(path=args.output, filter="data")
+    members_mock.assert_called_once_with(extract_mock, manifest, args.component)
+    extract_mock.extractall.assert_called_once_with(path=args.output, members=[], filter="data")
+
+
+def _archive(*names: str) -> MagicMock:
+    """
+    generate archive mock with specified members
+
+    Args:
+        *names(str): names of the archive members
+
+    Returns:
+        MagicMock: archive mock
+    """
+    archive = MagicMock()
+    archive.getmembers.return_value = [tarfile.TarInfo(name) for name in names]
+    return archive
+
+
+def test_members() -> None:
+    """
+    must return all members except for manifest
+    """
+    archive = _archive(BackupManifest.FILENAME, "etc/ahriman.ini", "var/lib/ahriman/ahriman.db")
+    assert [member.name for member in Restore.members(archive, None, None)] == [
+        "etc/ahriman.ini", "var/lib/ahriman/ahriman.db"
+    ]
+
+
+def test_members_components() -> None:
+    """
+    must return members of the specified components only
+    """
+    archive = _archive(BackupManifest.FILENAME, "etc/ahriman.ini", "var/lib/ahriman/ahriman.db")
+    manifest = BackupManifest(components={
+        BackupComponent.Configuration: ["etc/ahriman.ini"],
+        BackupComponent.Database: ["var/lib/ahriman/ahriman.db"],
+    })
+
+    members = Restore.members(archive, manifest, [BackupComponent.Database])
+    assert [member.name for member in members] == ["var/lib/ahriman/ahriman.db"]
+
+
+def test_members_components_no_manifest() -> None:
+    """
+    must raise OptionError if components are set, but archive has no manifest
+    """
+    with pytest.raises(OptionError):
+        Restore.members(_archive("etc/ahriman.ini"), None, [BackupComponent.Database])
 
 
 def test_disallow_multi_architecture_run() -> None:
@@ -10,6 +10,7 @@ from ahriman.core.configuration import Configuration
 from ahriman.core.repository import Repository
 from ahriman.core.utils import pretty_datetime, utcnow
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.package import Package
 from ahriman.models.repository_stats import RepositoryStats
 
@@ -40,6 +41,7 @@ def test_run(args: argparse.Namespace, configuration: Configuration, repository:
     must run command
     """
     args = _default_args(args)
+    args.limit = 2
     events = [Event("1", "1"), Event("2", "2")]
     stats = RepositoryStats(bases=1, packages=2, archive_size=3, installed_size=4)
     mocker.patch("ahriman.core.repository.Repository.load", return_value=repository)
@@ -61,6 +63,7 @@ def test_run_for_package(args: argparse.Namespace, configuration: Configuration,
     """
     args = _default_args(args)
     args.package = package_ahriman.base
+    args.chart = Path("chart")
     events = [Event("1", "1"), Event("2", "2")]
     mocker.patch("ahriman.core.repository.Repository.load", return_value=repository)
     events_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.event_get", return_value=events)
@@ -72,6 +75,46 @@ def test_run_for_package(args: argparse.Namespace, configuration: Configuration,
     application_mock.assert_called_once_with(args.event, events, args.chart)
 
 
+def test_run_rollups(args: argparse.Namespace, configuration: Configuration, repository: Repository,
+                     mocker: MockerFixture) -> None:
+    """
+    must run command by using aggregated events
+    """
+    args = _default_args(args)
+    args.from_date = "1970-01-02T00:00:00+00:00"
+    rollups = [EventRollup(event="1", object_id="1", created=EventRollup.BUCKET, count=1)]
+    stats = RepositoryStats(bases=1, packages=2, archive_size=3, installed_size=4)
+    mocker.patch("ahriman.core.repository.Repository.load", return_value=repository)
+    events_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.event_get")
+    rollups_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.event_rollup_get", return_value=rollups)
+    mocker.patch("ahriman.core.status.client.Client.statistics", return_value=stats)
+    application_mock = mocker.patch("ahriman.application.handlers.statistics.Statistics.rollups_per_package")
+
+    _, repository_id = configuration.check_loaded()
+    Statistics.run(args, repository_id, configuration, report=False)
+    rollups_mock.assert_called_once_with(args.event, args.package, EventRollup.BUCKET, None)
+    events_mock.assert_not_called()
+    application_mock.assert_called_once_with(args.event, rollups, args.chart)
+
+
+def test_run_rollups_for_package(args: argparse.Namespace, configuration: Configuration, repository: Repository,
+                                 package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must run command for specific package by using aggregated events
+    """
+    args = _default_args(args)
+    args.package = package_ahriman.base
+    rollups = [EventRollup(event="1", object_id=package_ahriman.base, created=0, count=1)]
+    mocker.patch("ahriman.core.repository.Repository.load", return_value=repository)
+    rollups_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.event_rollup_get", return_value=rollups)
+    application_mock = mocker.patch("ahriman.application.handlers.statistics.Statistics.rollup_stats")
+
+    _, repository_id = configuration.check_loaded()
+    Statistics.run(args, repository_id, configuration, report=False)
+    rollups_mock.assert_called_once_with(args.event, args.package, None, None)
+    application_mock.assert_called_once_with(args.event, rollups)
+
+
 def test_run_convert_from_date(args: argparse.Namespace, configuration: Configuration, repository: Repository,
                                mocker: MockerFixture) -> None:
     """
@@ -146,6 +189,55 @@ def test_plot_times(mocker: MockerFixture) -> None:
     save_mock.assert_called_once_with(local)
 
 
+def test_rollup_stats(mocker: MockerFixture) -> None:
+    """
+    must print event stats from aggregated events
+    """
+    print_mock = mocker.patch("ahriman.core.formatters.Printer.print")
+    rollups = [
+        EventRollup(event="event", object_id="1", created=0, count=1),
+        EventRollup(event="event", object_id="2", created=0, count=1, took_count=1, took_sum=42.0,
+                    took_squares=42.0 ** 2, took_min=42.0, took_max=42.0),
+    ]
+
+    Statistics.rollup_stats("event", rollups)
+    print_mock.assert_called_once_with(verbose=True, log_fn=pytest.helpers.anyvar(int), separator=": ")
+
+
+def test_rollups_per_package(mocker: MockerFixture) -> None:
+    """
+    must print statistics per package from aggregated events
+    """
+    rollups = [
+        EventRollup(event="event", object_id="1", created=0, count=1),
+        EventRollup(event="event", object_id="2", created=0, count=1),
+        EventRollup(event="event", object_id="1", created=EventRollup.BUCKET, count=2),
+    ]
+    package_mock = mocker.patch("ahriman.core.formatters.PackageStatsPrinter.__init__", return_value=None)
+    mocker.patch("ahriman.core.formatters.Printer.print")
+    rollup_mock = mocker.patch("ahriman.application.handlers.statistics.Statistics.rollup_stats")
+    chart_plot = mocker.patch("ahriman.application.handlers.statistics.Statistics.plot_packages")
+
+    Statistics.rollups_per_package("event", rollups, None)
+    package_mock.assert_called_once_with({"1": 3, "2": 1})
+    rollup_mock.assert_called_once_with("event", rollups)
+    chart_plot.assert_not_called()
+
+
+def test_rollups_per_package_with_chart(mocker: MockerFixture) -> None:
+    """
+    must print statistics per package from aggregated events with chart
+    """
+    local = Path("local")
+    rollups = [EventRollup(event="event", object_id="1", created=0, count=2)]
+    mocker.patch("ahriman.core.formatters.Printer.print")
+    mocker.patch("ahriman.application.handlers.statistics.Statistics.rollup_stats")
+    chart_plot = mocker.patch("ahriman.application.handlers.statistics.Statistics.plot_packages")
+
+    Statistics.rollups_per_package("event", rollups, local)
+    chart_plot.assert_called_once_with("event", {"1": 2}, local)
+
+
 def test_stats_for_package(mocker: MockerFixture) -> None:
     """
     must print statistics for the package
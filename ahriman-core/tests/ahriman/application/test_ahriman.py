@@ -1,5 +1,7 @@
 import argparse
 import pytest
+import subprocess
+import sys
 
 from pathlib import Path
 from pytest_mock import MockerFixture
@@ -8,6 +10,7 @@ from ahriman.application import ahriman
 from ahriman.application.handlers.handler import Handler
 from ahriman.core.configuration import Configuration
 from ahriman.models.action import Action
+from ahriman.models.backup_component import BackupComponent
 from ahriman.models.build_status import BuildStatusEnum
 from ahriman.models.event import EventType
 from ahriman.models.log_handler import LogHandler
@@ -15,6 +18,34 @@ from ahriman.models.sign_settings import SignSettings
 from ahriman.models.user_access import UserAccess
 
 
+def test_command(parser: argparse.ArgumentParser) -> None:
+    """
+    must guess command name
+    """
+    assert ahriman._command(parser, ["repo-update"]) == "repo-update"
+    assert ahriman._command(parser, ["repo-update", "--dry-run"]) == "repo-update"
+
+
+def test_command_options(parser: argparse.ArgumentParser) -> None:
+    """
+    must skip global options and their values while guessing command name
+    """
+    assert ahriman._command(parser, ["-a", "x86_64", "--force", "-r", "repo", "repo-update"]) == "repo-update"
+    assert ahriman._command(parser, ["--no-report", "-q", "package-status", "ahriman"]) == "package-status"
+
+
+def test_command_unknown(parser: argparse.ArgumentParser) -> None:
+    """
+    must not guess command name if arguments cannot be parsed without full parser
+    """
+    assert ahriman._command(parser, []) is None
+    assert ahriman._command(parser, ["--force"]) is None
+    assert ahriman._command(parser, ["--arch", "x86_64", "repo-update"]) is None
+    assert ahriman._command(parser, ["--architecture=x86_64", "repo-update"]) is None
+    assert ahriman._command(parser, ["-qa", "x86_64", "repo-update"]) is None
+    assert ahriman._command(parser, ["@arguments", "repo-update"]) is None
+
+
 def test_parser(parser: argparse.ArgumentParser) -> None:
     """
     must parse valid command line
@@ -22,6 +53,62 @@ def test_parser(parser: argparse.ArgumentParser) -> None:
     parser.parse_args(["-a", "x86_64", "-r", "repo", "service-config"])
 
 
+def test_parser_argv() -> None:
+    """
+    must load only handlers which provide requested command
+    """
+    parser = ahriman._parser(argv=["-a", "x86_64", "help-version"])
+    args = parser.parse_args(["-a", "x86_64", "help-version"])
+    assert args.command == "help-version"
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["repo-update"])
+
+
+def test_parser_argv_fallback() -> None:
+    """
+    must load all handlers if command has been guessed wrong
+    """
+    parser = ahriman._parser(argv=["unknown-command"])
+    assert parser.parse_args(["repo-update"]).command == "repo-update"
+
+    parser = ahriman._parser(argv=["--conf", "ahriman.ini", "repo-update"])
+    args = parser.parse_args(["--conf", "ahriman.ini", "repo-update"])
+    assert args.command == "repo-update"
+    assert args.configuration == Path("ahriman.ini")
+
+
+def test_parser_imports() -> None:
+    """
+    must not import heavy modules during command line parser construction
+    """
+    def imported(argv: list[str] | None) -> set[str]:
+        code = f"from ahriman.application import ahriman; ahriman._parser(argv={argv!r})"
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                capture_output=True, check=True, text=True)
+
+        # each line has format "import time: self [us] | cumulative | imported package"
+        return {
+            line.rsplit("|", maxsplit=1)[-1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:")
+        }
+
+    full = imported(None)
+    for module in ("aiohttp", "boto3", "jinja2", "matplotlib"):
+        assert module not in full
+
+    lazy = imported(["help-version"])
+    for module in ("requests", "sqlite3", "ahriman.application.application", "ahriman.core.database"):
+        assert module not in lazy
+
+    # the budget is measured by amount of imported application modules, because the rest depends on environment
+    def application_modules(modules: set[str]) -> int:
+        return len([module for module in modules if module.startswith("ahriman.")])
+
+    assert application_modules(lazy) < application_modules(full) / 2
+
+
 def test_parser_option_configuration(parser: argparse.ArgumentParser) -> None:
     """
     must convert configuration option to Path instance
@@ -777,6 +864,26 @@ def test_subparsers_repo_backup_option_architecture(parser: argparse.ArgumentPar
     assert args.architecture == ""
 
 
+def test_subparsers_repo_backup_option_incremental(parser: argparse.ArgumentParser) -> None:
+    """
+    repo-backup command must convert incremental option to path instance
+    """
+    args = parser.parse_args(["repo-backup", "output.tar"])
+    assert args.incremental is None
+    args = parser.parse_args(["repo-backup", "-i", "previous.tar", "output.tar"])
+    assert isinstance(args.incremental, Path)
+
+
+def test_subparsers_repo_backup_option_jobs(parser: argparse.ArgumentParser) -> None:
+    """
+    repo-backup command must convert jobs option to int instance
+    """
+    args = parser.parse_args(["repo-backup", "output.tar"])
+    assert args.jobs is None
+    args = parser.parse_args(["repo-backup", "-j", "4", "output.tar"])
+    assert isinstance(args.jobs, int)
+
+
 def test_subparsers_repo_backup_option_repository(parser: argparse.ArgumentParser) -> None:
     """
     repo-backup command must correctly parse repository list
@@ -1076,6 +1183,16 @@ def test_subparsers_repo_restore_option_architecture(parser: argparse.ArgumentPa
     assert args.architecture == ""
 
 
+def test_subparsers_repo_restore_option_component(parser: argparse.ArgumentParser) -> None:
+    """
+    repo-restore command must convert component option to BackupComponent instance
+    """
+    args = parser.parse_args(["repo-restore", "output.tar"])
+    assert args.component is None
+    args = parser.parse_args(["repo-restore", "-c", "database", "-c", "gnupg", "output.tar"])
+    assert args.component == [BackupComponent.Database, BackupComponent.GnuPG]
+
+
 def test_subparsers_repo_restore_option_repository(parser: argparse.ArgumentParser) -> None:
     """
     repo-restore command must correctly parse repository list
@@ -1757,8 +1874,11 @@ def test_run(args: argparse.Namespace, configuration: Configuration, mocker: Moc
 
     mocker.patch("ahriman.core.configuration.Configuration.load", new=lambda self, _: self.copy_from(configuration))
     mocker.patch("argparse.ArgumentParser.parse_args", return_value=args)
+    mocker.patch("sys.argv", ["ahriman", "repo-update"])
+    parser_mock = mocker.spy(ahriman, "_parser")
 
     assert ahriman.run() == 1
+    parser_mock.assert_called_once_with(color=True, argv=["repo-update"])
 
 
 def test_run_without_command(args: argparse.Namespace, mocker: MockerFixture) -> None:
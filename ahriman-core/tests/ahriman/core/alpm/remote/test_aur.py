@@ -2,6 +2,7 @@ import json
 import pytest
 import requests
 
+from dataclasses import replace
 from pathlib import Path
 from pytest_mock import MockerFixture
 from unittest.mock import MagicMock, call as MockCall
@@ -139,12 +140,55 @@ def test_package_info_not_found(aur: AUR, aur_package_ahriman: AURPackage, mocke
         assert aur.package_info(aur_package_ahriman.name, pacman=None)
 
 
+def test_package_multiinfo(aur: AUR, aur_package_ahriman: AURPackage,
+                           mocker: MockerFixture, resource_path_root: Path) -> None:
+    """
+    must make batched request for info
+    """
+    response_mock = MagicMock()
+    response_mock.json.return_value = json.loads(_get_response(resource_path_root))
+    request_mock = mocker.patch("ahriman.core.alpm.remote.AUR.make_request", return_value=response_mock)
+
+    assert aur.package_multiinfo([aur_package_ahriman.name, "random", "random"], pacman=None) == [aur_package_ahriman]
+    request_mock.assert_called_once_with("GET", "https://aur.archlinux.org/rpc/v5/info", params=[
+        ("arg[]", aur_package_ahriman.name),
+        ("arg[]", "random"),
+    ])
+
+
+def test_package_multiinfo_chunks(aur: AUR, mocker: MockerFixture) -> None:
+    """
+    must split request into chunks
+    """
+    request_mock = mocker.patch("ahriman.core.alpm.remote.AUR.make_request")
+    request_mock.return_value.json.return_value = {"type": "multiinfo", "results": []}
+    aur.MAX_INFO_ARGUMENTS = 2
+
+    assert aur.package_multiinfo(["a", "b", "c"], pacman=None) == []
+    request_mock.assert_has_calls([
+        MockCall("GET", "https://aur.archlinux.org/rpc/v5/info", params=[("arg[]", "a"), ("arg[]", "b")]),
+        MockCall().json(),
+        MockCall("GET", "https://aur.archlinux.org/rpc/v5/info", params=[("arg[]", "c")]),
+        MockCall().json(),
+    ])
+
+
+def test_package_multiinfo_empty(aur: AUR, mocker: MockerFixture) -> None:
+    """
+    must not make request if no packages supplied
+    """
+    request_mock = mocker.patch("ahriman.core.alpm.remote.AUR.make_request")
+    assert aur.package_multiinfo([], pacman=None) == []
+    request_mock.assert_not_called()
+
+
 def test_package_provided_by(aur: AUR, aur_package_ahriman: AURPackage, aur_package_akonadi: AURPackage,
                              mocker: MockerFixture) -> None:
     """
     must search for packages which provide required one
     """
-    aur_package_ahriman.provides.append(aur_package_ahriman.name)
+    provides = (*aur_package_ahriman.provides, aur_package_ahriman.name)
+    aur_package_ahriman = replace(aur_package_ahriman, provides=provides)
     search_mock = mocker.patch("ahriman.core.alpm.remote.AUR.package_search", return_value=[
         aur_package_ahriman, aur_package_akonadi
     ])
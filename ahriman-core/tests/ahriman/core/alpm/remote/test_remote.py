@@ -55,6 +55,15 @@ def test_info_include_provides_not_found(aur_package_ahriman: AURPackage, pacman
         Remote.info("ahriman", pacman=pacman, include_provides=True)
 
 
+def test_multiinfo(aur_package_ahriman: AURPackage, pacman: Pacman, mocker: MockerFixture) -> None:
+    """
+    must call multiinfo method
+    """
+    info_mock = mocker.patch("ahriman.core.alpm.remote.Remote.package_multiinfo", return_value=[aur_package_ahriman])
+    assert Remote.multiinfo(aur_package_ahriman.name, "random", pacman=pacman) == [aur_package_ahriman]
+    info_mock.assert_called_once_with((aur_package_ahriman.name, "random"), pacman=pacman)
+
+
 def test_multisearch(aur_package_ahriman: AURPackage, pacman: Pacman, mocker: MockerFixture) -> None:
     """
     must search in AUR with multiple words
@@ -133,6 +142,21 @@ def test_package_info(remote: Remote, pacman: Pacman) -> None:
         remote.package_info("package", pacman=pacman)
 
 
+def test_package_multiinfo(remote: Remote, aur_package_ahriman: AURPackage, pacman: Pacman,
+                           mocker: MockerFixture) -> None:
+    """
+    must call package info method for each package skipping unknown ones
+    """
+    info_mock = mocker.patch("ahriman.core.alpm.remote.Remote.package_info",
+                             side_effect=[aur_package_ahriman, UnknownPackageError("random")])
+
+    assert remote.package_multiinfo([aur_package_ahriman.name, "random"], pacman=pacman) == [aur_package_ahriman]
+    info_mock.assert_has_calls([
+        MockCall(aur_package_ahriman.name, pacman=pacman),
+        MockCall("random", pacman=pacman),
+    ])
+
+
 def test_package_provided_by(remote: Remote, pacman: Pacman) -> None:
     """
     must return empty list for provides method
@@ -176,6 +176,19 @@ def test_database_sync_forced(pacman: Pacman, mocker: MockerFixture) -> None:
     sync_mock.assert_called_once_with(force=True)
 
 
+def test_database_sync_empty(pacman: Pacman, mocker: MockerFixture) -> None:
+    """
+    must correctly process empty databases list
+    """
+    handle_mock = MagicMock()
+    handle_mock.get_syncdbs.return_value = []
+
+    sync_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.sync")
+
+    pacman.database_sync(handle_mock, force=True)
+    sync_mock.assert_not_called()
+
+
 def test_files_package(pacman: Pacman, package_ahriman: Package, pyalpm_package_ahriman: pyalpm.Package,
                        mocker: MockerFixture, resource_path_root: Path) -> None:
     """
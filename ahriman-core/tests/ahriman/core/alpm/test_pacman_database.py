@@ -22,6 +22,7 @@ def test_download(pacman_database: PacmanDatabase, mocker: MockerFixture) -> Non
     must download database by remote url
     """
     response_obj = MagicMock()
+    response_obj.status_code = 200
     response_obj.headers = {pacman_database.LAST_MODIFIED_HEADER: "Fri, 09 Feb 2024 00:25:55 GMT"}
     response_obj.iter_content.return_value = ["chunk".encode("utf8")]
 
@@ -29,75 +30,96 @@ def test_download(pacman_database: PacmanDatabase, mocker: MockerFixture) -> Non
     url = "url"
 
     file_mock = MagicMock()
+    mocker.patch("pathlib.Path.is_file", return_value=False)
     request_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.make_request",
                                 return_value=response_obj)
+    temporary_mock = mocker.patch("ahriman.core.alpm.pacman_database.NamedTemporaryFile")
+    temporary_mock.return_value.__enter__.return_value.name = ".local.tmp"
     open_mock = mocker.patch("pathlib.Path.open")
     open_mock.return_value.__enter__.return_value = file_mock
     mtime_mock = mocker.patch("os.utime")
+    replace_mock = mocker.patch("pathlib.Path.replace")
+    unlink_mock = mocker.patch("pathlib.Path.unlink")
 
-    pacman_database.download(url, path)
-    request_mock.assert_called_once_with("GET", url, stream=True)
+    assert pacman_database.download(url, path, force=False)
+    request_mock.assert_called_once_with("GET", url, headers={}, stream=True)
+    temporary_mock.assert_called_once_with(dir=path.parent, prefix=".local.", delete=False)
     open_mock.assert_called_once_with("wb")
     file_mock.write.assert_called_once_with("chunk".encode("utf8"))
-    mtime_mock.assert_called_once_with(path, (1707438355.0, 1707438355.0))
-
-
-def test_download_no_header(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
-    """
-    must raise exception in case if no last modified head found
-    """
-    response_obj = MagicMock()
-    response_obj.headers = {}
-    mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.make_request", return_value=response_obj)
-
-    with pytest.raises(PacmanError):
-        pacman_database.download("url", Path("local"))
+    response_obj.iter_content.assert_called_once_with(chunk_size=pacman_database.CHUNK_SIZE)
+    mtime_mock.assert_called_once_with(Path(".local.tmp"), (1707438355.0, 1707438355.0))
+    replace_mock.assert_called_once_with(path)
+    unlink_mock.assert_called_once_with(missing_ok=True)
 
 
-def test_is_outdated(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
+def test_download_conditional(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
     """
-    must correctly check if file is outdated
+    must perform conditional request if local file exists
     """
     response_obj = MagicMock()
-    response_obj.headers = {pacman_database.LAST_MODIFIED_HEADER: "Fri, 09 Feb 2024 00:25:55 GMT"}
+    response_obj.status_code = 304
     stat_mock = MagicMock()
-    stat_mock.st_mtime = 1707438354
-
-    path = Path("local")
-    url = "url"
+    stat_mock.st_mtime = 1707438355
 
     mocker.patch("pathlib.Path.is_file", return_value=True)
-    mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.make_request", return_value=response_obj)
     mocker.patch("pathlib.Path.stat", return_value=stat_mock)
+    request_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.make_request",
+                                return_value=response_obj)
+    temporary_mock = mocker.patch("ahriman.core.alpm.pacman_database.NamedTemporaryFile")
 
-    assert pacman_database.is_outdated(url, path)
+    assert not pacman_database.download("url", Path("local"), force=False)
+    request_mock.assert_called_once_with("GET", "url", headers={
+        pacman_database.IF_MODIFIED_SINCE_HEADER: "Fri, 09 Feb 2024 00:25:55 GMT",
+    }, stream=True)
+    temporary_mock.assert_not_called()
 
-    stat_mock.st_mtime += 1
-    assert not pacman_database.is_outdated(url, path)
 
-    stat_mock.st_mtime += 1
-    assert not pacman_database.is_outdated(url, path)
+def test_download_force(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
+    """
+    must not perform conditional request if force flag is set
+    """
+    mocker.patch("pathlib.Path.is_file", return_value=True)
+    request_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.make_request")
+    request_mock.return_value.status_code = 304
+
+    pacman_database.download("url", Path("local"), force=True)
+    request_mock.assert_called_once_with("GET", "url", headers={}, stream=True)
 
 
-def test_is_outdated_not_a_file(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
+def test_download_no_header(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
     """
-    must mark as outdated if no file was found
+    must raise exception in case if no last modified head found
     """
+    response_obj = MagicMock()
+    response_obj.status_code = 200
+    response_obj.headers = {}
     mocker.patch("pathlib.Path.is_file", return_value=False)
-    assert pacman_database.is_outdated("url", Path("local"))
+    mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.make_request", return_value=response_obj)
+
+    with pytest.raises(PacmanError):
+        pacman_database.download("url", Path("local"), force=False)
 
 
-def test_is_outdated_no_header(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
+def test_download_failed(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
     """
-    must raise exception in case if no last modified head found during timestamp check
+    must remove temporary file on download failure
     """
     response_obj = MagicMock()
-    response_obj.headers = {}
+    response_obj.status_code = 200
+    response_obj.headers = {pacman_database.LAST_MODIFIED_HEADER: "Fri, 09 Feb 2024 00:25:55 GMT"}
+    response_obj.iter_content.side_effect = Exception
+
+    mocker.patch("pathlib.Path.is_file", return_value=False)
     mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.make_request", return_value=response_obj)
-    mocker.patch("pathlib.Path.is_file", return_value=True)
+    mocker.patch("ahriman.core.alpm.pacman_database.NamedTemporaryFile")
+    mocker.patch("pathlib.Path.open")
+    replace_mock = mocker.patch("pathlib.Path.replace")
+    unlink_mock = mocker.patch("pathlib.Path.unlink")
 
-    with pytest.raises(PacmanError):
-        pacman_database.is_outdated("url", Path("local"))
+    with pytest.raises(Exception):
+        pacman_database.download("url", Path("local"), force=False)
+    replace_mock.assert_not_called()
+    unlink_mock.assert_called_once_with(missing_ok=True)
 
 
 def test_sync(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
@@ -139,37 +161,37 @@ def test_sync_files(pacman_database: PacmanDatabase, mocker: MockerFixture) -> N
     """
     must sync files database
     """
-    outdated_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.is_outdated", return_value=True)
-    download_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.download")
+    download_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.download", return_value=True)
+    lock_mock = mocker.patch("ahriman.core.alpm.pacman_database.filelock")
 
     pacman_database.sync_files(force=False)
-    outdated_mock.assert_called_once_with(
-        "https://geo.mirror.pkgbuild.com/core/os/x86_64/core.files.tar.gz", pytest.helpers.anyvar(int))
     download_mock.assert_called_once_with(
-        "https://geo.mirror.pkgbuild.com/core/os/x86_64/core.files.tar.gz", pytest.helpers.anyvar(int))
+        "https://geo.mirror.pkgbuild.com/core/os/x86_64/core.files.tar.gz", pytest.helpers.anyvar(int), force=False)
+    lock_mock.assert_called_once_with(pytest.helpers.anyvar(int))
 
 
 def test_sync_files_not_outdated(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
     """
     must skip files sync if up-to-date
     """
-    mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.is_outdated", return_value=False)
-    download_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.download")
+    mocker.patch("ahriman.core.alpm.pacman_database.filelock")
+    download_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.download", return_value=False)
 
     pacman_database.sync_files(force=False)
-    download_mock.assert_not_called()
+    download_mock.assert_called_once_with(
+        "https://geo.mirror.pkgbuild.com/core/os/x86_64/core.files.tar.gz", pytest.helpers.anyvar(int), force=False)
 
 
 def test_sync_files_force(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
     """
     must sync up-to-date files if force flag is set
     """
-    mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.is_outdated", return_value=False)
+    mocker.patch("ahriman.core.alpm.pacman_database.filelock")
     download_mock = mocker.patch("ahriman.core.alpm.pacman_database.PacmanDatabase.download")
 
     pacman_database.sync_files(force=True)
     download_mock.assert_called_once_with(
-        "https://geo.mirror.pkgbuild.com/core/os/x86_64/core.files.tar.gz", pytest.helpers.anyvar(int))
+        "https://geo.mirror.pkgbuild.com/core/os/x86_64/core.files.tar.gz", pytest.helpers.anyvar(int), force=True)
 
 
 def test_sync_files_local(pacman_database: PacmanDatabase, mocker: MockerFixture) -> None:
@@ -35,6 +35,27 @@ def test_repo_add(repo: Repo, mocker: MockerFixture) -> None:
     assert "--remove" in check_output_mock.call_args[0]
 
 
+def test_repo_add_packages(repo: Repo, mocker: MockerFixture) -> None:
+    """
+    must call repo-add once for multiple packages
+    """
+    check_output_mock = mocker.patch("ahriman.core.alpm.repo.check_output")
+
+    repo.add_packages([Path("path1"), Path("path2")])
+    check_output_mock.assert_called_once()  # it will be checked later
+    assert check_output_mock.call_args[0][0] == "repo-add"
+    assert check_output_mock.call_args[0][-2:] == ("path1", "path2")
+
+
+def test_repo_add_packages_empty(repo: Repo, mocker: MockerFixture) -> None:
+    """
+    must skip repo-add call if there are no packages
+    """
+    check_output_mock = mocker.patch("ahriman.core.alpm.repo.check_output")
+    repo.add_packages([])
+    check_output_mock.assert_not_called()
+
+
 def test_repo_init(repo: Repo, mocker: MockerFixture) -> None:
     """
     must call repo-add with empty package list on repo initializing
@@ -60,6 +81,32 @@ def test_repo_remove(repo: Repo, package_ahriman: Package, mocker: MockerFixture
     assert package_ahriman.base in check_output_mock.call_args[0]
 
 
+def test_repo_remove_packages(repo: Repo, mocker: MockerFixture) -> None:
+    """
+    must call repo-remove once for multiple packages
+    """
+    mocker.patch("pathlib.Path.glob", return_value=[])
+    check_output_mock = mocker.patch("ahriman.core.alpm.repo.check_output")
+
+    repo.remove_packages([
+        ("package1", Path("package1-1.0.0-1-any.pkg.tar.xz")),
+        ("package2", Path("package2-1.0.0-1-any.pkg.tar.xz")),
+        ("package2", Path("package2-1.0.1-1-any.pkg.tar.xz")),
+    ])
+    check_output_mock.assert_called_once()  # it will be checked later
+    assert check_output_mock.call_args[0][0] == "repo-remove"
+    assert check_output_mock.call_args[0][-2:] == ("package1", "package2")
+
+
+def test_repo_remove_packages_empty(repo: Repo, mocker: MockerFixture) -> None:
+    """
+    must skip repo-remove call if there are no packages
+    """
+    check_output_mock = mocker.patch("ahriman.core.alpm.repo.check_output")
+    repo.remove_packages([])
+    check_output_mock.assert_not_called()
+
+
 def test_repo_remove_fail_no_file(repo: Repo, mocker: MockerFixture) -> None:
     """
     must fail removal on missing file
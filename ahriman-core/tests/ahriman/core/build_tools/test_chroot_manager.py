@@ -0,0 +1,144 @@
+from pathlib import Path
+from pytest_mock import MockerFixture
+
+from ahriman.core.build_tools.chroot_manager import ChrootManager
+from ahriman.core.configuration import Configuration
+
+
+def _fake_wrapper(path: Path) -> tuple[Path, Path]:
+    """
+    create fake devtools wrapper, which stores its arguments
+
+    Args:
+        path(Path): directory in which wrapper must be created
+
+    Returns:
+        tuple[Path, Path]: path to the wrapper and path to file with arguments of the last call
+    """
+    arguments = path / "arguments"
+    wrapper = path / "wrapper"
+    wrapper.write_text(f"#!/bin/sh\nprintf '%s\\n' \"$@\" > {arguments}\n")
+    wrapper.chmod(0o755)
+    return wrapper, arguments
+
+
+def test_init_legacy(configuration: Configuration) -> None:
+    """
+    must disable snapshots for legacy build command
+    """
+    configuration.set_option("build", "chroot_snapshots", "yes")
+    configuration.set_option("build", "build_command", "extra-x86_64-build")
+    _, repository_id = configuration.check_loaded()
+
+    assert not ChrootManager(configuration, repository_id, configuration.repository_paths).enabled
+
+
+def test_snapshot_flags(configuration: Configuration) -> None:
+    """
+    must return empty flags if root chroot hasn't been updated
+    """
+    _, repository_id = configuration.check_loaded()
+    assert ChrootManager(configuration, repository_id, configuration.repository_paths).snapshot_flags() == []
+
+
+def test_snapshot_flags_updated(configuration: Configuration) -> None:
+    """
+    must return snapshot flags if root chroot has been updated
+    """
+    _, repository_id = configuration.check_loaded()
+    chroot = ChrootManager(configuration, repository_id, configuration.repository_paths)
+    chroot.is_updated = True
+
+    assert chroot.snapshot_flags() == ["-s", configuration.repository_paths.build_root.name]
+
+
+def test_update(configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must update root chroot only once
+    """
+    configuration.set_option("build", "chroot_snapshots", "yes")
+    _, repository_id = configuration.check_loaded()
+    chroot = ChrootManager(configuration, repository_id, configuration.repository_paths)
+    check_output_mock = mocker.patch("ahriman.core.build_tools.chroot_manager.check_output")
+
+    chroot.update()
+    chroot.update()
+    check_output_mock.assert_called_once_with(
+        "ahriman-archbuild",
+        "-r", repository_id.name,
+        "-a", repository_id.architecture,
+        "-c", str(chroot.devtools_configs),
+        "-u",
+        "--", "-r", str(chroot.paths.chroot),
+        cwd=chroot.paths.root,
+        logger=chroot.logger,
+        user=chroot.uid,
+    )
+    assert chroot.is_updated
+
+
+def test_update_disabled(configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must skip root chroot update if snapshots are disabled
+    """
+    _, repository_id = configuration.check_loaded()
+    chroot = ChrootManager(configuration, repository_id, configuration.repository_paths)
+    check_output_mock = mocker.patch("ahriman.core.build_tools.chroot_manager.check_output")
+
+    chroot.update()
+    check_output_mock.assert_not_called()
+    assert not chroot.is_updated
+
+
+def test_update_failed(configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must disable snapshots if root chroot update failed
+    """
+    configuration.set_option("build", "chroot_snapshots", "yes")
+    _, repository_id = configuration.check_loaded()
+    chroot = ChrootManager(configuration, repository_id, configuration.repository_paths)
+    check_output_mock = mocker.patch("ahriman.core.build_tools.chroot_manager.check_output", side_effect=Exception)
+
+    chroot.update()
+    chroot.update()
+    check_output_mock.assert_called_once()
+    assert not chroot.enabled
+    assert chroot.snapshot_flags() == []
+
+
+def test_update_wrapper(configuration: Configuration, tmp_path: Path) -> None:
+    """
+    must call devtools wrapper in update mode
+    """
+    wrapper, arguments = _fake_wrapper(tmp_path)
+    configuration.set_option("build", "chroot_snapshots", "yes")
+    configuration.set_option("build", "devtools_wrapper", str(wrapper))
+    _, repository_id = configuration.check_loaded()
+    chroot = ChrootManager(configuration, repository_id, configuration.repository_paths)
+
+    chroot.update()
+    assert chroot.is_updated
+    assert arguments.read_text().splitlines() == [
+        "-r", repository_id.name,
+        "-a", repository_id.architecture,
+        "-c", str(chroot.devtools_configs),
+        "-u",
+        "--", "-r", str(chroot.paths.chroot),
+    ]
+
+
+def test_update_wrapper_failed(configuration: Configuration, tmp_path: Path) -> None:
+    """
+    must disable snapshots if devtools wrapper failed
+    """
+    wrapper = tmp_path / "wrapper"
+    wrapper.write_text("#!/bin/sh\nexit 1\n")
+    wrapper.chmod(0o755)
+    configuration.set_option("build", "chroot_snapshots", "yes")
+    configuration.set_option("build", "devtools_wrapper", str(wrapper))
+    _, repository_id = configuration.check_loaded()
+    chroot = ChrootManager(configuration, repository_id, configuration.repository_paths)
+
+    chroot.update()
+    assert not chroot.is_updated
+    assert not chroot.enabled
@@ -0,0 +1,288 @@
+import io
+import pytest
+import subprocess
+
+from pathlib import Path
+from pytest_mock import MockerFixture
+from unittest.mock import MagicMock
+
+from ahriman.core.build_tools.git_repository import GitRepository
+from ahriman.core.exceptions import CalledProcessError
+
+
+def _process(output: bytes) -> MagicMock:
+    """
+    create batch process mock
+
+    Args:
+        output(bytes): process output
+
+    Returns:
+        MagicMock: process mock
+    """
+    process = MagicMock()
+    process.stdin = io.BytesIO()
+    process.stdout = io.BytesIO(output)
+    process.returncode = None
+    return process
+
+
+def _repository(path: Path) -> GitRepository:
+    """
+    create git repository files
+
+    Args:
+        path(Path): local path to git repository
+
+    Returns:
+        GitRepository: repository reader
+    """
+    (path / ".git" / "refs" / "heads").mkdir(parents=True)
+    (path / ".git" / "refs" / "remotes" / "origin").mkdir(parents=True)
+    return GitRepository(path)
+
+
+def test_context(mocker: MockerFixture) -> None:
+    """
+    must stop batch process on context exit
+    """
+    close_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.close")
+    with GitRepository(Path("local")):
+        close_mock.assert_not_called()
+    close_mock.assert_called_once_with()
+
+
+def test_batch(mocker: MockerFixture) -> None:
+    """
+    must spawn batch process only once
+    """
+    popen_mock = mocker.patch("subprocess.Popen")
+    repository = GitRepository(Path("local"))
+
+    assert repository._batch() == repository._batch()
+    popen_mock.assert_called_once_with(["git", "cat-file", "--batch"], cwd=Path("local"),
+                                       stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+
+def test_channels() -> None:
+    """
+    must raise ValueError if process channels are not available
+    """
+    process = _process(b"")
+    process.stdout = None
+    with pytest.raises(ValueError):
+        GitRepository._channels(process)
+
+
+def test_cat_file(mocker: MockerFixture) -> None:
+    """
+    must read objects through batch process
+    """
+    process = _process(b"sha blob 7\ncontent\nsha blob 5\nother\n")
+    mocker.patch("subprocess.Popen", return_value=process)
+    repository = GitRepository(Path("local"))
+
+    assert repository.cat_file("HEAD:PKGBUILD") == b"content"
+    assert repository.cat_file("HEAD:.SRCINFO") == b"other"
+    assert process.stdin.getvalue() == b"HEAD:PKGBUILD\nHEAD:.SRCINFO\n"
+
+
+def test_cat_file_missing(mocker: MockerFixture) -> None:
+    """
+    must return None if object is missing
+    """
+    mocker.patch("subprocess.Popen", return_value=_process(b"HEAD:file name missing\nsha ambiguous\n"))
+    repository = GitRepository(Path("local"))
+
+    assert repository.cat_file("HEAD:file name") is None
+    assert repository.cat_file("sha") is None
+
+
+def test_cat_file_newline(mocker: MockerFixture) -> None:
+    """
+    must not request objects with new line in name
+    """
+    popen_mock = mocker.patch("subprocess.Popen")
+    assert GitRepository(Path("local")).cat_file("HEAD:file\nname") is None
+    popen_mock.assert_not_called()
+
+
+def test_cat_file_terminated(mocker: MockerFixture) -> None:
+    """
+    must raise CalledProcessError if batch process has been terminated
+    """
+    mocker.patch("subprocess.Popen", return_value=_process(b""))
+    repository = GitRepository(Path("local"))
+
+    with pytest.raises(CalledProcessError):
+        repository.cat_file("HEAD")
+    assert repository._process is None
+
+
+def test_cat_file_broken_pipe(mocker: MockerFixture) -> None:
+    """
+    must raise CalledProcessError if batch process doesn't accept input
+    """
+    process = _process(b"")
+    process.stdin = MagicMock()
+    process.stdin.write.side_effect = BrokenPipeError
+    mocker.patch("subprocess.Popen", return_value=process)
+
+    with pytest.raises(CalledProcessError):
+        GitRepository(Path("local")).cat_file("HEAD")
+
+
+def test_close(mocker: MockerFixture) -> None:
+    """
+    must stop batch process
+    """
+    process = _process(b"")
+    mocker.patch("subprocess.Popen", return_value=process)
+    repository = GitRepository(Path("local"))
+    repository._batch()
+
+    repository.close()
+    assert process.stdin.closed
+    assert process.stdout.closed
+    process.wait.assert_called_once_with()
+    assert repository._process is None
+
+
+def test_close_not_started() -> None:
+    """
+    must do nothing if batch process hasn't been started
+    """
+    GitRepository(Path("local")).close()
+
+
+def test_has_object(mocker: MockerFixture) -> None:
+    """
+    must check if object exists
+    """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.cat_file", side_effect=[b"", None])
+    repository = GitRepository(Path("local"))
+
+    assert repository.has_object("sha")
+    assert not repository.has_object("sha")
+
+
+def test_read(mocker: MockerFixture) -> None:
+    """
+    must read file content from commit
+    """
+    cat_file_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.cat_file",
+                                 return_value=b"pkgname=ahriman\n")
+    assert GitRepository(Path("local")).read("sha", Path("PKGBUILD")) == "pkgname=ahriman"
+    cat_file_mock.assert_called_once_with("sha:PKGBUILD")
+
+
+def test_read_missing(mocker: MockerFixture) -> None:
+    """
+    must return None if file is missing
+    """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.cat_file", return_value=None)
+    assert GitRepository(Path("local")).read("sha", Path("PKGBUILD")) is None
+
+
+def test_ref(tmp_path: Path) -> None:
+    """
+    must resolve HEAD from repository files
+    """
+    repository = _repository(tmp_path)
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/master\n")
+    (tmp_path / ".git" / "refs" / "heads" / "master").write_text(f"{"a" * 40}\n")
+
+    assert repository.ref() == "a" * 40
+    assert repository.ref("master") == "a" * 40
+    assert repository.ref("refs/heads/master") == "a" * 40
+
+
+def test_ref_detached(tmp_path: Path) -> None:
+    """
+    must resolve detached HEAD
+    """
+    repository = _repository(tmp_path)
+    (tmp_path / ".git" / "HEAD").write_text(f"{"b" * 64}\n")
+    assert repository.ref() == "b" * 64
+
+
+def test_ref_packed(tmp_path: Path) -> None:
+    """
+    must resolve packed references
+    """
+    repository = _repository(tmp_path)
+    (tmp_path / ".git" / "refs" / "remotes" / "origin" / "HEAD").write_text("ref: refs/remotes/origin/master\n")
+    (tmp_path / ".git" / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{"a" * 40} refs/remotes/origin/master\n"
+        f"{"b" * 40} refs/tags/v1\n"
+        f"^{"c" * 40}\n"
+    )
+
+    assert repository.ref("origin/master") == "a" * 40
+    assert repository.ref("origin") == "a" * 40
+    assert repository.ref("v1") == "b" * 40
+
+
+def test_ref_unknown(tmp_path: Path) -> None:
+    """
+    must return None if reference can't be resolved
+    """
+    repository = _repository(tmp_path)
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/.invalid\n")
+
+    assert repository.ref() is None
+    assert repository.ref("a" * 40) is None
+    assert repository.ref("config") is None
+
+
+def test_ref_loop(tmp_path: Path) -> None:
+    """
+    must not follow symbolic references infinitely
+    """
+    repository = _repository(tmp_path)
+    (tmp_path / ".git" / "HEAD").write_text("ref: HEAD\n")
+    assert repository.ref() is None
+
+
+def test_ref_no_git_dir(tmp_path: Path) -> None:
+    """
+    must return None if git directory is not available
+    """
+    (tmp_path / ".git").write_text("gitdir: /path/to/repository\n")
+    assert GitRepository(tmp_path).ref() is None
+
+
+def test_remotes(tmp_path: Path) -> None:
+    """
+    must read remotes from configuration
+    """
+    repository = _repository(tmp_path)
+    (tmp_path / ".git" / "config").write_text(
+        "[core]\n"
+        "\tbare = false\n"
+        "[remote \"origin\"]\n"
+        "\turl = https://github.com/arcan1s/ahriman\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        "[remote.upstream]\n"
+        "\turl = https://aur.archlinux.org/ahriman.git\n"
+        "[branch \"master\"]\n"
+        "\tremote = origin\n"
+    )
+    assert repository.remotes() == ["origin", "upstream"]
+
+
+def test_remotes_empty(tmp_path: Path) -> None:
+    """
+    must return empty list if there are no remotes
+    """
+    repository = _repository(tmp_path)
+    (tmp_path / ".git" / "config").write_text("[core]\n\tbare = false\n")
+    assert repository.remotes() == []
+
+
+def test_remotes_no_config(tmp_path: Path) -> None:
+    """
+    must return None if there is no configuration file
+    """
+    assert _repository(tmp_path).remotes() is None
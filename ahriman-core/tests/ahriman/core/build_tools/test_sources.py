@@ -4,6 +4,7 @@ from pathlib import Path
 from pytest_mock import MockerFixture
 from unittest.mock import call as MockCall
 
+from ahriman.core.build_tools.git_repository import GitRepository
 from ahriman.core.build_tools.sources import Sources
 from ahriman.core.exceptions import CalledProcessError
 from ahriman.models.changes import Changes
@@ -21,13 +22,28 @@ def test_changes(mocker: MockerFixture) -> None:
     fetch_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.fetch_until")
     diff_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.diff", return_value="diff")
     read_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.read", return_value="pkgbuild")
+    head_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.head", return_value="head")
     local = Path("local")
     last_commit_sha = "sha"
 
-    assert Sources.changes(local, last_commit_sha) == Changes(last_commit_sha, "diff", "pkgbuild")
+    assert Sources.changes(local, last_commit_sha) == Changes(last_commit_sha, "diff", "pkgbuild", "head")
     fetch_mock.assert_called_once_with(local, commit_sha=last_commit_sha)
     diff_mock.assert_called_once_with(local, last_commit_sha)
-    read_mock.assert_called_once_with(local, "HEAD", Path("PKGBUILD"))
+    head_mock.assert_called_once_with(local)
+    read_mock.assert_called_once_with(local, "head", Path("PKGBUILD"))
+
+
+def test_changes_close(mocker: MockerFixture) -> None:
+    """
+    must stop repository readers after changes calculation
+    """
+    mocker.patch("ahriman.core.build_tools.sources.Sources.fetch_until", return_value=None)
+    mocker.patch("ahriman.core.build_tools.sources.Sources.read", return_value="pkgbuild")
+    mocker.patch("ahriman.core.build_tools.sources.Sources.head", return_value="head")
+    close_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.close")
+
+    Sources.changes(Path("local"), "sha")
+    close_mock.assert_called_once_with()
 
 
 def test_changes_unknown_commit(mocker: MockerFixture) -> None:
@@ -37,10 +53,11 @@ def test_changes_unknown_commit(mocker: MockerFixture) -> None:
     mocker.patch("ahriman.core.build_tools.sources.Sources.fetch_until", return_value=None)
     diff_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.diff")
     read_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.read", return_value="pkgbuild")
+    mocker.patch("ahriman.core.build_tools.sources.Sources.head", return_value="head")
 
-    assert Sources.changes(Path("local"), "sha") == Changes("sha", None, "pkgbuild")
+    assert Sources.changes(Path("local"), "sha") == Changes("sha", None, "pkgbuild", "head")
     diff_mock.assert_not_called()
-    read_mock.assert_called_once_with(Path("local"), "HEAD", Path("PKGBUILD"))
+    read_mock.assert_called_once_with(Path("local"), "head", Path("PKGBUILD"))
 
 
 def test_extend_architectures(mocker: MockerFixture) -> None:
@@ -93,12 +110,9 @@ def test_fetch_existing(sources: Sources, remote_source: RemoteSource, mocker: M
     local = Path("local")
     assert sources.fetch(local, remote_source) == "sha"
     fetch_mock.assert_called_once_with(local, branch=remote_source.branch)
-    check_output_mock.assert_has_calls([
-        MockCall(*sources.git(), "checkout", "--force", remote_source.branch,
-                 cwd=local, logger=pytest.helpers.anyvar(int)),
-        MockCall(*sources.git(), "reset", "--quiet", "--hard", f"origin/{remote_source.branch}",
-                 cwd=local, logger=pytest.helpers.anyvar(int)),
-    ])
+    check_output_mock.assert_called_once_with(
+        *sources.git(), "checkout", "--quiet", "--force", "-B", remote_source.branch,
+        f"origin/{remote_source.branch}", cwd=local, logger=pytest.helpers.anyvar(int))
     move_mock.assert_called_once_with(local.resolve(), local)
     head_mock.assert_called_once_with(local)
 
@@ -118,10 +132,8 @@ def test_fetch_new(sources: Sources, remote_source: RemoteSource, mocker: Mocker
         MockCall(*sources.git(), "clone", "--quiet", "--depth", "1", "--branch", remote_source.branch,
                  "--single-branch", remote_source.git_url, str(local),
                  cwd=local.parent, logger=pytest.helpers.anyvar(int)),
-        MockCall(*sources.git(), "checkout", "--force", remote_source.branch,
-                 cwd=local, logger=pytest.helpers.anyvar(int)),
-        MockCall(*sources.git(), "reset", "--quiet", "--hard", f"origin/{remote_source.branch}",
-                 cwd=local, logger=pytest.helpers.anyvar(int))
+        MockCall(*sources.git(), "checkout", "--quiet", "--force", "-B", remote_source.branch,
+                 f"origin/{remote_source.branch}", cwd=local, logger=pytest.helpers.anyvar(int)),
     ])
     move_mock.assert_called_once_with(local.resolve(), local)
     head_mock.assert_called_once_with(local)
@@ -138,12 +150,9 @@ def test_fetch_new_without_remote(sources: Sources, mocker: MockerFixture) -> No
 
     local = Path("local")
     assert sources.fetch(local, RemoteSource(source=PackageSource.Archive)) == "sha"
-    check_output_mock.assert_has_calls([
-        MockCall(*sources.git(), "checkout", "--force", sources.DEFAULT_BRANCH,
-                 cwd=local, logger=pytest.helpers.anyvar(int)),
-        MockCall(*sources.git(), "reset", "--quiet", "--hard", f"origin/{sources.DEFAULT_BRANCH}",
-                 cwd=local, logger=pytest.helpers.anyvar(int))
-    ])
+    check_output_mock.assert_called_once_with(
+        *sources.git(), "checkout", "--quiet", "--force", "-B", sources.DEFAULT_BRANCH,
+        f"origin/{sources.DEFAULT_BRANCH}", cwd=local, logger=pytest.helpers.anyvar(int))
     move_mock.assert_called_once_with(local.resolve(), local)
     head_mock.assert_called_once_with(local)
 
@@ -162,10 +171,32 @@ def test_fetch_relative(remote_source: RemoteSource, mocker: MockerFixture) -> N
     head_mock.assert_called_once_with(local)
 
 
-def test_has_remotes(sources: Sources, mocker: MockerFixture) -> None:
+def test_has_remotes(mocker: MockerFixture) -> None:
     """
-    must ask for remotes
+    must read remotes from repository configuration
     """
+    remotes_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.remotes",
+                                return_value=["origin"])
+    check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
+
+    assert Sources.has_remotes(Path("local"))
+    remotes_mock.assert_called_once_with()
+    check_output_mock.assert_not_called()
+
+
+def test_has_remotes_empty(mocker: MockerFixture) -> None:
+    """
+    must return false in case if no remotes found in repository configuration
+    """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.remotes", return_value=[])
+    assert not Sources.has_remotes(Path("local"))
+
+
+def test_has_remotes_fallback(sources: Sources, mocker: MockerFixture) -> None:
+    """
+    must ask git for remotes if configuration can't be read
+    """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.remotes", return_value=None)
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output", return_value="origin")
 
     local = Path("local")
@@ -173,10 +204,11 @@ def test_has_remotes(sources: Sources, mocker: MockerFixture) -> None:
     check_output_mock.assert_called_once_with(*sources.git(), "remote", cwd=local, logger=pytest.helpers.anyvar(int))
 
 
-def test_has_remotes_empty(mocker: MockerFixture) -> None:
+def test_has_remotes_fallback_empty(mocker: MockerFixture) -> None:
     """
-    must ask for remotes and return false in case if no remotes found
+    must ask git for remotes and return false in case if no remotes found
     """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.remotes", return_value=None)
     mocker.patch("ahriman.core.build_tools.sources.check_output", return_value="")
     assert not Sources.has_remotes(Path("local"))
 
@@ -187,7 +219,7 @@ def test_init(sources: Sources, mocker: MockerFixture) -> None:
     """
     mocker.patch("ahriman.models.pkgbuild.Pkgbuild.local_files", return_value=[Path("local")])
     mocker.patch("pathlib.Path.is_dir", return_value=False)
-    add_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.add")
+    add_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.add", return_value=[Path("local/PKGBUILD")])
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
     commit_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.commit")
 
@@ -196,6 +228,21 @@ def test_init(sources: Sources, mocker: MockerFixture) -> None:
     check_output_mock.assert_called_once_with(*sources.git(), "init", "--quiet", "--initial-branch",
                                               sources.DEFAULT_BRANCH, cwd=local, logger=pytest.helpers.anyvar(int))
     add_mock.assert_called_once_with(local, "PKGBUILD", ".SRCINFO", "local")
+    commit_mock.assert_called_once_with(local, check_changes=False)
+
+
+def test_init_no_files(mocker: MockerFixture) -> None:
+    """
+    must check changes before commit if no files have been added to the new repository
+    """
+    mocker.patch("ahriman.models.pkgbuild.Pkgbuild.local_files", return_value=[])
+    mocker.patch("pathlib.Path.is_dir", return_value=False)
+    mocker.patch("ahriman.core.build_tools.sources.Sources.add", return_value=[])
+    mocker.patch("ahriman.core.build_tools.sources.check_output")
+    commit_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.commit")
+
+    local = Path("local")
+    Sources.init(local)
     commit_mock.assert_called_once_with(local)
 
 
@@ -205,12 +252,14 @@ def test_init_skip(mocker: MockerFixture) -> None:
     """
     mocker.patch("ahriman.models.pkgbuild.Pkgbuild.local_files", return_value=[Path("local")])
     mocker.patch("pathlib.Path.is_dir", return_value=True)
-    mocker.patch("ahriman.core.build_tools.sources.Sources.add")
-    mocker.patch("ahriman.core.build_tools.sources.Sources.commit")
+    mocker.patch("ahriman.core.build_tools.sources.Sources.add", return_value=[Path("local/PKGBUILD")])
+    commit_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.commit")
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
 
-    Sources.init(Path("local"))
+    local = Path("local")
+    Sources.init(local)
     check_output_mock.assert_not_called()
+    commit_mock.assert_called_once_with(local)
 
 
 def test_load(package_ahriman: Package, repository_paths: RepositoryPaths, mocker: MockerFixture) -> None:
@@ -314,7 +363,7 @@ def test_add(sources: Sources, mocker: MockerFixture) -> None:
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
 
     local = Path("local")
-    sources.add(local, "pattern1", "pattern2")
+    assert sources.add(local, "pattern1", "pattern2") == [Path("local/1"), Path("local/2")] * 2
     glob_mock.assert_has_calls([MockCall("pattern1"), MockCall("pattern2")])
     check_output_mock.assert_called_once_with(
         *sources.git(), "add", "1", "2", "1", "2", cwd=local, logger=sources.logger
@@ -343,10 +392,33 @@ def test_add_skip(sources: Sources, mocker: MockerFixture) -> None:
     mocker.patch("pathlib.Path.glob", return_value=[])
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
 
-    sources.add(Path("local"), "pattern1")
+    assert sources.add(Path("local"), "pattern1") == []
     check_output_mock.assert_not_called()
 
 
+def test_close(sources: Sources, mocker: MockerFixture) -> None:
+    """
+    must stop all repository readers
+    """
+    close_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.close")
+    sources.repository(Path("local1"))
+    sources.repository(Path("local2"))
+
+    sources.close()
+    assert close_mock.call_count == 2
+    assert not sources._repositories
+
+
+def test_context(mocker: MockerFixture) -> None:
+    """
+    must stop repository readers on context exit
+    """
+    close_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.close")
+    with Sources():
+        close_mock.assert_not_called()
+    close_mock.assert_called_once_with()
+
+
 def test_commit(sources: Sources, mocker: MockerFixture) -> None:
     """
     must commit changes
@@ -375,6 +447,18 @@ def test_commit_no_changes(sources: Sources, mocker: MockerFixture) -> None:
     check_output_mock.assert_not_called()
 
 
+def test_commit_skip_check(sources: Sources, mocker: MockerFixture) -> None:
+    """
+    must commit changes without index check
+    """
+    has_changes_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.has_changes")
+    check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
+
+    assert sources.commit(Path("local"), check_changes=False)
+    has_changes_mock.assert_not_called()
+    check_output_mock.assert_called_once()
+
+
 def test_commit_author(sources: Sources, mocker: MockerFixture) -> None:
     """
     must commit changes with commit author
@@ -434,12 +518,9 @@ def test_fetch_until(sources: Sources, mocker: MockerFixture) -> None:
     """
     must fetch until the specified commit
     """
-    check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output", side_effect=[
-        "",
-        CalledProcessError(1, ["command"], "error"),
-        "",
-        "",
-    ])
+    check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
+    has_object_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.has_object",
+                                   side_effect=[False, True])
     local = Path("local")
     last_commit_sha = "sha"
 
@@ -447,11 +528,10 @@ def test_fetch_until(sources: Sources, mocker: MockerFixture) -> None:
     check_output_mock.assert_has_calls([
         MockCall(*sources.git(), "fetch", "--quiet", "--depth", "1", "origin", "master",
                  cwd=local, logger=sources.logger),
-        MockCall(*sources.git(), "cat-file", "-e", last_commit_sha, cwd=local, logger=sources.logger),
         MockCall(*sources.git(), "fetch", "--quiet", "--depth", "2", "origin", "master",
                  cwd=local, logger=sources.logger),
-        MockCall(*sources.git(), "cat-file", "-e", last_commit_sha, cwd=local, logger=sources.logger),
     ])
+    has_object_mock.assert_has_calls([MockCall(last_commit_sha), MockCall(last_commit_sha)])
 
 
 def test_fetch_until_first(sources: Sources, mocker: MockerFixture) -> None:
@@ -459,14 +539,14 @@ def test_fetch_until_first(sources: Sources, mocker: MockerFixture) -> None:
     must fetch first commit only
     """
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
+    has_object_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.has_object",
+                                   return_value=True)
     local = Path("local")
 
     assert sources.fetch_until(local, branch="master") == "HEAD"
-    check_output_mock.assert_has_calls([
-        MockCall(*sources.git(), "fetch", "--quiet", "--depth", "1", "origin", "master",
-                 cwd=local, logger=sources.logger),
-        MockCall(*sources.git(), "cat-file", "-e", "HEAD", cwd=local, logger=sources.logger),
-    ])
+    check_output_mock.assert_called_once_with(*sources.git(), "fetch", "--quiet", "--depth", "1", "origin", "master",
+                                              cwd=local, logger=sources.logger)
+    has_object_mock.assert_called_once_with("HEAD")
 
 
 def test_fetch_until_all_branches(sources: Sources, mocker: MockerFixture) -> None:
@@ -474,25 +554,20 @@ def test_fetch_until_all_branches(sources: Sources, mocker: MockerFixture) -> No
     must fetch all branches
     """
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.has_object", return_value=True)
     local = Path("local")
 
     assert sources.fetch_until(local) == "HEAD"
-    check_output_mock.assert_has_calls([
-        MockCall(*sources.git(), "fetch", "--quiet", "--depth", "1", cwd=local, logger=sources.logger),
-        MockCall(*sources.git(), "cat-file", "-e", "HEAD", cwd=local, logger=sources.logger),
-    ])
+    check_output_mock.assert_called_once_with(*sources.git(), "fetch", "--quiet", "--depth", "1",
+                                              cwd=local, logger=sources.logger)
 
 
 def test_fetch_until_not_found(sources: Sources, mocker: MockerFixture) -> None:
     """
     must return None in case if no commit found at the required maximal depth
     """
-    mocker.patch("ahriman.core.build_tools.sources.check_output", side_effect=[
-        "",
-        CalledProcessError(1, ["command"], "error"),
-        "",
-        CalledProcessError(1, ["command"], "error"),
-    ])
+    mocker.patch("ahriman.core.build_tools.sources.check_output")
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.has_object", return_value=False)
     assert sources.fetch_until(Path("local"), branch="master", commit_sha="sha", max_depth=2) is None
 
 
@@ -531,8 +606,21 @@ def test_has_changes(sources: Sources, mocker: MockerFixture) -> None:
 
 def test_head(sources: Sources, mocker: MockerFixture) -> None:
     """
-    must correctly define HEAD hash
+    must correctly define HEAD hash from repository files
+    """
+    ref_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.ref", return_value="sha")
+    check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output")
+
+    assert sources.head(Path("local")) == "sha"
+    ref_mock.assert_called_once_with("HEAD")
+    check_output_mock.assert_not_called()
+
+
+def test_head_fallback(sources: Sources, mocker: MockerFixture) -> None:
+    """
+    must correctly define HEAD hash by using git if it can't be resolved from files
     """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.ref", return_value=None)
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output", return_value="sha")
     local = Path("local")
 
@@ -544,6 +632,7 @@ def test_head_specific(sources: Sources, mocker: MockerFixture) -> None:
     """
     must correctly define ref hash
     """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.ref", return_value=None)
     check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output", return_value="sha")
     local = Path("local")
 
@@ -602,15 +691,34 @@ def test_read(sources: Sources, mocker: MockerFixture) -> None:
     """
     must read file from commit
     """
-    check_output_mock = mocker.patch("ahriman.core.build_tools.sources.check_output", return_value="content")
+    read_mock = mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.read", return_value="content")
     assert sources.read(Path("local"), "sha", Path("PKGBUILD")) == "content"
-    check_output_mock.assert_called_once()
+    read_mock.assert_called_once_with("sha", Path("PKGBUILD"))
+
+
+def test_read_missing(sources: Sources, mocker: MockerFixture) -> None:
+    """
+    must return None in case if file doesn't exist at commit
+    """
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.read", return_value=None)
+    assert sources.read(Path("local"), "sha", Path("PKGBUILD")) is None
 
 
 def test_read_failed(sources: Sources, mocker: MockerFixture) -> None:
     """
     must return None in case if file cannot be read from commit
     """
-    mocker.patch("ahriman.core.build_tools.sources.check_output",
+    mocker.patch("ahriman.core.build_tools.git_repository.GitRepository.read",
                  side_effect=CalledProcessError(1, ["command"], "error"))
     assert sources.read(Path("local"), "sha", Path("PKGBUILD")) is None
+
+
+def test_repository(sources: Sources) -> None:
+    """
+    must return shared repository reader
+    """
+    repository = sources.repository(Path("local"))
+    assert isinstance(repository, GitRepository)
+    assert repository.sources_dir == Path("local")
+    assert sources.repository(Path("local")) is repository
+    assert sources.repository(Path("other")) is not repository
@@ -1,9 +1,14 @@
+import os
 import pytest
+import subprocess
 
 from pathlib import Path
 from pytest_mock import MockerFixture
 
+from ahriman.core.build_tools.chroot_manager import ChrootManager
 from ahriman.core.build_tools.task import Task
+from ahriman.core.configuration import Configuration
+from ahriman.core.exceptions import BuildError
 from ahriman.models.pkgbuild_patch import PkgbuildPatch
 
 
@@ -41,6 +46,32 @@ def test_package_archives_no_debug(task_ahriman: Task, mocker: MockerFixture) ->
     ]
 
 
+def test_pkgver_host(task_ahriman: Task, mocker: MockerFixture) -> None:
+    """
+    must calculate version on the host
+    """
+    check_output_mock = mocker.patch("ahriman.core.build_tools.task.check_output")
+
+    local = Path("local")
+    assert task_ahriman._pkgver_host(local)
+    check_output_mock.assert_called_once_with(
+        "makepkg", "--nobuild", "--noprepare", "--nocheck",
+        exception=pytest.helpers.anyvar(int),
+        cwd=local,
+        logger=task_ahriman.logger,
+        user=task_ahriman.uid,
+        environment={"BUILDDIR": pytest.helpers.anyvar(str, True), "SRCDEST": str(local)},
+    )
+
+
+def test_pkgver_host_failed(task_ahriman: Task, mocker: MockerFixture) -> None:
+    """
+    must return False if version could not be calculated on the host
+    """
+    mocker.patch("ahriman.core.build_tools.task.check_output", side_effect=BuildError(task_ahriman.package.base))
+    assert not task_ahriman._pkgver_host(Path("local"))
+
+
 def test_build(task_ahriman: Task, mocker: MockerFixture) -> None:
     """
     must build package
@@ -151,6 +182,115 @@ def test_build_dry_run(task_ahriman: Task, mocker: MockerFixture) -> None:
     )
 
 
+def test_build_snapshot(task_ahriman: Task, configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must build package in chroot snapshot
+    """
+    task_ahriman.chroot = ChrootManager(configuration, task_ahriman.repository_id, task_ahriman.paths)
+    task_ahriman.chroot.is_updated = True
+    mocker.patch("pathlib.Path.iterdir", return_value=["file"])
+    check_output_mock = mocker.patch("ahriman.core.build_tools.task.check_output")
+    mocker.patch("ahriman.core.build_tools.task.Task._package_archives", return_value=[])
+
+    task_ahriman.build(Path("local"))
+    check_output_mock.assert_called_once_with(
+        "ahriman-archbuild",
+        "-r", task_ahriman.repository_id.name,
+        "-a", task_ahriman.repository_id.architecture,
+        "-c", str(task_ahriman.devtools_configs),
+        "-s", task_ahriman.paths.build_root.name,
+        "--", "-r", str(task_ahriman.paths.chroot),
+        "--", "-D", str(task_ahriman.paths.archive),
+        "--", "--skippgpcheck",
+        exception=pytest.helpers.anyvar(int),
+        cwd=Path("local"),
+        logger=task_ahriman.logger,
+        user=task_ahriman.uid,
+        environment={},
+    )
+
+
+def test_build_snapshot_wrapper(task_ahriman: Task, configuration: Configuration, tmp_path: Path) -> None:
+    """
+    must pass snapshot flags to the devtools wrapper
+    """
+    arguments = tmp_path / "arguments"
+    wrapper = tmp_path / "wrapper"
+    wrapper.write_text(f"#!/bin/sh\nprintf '%s\\n' \"$@\" > {arguments}\n")
+    wrapper.chmod(0o755)
+    sources_dir = tmp_path / "sources"
+    sources_dir.mkdir()
+
+    task_ahriman.build_command = [str(wrapper)]
+    task_ahriman.uid = os.getuid()
+    task_ahriman.chroot = ChrootManager(configuration, task_ahriman.repository_id, task_ahriman.paths)
+    task_ahriman.chroot.is_updated = True
+
+    assert task_ahriman.build(sources_dir) == []
+    assert arguments.read_text().splitlines()[:10] == [
+        "-r", task_ahriman.repository_id.name,
+        "-a", task_ahriman.repository_id.architecture,
+        "-c", str(task_ahriman.devtools_configs),
+        "-s", task_ahriman.paths.build_root.name,
+        "--", "-r",
+    ]
+
+
+def test_build_snapshot_archbuild(tmp_path: Path) -> None:
+    """
+    must not recreate snapshot by makechrootpkg in the devtools wrapper
+    """
+    script = Path(__file__).parents[4] / "package" / "bin" / "ahriman-archbuild"
+    arguments = tmp_path / "arguments"
+
+    devtools = tmp_path / "devtools"
+    (devtools / "lib").mkdir(parents=True)
+    (devtools / "lib" / "archroot.sh").write_text(
+        "check_root() { :; }\n"
+        "is_btrfs() { return 1; }\n"
+        "is_subvolume() { return 1; }\n"
+        "subvolume_delete_recursive() { :; }\n"
+    )
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    # simplified version of the archbuild script, which passes clean flag to makechrootpkg
+    archbuild = bin_dir / "archbuild"
+    archbuild.write_text(
+        "makechrootpkg_args=(-c -n -C)\n"
+        "while getopts 'hcr:' arg; do case $arg in r) chroots=$OPTARG ;; esac; done\n"
+        "makechrootpkg_args+=(\"${@:$OPTIND}\")\n"
+        "exec makechrootpkg -r \"$chroots/${0%-build}\" \"${makechrootpkg_args[@]}\"\n"
+    )
+    makechrootpkg = bin_dir / "makechrootpkg"
+    makechrootpkg.write_text(f"#!/bin/sh\nprintf '%s\\n' \"$@\" > {arguments}\n")
+    makechrootpkg.chmod(0o755)
+
+    chroots = tmp_path / "chroot"
+    chrootdir = chroots / "repo-arch"
+    (chrootdir / "root").mkdir(parents=True)
+    (chrootdir / "root" / "file").touch()
+    (chrootdir / "copy").mkdir()
+    (chrootdir / "copy" / "stale").touch()
+
+    subprocess.run(
+        [str(script), "-r", "repo", "-a", "arch", "-s", "copy",
+         "--", "-r", str(chroots), "--", "-D", "archive", "--", "--skippgpcheck", "-c"],
+        check=True,
+        env=os.environ | {
+            "AHRIMAN_ARCHBUILD": str(archbuild),
+            "AHRIMAN_DEVTOOLS_DIR": str(devtools),
+            "PATH": f"{bin_dir}:{os.environ["PATH"]}",
+        },
+    )
+
+    assert arguments.read_text().splitlines() == [
+        "-r", str(chrootdir), "-n", "-C", "-l", "copy", "-D", "archive", "--", "--skippgpcheck", "-c",
+    ]
+    assert (chrootdir / "copy" / "file").exists()
+    assert not (chrootdir / "copy" / "stale").exists()
+
+
 def test_build_legacy_subcommand(task_ahriman: Task, mocker: MockerFixture) -> None:
     """
     must build package by using legacy subcommand if set
@@ -226,3 +366,47 @@ def test_init_bump_pkgrel_skip(task_ahriman: Task, mocker: MockerFixture) -> Non
 
     assert task_ahriman.init(Path("ahriman"), [], "1.0.0-1") == "sha"
     write_mock.assert_not_called()
+
+
+def test_pkgver(task_ahriman: Task, mocker: MockerFixture) -> None:
+    """
+    must calculate version inside the chroot by default
+    """
+    host_mock = mocker.patch("ahriman.core.build_tools.task.Task._pkgver_host")
+    build_mock = mocker.patch("ahriman.core.build_tools.task.Task.build")
+
+    local = Path("local")
+    task_ahriman.pkgver(local)
+    host_mock.assert_not_called()
+    build_mock.assert_called_once_with(local, dry_run=True)
+    assert "pkgver_chroot" in task_ahriman.timings
+
+
+def test_pkgver_host_enabled(task_ahriman: Task, mocker: MockerFixture) -> None:
+    """
+    must calculate version on the host if enabled
+    """
+    task_ahriman.vcs_host_pkgver = True
+    host_mock = mocker.patch("ahriman.core.build_tools.task.Task._pkgver_host", return_value=True)
+    build_mock = mocker.patch("ahriman.core.build_tools.task.Task.build")
+
+    local = Path("local")
+    task_ahriman.pkgver(local)
+    host_mock.assert_called_once_with(local)
+    build_mock.assert_not_called()
+    assert "pkgver_host" in task_ahriman.timings
+
+
+def test_pkgver_host_fallback(task_ahriman: Task, mocker: MockerFixture) -> None:
+    """
+    must fallback to chroot if version could not be calculated on the host
+    """
+    task_ahriman.vcs_host_pkgver = True
+    mocker.patch("ahriman.core.build_tools.task.Task._pkgver_host", return_value=False)
+    build_mock = mocker.patch("ahriman.core.build_tools.task.Task.build")
+
+    local = Path("local")
+    task_ahriman.pkgver(local)
+    build_mock.assert_called_once_with(local, dry_run=True)
+    assert "pkgver_chroot" in task_ahriman.timings
+    assert "pkgver_host" not in task_ahriman.timings
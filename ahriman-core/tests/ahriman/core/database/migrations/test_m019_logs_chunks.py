@@ -0,0 +1,41 @@
+from pytest_mock import MockerFixture
+from sqlite3 import Connection
+from unittest.mock import call as MockCall
+
+from ahriman.core.configuration import Configuration
+from ahriman.core.database.migrations.m019_logs_chunks import migrate_data, migrate_logs, steps
+from ahriman.core.database.operations.logs_operations import LogsOperations
+
+
+def test_migration_logs_chunks() -> None:
+    """
+    migration must not be empty
+    """
+    assert steps
+
+
+def test_migrate_data(connection: Connection, configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must perform data migration
+    """
+    migration_mock = mocker.patch("ahriman.core.database.migrations.m019_logs_chunks.migrate_logs")
+    migrate_data(connection, configuration)
+    migration_mock.assert_called_once_with(connection)
+
+
+def test_migrate_logs(connection: Connection, mocker: MockerFixture) -> None:
+    """
+    must compress existing logs
+    """
+    processes = [
+        {"package_base": "ahriman", "version": "1", "repository": "aur-x86_64", "process_id": "1"},
+        {"package_base": "ahriman", "version": "2", "repository": "aur-x86_64", "process_id": "2"},
+    ]
+    connection.execute.return_value.fetchall.return_value = processes
+    compress_mock = mocker.patch("ahriman.core.database.operations.logs_operations.LogsOperations.logs_compress")
+
+    migrate_logs(connection)
+    compress_mock.assert_has_calls([
+        MockCall(connection, process, LogsOperations.LOGS_CHUNK_SIZE, partial=True)
+        for process in processes
+    ])
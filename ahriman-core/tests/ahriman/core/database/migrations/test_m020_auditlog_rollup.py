@@ -0,0 +1,8 @@
+from ahriman.core.database.migrations.m020_auditlog_rollup import steps
+
+
+def test_migration_auditlog_rollup() -> None:
+    """
+    migration must not be empty
+    """
+    assert steps
@@ -0,0 +1,52 @@
+import pytest
+
+from pytest_mock import MockerFixture
+from sqlite3 import Connection
+from unittest.mock import call as MockCall
+
+from ahriman.core.configuration import Configuration
+from ahriman.core.database.migrations.m021_changes_cache import migrate_changes, migrate_data, steps
+from ahriman.core.database.operations.changes_operations import ChangesOperations
+
+
+def test_migration_changes_cache() -> None:
+    """
+    migration must not be empty
+    """
+    assert steps
+
+
+def test_migrate_data(connection: Connection, configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must perform data migration
+    """
+    migration_mock = mocker.patch("ahriman.core.database.migrations.m021_changes_cache.migrate_changes")
+    migrate_data(connection, configuration)
+    migration_mock.assert_called_once_with(connection)
+
+
+def test_migrate_changes(connection: Connection) -> None:
+    """
+    must compress existing changes
+    """
+    connection.execute.return_value.fetchall.return_value = [{
+        "package_base": "ahriman",
+        "repository": "aur-x86_64",
+        "last_commit_sha": "sha",
+        "changes": "changes",
+        "pkgbuild": "",
+    }]
+
+    migrate_changes(connection)
+    connection.execute.assert_has_calls([
+        MockCall(
+            pytest.helpers.anyvar(str, strict=True),
+            {
+                "package_base": "ahriman",
+                "repository": "aur-x86_64",
+                "last_commit_sha": "sha",
+                "changes": ChangesOperations.changes_compress("changes"),
+                "pkgbuild": None,
+            }),
+        MockCall(pytest.helpers.anyvar(str, strict=True)),
+    ])
@@ -0,0 +1,8 @@
+from ahriman.core.database.migrations.m022_packages_index import steps
+
+
+def test_migration_packages_index() -> None:
+    """
+    migration must not be empty
+    """
+    assert steps
@@ -1,4 +1,5 @@
 from ahriman.core.database import SQLite
+from ahriman.core.database.operations.changes_operations import ChangesOperations
 from ahriman.models.changes import Changes
 from ahriman.models.package import Package
 from ahriman.models.repository_id import RepositoryId
@@ -55,6 +56,22 @@ def test_changes_insert_remove_full(database: SQLite, package_ahriman: Package,
     assert database.changes_get(package_ahriman.base, RepositoryId("i686", database._repository_id.name)) == changes2
 
 
+def test_changes_insert_many(database: SQLite, package_ahriman: Package, package_python_schedule: Package) -> None:
+    """
+    must insert and remove changes of multiple packages at once
+    """
+    changes1 = Changes("sha1", "change1", "pkgbuild1")
+    changes2 = Changes("sha2", "change2", "pkgbuild2")
+    database.changes_insert(package_python_schedule.base, Changes("sha3", "change3", "pkgbuild3"))
+
+    database.changes_insert_many([(package_ahriman.base, changes1), (package_python_schedule.base, Changes())])
+    assert database.changes_get(package_ahriman.base) == changes1
+    assert database.changes_get(package_python_schedule.base).changes is None
+
+    database.changes_insert_many([(package_ahriman.base, changes2)])
+    assert database.changes_get(package_ahriman.base) == changes2
+
+
 def test_changes_insert_pkgbuild_preserve(database: SQLite, package_ahriman: Package) -> None:
     """
     must preserve existing pkgbuild when inserting changes without pkgbuild
@@ -62,3 +79,25 @@ def test_changes_insert_pkgbuild_preserve(database: SQLite, package_ahriman: Pac
     database.changes_insert(package_ahriman.base, Changes("sha1", "change1", "pkgbuild1"))
     database.changes_insert(package_ahriman.base, Changes("sha2", "change2", None))
     assert database.changes_get(package_ahriman.base) == Changes("sha2", "change2", "pkgbuild1")
+
+
+def test_changes_compress_decompress() -> None:
+    """
+    must compress and decompress changes
+    """
+    assert ChangesOperations.changes_decompress(ChangesOperations.changes_compress("change")) == "change"
+    assert ChangesOperations.changes_decompress(ChangesOperations.changes_compress("")) is None
+    assert ChangesOperations.changes_compress(None) is None
+    assert ChangesOperations.changes_decompress(None) is None
+
+
+def test_changes_insert_get_head(database: SQLite, package_ahriman: Package) -> None:
+    """
+    must insert and get changes with commit range
+    """
+    changes = Changes("sha1", "change1", "pkgbuild1", "sha2")
+    database.changes_insert(package_ahriman.base, changes)
+    assert database.changes_get(package_ahriman.base) == changes
+
+    database.changes_insert(package_ahriman.base, Changes("sha2", "change1", "pkgbuild1"))
+    assert database.changes_get(package_ahriman.base).head_commit_sha is None
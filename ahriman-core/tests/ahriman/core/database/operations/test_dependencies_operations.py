@@ -23,6 +23,24 @@ def test_dependencies_insert_get(database: SQLite, package_ahriman: Package) ->
     }
 
 
+def test_dependencies_insert_many(database: SQLite, package_ahriman: Package,
+                                  package_python_schedule: Package) -> None:
+    """
+    must insert dependencies of multiple packages at once
+    """
+    dependencies1 = Dependencies({"usr": ["python"]})
+    dependencies2 = Dependencies({"usr": ["filesystem"]})
+
+    database.dependencies_insert_many([
+        (package_ahriman.base, dependencies1),
+        (package_python_schedule.base, dependencies2),
+    ])
+    assert database.dependencies_get() == {
+        package_ahriman.base: dependencies1,
+        package_python_schedule.base: dependencies2,
+    }
+
+
 def test_dependencies_insert_remove(database: SQLite, package_ahriman: Package,
                                     package_python_schedule: Package) -> None:
     """
@@ -1,5 +1,6 @@
 from ahriman.core.database import SQLite
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.package import Package
 from ahriman.models.repository_id import RepositoryId
 
@@ -38,3 +39,34 @@ def test_event_insert_get_pagination(database: SQLite) -> None:
     database.event_insert(Event("1", "1"))
     database.event_insert(Event("2", "2"))
     assert all(event.event == "1" for event in database.event_get(limit=1, offset=1))
+
+
+def test_event_insert_rollup(database: SQLite) -> None:
+    """
+    must update rollups on event insertion
+    """
+    database.event_insert(Event("event", "object", created=1, took=1.0))
+    database.event_insert(Event("event", "object", created=2, took=3.0))
+    database.event_insert(Event("event", "object", created=3))
+    database.event_insert(Event("event", "object", created=EventRollup.BUCKET + 1, took="invalid"))
+
+    assert database.event_rollup_get() == [
+        EventRollup(event="event", object_id="object", created=0, count=3, took_count=2, took_sum=4.0,
+                    took_squares=10.0, took_min=1.0, took_max=3.0),
+        EventRollup(event="event", object_id="object", created=EventRollup.BUCKET, count=1),
+    ]
+
+
+def test_event_rollup_get_filter(database: SQLite) -> None:
+    """
+    must get rollups with filter
+    """
+    database.event_insert(Event("event 1", "object 1", created=1))
+    database.event_insert(Event("event 2", "object 2", created=EventRollup.BUCKET))
+    database.event_insert(Event("event 1", "object 1", created=1), RepositoryId("i686", database._repository_id.name))
+
+    assert [rollup.event for rollup in database.event_rollup_get(event="event 1")] == ["event 1"]
+    assert [rollup.object_id for rollup in database.event_rollup_get(object_id="object 2")] == ["object 2"]
+    assert [rollup.event for rollup in database.event_rollup_get(from_date=EventRollup.BUCKET)] == ["event 2"]
+    assert [rollup.event for rollup in database.event_rollup_get(to_date=EventRollup.BUCKET)] == ["event 1"]
+    assert len(database.event_rollup_get(repository_id=RepositoryId("i686", database._repository_id.name))) == 1
@@ -1,10 +1,181 @@
+import pytest
+
+from pytest_mock import MockerFixture
+
 from ahriman.core.database import SQLite
+from ahriman.core.database.operations.logs_operations import LogsOperations
 from ahriman.models.log_record import LogRecord
 from ahriman.models.log_record_id import LogRecordId
 from ahriman.models.package import Package
 from ahriman.models.repository_id import RepositoryId
 
 
+def test_logs_counters_remove(database: SQLite) -> None:
+    """
+    must remove cached counters
+    """
+    database._logs_uncompressed = {
+        ("ahriman", "1", "repo", "p1"): 1,
+        ("ahriman", "2", "repo", "p2"): 1,
+        ("python-schedule", "1", "repo", "p1"): 1,
+        ("ahriman", "1", "another", "p1"): 1,
+    }
+
+    database._logs_counters_remove("repo", "ahriman", "2")
+    assert list(database._logs_uncompressed) == [
+        ("ahriman", "2", "repo", "p2"),
+        ("python-schedule", "1", "repo", "p1"),
+        ("ahriman", "1", "another", "p1"),
+    ]
+
+    database._logs_counters_remove("repo", "ahriman")
+    assert list(database._logs_uncompressed) == [
+        ("python-schedule", "1", "repo", "p1"),
+        ("ahriman", "1", "another", "p1"),
+    ]
+
+    database._logs_counters_remove("repo")
+    assert list(database._logs_uncompressed) == [("ahriman", "1", "another", "p1")]
+
+
+def test_logs_counters_update(database: SQLite) -> None:
+    """
+    must update cached counter and move it to the end
+    """
+    database._logs_counters_update(("ahriman", "1", "repo", "p1"), 1)
+    database._logs_counters_update(("ahriman", "1", "repo", "p2"), 1)
+    database._logs_counters_update(("ahriman", "1", "repo", "p1"), 2)
+    assert database._logs_uncompressed == {
+        ("ahriman", "1", "repo", "p2"): 1,
+        ("ahriman", "1", "repo", "p1"): 2,
+    }
+    assert list(database._logs_uncompressed)[-1] == ("ahriman", "1", "repo", "p1")
+
+
+def test_logs_counters_update_empty(database: SQLite) -> None:
+    """
+    must remove cached counter if there are no uncompressed records
+    """
+    database._logs_counters_update(("ahriman", "1", "repo", "p1"), 1)
+    database._logs_counters_update(("ahriman", "1", "repo", "p1"), 0)
+    assert not database._logs_uncompressed
+
+
+def test_logs_counters_update_evict(database: SQLite, mocker: MockerFixture) -> None:
+    """
+    must evict least recently used counters
+    """
+    mocker.patch.object(LogsOperations, "LOGS_COUNTERS_SIZE", 2)
+    database._logs_counters_update(("ahriman", "1", "repo", "p1"), 1)
+    database._logs_counters_update(("ahriman", "1", "repo", "p2"), 1)
+    database._logs_counters_update(("ahriman", "1", "repo", "p1"), 2)
+    database._logs_counters_update(("ahriman", "1", "repo", "p3"), 1)
+    assert database._logs_uncompressed == {
+        ("ahriman", "1", "repo", "p1"): 2,
+        ("ahriman", "1", "repo", "p3"): 1,
+    }
+
+
+def test_logs_chunk_compress() -> None:
+    """
+    must compress and decompress log records
+    """
+    records = [(42.0, "message 1"), (43.0, "message 2")]
+    assert LogsOperations.logs_chunk_decompress(LogsOperations.logs_chunk_compress(records)) == records
+
+
+def test_logs_compress(database: SQLite, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must compress log records into chunks
+    """
+    mocker.patch.object(LogsOperations, "LOGS_CHUNK_SIZE", 2)
+    records = [
+        LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 42.0 + index, f"message {index}")
+        for index in range(5)
+    ]
+    for record in records:
+        database.logs_insert(record)
+
+    chunks = database.with_connection(
+        lambda connection: connection.execute("select line_offset, lines from logs_chunks").fetchall())
+    assert chunks == [{"line_offset": 0, "lines": 2}, {"line_offset": 2, "lines": 2}]
+    assert database.logs_get(package_ahriman.base) == records
+    assert database.logs_get(package_ahriman.base, limit=2, offset=2) == records[1:3]
+    assert database.logs_get(package_ahriman.base, limit=1) == records[4:]
+
+
+def test_logs_compress_counter(database: SQLite, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must count uncompressed records without queries on each insert
+    """
+    mocker.patch.object(LogsOperations, "LOGS_CHUNK_SIZE", 2)
+    compress_mock = mocker.patch("ahriman.core.database.operations.LogsOperations.logs_compress", return_value=1)
+    key = (package_ahriman.base, "1", database._repository_id.id, "p1")
+
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 42.0, "message 1"))
+    assert database._logs_uncompressed[key] == 1
+    compress_mock.assert_not_called()
+
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 43.0, "message 2"))
+    compress_mock.assert_called_once_with(pytest.helpers.anyvar(int), pytest.helpers.anyvar(int), 2, partial=False)
+    assert database._logs_uncompressed[key] == 1
+
+
+def test_logs_compress_counter_empty(database: SQLite, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must remove counter if all records have been compressed
+    """
+    mocker.patch.object(LogsOperations, "LOGS_CHUNK_SIZE", 1)
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 42.0, "message 1"))
+    assert not database._logs_uncompressed
+
+
+def test_logs_iterate_lazy(database: SQLite, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must decompress only chunks which contain requested records
+    """
+    mocker.patch.object(LogsOperations, "LOGS_CHUNK_SIZE", 2)
+    records = [
+        LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 42.0 + index, f"message {index}")
+        for index in range(7)
+    ]
+    for record in records:
+        database.logs_insert(record)
+    decompress_mock = mocker.spy(LogsOperations, "logs_chunk_decompress")
+
+    assert database.logs_get(package_ahriman.base, limit=2, offset=1) == records[4:6]
+    decompress_mock.assert_called_once_with(pytest.helpers.anyvar(bytes, strict=True))
+
+    iterator = database.logs_iterate(package_ahriman.base)
+    assert next(iterator) == records[0]
+    assert decompress_mock.call_count == 2
+
+
+def test_logs_compress_partial(database: SQLite, package_ahriman: Package) -> None:
+    """
+    must compress remaining log records if partial flag is set
+    """
+    records = [
+        LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 42.0 + index, f"message {index}")
+        for index in range(3)
+    ]
+    for record in records:
+        database.logs_insert(record)
+    parameters = {
+        "package_base": package_ahriman.base,
+        "version": "1",
+        "repository": database._repository_id.id,
+        "process_id": "p1",
+    }
+
+    database.with_connection(
+        lambda connection: LogsOperations.logs_compress(connection, parameters, 2, partial=True), commit=True)
+    chunks = database.with_connection(
+        lambda connection: connection.execute("select line_offset, lines from logs_chunks").fetchall())
+    assert chunks == [{"line_offset": 0, "lines": 2}, {"line_offset": 2, "lines": 1}]
+    assert database.logs_get(package_ahriman.base) == records
+
+
 def test_logs_insert_remove_version(database: SQLite, package_ahriman: Package,
                                     package_python_schedule: Package) -> None:
     """
@@ -21,6 +192,10 @@ def test_logs_insert_remove_version(database: SQLite, package_ahriman: Package,
     assert database.logs_get(package_python_schedule.base) == [
         LogRecord(LogRecordId(package_python_schedule.base, "1"), 42.0, "message 3"),
     ]
+    assert {key[:2] for key in database._logs_uncompressed} == {
+        (package_ahriman.base, "1"),
+        (package_python_schedule.base, "1"),
+    }
 
 
 def test_logs_insert_remove_multi(database: SQLite, package_ahriman: Package) -> None:
@@ -148,6 +323,7 @@ def test_logs_rotate_remove_all(database: SQLite, package_ahriman: Package) -> N
 
     database.logs_rotate(0)
     assert not database.logs_get(package_ahriman.base)
+    assert not database._logs_uncompressed
 
 
 def test_logs_rotate_remove_duplicates(database: SQLite, package_ahriman: Package) -> None:
@@ -167,3 +343,36 @@ def test_logs_rotate_remove_duplicates(database: SQLite, package_ahriman: Packag
         LogRecord(LogRecordId(package_ahriman.base, "1", "p3"), 44.0, "message 3"),
         LogRecord(LogRecordId(package_ahriman.base, "2", "p1"), 45.0, "message 4"),
     ]
+
+
+def test_logs_rotate_compressed(database: SQLite, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must rotate compressed records
+    """
+    mocker.patch.object(LogsOperations, "LOGS_CHUNK_SIZE", 2)
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 42.0, "message 1"))
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "1", "p1"), 43.0, "message 2"))
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "2", "p2"), 44.0, "message 3"))
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "2", "p2"), 45.0, "message 4"))
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "2", "p2"), 46.0, "message 5"))
+
+    database.logs_rotate(1)
+    assert database.logs_get(package_ahriman.base) == [
+        LogRecord(LogRecordId(package_ahriman.base, "2", "p2"), 44.0, "message 3"),
+        LogRecord(LogRecordId(package_ahriman.base, "2", "p2"), 45.0, "message 4"),
+        LogRecord(LogRecordId(package_ahriman.base, "2", "p2"), 46.0, "message 5"),
+    ]
+
+
+def test_logs_remove_compressed(database: SQLite, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must remove compressed records
+    """
+    mocker.patch.object(LogsOperations, "LOGS_CHUNK_SIZE", 1)
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "1"), 42.0, "message 1"))
+    database.logs_insert(LogRecord(LogRecordId(package_ahriman.base, "2"), 43.0, "message 2"))
+
+    database.logs_remove(package_ahriman.base, "2")
+    assert database.logs_get(package_ahriman.base) == [
+        LogRecord(LogRecordId(package_ahriman.base, "2"), 43.0, "message 2"),
+    ]
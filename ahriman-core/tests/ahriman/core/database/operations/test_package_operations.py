@@ -5,7 +5,7 @@ from sqlite3 import Connection
 from unittest.mock import call as MockCall
 
 from ahriman.core.database import SQLite
-from ahriman.models.build_status import BuildStatus
+from ahriman.models.build_status import BuildStatus, BuildStatusEnum
 from ahriman.models.package import Package
 
 
@@ -64,43 +64,17 @@ def test_package_update_insert_packages_no_arch(database: SQLite, connection: Co
     connection.executemany(pytest.helpers.anyvar(str, strict=True), [])
 
 
-def test_packages_get_select_package_bases(database: SQLite, connection: Connection) -> None:
+def test_packages_get_select(database: SQLite, connection: Connection) -> None:
     """
-    must select all bases
+    must select packages in single query
     """
-    database._packages_get_select_package_bases(connection, database._repository_id)
-    connection.execute(pytest.helpers.anyvar(str, strict=True))
-
-
-def test_packages_get_select_packages(database: SQLite, connection: Connection, package_ahriman: Package) -> None:
-    """
-    must select all packages
-    """
-    database._packages_get_select_packages(connection, {package_ahriman.base: package_ahriman},
-                                           database._repository_id)
-    connection.execute(pytest.helpers.anyvar(str, strict=True))
-
-
-def test_packages_get_select_packages_skip(database: SQLite, connection: Connection, package_ahriman: Package) -> None:
-    """
-    must skip unknown packages
-    """
-    view = {"package_base": package_ahriman.base}
-    for package, properties in package_ahriman.packages.items():
-        view.update({"package": package})
-        view.update(properties.view())
-    connection.execute.return_value = [{"package_base": "random name"}, view]
-
-    database._packages_get_select_packages(connection, {package_ahriman.base: package_ahriman},
-                                           database._repository_id)
-
-
-def test_packages_get_select_statuses(database: SQLite, connection: Connection) -> None:
-    """
-    must select all statuses
-    """
-    database._packages_get_select_statuses(connection, database._repository_id)
-    connection.execute(pytest.helpers.anyvar(str, strict=True))
+    assert database._packages_get_select(connection, None, -1, 0, database._repository_id) == []
+    connection.execute.assert_called_once_with(pytest.helpers.anyvar(str, strict=True), {
+        "package_base": None,
+        "limit": -1,
+        "offset": 0,
+        "repository": database._repository_id.id,
+    })
 
 
 def test_package_hold_update(database: SQLite, package_ahriman: Package) -> None:
@@ -160,20 +134,73 @@ def test_package_update(database: SQLite, package_ahriman: Package, mocker: Mock
                                                  package_ahriman.packages.keys(), database._repository_id)
 
 
+def test_package_update_many(database: SQLite, package_ahriman: Package, package_python_schedule: Package) -> None:
+    """
+    must insert multiple packages at once
+    """
+    database.package_update_many([package_ahriman, package_python_schedule])
+    assert [package for package, _ in database.packages_get()] == [package_ahriman, package_python_schedule]
+
+
 def test_packages_get(database: SQLite, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must return all packages
     """
-    select_bases_mock = mocker.patch("ahriman.core.database.SQLite._packages_get_select_package_bases",
-                                     return_value={package_ahriman.base: package_ahriman})
-    select_packages_mock = mocker.patch("ahriman.core.database.SQLite._packages_get_select_packages")
-    select_statuses_mock = mocker.patch("ahriman.core.database.SQLite._packages_get_select_statuses")
+    select_mock = mocker.patch("ahriman.core.database.SQLite._packages_get_select")
 
     database.packages_get()
-    select_bases_mock.assert_called_once_with(pytest.helpers.anyvar(int), database._repository_id)
-    select_statuses_mock.assert_called_once_with(pytest.helpers.anyvar(int), database._repository_id)
-    select_packages_mock.assert_called_once_with(pytest.helpers.anyvar(int), {package_ahriman.base: package_ahriman},
-                                                 database._repository_id)
+    select_mock.assert_called_once_with(pytest.helpers.anyvar(int), None, -1, 0, database._repository_id)
+
+
+def test_packages_get_package_base(database: SQLite, package_ahriman: Package,
+                                   package_python_schedule: Package) -> None:
+    """
+    must return only specified package base
+    """
+    database.package_update(package_ahriman)
+    database.package_update(package_python_schedule)
+    database.status_update(package_python_schedule.base, BuildStatus())
+
+    expected = BuildStatus(timestamp=pytest.helpers.anyvar(int))
+    assert database.packages_get(package_ahriman.base) == [(package_ahriman, expected)]
+    assert database.packages_get("random") == []
+
+
+def test_packages_get_paginated(database: SQLite, package_ahriman: Package, package_python_schedule: Package) -> None:
+    """
+    must return package bases ordered by name with limit and offset
+    """
+    database.package_update(package_python_schedule)
+    database.package_update(package_ahriman)
+
+    assert [package.base for package, _ in database.packages_get()] == [
+        package_ahriman.base, package_python_schedule.base
+    ]
+    assert [package for package, _ in database.packages_get(limit=1)] == [package_ahriman]
+    assert [package for package, _ in database.packages_get(limit=1, offset=1)] == [package_python_schedule]
+    assert database.packages_get(offset=2) == []
+
+
+def test_packages_get_without_packages(database: SQLite, package_ahriman: Package) -> None:
+    """
+    must return package base without packages
+    """
+    package_ahriman.packages = {}
+    database.package_update(package_ahriman)
+    assert database.packages_get() == [(package_ahriman, BuildStatus(timestamp=pytest.helpers.anyvar(int)))]
+
+
+def test_packages_get_without_packages_multiple(database: SQLite, package_ahriman: Package,
+                                                package_python_schedule: Package) -> None:
+    """
+    must not merge package bases without packages
+    """
+    package_ahriman.packages = {}
+    package_python_schedule.packages = {}
+    database.package_update(package_ahriman)
+    database.package_update(package_python_schedule)
+    assert {package.base for package, _ in database.packages_get()} == {package_ahriman.base,
+                                                                         package_python_schedule.base}
 
 
 def test_package_update_get(database: SQLite, package_ahriman: Package) -> None:
@@ -232,3 +259,15 @@ def test_status_update_skip_same_status(database: SQLite, package_ahriman: Packa
     database.status_update(package_ahriman.base, BuildStatus())
     assert next(db_status.timestamp
                 for _, db_status in database.packages_get()) == status.timestamp
+
+
+def test_status_update_many(database: SQLite, package_ahriman: Package, package_python_schedule: Package) -> None:
+    """
+    must insert statuses of multiple packages at once
+    """
+    status = BuildStatus(BuildStatusEnum.Failed)
+    database.package_update_many([package_ahriman, package_python_schedule])
+
+    database.status_update_many([(package_ahriman.base, status), (package_python_schedule.base, status)])
+    expected = BuildStatus(status.status, status.timestamp, is_held=False)
+    assert database.packages_get() == [(package_ahriman, expected), (package_python_schedule, expected)]
@@ -1,4 +1,5 @@
 from ahriman.core.formatters import EventStatsPrinter
+from ahriman.models.event_rollup import EventRollup
 
 
 def test_properties(event_stats_printer: EventStatsPrinter) -> None:
@@ -15,6 +16,16 @@ def test_properties_empty() -> None:
     assert EventStatsPrinter("event", []).properties()
 
 
+def test_properties_rollup() -> None:
+    """
+    must correctly generate properties for aggregated events
+    """
+    rollup = EventRollup(event="event", object_id="object", created=0, count=3, took_count=2, took_sum=3.0,
+                         took_squares=5.0, took_min=1.0, took_max=2.0)
+    properties = EventStatsPrinter("event", rollup).properties()
+    assert [prop.value for prop in properties] == [2, 1.0, "1.500 ± 0.707", 2.0]
+
+
 def test_title(event_stats_printer: EventStatsPrinter) -> None:
     """
     must return non-empty title
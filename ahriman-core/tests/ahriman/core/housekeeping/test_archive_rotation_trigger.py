@@ -1,9 +1,6 @@
 import pytest
 
-from dataclasses import replace
-from pathlib import Path
 from pytest_mock import MockerFixture
-from unittest.mock import call as MockCall
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.housekeeping import ArchiveRotationTrigger
@@ -24,24 +21,12 @@ def test_archives_remove(archive_rotation_trigger: ArchiveRotationTrigger, packa
     """
     must remove older packages
     """
-    packages = []
-    for i in range(5):
-        generated = replace(package_ahriman, version=str(i))
-        generated.packages = {
-            key: replace(value, filename=str(i))
-            for key, value in generated.packages.items()
-        }
-        packages.append(generated)
-
-    mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives", return_value=packages)
-    mocker.patch("pathlib.Path.glob", return_value=[Path(str(i)) for i in range(5)])
-    unlink_mock = mocker.patch("pathlib.Path.unlink", autospec=True)
+    index_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives_index")
 
     archive_rotation_trigger.archives_remove(package_ahriman, repository)
-    unlink_mock.assert_has_calls([
-        MockCall(Path("0")),
-        MockCall(Path("1")),
-    ])
+    index_mock.assert_called_once_with(package_ahriman.base)
+    index_mock.return_value.rotate.assert_called_once_with(
+        archive_rotation_trigger.repository_id.architecture, archive_rotation_trigger.keep_built_packages)
 
 
 def test_archives_remove_keep(archive_rotation_trigger: ArchiveRotationTrigger, package_ahriman: Package,
@@ -49,11 +34,11 @@ def test_archives_remove_keep(archive_rotation_trigger: ArchiveRotationTrigger,
     """
     must keep all packages if set to
     """
-    archives_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives")
+    index_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives_index")
 
     archive_rotation_trigger.keep_built_packages = 0
     archive_rotation_trigger.archives_remove(package_ahriman, repository)
-    archives_mock.assert_not_called()
+    index_mock.assert_not_called()
 
 
 def test_on_result(archive_rotation_trigger: ArchiveRotationTrigger, package_ahriman: Package,
@@ -137,8 +137,8 @@ def test_make_request(mocker: MockerFixture) -> None:
         MockCall("POST", "url3", params=None, data=None, headers=None, files=None, json=None,
                  stream=None, auth=None, timeout=client.timeout),
         MockCall().raise_for_status(),
-        MockCall("POST", "url4", params=None, data=None, headers=None, files=None, json={"param": "value"},
-                 stream=None, auth=None, timeout=client.timeout),
+        MockCall("POST", "url4", params=None, data=b'{"param":"value"}', headers={"Content-Type": "application/json"},
+                 files=None, json=None, stream=None, auth=None, timeout=client.timeout),
         MockCall().raise_for_status(),
         MockCall("POST", "url5", params=None, data={"param": "value"}, headers=None, files=None, json=None,
                  stream=None, auth=None, timeout=client.timeout),
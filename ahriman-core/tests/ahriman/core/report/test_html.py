@@ -1,5 +1,3 @@
-import pytest
-
 from pytest_mock import MockerFixture
 
 from ahriman.core.configuration import Configuration
@@ -26,9 +24,9 @@ def test_generate(configuration: Configuration, package_ahriman: Package, mocker
     """
     must generate report
     """
-    write_mock = mocker.patch("pathlib.Path.write_text")
+    write_mock = mocker.patch("ahriman.core.report.jinja_template.JinjaTemplate.write_report")
     _, repository_id = configuration.check_loaded()
 
     report = HTML(repository_id, configuration, "html")
     report.generate([package_ahriman], Result())
-    write_mock.assert_called_once_with(pytest.helpers.anyvar(int), encoding="utf8")
+    write_mock.assert_called_once_with(Result(updated=[package_ahriman]), report.template, report.report_path)
@@ -1,3 +1,8 @@
+import pytest
+
+from pathlib import Path
+from pytest_mock import MockerFixture
+
 from ahriman.core.configuration import Configuration
 from ahriman.core.report.jinja_template import JinjaTemplate
 from ahriman.core.utils import utcnow
@@ -5,6 +10,15 @@ from ahriman.models.package import Package
 from ahriman.models.result import Result
 
 
+def test_environment(tmp_path: Path) -> None:
+    """
+    must cache jinja environment
+    """
+    environment = JinjaTemplate.environment([tmp_path])
+    assert JinjaTemplate.environment([tmp_path]) is environment
+    assert JinjaTemplate.environment([tmp_path, tmp_path / "other"]) is not environment
+
+
 def test_format_datetime() -> None:
     """
     must format datetime
@@ -19,6 +33,44 @@ def sort_content() -> None:
     assert JinjaTemplate.sort_content([{"filename": "2"}, {"filename": "1"}]) == [{"filename": "1"}, {"filename": "2"}]
 
 
+def test_write(tmp_path: Path) -> None:
+    """
+    must write file atomically
+    """
+    path = tmp_path / "index.html"
+    path.write_text("old")
+
+    JinjaTemplate.write(path, "new")
+    assert path.read_text(encoding="utf8") == "new"
+    assert path.stat().st_mode & 0o777 == 0o644
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_failed(tmp_path: Path, mocker: MockerFixture) -> None:
+    """
+    must remove temporary file on failure
+    """
+    mocker.patch("pathlib.Path.replace", side_effect=OSError)
+    path = tmp_path / "index.html"
+
+    with pytest.raises(OSError):
+        JinjaTemplate.write(path, "content")
+    assert not list(tmp_path.iterdir())
+
+
+def test_make_context(configuration: Configuration, package_ahriman: Package) -> None:
+    """
+    must generate template variables
+    """
+    _, repository_id = configuration.check_loaded()
+    report = JinjaTemplate(repository_id, configuration, "html")
+
+    context = report.make_context(Result(updated=[package_ahriman]))
+    assert "last_update" not in context
+    assert context["repository"] == repository_id.name
+    assert [package["name"] for package in context["packages"]] == list(package_ahriman.packages)
+
+
 def test_generate(configuration: Configuration, package_ahriman: Package) -> None:
     """
     must generate html report
@@ -37,3 +89,51 @@ def test_generate_from_path(configuration: Configuration, package_ahriman: Packa
     _, repository_id = configuration.check_loaded()
     report = JinjaTemplate(repository_id, configuration, "html")
     assert report.make_html(Result(updated=[package_ahriman]), path)
+
+
+def test_template_get(configuration: Configuration) -> None:
+    """
+    must load template by name
+    """
+    _, repository_id = configuration.check_loaded()
+    report = JinjaTemplate(repository_id, configuration, "html")
+
+    template = report.template_get(configuration.get("html", "template"))
+    assert template is report.template_get(configuration.get("html", "template"))
+
+
+def test_write_report(configuration: Configuration, package_ahriman: Package, tmp_path: Path,
+                      mocker: MockerFixture) -> None:
+    """
+    must write report only if it has been changed
+    """
+    write_mock = mocker.spy(JinjaTemplate, "write")
+    _, repository_id = configuration.check_loaded()
+    report = JinjaTemplate(repository_id, configuration, "html")
+    template = configuration.get("html", "template")
+    path = tmp_path / "index.html"
+
+    report.write_report(Result(updated=[package_ahriman]), template, path)
+    report.write_report(Result(updated=[package_ahriman]), template, path)
+    write_mock.assert_called_once_with(path, pytest.helpers.anyvar(str, True))
+    assert path.is_file()
+
+    report.write_report(Result(), template, path)
+    assert write_mock.call_count == 2
+
+
+def test_write_report_removed(configuration: Configuration, package_ahriman: Package, tmp_path: Path,
+                              mocker: MockerFixture) -> None:
+    """
+    must write report if file has been removed
+    """
+    write_mock = mocker.spy(JinjaTemplate, "write")
+    _, repository_id = configuration.check_loaded()
+    report = JinjaTemplate(repository_id, configuration, "html")
+    template = configuration.get("html", "template")
+    path = tmp_path / "index.html"
+
+    report.write_report(Result(updated=[package_ahriman]), template, path)
+    path.unlink()
+    report.write_report(Result(updated=[package_ahriman]), template, path)
+    assert write_mock.call_count == 2
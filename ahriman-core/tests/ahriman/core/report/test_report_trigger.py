@@ -2,6 +2,7 @@ from pytest_mock import MockerFixture
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.report import ReportTrigger
+from ahriman.core.report.report import Report
 from ahriman.models.result import Result
 
 
@@ -27,3 +28,19 @@ def test_on_result(configuration: Configuration, mocker: MockerFixture) -> None:
     trigger = ReportTrigger(repository_id, configuration)
     trigger.on_result(Result(), [])
     run_mock.assert_called_once_with(Result(), [])
+
+
+def test_on_result_cached(configuration: Configuration, mocker: MockerFixture) -> None:
+    """
+    must reuse report generators between runs
+    """
+    configuration.set_option("report", "target", "email")
+    mocker.patch("ahriman.core.report.report.Report.run")
+    load_mock = mocker.spy(Report, "load")
+    _, repository_id = configuration.check_loaded()
+
+    trigger = ReportTrigger(repository_id, configuration)
+    trigger.on_result(Result(), [])
+    trigger.on_result(Result(), [])
+    load_mock.assert_called_once_with(repository_id, configuration, "email")
+    assert "email" in trigger.reports
@@ -1,5 +1,3 @@
-import pytest
-
 from email.utils import parsedate_to_datetime
 from pytest_mock import MockerFixture
 from unittest.mock import MagicMock
@@ -72,8 +70,8 @@ def test_generate(rss: RSS, package_ahriman: Package, mocker: MockerFixture) ->
     must generate report
     """
     content_mock = mocker.patch("ahriman.core.report.rss.RSS.content", return_value=Result())
-    write_mock = mocker.patch("pathlib.Path.write_text")
+    write_mock = mocker.patch("ahriman.core.report.jinja_template.JinjaTemplate.write_report")
 
     rss.generate([package_ahriman], Result())
     content_mock.assert_called_once_with([package_ahriman])
-    write_mock.assert_called_once_with(pytest.helpers.anyvar(int), encoding="utf8")
+    write_mock.assert_called_once_with(Result(), rss.template, rss.report_path)
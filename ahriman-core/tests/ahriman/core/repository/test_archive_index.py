@@ -0,0 +1,137 @@
+from dataclasses import replace
+from pathlib import Path
+
+from ahriman.core.repository.archive_index import ArchiveIndex
+from ahriman.models.package import Package
+
+
+def _package(package: Package, version: str, architecture: str = "x86_64") -> Package:
+    """
+    generate package with the specified version
+
+    Args:
+        package(Package): base package
+        version(str): package version
+        architecture(str, optional): package architecture (Default value = "x86_64")
+
+    Returns:
+        Package: package copy with the new version
+    """
+    return replace(package, version=version, packages={
+        name: replace(description, filename=f"{name}-{version}-{architecture}.pkg.tar.zst", architecture=architecture)
+        for name, description in package.packages.items()
+    })
+
+
+def test_exists(tmp_path: Path) -> None:
+    """
+    must check if index exists
+    """
+    index = ArchiveIndex(tmp_path)
+    assert not index.exists
+
+    index.add([])
+    assert index.exists
+
+
+def test_add(package_ahriman: Package, tmp_path: Path) -> None:
+    """
+    must add packages to the index
+    """
+    index = ArchiveIndex(tmp_path)
+    index.add([_package(package_ahriman, "1.0.0-1")])
+    index.add([_package(package_ahriman, "1.0.0-2")])
+
+    assert index.versions("x86_64") == {
+        "1.0.0-1": ["ahriman-1.0.0-1-x86_64.pkg.tar.zst"],
+        "1.0.0-2": ["ahriman-1.0.0-2-x86_64.pkg.tar.zst"],
+    }
+
+
+def test_add_skip_empty_filename(package_ahriman: Package, tmp_path: Path) -> None:
+    """
+    must skip packages without filename
+    """
+    package_ahriman.packages[package_ahriman.base].filename = None
+    index = ArchiveIndex(tmp_path)
+    index.add([package_ahriman])
+
+    assert index.versions("x86_64") == {}
+
+
+def test_remove(package_ahriman: Package, tmp_path: Path) -> None:
+    """
+    must remove files from the index
+    """
+    index = ArchiveIndex(tmp_path)
+    index.add([_package(package_ahriman, "1.0.0-1"), _package(package_ahriman, "1.0.0-2")])
+
+    index.remove(["ahriman-1.0.0-1-x86_64.pkg.tar.zst", "unknown"])
+    assert list(index.versions("x86_64")) == ["1.0.0-2"]
+
+
+def test_rotate(package_ahriman: Package, tmp_path: Path) -> None:
+    """
+    must remove older versions
+    """
+    index = ArchiveIndex(tmp_path)
+    packages = [_package(package_ahriman, f"1.0.{i}-1") for i in range(4)]
+    index.add(packages)
+    for package in packages:
+        for description in package.packages.values():
+            (tmp_path / description.filename).touch()
+            (tmp_path / f"{description.filename}.sig").touch()
+
+    removed = index.rotate("x86_64", 2)
+    assert sorted(removed) == [
+        tmp_path / "ahriman-1.0.0-1-x86_64.pkg.tar.zst",
+        tmp_path / "ahriman-1.0.0-1-x86_64.pkg.tar.zst.sig",
+        tmp_path / "ahriman-1.0.1-1-x86_64.pkg.tar.zst",
+        tmp_path / "ahriman-1.0.1-1-x86_64.pkg.tar.zst.sig",
+    ]
+    assert all(not path.exists() for path in removed)
+    assert list(index.versions("x86_64")) == ["1.0.2-1", "1.0.3-1"]
+    assert (tmp_path / "ahriman-1.0.3-1-x86_64.pkg.tar.zst").exists()
+
+
+def test_rotate_disabled(package_ahriman: Package, tmp_path: Path) -> None:
+    """
+    must not remove anything if rotation is disabled
+    """
+    index = ArchiveIndex(tmp_path)
+    index.add([_package(package_ahriman, "1.0.0-1"), _package(package_ahriman, "1.0.0-2")])
+
+    assert index.rotate("x86_64", 0) == []
+    assert len(index.versions("x86_64")) == 2
+
+
+def test_versions(package_ahriman: Package, tmp_path: Path) -> None:
+    """
+    must return versions sorted with vercmp
+    """
+    index = ArchiveIndex(tmp_path)
+    index.add([
+        _package(package_ahriman, "1.10.0-1"),
+        _package(package_ahriman, "1.9.0-1", "any"),
+        _package(package_ahriman, "1:1.0.0-1"),
+    ])
+
+    assert list(index.versions("x86_64")) == ["1.9.0-1", "1.10.0-1", "1:1.0.0-1"]
+
+
+def test_versions_architecture(package_ahriman: Package, tmp_path: Path) -> None:
+    """
+    must filter versions by architecture
+    """
+    index = ArchiveIndex(tmp_path)
+    index.add([_package(package_ahriman, "1.0.0-1"), _package(package_ahriman, "1.0.0-2", "aarch64")])
+
+    assert list(index.versions("x86_64")) == ["1.0.0-1"]
+    assert list(index.versions("aarch64")) == ["1.0.0-2"]
+
+
+def test_versions_empty(tmp_path: Path) -> None:
+    """
+    must return empty list if there is no index
+    """
+    assert ArchiveIndex(tmp_path / "missing").versions("x86_64") == {}
@@ -30,6 +30,43 @@ def _mock_clear_check() -> None:
     ])
 
 
+def test_clear_archives(cleaner: Cleaner, mocker: MockerFixture) -> None:
+    """
+    must rotate archives of all packages
+    """
+    mocker.patch("pathlib.Path.is_dir", return_value=True)
+    mocker.patch("pathlib.Path.glob", return_value=[Path("a") / "ahriman", Path("p") / "python-schedule"])
+    index_mock = mocker.patch("ahriman.core.repository.cleaner.Cleaner.package_archives_index")
+
+    cleaner.clear_archives(2)
+    index_mock.assert_has_calls([
+        MockCall("ahriman"),
+        MockCall().rotate(cleaner.repository_id.architecture, 2),
+        MockCall("python-schedule"),
+        MockCall().rotate(cleaner.repository_id.architecture, 2),
+    ])
+
+
+def test_clear_archives_disabled(cleaner: Cleaner, mocker: MockerFixture) -> None:
+    """
+    must skip archives rotation if it is disabled
+    """
+    index_mock = mocker.patch("ahriman.core.repository.cleaner.Cleaner.package_archives_index")
+    cleaner.clear_archives(0)
+    index_mock.assert_not_called()
+
+
+def test_clear_archives_no_directory(cleaner: Cleaner, mocker: MockerFixture) -> None:
+    """
+    must skip archives rotation if there is no archive directory
+    """
+    mocker.patch("pathlib.Path.is_dir", return_value=False)
+    index_mock = mocker.patch("ahriman.core.repository.cleaner.Cleaner.package_archives_index")
+
+    cleaner.clear_archives(2)
+    index_mock.assert_not_called()
+
+
 def test_clear_cache(cleaner: Cleaner, mocker: MockerFixture) -> None:
     """
     must remove every cached sources
@@ -78,6 +115,14 @@ def test_clear_queue(cleaner: Cleaner, mocker: MockerFixture) -> None:
     clear_mock.assert_called_once_with(None)
 
 
+def test_package_archives_index(cleaner: Cleaner) -> None:
+    """
+    must raise NotImplemented for missing method
+    """
+    with pytest.raises(NotImplementedError):
+        cleaner.package_archives_index("ahriman")
+
+
 def test_packages_built(cleaner: Cleaner) -> None:
     """
     must raise NotImplemented for missing method
@@ -30,6 +30,19 @@ def test_in_event(repository: EventLogger, mocker: MockerFixture) -> None:
     event_mock.assert_called_once_with(event)
 
 
+def test_in_event_metadata(repository: EventLogger, mocker: MockerFixture) -> None:
+    """
+    must log success action with additional metadata
+    """
+    event = Event(EventType.PackageUpdated, "base", created=pytest.helpers.anyvar(int, True),
+                  took=pytest.helpers.anyvar(float, True), key="value")
+    event_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.event_add")
+
+    with repository.in_event(event.object_id, event.event) as metadata:
+        metadata["key"] = "value"
+    event_mock.assert_called_once_with(event)
+
+
 def test_in_event_exception(repository: EventLogger, mocker: MockerFixture) -> None:
     """
     must reraise exception in context
@@ -1,3 +1,4 @@
+import logging
 import pytest
 
 from pathlib import Path
@@ -5,9 +6,12 @@ from pytest_mock import MockerFixture
 from typing import Any
 from unittest.mock import call as MockCall
 
+from ahriman.core.build_tools.task import Task
 from ahriman.core.repository.executor import Executor
+from ahriman.models.build_status import BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.dependencies import Dependencies
+from ahriman.models.log_record_id import LogRecordId
 from ahriman.models.package import Package
 from ahriman.models.packagers import Packagers
 from ahriman.models.user import User
@@ -59,6 +63,25 @@ def test_package_build(executor: Executor, package_ahriman: Package, mocker: Moc
     rename_mock.assert_called_once_with(Path(package_ahriman.base), executor.paths.packages / package_ahriman.base)
 
 
+def test_package_build_metadata(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must store build steps timings in event metadata
+    """
+    def init(task: Task, *args: Any) -> str:
+        task.timings["pkgver_host"] = 1.0
+        return "sha"
+
+    mocker.patch("ahriman.core.build_tools.task.Task.build", return_value=[])
+    mocker.patch("ahriman.core.build_tools.task.Task.init", autospec=True, side_effect=init)
+    mocker.patch("ahriman.models.package.Package.from_build", return_value=package_ahriman)
+    mocker.patch("ahriman.core.repository.executor.Executor.package_archives_lookup", return_value=[])
+    mocker.patch("ahriman.models.package.Package.with_packages")
+
+    metadata: dict[str, Any] = {}
+    executor._package_build(package_ahriman, Path("local"), "packager", None, metadata)
+    assert metadata == {"pkgver_host": 1.0}
+
+
 def test_package_build_copy(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must copy package from archive if there are already built ones
@@ -113,40 +136,68 @@ def test_package_remove_base_failed(executor: Executor, package_ahriman: Package
     executor._package_remove_base(package_ahriman.base)
 
 
-def test_package_update(executor: Executor, package_ahriman: Package, user: User, mocker: MockerFixture) -> None:
+def test_package_sign(executor: Executor, package_python_schedule: Package, user: User,
+                      mocker: MockerFixture) -> None:
     """
-    must update built package in repository
+    must sign all package archives at once
     """
-    rename_mock = mocker.patch("ahriman.core.repository.executor.atomic_move")
-    symlink_mock = mocker.patch("pathlib.Path.symlink_to")
-    repo_add_mock = mocker.patch("ahriman.core.alpm.repo.Repo.add")
-    sign_package_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_sign_package", side_effect=lambda fn, _: [fn])
-    filepath = next(package.filepath for package in package_ahriman.packages.values())
+    sign_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_sign_packages", return_value=[Path("a")])
+
+    assert executor._package_sign(package_python_schedule, user.key) == [Path("a")]
+    sign_mock.assert_called_once_with([
+        executor.paths.packages / package.filename
+        for package in package_python_schedule.packages.values()
+    ], user.key)
 
-    executor._package_update(filepath, package_ahriman.base, user.key)
-    # must move files (once)
-    rename_mock.assert_called_once_with(
-        executor.paths.packages / filepath, executor.paths.archive_for(package_ahriman.base) / filepath)
-    # must sign package
-    sign_package_mock.assert_called_once_with(executor.paths.packages / filepath, user.key)
-    # symlink to the archive
-    symlink_mock.assert_called_once_with(
-        Path("..") /
-        ".." /
-        ".." /
-        executor.paths.archive_for(package_ahriman.base).relative_to(executor.paths.root) /
-        filepath)
-    # must add package
-    repo_add_mock.assert_called_once_with(executor.paths.repository / filepath)
 
+def test_package_sign_empty_filename(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must skip archives which do not have path
+    """
+    package_ahriman.packages[package_ahriman.base].filename = None
+    sign_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_sign_packages", return_value=[])
+
+    assert executor._package_sign(package_ahriman, None) == []
+    sign_mock.assert_called_once_with([], None)
 
-def test_package_update_empty_filename(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
+
+def test_package_update(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
-    must skip update for package which does not have path
+    must update built package in repository
     """
     rename_mock = mocker.patch("ahriman.core.repository.executor.atomic_move")
-    executor._package_update(None, package_ahriman.base, None)
-    rename_mock.assert_not_called()
+    symlink_mock = mocker.patch("pathlib.Path.symlink_to")
+    repo_add_mock = mocker.patch("ahriman.core.alpm.repo.Repo.add_packages")
+    filepath = next(package.filepath for package in package_ahriman.packages.values())
+    signature = filepath.parent / f"{filepath.name}.sig"
+
+    executor._package_update(package_ahriman.base, [
+        executor.paths.packages / filepath,
+        executor.paths.packages / signature,
+    ])
+    # must move files
+    rename_mock.assert_has_calls([
+        MockCall(executor.paths.packages / filepath, executor.paths.archive_for(package_ahriman.base) / filepath),
+        MockCall(executor.paths.packages / signature, executor.paths.archive_for(package_ahriman.base) / signature),
+    ])
+    # symlink to the archive
+    symlink_mock.assert_has_calls([
+        MockCall(
+            Path("..") /
+            ".." /
+            ".." /
+            executor.paths.archive_for(package_ahriman.base).relative_to(executor.paths.root) /
+            filepath),
+        MockCall(
+            Path("..") /
+            ".." /
+            ".." /
+            executor.paths.archive_for(package_ahriman.base).relative_to(executor.paths.root) /
+            signature),
+    ])
+    # must add package (and only package)
+    repo_add_mock.assert_called_once_with(pytest.helpers.anyvar(int))
+    assert list(repo_add_mock.call_args.args[0]) == [executor.paths.repository / filepath]
 
 
 def test_process_build(executor: Executor, package_ahriman: Package, passwd: Any, mocker: MockerFixture) -> None:
@@ -165,7 +216,8 @@ def test_process_build(executor: Executor, package_ahriman: Package, passwd: Any
 
     executor.process_build([package_ahriman], Packagers("packager"), bump_pkgrel=False)
     changes_mock.assert_called_once_with(package_ahriman.base)
-    build_mock.assert_called_once_with(package_ahriman, pytest.helpers.anyvar(Path, strict=True), None, None)
+    build_mock.assert_called_once_with(package_ahriman, pytest.helpers.anyvar(Path, strict=True), None, None, {},
+                                       pytest.helpers.anyvar(int))
     depends_on_mock.assert_called_once_with()
     dependencies_mock.assert_called_once_with(package_ahriman.base, Dependencies())
     commit_sha_mock.assert_called_once_with(package_ahriman.base, Changes("sha", "change", "pkgbuild"))
@@ -305,8 +357,10 @@ def test_process_update(executor: Executor, package_ahriman: Package, user: User
     mocker.patch("ahriman.core.repository.executor.Executor.load_archives", return_value=[package_ahriman])
     mocker.patch("ahriman.core.repository.executor.Executor.packages", return_value=[package_ahriman])
     rename_mock = mocker.patch("ahriman.core.repository.executor.Executor._archive_rename")
+    sign_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_sign", return_value=[Path("a")])
     update_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_update")
-    status_client_mock = mocker.patch("ahriman.core.status.Client.set_success")
+    index_mock = mocker.patch("ahriman.core.repository.executor.Executor.package_archives_index")
+    status_client_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_update_many")
     remove_mock = mocker.patch("ahriman.core.repository.executor.Executor.process_remove")
     packager_mock = mocker.patch("ahriman.core.repository.executor.Executor.packager", return_value=user)
     filepath = next(package.filepath for package in package_ahriman.packages.values())
@@ -315,9 +369,13 @@ def test_process_update(executor: Executor, package_ahriman: Package, user: User
     assert executor.process_update([filepath], Packagers("packager"))
     packager_mock.assert_called_once_with(Packagers("packager"), "ahriman")
     rename_mock.assert_called_once_with(package_ahriman.packages[package_ahriman.base], package_ahriman.base)
-    update_mock.assert_called_once_with(filepath.name, package_ahriman.base, user.key)
+    sign_mock.assert_called_once_with(package_ahriman, user.key)
+    update_mock.assert_called_once_with(package_ahriman.base, [Path("a")])
+    # must update archive index
+    index_mock.assert_called_once_with(package_ahriman.base)
+    index_mock.return_value.add.assert_called_once_with([package_ahriman])
     # must update status
-    status_client_mock.assert_called_once_with(package_ahriman)
+    status_client_mock.assert_called_once_with([package_ahriman], BuildStatusEnum.Success)
     # must clear directory
     from ahriman.core.repository.cleaner import Cleaner
     Cleaner.clear_packages.assert_called_once_with()
@@ -325,6 +383,26 @@ def test_process_update(executor: Executor, package_ahriman: Package, user: User
     remove_mock.assert_called_once_with([])
 
 
+def test_process_update_context(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must sign packages in background while keeping package log context
+    """
+    def package_sign(*_: Any) -> list[Path]:
+        record = logging.makeLogRecord({})
+        assert record.package_id == LogRecordId(package_ahriman.base, package_ahriman.version)
+        return [Path("a")]
+
+    mocker.patch("ahriman.core.repository.executor.Executor.load_archives", return_value=[package_ahriman])
+    mocker.patch("ahriman.core.repository.executor.Executor.packages", return_value=[package_ahriman])
+    mocker.patch("ahriman.core.repository.executor.Executor.package_archives_index")
+    mocker.patch("ahriman.core.repository.executor.Executor._package_sign", side_effect=package_sign)
+    update_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_update")
+    mocker.patch("ahriman.core.repository.executor.Executor.process_remove")
+
+    assert executor.process_update([package.filepath for package in package_ahriman.packages.values()]).success
+    update_mock.assert_called_once_with(package_ahriman.base, [Path("a")])
+
+
 def test_process_update_group(executor: Executor, package_python_schedule: Package,
                               mocker: MockerFixture) -> None:
     """
@@ -332,16 +410,16 @@ def test_process_update_group(executor: Executor, package_python_schedule: Packa
     """
     mocker.patch("ahriman.core.repository.executor.Executor.load_archives", return_value=[package_python_schedule])
     mocker.patch("ahriman.core.repository.executor.Executor.packages", return_value=[package_python_schedule])
+    mocker.patch("ahriman.core.repository.executor.Executor.package_archives_index")
+    sign_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_sign", return_value=[Path("a")])
     update_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_update")
-    status_client_mock = mocker.patch("ahriman.core.status.Client.set_success")
+    status_client_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_update_many")
     remove_mock = mocker.patch("ahriman.core.repository.executor.Executor.process_remove")
 
     executor.process_update([package.filepath for package in package_python_schedule.packages.values()])
-    update_mock.assert_has_calls([
-        MockCall(package.filename, package_python_schedule.base, None)
-        for package in package_python_schedule.packages.values()
-    ], any_order=True)
-    status_client_mock.assert_called_once_with(package_python_schedule)
+    sign_mock.assert_called_once_with(package_python_schedule, None)
+    update_mock.assert_called_once_with(package_python_schedule.base, [Path("a")])
+    status_client_mock.assert_called_once_with([package_python_schedule], BuildStatusEnum.Success)
     remove_mock.assert_called_once_with([])
 
 
@@ -349,13 +427,46 @@ def test_process_update_failed(executor: Executor, package_ahriman: Package, moc
     """
     must process update for failed package
     """
+    mocker.patch("ahriman.core.repository.executor.Executor._package_sign")
     mocker.patch("ahriman.core.repository.executor.Executor._package_update", side_effect=Exception)
     mocker.patch("ahriman.core.repository.executor.Executor.load_archives", return_value=[package_ahriman])
     mocker.patch("ahriman.core.repository.executor.Executor.packages", return_value=[package_ahriman])
-    status_client_mock = mocker.patch("ahriman.core.status.Client.set_failed")
+    status_client_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_status_update_many")
 
     executor.process_update([package.filepath for package in package_ahriman.packages.values()])
-    status_client_mock.assert_called_once_with(package_ahriman.base)
+    status_client_mock.assert_called_once_with([package_ahriman.base], BuildStatusEnum.Failed)
+
+
+def test_process_update_failed_sign(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must process update for package which could not be signed
+    """
+    mocker.patch("ahriman.core.repository.executor.Executor._package_sign", side_effect=Exception)
+    update_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_update")
+    mocker.patch("ahriman.core.repository.executor.Executor.load_archives", return_value=[package_ahriman])
+    mocker.patch("ahriman.core.repository.executor.Executor.packages", return_value=[package_ahriman])
+    status_client_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_status_update_many")
+
+    executor.process_update([package.filepath for package in package_ahriman.packages.values()])
+    update_mock.assert_not_called()
+    status_client_mock.assert_called_once_with([package_ahriman.base], BuildStatusEnum.Failed)
+
+
+def test_process_update_failed_prepare(executor: Executor, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must skip update for package which could not be prepared
+    """
+    mocker.patch("ahriman.core.repository.executor.Executor._archive_rename", side_effect=Exception)
+    sign_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_sign")
+    update_mock = mocker.patch("ahriman.core.repository.executor.Executor._package_update")
+    mocker.patch("ahriman.core.repository.executor.Executor.load_archives", return_value=[package_ahriman])
+    mocker.patch("ahriman.core.repository.executor.Executor.packages", return_value=[package_ahriman])
+    status_client_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_status_update_many")
+
+    executor.process_update([package.filepath for package in package_ahriman.packages.values()])
+    sign_mock.assert_not_called()
+    update_mock.assert_not_called()
+    status_client_mock.assert_called_once_with([package_ahriman.base], BuildStatusEnum.Failed)
 
 
 def test_process_update_removed_package(executor: Executor, package_python_schedule: Package,
@@ -366,7 +477,9 @@ def test_process_update_removed_package(executor: Executor, package_python_sched
     without_python2 = Package.from_json(package_python_schedule.view())
     del without_python2.packages["python2-schedule"]
 
+    mocker.patch("ahriman.core.repository.executor.Executor._package_sign")
     mocker.patch("ahriman.core.repository.executor.Executor._package_update")
+    mocker.patch("ahriman.core.repository.executor.Executor.package_archives_index")
     mocker.patch("ahriman.core.repository.executor.Executor.load_archives", return_value=[without_python2])
     mocker.patch("ahriman.core.repository.executor.Executor.packages", return_value=[package_python_schedule])
     remove_mock = mocker.patch("ahriman.core.repository.executor.Executor.process_remove")
@@ -145,6 +145,49 @@ def test_package_archives_architecture_mismatch(repository: Repository, package_
     assert len(result) == 0
 
 
+def test_package_archives_index(repository: Repository, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must return archive index
+    """
+    mocker.patch("pathlib.Path.is_file", return_value=True)
+    load_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.load_archives")
+
+    index = repository.package_archives_index(package_ahriman.base)
+    assert index.directory == repository.paths.archive_for(package_ahriman.base)
+    load_mock.assert_not_called()
+
+
+def test_package_archives_index_create(repository: Repository, package_ahriman: Package,
+                                       mocker: MockerFixture) -> None:
+    """
+    must create archive index if it does not exist
+    """
+    mocker.patch("pathlib.Path.is_file", return_value=False)
+    mocker.patch("pathlib.Path.is_dir", return_value=True)
+    mocker.patch("pathlib.Path.iterdir", return_value=[Path("a.pkg.tar.zst"), Path("b.pkg.tar.zst.sig")])
+    load_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.load_archives",
+                             return_value=[package_ahriman])
+    add_mock = mocker.patch("ahriman.core.repository.archive_index.ArchiveIndex.add")
+
+    repository.package_archives_index(package_ahriman.base)
+    load_mock.assert_called_once_with(pytest.helpers.anyvar(int), latest_only=False)
+    assert list(load_mock.call_args.args[0]) == [Path("a.pkg.tar.zst")]
+    add_mock.assert_called_once_with([package_ahriman])
+
+
+def test_package_archives_index_no_directory(repository: Repository, package_ahriman: Package,
+                                             mocker: MockerFixture) -> None:
+    """
+    must not create archive index if there is no archive directory
+    """
+    mocker.patch("pathlib.Path.is_file", return_value=False)
+    mocker.patch("pathlib.Path.is_dir", return_value=False)
+    add_mock = mocker.patch("ahriman.core.repository.archive_index.ArchiveIndex.add")
+
+    repository.package_archives_index(package_ahriman.base)
+    add_mock.assert_not_called()
+
+
 def test_package_archives_lookup(repository: Repository, package_ahriman: Package, package_python_schedule: Package,
                                  mocker: MockerFixture) -> None:
     """
@@ -215,6 +258,29 @@ def test_package_changes_skip(repository: Repository, package_ahriman: Package,
     changes_mock.assert_not_called()
 
 
+def test_package_changes_cached(repository: Repository, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must skip loading package changes if they have been already calculated for the current HEAD
+    """
+    mocker.patch("ahriman.core.build_tools.sources.Sources.load", return_value="sha2")
+    changes_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.changes")
+
+    assert repository.package_changes(package_ahriman, "sha", "sha2") is None
+    changes_mock.assert_not_called()
+
+
+def test_package_changes_moved(repository: Repository, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must load package changes if HEAD has been moved since the last calculation
+    """
+    changes = Changes("sha", "change", None, "sha3")
+    mocker.patch("ahriman.core.build_tools.sources.Sources.load", return_value="sha3")
+    changes_mock = mocker.patch("ahriman.core.build_tools.sources.Sources.changes", return_value=changes)
+
+    assert repository.package_changes(package_ahriman, "sha", "sha2") == changes
+    changes_mock.assert_called_once_with(pytest.helpers.anyvar(int), "sha")
+
+
 def test_packages(repository: Repository, package_ahriman: Package, package_python_schedule: Package,
                   mocker: MockerFixture) -> None:
     """
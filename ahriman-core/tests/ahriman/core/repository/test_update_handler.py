@@ -3,6 +3,7 @@ import pytest
 from pathlib import Path
 from pytest_mock import MockerFixture
 from typing import Any
+from unittest.mock import call as MockCall
 
 from ahriman.core.exceptions import UnknownPackageError
 from ahriman.core.repository.update_handler import UpdateHandler
@@ -306,6 +307,25 @@ def test_updates_local_with_failures(update_handler: UpdateHandler, package_ahri
     assert not update_handler.updates_local(vcs=True)
 
 
+def test_updates_local_order(update_handler: UpdateHandler, package_ahriman: Package,
+                             package_python_schedule: Package, mocker: MockerFixture) -> None:
+    """
+    must return local updates in the stable order
+    """
+    for package in (package_ahriman, package_python_schedule):
+        package.remote = RemoteSource(source=PackageSource.Local, git_url="", web_url="", path="", branch="")
+    packages = {package.base: package for package in (package_ahriman, package_python_schedule)}
+    mocker.patch("ahriman.core.repository.update_handler.UpdateHandler.packages", return_value=list(packages.values()))
+    mocker.patch("pathlib.Path.iterdir", return_value=[Path(package_python_schedule.base), Path(package_ahriman.base)])
+    mocker.patch("ahriman.core.build_tools.sources.Sources.fetch")
+    mocker.patch("ahriman.models.package.Package.from_build", side_effect=lambda path, *_: packages[path.name])
+    mocker.patch("ahriman.core.build_tools.package_version.PackageVersion.is_outdated", return_value=True)
+    status_client_mock = mocker.patch("ahriman.core.status.Client.set_pending")
+
+    assert update_handler.updates_local(vcs=True) == [package_ahriman, package_python_schedule]
+    status_client_mock.assert_has_calls([MockCall(package_ahriman.base), MockCall(package_python_schedule.base)])
+
+
 def test_updates_manual_clear(update_handler: UpdateHandler, mocker: MockerFixture) -> None:
     """
     requesting manual updates must clear packages directory
@@ -1,12 +1,18 @@
+import logging
 import pytest
 import requests
+import shutil
 
 from pathlib import Path
 from pytest_mock import MockerFixture
+from typing import Any
+from unittest.mock import call as MockCall
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.exceptions import GPGError
 from ahriman.core.sign.gpg import GPG
+from ahriman.core.utils import check_output
+from ahriman.models.log_record_id import LogRecordId
 from ahriman.models.sign_settings import SignSettings
 
 
@@ -50,6 +56,15 @@ def test_sign_command(gpg_with_key: GPG) -> None:
     assert gpg_with_key.sign_command(Path("a"), gpg_with_key.default_key)
 
 
+def test_sign_command_homedir(gpg_with_key: GPG) -> None:
+    """
+    must generate sign command bound to the running agent
+    """
+    assert gpg_with_key.sign_command(Path("a"), "key", "homedir") == [
+        "gpg", "--homedir", "homedir", "--no-autostart", "-u", "key", "-b", "a",
+    ]
+
+
 def test_sign_options(configuration: Configuration) -> None:
     """
     must correctly parse sign options
@@ -69,6 +84,18 @@ def test_signature() -> None:
     assert GPG.signature(Path("path") / "to" / "package.tar.xz") == Path("path") / "to" / "package.tar.xz.sig"
 
 
+def test_agent_launch(gpg: GPG, mocker: MockerFixture) -> None:
+    """
+    must launch agent and return its home directory
+    """
+    check_output_mock = mocker.patch("ahriman.core.sign.gpg.check_output", return_value="homedir")
+    assert gpg.agent_launch() == "homedir"
+    check_output_mock.assert_has_calls([
+        MockCall("gpgconf", "--list-dirs", "homedir", logger=gpg.logger),
+        MockCall("gpgconf", "--launch", "gpg-agent", logger=gpg.logger),
+    ])
+
+
 def test_key_download(gpg: GPG, mocker: MockerFixture) -> None:
     """
     must download the key from public server
@@ -145,6 +172,83 @@ def test_process(gpg_with_key: GPG, mocker: MockerFixture) -> None:
     check_output_mock.assert_called()
 
 
+def test_process_many(gpg_with_key: GPG, mocker: MockerFixture) -> None:
+    """
+    must sign multiple files
+    """
+    agent_mock = mocker.patch("ahriman.core.sign.gpg.GPG.agent_launch", return_value="homedir")
+    process_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process",
+                                side_effect=lambda path, *_: [path, gpg_with_key.signature(path)])
+
+    assert gpg_with_key.process_many([Path("a"), Path("b")], "key") == [
+        Path("a"), Path("a.sig"), Path("b"), Path("b.sig"),
+    ]
+    agent_mock.assert_called_once_with()
+    process_mock.assert_has_calls([
+        MockCall(Path("a"), "key", "homedir"),
+        MockCall(Path("b"), "key", "homedir"),
+    ], any_order=True)
+
+
+def test_process_many_context(gpg_with_key: GPG, mocker: MockerFixture) -> None:
+    """
+    must keep log context while signing files
+    """
+    def process(path: Path, *_: Any) -> list[Path]:
+        record = logging.makeLogRecord({})
+        assert record.package_id == LogRecordId("ahriman", "1.0.0-1")
+        return [path]
+
+    mocker.patch("ahriman.core.sign.gpg.GPG.agent_launch", return_value="homedir")
+    mocker.patch("ahriman.core.sign.gpg.GPG.process", side_effect=process)
+
+    with gpg_with_key.in_package_context("ahriman", "1.0.0-1"):
+        assert gpg_with_key.process_many([Path("a"), Path("b")], "key") == [Path("a"), Path("b")]
+
+
+def test_process_many_empty(gpg_with_key: GPG, mocker: MockerFixture) -> None:
+    """
+    must skip processing if no files supplied
+    """
+    agent_mock = mocker.patch("ahriman.core.sign.gpg.GPG.agent_launch")
+    process_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process")
+    assert gpg_with_key.process_many([], "key") == []
+    agent_mock.assert_not_called()
+    process_mock.assert_not_called()
+
+
+@pytest.mark.skipif(shutil.which("gpg") is None or shutil.which("gpgconf") is None, reason="gnupg is not installed")
+def test_process_many_keyring(gpg: GPG, tmp_path: Path, mocker: MockerFixture) -> None:
+    """
+    must sign multiple files by using throwaway keyring
+    """
+    homedir = tmp_path / "gnupg"
+    homedir.mkdir(mode=0o700)
+    environment = {"GNUPGHOME": str(homedir)}
+    key = "ahriman <ahriman@localhost>"
+
+    def gpg_output(*args: str, **kwargs: Any) -> str:
+        return check_output(*args, environment=environment, **kwargs)
+
+    mocker.patch("ahriman.core.sign.gpg.check_output", side_effect=gpg_output)
+    gpg_output("gpg", "--batch", "--passphrase", "", "--quick-generate-key", key, "ed25519", "sign", "never")
+
+    files = [tmp_path / f"file{index}" for index in range(4)]
+    for path in files:
+        path.write_text(path.name)
+
+    try:
+        assert gpg.process_many(files, key) == [
+            generated
+            for path in files
+            for generated in (path, gpg.signature(path))
+        ]
+        for path in files:
+            gpg_output("gpg", "--verify", str(gpg.signature(path)), str(path))
+    finally:
+        gpg_output("gpgconf", "--kill", "gpg-agent")
+
+
 def test_process_sign_package_1(gpg_with_key: GPG, mocker: MockerFixture) -> None:
     """
     must sign package
@@ -223,6 +327,32 @@ def test_process_sign_package_skip_already_signed(gpg_with_key: GPG, mocker: Moc
     process_mock.assert_not_called()
 
 
+def test_process_sign_packages(gpg_with_key: GPG, mocker: MockerFixture) -> None:
+    """
+    must sign only packages which have not been signed yet
+    """
+    mocker.patch("pathlib.Path.is_file", autospec=True, side_effect=lambda path: path.name == "a.sig")
+    process_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_many",
+                                return_value=[Path("b"), Path("b.sig"), Path("c"), Path("c.sig")])
+
+    gpg_with_key.targets = {SignSettings.Packages}
+    assert gpg_with_key.process_sign_packages([Path("a"), Path("b"), Path("c")], None) == [
+        Path("a"), Path("a.sig"), Path("b"), Path("b.sig"), Path("c"), Path("c.sig"),
+    ]
+    process_mock.assert_called_once_with([Path("b"), Path("c")], gpg_with_key.default_key)
+
+
+def test_process_sign_packages_skip(gpg: GPG, mocker: MockerFixture) -> None:
+    """
+    must return unsigned packages as is if key is not set
+    """
+    process_mock = mocker.patch("ahriman.core.sign.gpg.GPG.process_many")
+    gpg.targets = {SignSettings.Packages}
+
+    assert gpg.process_sign_packages([Path("a"), Path("b")], None) == [Path("a"), Path("b")]
+    process_mock.assert_not_called()
+
+
 def test_process_sign_repository_1(gpg_with_key: GPG, mocker: MockerFixture) -> None:
     """
     must sign repository
@@ -2,6 +2,7 @@ import logging
 import pytest
 
 from pytest_mock import MockerFixture
+from unittest.mock import call as MockCall
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.database import SQLite
@@ -120,6 +121,14 @@ def test_event_get(client: Client) -> None:
         client.event_get(None, None)
 
 
+def test_event_rollup_get(client: Client) -> None:
+    """
+    must raise not implemented on event rollups request
+    """
+    with pytest.raises(NotImplementedError):
+        client.event_rollup_get(None, None)
+
+
 def test_logs_rotate(client: Client) -> None:
     """
     must do not raise exception on logs rotation call
@@ -143,6 +152,17 @@ def test_package_changes_update(client: Client, package_ahriman: Package) -> Non
         client.package_changes_update(package_ahriman.base, Changes())
 
 
+def test_package_changes_update_many(client: Client, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must update changes for each package
+    """
+    update_mock = mocker.patch("ahriman.core.status.Client.package_changes_update")
+    changes = Changes()
+
+    client.package_changes_update_many([(package_ahriman.base, changes)])
+    update_mock.assert_called_once_with(package_ahriman.base, changes)
+
+
 def test_package_dependencies_get(client: Client, package_ahriman: Package) -> None:
     """
     must raise not implemented on package dependencies request
@@ -159,6 +179,17 @@ def test_package_dependencies_update(client: Client, package_ahriman: Package) -
         client.package_dependencies_update(package_ahriman.base, Dependencies())
 
 
+def test_package_dependencies_update_many(client: Client, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must update dependencies for each package
+    """
+    update_mock = mocker.patch("ahriman.core.status.Client.package_dependencies_update")
+    dependencies = Dependencies()
+
+    client.package_dependencies_update_many([(package_ahriman.base, dependencies)])
+    update_mock.assert_called_once_with(package_ahriman.base, dependencies)
+
+
 def test_package_get(client: Client, package_ahriman: Package) -> None:
     """
     must raise not implemented on packages get
@@ -239,6 +270,20 @@ def test_package_status_update(client: Client, package_ahriman: Package) -> None
         client.package_status_update(package_ahriman.base, BuildStatusEnum.Unknown)
 
 
+def test_package_status_update_many(client: Client, package_ahriman: Package, package_python_schedule: Package,
+                                    mocker: MockerFixture) -> None:
+    """
+    must update status for each package
+    """
+    update_mock = mocker.patch("ahriman.core.status.Client.package_status_update")
+
+    client.package_status_update_many([package_ahriman.base, package_python_schedule.base], BuildStatusEnum.Failed)
+    update_mock.assert_has_calls([
+        MockCall(package_ahriman.base, BuildStatusEnum.Failed),
+        MockCall(package_python_schedule.base, BuildStatusEnum.Failed),
+    ])
+
+
 def test_package_update(client: Client, package_ahriman: Package) -> None:
     """
     must raise not implemented on package addition
@@ -247,6 +292,20 @@ def test_package_update(client: Client, package_ahriman: Package) -> None:
         client.package_update(package_ahriman, BuildStatusEnum.Unknown)
 
 
+def test_package_update_many(client: Client, package_ahriman: Package, package_python_schedule: Package,
+                             mocker: MockerFixture) -> None:
+    """
+    must add or update each package
+    """
+    update_mock = mocker.patch("ahriman.core.status.Client.package_update")
+
+    client.package_update_many([package_ahriman, package_python_schedule], BuildStatusEnum.Success)
+    update_mock.assert_has_calls([
+        MockCall(package_ahriman, BuildStatusEnum.Success),
+        MockCall(package_python_schedule, BuildStatusEnum.Success),
+    ])
+
+
 def test_set_building(client: Client, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must set building status to the package
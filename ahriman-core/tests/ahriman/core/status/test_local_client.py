@@ -35,6 +35,16 @@ def test_event_get(local_client: LocalClient, package_ahriman: Package, mocker:
                                        local_client.repository_id)
 
 
+def test_event_rollup_get(local_client: LocalClient, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must retrieve event rollups
+    """
+    rollup_mock = mocker.patch("ahriman.core.database.SQLite.event_rollup_get")
+    local_client.event_rollup_get(EventType.PackageUpdated, package_ahriman.base, from_date=10, to_date=20)
+    rollup_mock.assert_called_once_with(EventType.PackageUpdated, package_ahriman.base, 10, 20,
+                                        local_client.repository_id)
+
+
 def test_logs_rotate(local_client: LocalClient, mocker: MockerFixture) -> None:
     """
     must rotate logs
@@ -64,6 +74,18 @@ def test_package_changes_update(local_client: LocalClient, package_ahriman: Pack
     changes_mock.assert_called_once_with(package_ahriman.base, changes, local_client.repository_id)
 
 
+def test_package_changes_update_many(local_client: LocalClient, package_ahriman: Package,
+                                     mocker: MockerFixture) -> None:
+    """
+    must update changes of multiple packages
+    """
+    changes_mock = mocker.patch("ahriman.core.database.SQLite.changes_insert_many")
+    changes = [(package_ahriman.base, Changes())]
+
+    local_client.package_changes_update_many(changes)
+    changes_mock.assert_called_once_with(changes, local_client.repository_id)
+
+
 def test_package_dependencies_get(local_client: LocalClient, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must retrieve package dependencies
@@ -85,6 +107,18 @@ def test_package_dependencies_update(
     dependencies_mock.assert_called_once_with(package_ahriman.base, Dependencies(), local_client.repository_id)
 
 
+def test_package_dependencies_update_many(local_client: LocalClient, package_ahriman: Package,
+                                          mocker: MockerFixture) -> None:
+    """
+    must update dependencies of multiple packages
+    """
+    dependencies_mock = mocker.patch("ahriman.core.database.SQLite.dependencies_insert_many")
+    dependencies = [(package_ahriman.base, Dependencies())]
+
+    local_client.package_dependencies_update_many(dependencies)
+    dependencies_mock.assert_called_once_with(dependencies, local_client.repository_id)
+
+
 def test_package_get(local_client: LocalClient, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must retrieve packages
@@ -92,18 +126,17 @@ def test_package_get(local_client: LocalClient, package_ahriman: Package, mocker
     result = [(package_ahriman, BuildStatus())]
     package_mock = mocker.patch("ahriman.core.database.SQLite.packages_get", return_value=result)
     assert local_client.package_get(None) == result
-    package_mock.assert_called_once_with(local_client.repository_id)
+    package_mock.assert_called_once_with(None, repository_id=local_client.repository_id)
 
 
-def test_package_get_package(local_client: LocalClient, package_ahriman: Package, package_python_schedule: Package,
-                             mocker: MockerFixture) -> None:
+def test_package_get_package(local_client: LocalClient, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must retrieve specific package
     """
-    result = [(package_ahriman, BuildStatus()), (package_python_schedule, BuildStatus())]
+    result = [(package_ahriman, BuildStatus())]
     package_mock = mocker.patch("ahriman.core.database.SQLite.packages_get", return_value=result)
-    assert local_client.package_get(package_ahriman.base) == [result[0]]
-    package_mock.assert_called_once_with(local_client.repository_id)
+    assert local_client.package_get(package_ahriman.base) == result
+    package_mock.assert_called_once_with(package_ahriman.base, repository_id=local_client.repository_id)
 
 
 def test_package_hold_update(local_client: LocalClient, package_ahriman: Package, mocker: MockerFixture) -> None:
@@ -212,6 +245,17 @@ def test_package_status_update(local_client: LocalClient, package_ahriman: Packa
     status_mock.assert_called_once_with(package_ahriman.base, pytest.helpers.anyvar(int), local_client.repository_id)
 
 
+def test_package_status_update_many(local_client: LocalClient, package_ahriman: Package,
+                                    mocker: MockerFixture) -> None:
+    """
+    must update status of multiple packages
+    """
+    status_mock = mocker.patch("ahriman.core.database.SQLite.status_update_many")
+    local_client.package_status_update_many([package_ahriman.base], BuildStatusEnum.Success)
+    status_mock.assert_called_once_with(
+        [(package_ahriman.base, pytest.helpers.anyvar(int))], local_client.repository_id)
+
+
 def test_package_update(local_client: LocalClient, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must process package addition
@@ -222,3 +266,16 @@ def test_package_update(local_client: LocalClient, package_ahriman: Package, moc
     local_client.package_update(package_ahriman, BuildStatusEnum.Success)
     package_mock.assert_called_once_with(package_ahriman, local_client.repository_id)
     status_mock.assert_called_once_with(package_ahriman.base, pytest.helpers.anyvar(int), local_client.repository_id)
+
+
+def test_package_update_many(local_client: LocalClient, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must process multiple packages addition
+    """
+    package_mock = mocker.patch("ahriman.core.database.SQLite.package_update_many")
+    status_mock = mocker.patch("ahriman.core.database.SQLite.status_update_many")
+
+    local_client.package_update_many(iter([package_ahriman]), BuildStatusEnum.Success)
+    package_mock.assert_called_once_with([package_ahriman], local_client.repository_id)
+    status_mock.assert_called_once_with(
+        [(package_ahriman.base, pytest.helpers.anyvar(int))], local_client.repository_id)
@@ -1,6 +1,7 @@
 import pytest
 
 from pytest_mock import MockerFixture
+from unittest.mock import MagicMock
 
 from ahriman.core.exceptions import UnknownPackageError
 from ahriman.core.status.watcher import Watcher
@@ -8,6 +9,7 @@ from ahriman.models.build_status import BuildStatus, BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.dependencies import Dependencies
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.log_record import LogRecord
 from ahriman.models.log_record_id import LogRecordId
 from ahriman.models.package import Package
@@ -37,6 +39,18 @@ async def test_event_get(watcher: Watcher, mocker: MockerFixture) -> None:
     cache_mock.assert_called_once_with(None, None, None, None, -1, 0)
 
 
+async def test_event_rollup_get(watcher: Watcher, mocker: MockerFixture) -> None:
+    """
+    must retrieve event rollups
+    """
+    rollup = EventRollup(event="event", object_id="object", created=0)
+    cache_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.event_rollup_get", return_value=[rollup])
+
+    result = await watcher.event_rollup_get(None, None)
+    assert result == [rollup]
+    cache_mock.assert_called_once_with(None, None, None, None)
+
+
 async def test_load(watcher: Watcher, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must correctly load packages
@@ -73,11 +87,51 @@ async def test_logs_rotate(watcher: Watcher, mocker: MockerFixture) -> None:
     cache_mock.assert_called_once_with(42)
 
 
+def test_package_archives_load(watcher: Watcher, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must load package archives and cache them
+    """
+    mocker.patch("pathlib.Path.stat", return_value=MagicMock(st_mtime_ns=1))
+    archives_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives",
+                                 return_value=[package_ahriman])
+
+    assert watcher._package_archives_load(package_ahriman.base) == [package_ahriman]
+    assert watcher._package_archives_load(package_ahriman.base) == [package_ahriman]
+    archives_mock.assert_called_once_with(package_ahriman.base)
+
+
+def test_package_archives_load_modified(watcher: Watcher, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must reload package archives if directory has been modified
+    """
+    mocker.patch("pathlib.Path.stat", side_effect=[MagicMock(st_mtime_ns=1), MagicMock(st_mtime_ns=2)])
+    archives_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives",
+                                 return_value=[package_ahriman])
+
+    watcher._package_archives_load(package_ahriman.base)
+    watcher._package_archives_load(package_ahriman.base)
+    assert archives_mock.call_count == 2
+
+
+def test_package_archives_load_no_directory(watcher: Watcher, package_ahriman: Package,
+                                            mocker: MockerFixture) -> None:
+    """
+    must always load package archives if there is no archive directory
+    """
+    mocker.patch("pathlib.Path.stat", side_effect=FileNotFoundError)
+    archives_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives",
+                                 return_value=[])
+
+    assert watcher._package_archives_load(package_ahriman.base) == []
+    assert watcher._package_archives_load(package_ahriman.base) == []
+    assert archives_mock.call_count == 2
+
+
 async def test_package_archives(watcher: Watcher, package_ahriman: Package, mocker: MockerFixture) -> None:
     """
     must return package archives from package info
     """
-    archives_mock = mocker.patch("ahriman.core.repository.package_info.PackageInfo.package_archives",
+    archives_mock = mocker.patch("ahriman.core.status.watcher.Watcher._package_archives_load",
                                  return_value=[package_ahriman])
 
     result = await watcher.package_archives(package_ahriman.base)
@@ -85,6 +139,19 @@ async def test_package_archives(watcher: Watcher, package_ahriman: Package, mock
     archives_mock.assert_called_once_with(package_ahriman.base)
 
 
+async def test_package_archives_paginated(watcher: Watcher, package_ahriman: Package, package_python_schedule: Package,
+                                          mocker: MockerFixture) -> None:
+    """
+    must paginate package archives
+    """
+    mocker.patch("ahriman.core.status.watcher.Watcher._package_archives_load",
+                 return_value=[package_ahriman, package_python_schedule])
+
+    assert await watcher.package_archives(package_ahriman.base, 1, 0) == [package_ahriman]
+    assert await watcher.package_archives(package_ahriman.base, 1, 1) == [package_python_schedule]
+    assert await watcher.package_archives(package_ahriman.base, -1, 1) == [package_python_schedule]
+
+
 async def test_package_get(watcher: Watcher, package_ahriman: Package) -> None:
     """
     must return package status
@@ -244,9 +311,11 @@ async def test_package_remove(watcher: Watcher, package_ahriman: Package, mocker
     cache_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_remove")
     broadcast_mock = mocker.patch("ahriman.core.status.event_bus.EventBus.broadcast")
     watcher._known = {package_ahriman.base: (package_ahriman, BuildStatus())}
+    watcher._archives = {package_ahriman.base: (1, [package_ahriman])}
 
     await watcher.package_remove(package_ahriman.base)
     assert not watcher._known
+    assert not watcher._archives
     cache_mock.assert_called_once_with(package_ahriman.base)
     broadcast_mock.assert_called_once_with(EventType.PackageRemoved, package_ahriman.base)
 
@@ -309,9 +378,11 @@ async def test_package_update(watcher: Watcher, package_ahriman: Package, mocker
     """
     cache_mock = mocker.patch("ahriman.core.status.local_client.LocalClient.package_update")
     broadcast_mock = mocker.patch("ahriman.core.status.event_bus.EventBus.broadcast")
+    watcher._archives = {package_ahriman.base: (1, [package_ahriman])}
 
     await watcher.package_update(package_ahriman, BuildStatusEnum.Unknown)
     assert await watcher.packages()
+    assert not watcher._archives
     cache_mock.assert_called_once_with(package_ahriman, pytest.helpers.anyvar(int))
     broadcast_mock.assert_called_once_with(
         EventType.PackageUpdated, package_ahriman.base,
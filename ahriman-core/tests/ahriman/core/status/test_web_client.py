@@ -11,6 +11,7 @@ from ahriman.models.build_status import BuildStatus, BuildStatusEnum
 from ahriman.models.changes import Changes
 from ahriman.models.dependencies import Dependencies
 from ahriman.models.event import Event, EventType
+from ahriman.models.event_rollup import EventRollup
 from ahriman.models.internal_status import InternalStatus
 from ahriman.models.log_record import LogRecord
 from ahriman.models.log_record_id import LogRecordId
@@ -307,6 +308,51 @@ def test_event_get_failed_http_error_suppress(web_client: WebClient, mocker: Moc
     logging_mock.assert_not_called()
 
 
+def test_event_rollup_get(web_client: WebClient, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must get event rollups
+    """
+    rollup = EventRollup(event=EventType.PackageUpdated, object_id=package_ahriman.base, created=0, count=1)
+    response_obj = requests.Response()
+    response_obj._content = json.dumps([rollup.view()]).encode("utf8")
+    response_obj.status_code = 200
+
+    requests_mock = mocker.patch("ahriman.core.status.web_client.WebClient.make_request", return_value=response_obj)
+
+    result = web_client.event_rollup_get(None, None)
+    requests_mock.assert_called_once_with("GET", f"{web_client.address}/api/v1/events/rollup",
+                                          params=web_client.repository_id.query())
+    assert result == [rollup]
+
+
+def test_event_rollup_get_filter(web_client: WebClient, mocker: MockerFixture) -> None:
+    """
+    must get event rollups with filter
+    """
+    response_obj = requests.Response()
+    response_obj._content = json.dumps([]).encode("utf8")
+    response_obj.status_code = 200
+
+    requests_mock = mocker.patch("ahriman.core.status.web_client.WebClient.make_request", return_value=response_obj)
+
+    web_client.event_rollup_get("event", "object", from_date=1, to_date=2)
+    requests_mock.assert_called_once_with("GET", pytest.helpers.anyvar(str, True),
+                                          params=web_client.repository_id.query() + [
+                                              ("event", "event"),
+                                              ("object_id", "object"),
+                                              ("from_date", "1"),
+                                              ("to_date", "2"),
+    ])
+
+
+def test_event_rollup_get_failed(web_client: WebClient, mocker: MockerFixture) -> None:
+    """
+    must suppress any exception happened during event rollups fetch
+    """
+    mocker.patch("requests.Session.request", side_effect=Exception)
+    assert web_client.event_rollup_get(None, None) == []
+
+
 def test_logs_rotate(web_client: WebClient, mocker: MockerFixture) -> None:
     """
     must rotate logs
@@ -0,0 +1,134 @@
+import json
+import pytest
+
+from pytest_mock import MockerFixture
+
+from ahriman.core.json_serializer import _default, json_dumps, json_loads
+from ahriman.core.utils import dataclass_view
+from ahriman.models.build_status import BuildStatus, BuildStatusEnum
+from ahriman.models.event import Event, EventType
+from ahriman.models.log_record import LogRecord
+from ahriman.models.log_record_id import LogRecordId
+from ahriman.models.package import Package
+
+
+def test_default(package_ahriman: Package) -> None:
+    """
+    must convert dataclasses to json-friendly dictionaries
+    """
+    assert _default(package_ahriman) == dataclass_view(package_ahriman)
+
+
+def test_default_unknown() -> None:
+    """
+    must raise TypeError for unsupported objects
+    """
+    with pytest.raises(TypeError):
+        _default(object())
+    with pytest.raises(TypeError):
+        _default(Package)
+
+
+def test_json_dumps(package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must serialize objects to compact json
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    assert json_dumps({"key": ["value", 1, None]}) == b'{"key":["value",1,null]}'
+    assert json_loads(json_dumps(package_ahriman.view())) == json.loads(json.dumps(package_ahriman.view()))
+
+
+def test_json_dumps_dataclass(package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must serialize dataclasses in the same way as their views
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    assert json_loads(json_dumps(package_ahriman)) == package_ahriman.view()
+    assert json_loads(json_dumps({"package": package_ahriman})) == {"package": package_ahriman.view()}
+
+
+def test_json_dumps_non_ascii(mocker: MockerFixture) -> None:
+    """
+    must correctly serialize non-ascii strings
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    assert json_loads(json_dumps({"message": "привет \udc80"})) == {"message": "привет \udc80"}
+
+
+def test_json_dumps_orjson(mocker: MockerFixture) -> None:
+    """
+    must use orjson library if available
+    """
+    orjson_mock = mocker.patch("ahriman.core.json_serializer.orjson")
+    orjson_mock.dumps.return_value = b"{}"
+
+    assert json_dumps({}) == b"{}"
+    orjson_mock.dumps.assert_called_once_with(
+        {}, default=_default, option=orjson_mock.OPT_NON_STR_KEYS | orjson_mock.OPT_PASSTHROUGH_DATACLASS)
+
+
+def test_json_dumps_orjson_fallback(mocker: MockerFixture) -> None:
+    """
+    must fallback to standard library if orjson cannot serialize object
+    """
+    orjson_mock = mocker.patch("ahriman.core.json_serializer.orjson")
+    orjson_mock.JSONEncodeError = TypeError
+    orjson_mock.dumps.side_effect = TypeError
+
+    assert json_dumps({"key": "value"}) == b'{"key":"value"}'
+
+
+def test_json_loads(mocker: MockerFixture) -> None:
+    """
+    must deserialize json documents
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    assert json_loads(b'{"key":"value"}') == {"key": "value"}
+    assert json_loads('{"key":"value"}') == {"key": "value"}
+
+
+def test_json_loads_orjson(mocker: MockerFixture) -> None:
+    """
+    must use orjson library for deserialization if available
+    """
+    orjson_mock = mocker.patch("ahriman.core.json_serializer.orjson")
+    orjson_mock.loads.return_value = {}
+
+    assert json_loads(b"{}") == {}
+    orjson_mock.loads.assert_called_once_with(b"{}")
+
+
+def test_round_trip_build_status(mocker: MockerFixture) -> None:
+    """
+    must restore build status from serialized view
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    status = BuildStatus(BuildStatusEnum.Failed, 42)
+    assert BuildStatus.from_json(json_loads(json_dumps(status.view()))) == status
+
+
+def test_round_trip_event(mocker: MockerFixture) -> None:
+    """
+    must restore event from serialized view
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    event = Event(EventType.PackageUpdated, "ahriman", "message", created=42, key="value")
+    assert Event.from_json(json_loads(json_dumps(event.view()))) == event
+
+
+def test_round_trip_log_record(package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must restore log record from serialized view
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    record = LogRecord(LogRecordId(package_ahriman.base, package_ahriman.version, "process"), 42.0, "message")
+    assert LogRecord.from_json(package_ahriman.base, json_loads(json_dumps(record.view()))) == record
+
+
+def test_round_trip_package(package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must restore package from serialized view
+    """
+    mocker.patch("ahriman.core.json_serializer.orjson", None)
+    assert Package.from_json(json_loads(json_dumps(package_ahriman.view()))) == package_ahriman
+    assert Package.from_json(json_loads(json_dumps(package_ahriman))) == package_ahriman
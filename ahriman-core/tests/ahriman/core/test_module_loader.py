@@ -2,10 +2,25 @@ import ahriman.web.views
 
 from pathlib import Path
 
-from ahriman.core.module_loader import _modules, implementations, optional_module
+from ahriman.core.module_loader import _module_contains, _modules, implementations, optional_module
 from ahriman.web.views.base import BaseView
 
 
+def test_module_contains() -> None:
+    """
+    must check if module contains string
+    """
+    assert _module_contains("ahriman.web.views.base", "BaseView")
+    assert not _module_contains("ahriman.web.views.base", "random string which does not exist")
+
+
+def test_module_contains_unknown() -> None:
+    """
+    must return true if module source cannot be found
+    """
+    assert _module_contains("ahriman.web.views.missing_ahriman_module", "BaseView")
+
+
 def test_modules() -> None:
     """
     must load modules
@@ -25,6 +40,16 @@ def test_implementations() -> None:
     assert all(issubclass(view, BaseView) for view in routes)
 
 
+def test_implementations_hint() -> None:
+    """
+    must load implementations only from modules which contain hint
+    """
+    routes = list(implementations(ahriman.web.views, BaseView, hint="/api/v1/service/process/"))
+    assert routes
+    assert len(routes) < len(list(implementations(ahriman.web.views, BaseView)))
+    assert all("/api/v1/service/process/" in "".join(view.ROUTES) for view in routes)
+
+
 def test_optional_module() -> None:
     """
     must import an available module
@@ -1,5 +1,9 @@
+import multiprocessing
+import os
 import pytest
+import time
 
+from collections import deque
 from pytest_mock import MockerFixture
 from unittest.mock import MagicMock
 
@@ -55,16 +59,133 @@ def test_spawn_process(spawner: Spawn, repository_id: RepositoryId, mocker: Mock
     """
     must correctly spawn child process
     """
-    start_mock = mocker.patch("multiprocessing.Process.start")
+    start_mock = mocker.patch("multiprocessing.process.BaseProcess.start")
 
-    assert spawner._spawn_process(repository_id, "command", "argument",
-                                  empty="", string="v", list=["a", "b"], empty_list=[], none=None)
+    process_id = spawner._spawn_process(repository_id, "command", "argument",
+                                        empty="", string="v", list=["a", "b"], empty_list=[], none=None)
+    assert process_id
     start_mock.assert_called_once_with()
     spawner.args_parser.parse_args.assert_called_once_with(
         spawner.command_arguments + [
             "command", "argument", "--empty", "--string", "v", "--list", "a", "--list", "b",
         ]
     )
+    assert spawner.pending[repository_id] == deque([process_id])
+
+
+def test_spawn_process_queued(spawner: Spawn, repository_id: RepositoryId, mocker: MockerFixture) -> None:
+    """
+    must queue process if there is another running process for the same repository
+    """
+    start_mock = mocker.patch("multiprocessing.process.BaseProcess.start")
+
+    first = spawner._spawn_process(repository_id, "command")
+    second = spawner._spawn_process(repository_id, "command")
+    start_mock.assert_called_once_with()
+    assert spawner.has_process(first)
+    assert spawner.has_process(second)
+    assert spawner.pending[repository_id] == deque([first, second])
+
+
+def test_spawn_process_start_error(spawner: Spawn, repository_id: RepositoryId, mocker: MockerFixture) -> None:
+    """
+    must remove process from queue if it could not be started
+    """
+    mocker.patch("multiprocessing.process.BaseProcess.start", side_effect=Exception)
+
+    with pytest.raises(Exception):
+        spawner._spawn_process(repository_id, "command")
+    assert not spawner.active
+    assert not spawner.pending
+
+
+def test_spawn_process_parallel(spawner: Spawn, repository_id: RepositoryId, mocker: MockerFixture) -> None:
+    """
+    must run processes for different repositories in parallel
+    """
+    start_mock = mocker.patch("multiprocessing.process.BaseProcess.start")
+
+    spawner._spawn_process(repository_id, "command")
+    spawner._spawn_process(RepositoryId("i686", repository_id.name), "command")
+    assert start_mock.call_count == 2
+
+
+def test_next_process(spawner: Spawn, repository_id: RepositoryId) -> None:
+    """
+    must extract next process for the repository
+    """
+    spawner.pending[repository_id] = deque(["1", "2"])
+
+    assert spawner._next_process("1") == "2"
+    assert spawner.pending[repository_id] == deque(["2"])
+
+    assert spawner._next_process("2") is None
+    assert repository_id not in spawner.pending
+
+
+def test_next_process_unknown(spawner: Spawn, repository_id: RepositoryId) -> None:
+    """
+    must skip processes which are not running
+    """
+    spawner.pending[repository_id] = deque(["1", "2"])
+    assert spawner._next_process("2") is None
+    assert spawner.pending[repository_id] == deque(["1", "2"])
+
+
+def test_process_finish(spawner: Spawn, repository_id: RepositoryId) -> None:
+    """
+    must remove finished process and start the next one
+    """
+    first = spawner.active["1"] = MagicMock()
+    second = spawner.active["2"] = MagicMock()
+    spawner.pending[repository_id] = deque(["1", "2"])
+
+    assert spawner._process_finish("1") == first
+    first.join.assert_called_once_with()
+    second.start.assert_called_once_with()
+    assert spawner.pending[repository_id] == deque(["2"])
+
+
+def test_process_finish_unknown(spawner: Spawn) -> None:
+    """
+    must skip unknown process on finish
+    """
+    assert spawner._process_finish("1") is None
+
+
+def test_process_finish_start_error(spawner: Spawn, repository_id: RepositoryId) -> None:
+    """
+    must skip processes which could not be started
+    """
+    spawner.active["1"] = MagicMock()
+    second = spawner.active["2"] = MagicMock()
+    second.start.side_effect = Exception
+    third = spawner.active["3"] = MagicMock()
+    spawner.pending[repository_id] = deque(["1", "2", "3"])
+
+    spawner._process_finish("1")
+    third.start.assert_called_once_with()
+    assert not spawner.has_process("2")
+    assert spawner.pending[repository_id] == deque(["3"])
+
+
+def test_process_statuses(spawner: Spawn) -> None:
+    """
+    must read all available statuses
+    """
+    spawner.queue.put(ProcessStatus("1", True, 1))
+    spawner.queue.put(None)
+    time.sleep(0.1)  # let feeder thread flush the queue
+
+    assert list(spawner._process_statuses()) == [ProcessStatus("1", True, 1), None]
+
+
+def test_process_statuses_empty(spawner: Spawn, mocker: MockerFixture) -> None:
+    """
+    must return nothing if there are no statuses
+    """
+    mocker.patch.object(Spawn, "POLL_INTERVAL", 0.01)
+    assert not list(spawner._process_statuses())
 
 
 def test_has_process(spawner: Spawn) -> None:
@@ -309,6 +430,80 @@ def test_run_pop(spawner: Spawn) -> None:
     assert not spawner.active
 
 
+def test_run_next(spawner: Spawn, repository_id: RepositoryId) -> None:
+    """
+    must start next queued process for the repository
+    """
+    spawner.active["1"] = MagicMock()
+    second = spawner.active["2"] = MagicMock()
+    spawner.pending[repository_id] = deque(["1", "2"])
+
+    spawner.queue.put(ProcessStatus("1", True, 1))
+    spawner.queue.put(None)  # terminate
+
+    spawner.run()
+
+    second.start.assert_called_once_with()
+    assert spawner.has_process("2")
+    assert spawner.pending[repository_id] == deque(["2"])
+
+
+def test_run_exited(spawner: Spawn, repository_id: RepositoryId, mocker: MockerFixture) -> None:
+    """
+    must reap processes which have exited without status and start the next one
+    """
+    first = spawner.active["1"] = MagicMock(exitcode=-9)
+    second = spawner.active["2"] = MagicMock(exitcode=None)
+    spawner.pending[repository_id] = deque(["1", "2"])
+    mocker.patch("ahriman.core.spawn.Spawn._process_statuses", side_effect=[iter([]), iter([None])])
+
+    spawner.run()
+
+    first.join.assert_called_once_with()
+    second.start.assert_called_once_with()
+    assert not spawner.has_process("1")
+    assert spawner.pending[repository_id] == deque(["2"])
+
+
+def test_run_exited_reported(spawner: Spawn, repository_id: RepositoryId, mocker: MockerFixture) -> None:
+    """
+    must not treat exited process as crashed if its status has been read
+    """
+    spawner.active["1"] = MagicMock(exitcode=0)
+    spawner.pending[repository_id] = deque(["1"])
+    mocker.patch("ahriman.core.spawn.Spawn._process_statuses",
+                 side_effect=[iter([ProcessStatus("1", True, 1)]), iter([None])])
+    logging_mock = mocker.patch("logging.Logger.error")
+
+    spawner.run()
+    logging_mock.assert_not_called()
+    assert not spawner.active
+
+
+def test_run_exited_child(spawner: Spawn, repository_id: RepositoryId, mocker: MockerFixture) -> None:
+    """
+    must start the next process if real child process has died without reporting
+    """
+    mocker.patch.object(Spawn, "POLL_INTERVAL", 0.01)
+    first = multiprocessing.get_context("fork").Process(target=os._exit, args=(1,))
+    second = spawner.active["2"] = MagicMock(exitcode=None)
+    spawner.active["1"] = first
+    spawner.pending[repository_id] = deque(["1", "2"])
+
+    first.start()
+    spawner.start()
+    for _ in range(500):
+        if not spawner.has_process("1"):
+            break
+        time.sleep(0.01)
+    spawner.stop()
+    spawner.join()
+
+    assert first.exitcode == 1
+    assert not spawner.has_process("1")
+    second.start.assert_called_once_with()
+
+
 def test_stop(spawner: Spawn) -> None:
     """
     must gracefully terminate thread
@@ -221,6 +221,16 @@ def test_dataclass_view_without_none(package_ahriman: Package) -> None:
     assert Package.from_json(result) == package_ahriman
 
 
+def test_dataclass_view_copy(package_ahriman: Package) -> None:
+    """
+    must not share containers with the original object
+    """
+    result = dataclass_view(package_ahriman)
+    description = next(iter(package_ahriman.packages.values()))
+    result["packages"][package_ahriman.base]["depends"].append("unknown")
+    assert "unknown" not in description.depends
+
+
 def test_enum_values() -> None:
     """
     must correctly generate choices from enumeration classes
@@ -323,6 +333,18 @@ def test_full_version() -> None:
     assert full_version(1, "0.12.1", "1") == "1:0.12.1-1"
 
 
+def test_intern_all() -> None:
+    """
+    must convert strings to tuple of interned strings
+    """
+    first = intern_all(["".join(["py", "thon"]), "pacman"])
+    second = intern_all(["".join(["pyt", "hon"])])
+
+    assert first == ("python", "pacman")
+    assert first[0] is second[0]
+    assert intern_all([]) == ()
+
+
 def test_list_flatmap() -> None:
     """
     must flat map iterable correctly
@@ -8,6 +8,7 @@ from unittest.mock import call as MockCall
 
 from ahriman.core.configuration import Configuration
 from ahriman.core.upload.github import GitHub
+from ahriman.models.package import Package
 
 
 def test_github_release_tag(configuration: Configuration) -> None:
@@ -116,7 +117,7 @@ def test_files_upload(github: GitHub, github_release: dict[str, Any], mocker: Mo
     upload_mock.assert_has_calls([
         MockCall(github_release, Path("b")),
         MockCall(github_release, Path("c")),
-    ])
+    ], any_order=True)
 
 
 def test_files_upload_empty(github: GitHub, github_release: dict[str, Any], mocker: MockerFixture) -> None:
@@ -137,6 +138,58 @@ def test_get_local_files(github: GitHub, resource_path_root: Path, mocker: Mocke
     walk_mock.assert_called()
 
 
+def test_get_local_files_built_packages(github: GitHub, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must reuse remote checksums for the package archives which have not been built
+    """
+    filename = package_ahriman.packages[package_ahriman.base].filename
+    mocker.patch("ahriman.core.upload.github.walk", return_value=[
+        Path("local") / filename,
+        Path("local") / "old-1.0.0-1-x86_64.pkg.tar.zst",
+        Path("local") / "old-1.0.0-1-x86_64.pkg.tar.zst.sig",
+        Path("local") / "repo.db",
+    ])
+    hash_mock = mocker.patch("ahriman.core.upload.github.GitHub.calculate_hash_cached", return_value="local")
+    remote_files = {
+        filename: "remote",
+        "old-1.0.0-1-x86_64.pkg.tar.zst": "remote",
+        "old-1.0.0-1-x86_64.pkg.tar.zst.sig": "remote",
+        "repo.db": "remote",
+    }
+
+    assert github.get_local_files(Path("local"), remote_files, [package_ahriman]) == {
+        Path("local") / filename: "local",
+        Path("local") / "old-1.0.0-1-x86_64.pkg.tar.zst": "remote",
+        Path("local") / "old-1.0.0-1-x86_64.pkg.tar.zst.sig": "remote",
+        Path("local") / "repo.db": "local",
+    }
+    hash_mock.assert_has_calls([MockCall(Path("local") / filename), MockCall(Path("local") / "repo.db")])
+
+
+def test_get_local_files_no_built_packages(github: GitHub, mocker: MockerFixture) -> None:
+    """
+    must calculate checksums for all files if no built packages list supplied
+    """
+    mocker.patch("ahriman.core.upload.github.walk", return_value=[Path("local") / "old-1.0.0-1-x86_64.pkg.tar.zst"])
+    hash_mock = mocker.patch("ahriman.core.upload.github.GitHub.calculate_hash_cached", return_value="local")
+
+    assert github.get_local_files(Path("local"), {"old-1.0.0-1-x86_64.pkg.tar.zst": "remote"}) == {
+        Path("local") / "old-1.0.0-1-x86_64.pkg.tar.zst": "local",
+    }
+    hash_mock.assert_called_once_with(Path("local") / "old-1.0.0-1-x86_64.pkg.tar.zst")
+
+
+def test_is_immutable() -> None:
+    """
+    must check if file is immutable
+    """
+    assert GitHub.is_immutable("old-1.0.0-1-x86_64.pkg.tar.zst", set())
+    assert GitHub.is_immutable("old-1.0.0-1-x86_64.pkg.tar.zst.sig", set())
+    assert not GitHub.is_immutable("old-1.0.0-1-x86_64.pkg.tar.zst", {"old-1.0.0-1-x86_64.pkg.tar.zst"})
+    assert not GitHub.is_immutable("old-1.0.0-1-x86_64.pkg.tar.zst.sig", {"old-1.0.0-1-x86_64.pkg.tar.zst"})
+    assert not GitHub.is_immutable("repo.db.tar.gz", set())
+
+
 def test_release_create(github: GitHub, mocker: MockerFixture) -> None:
     """
     must create release
@@ -196,13 +249,34 @@ def test_release_update(github: GitHub, github_release: dict[str, Any], mocker:
     request_mock.assert_called_once_with("POST", "release_url", json={"body": "body"})
 
 
+def test_run_concurrently(github: GitHub) -> None:
+    """
+    must run action for each item
+    """
+    result = []
+    github.run_concurrently(result.append, [1, 2, 3])
+    assert sorted(result) == [1, 2, 3]
+
+
+def test_run_concurrently_exception(github: GitHub) -> None:
+    """
+    must reraise exception from action
+    """
+    def action(_: int) -> None:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        github.run_concurrently(action, [1])
+
+
 def test_release_sync(github: GitHub, mocker: MockerFixture) -> None:
     """
     must run sync command
     """
     release_get_mock = mocker.patch("ahriman.core.upload.github.GitHub.release_get", return_value={})
     get_hashes_mock = mocker.patch("ahriman.core.upload.github.GitHub.get_hashes", return_value={})
-    get_local_files_mock = mocker.patch("ahriman.core.upload.github.GitHub.get_local_files", return_value={})
+    get_local_files_mock = mocker.patch("ahriman.core.upload.github.GitHub.get_local_files",
+                                        return_value={Path("a"): "a"})
     files_upload_mock = mocker.patch("ahriman.core.upload.github.GitHub.files_upload")
     files_remove_mock = mocker.patch("ahriman.core.upload.github.GitHub.files_remove")
     release_update_mock = mocker.patch("ahriman.core.upload.github.GitHub.release_update")
@@ -210,10 +284,24 @@ def test_release_sync(github: GitHub, mocker: MockerFixture) -> None:
     github.sync(Path("local"), [])
     release_get_mock.assert_called_once_with()
     get_hashes_mock.assert_called_once_with("")
-    get_local_files_mock.assert_called_once_with(Path("local"))
-    files_upload_mock.assert_called_once_with({}, {}, {})
-    files_remove_mock.assert_called_once_with({}, {}, {})
-    release_update_mock.assert_called_once_with({}, pytest.helpers.anyvar(int))
+    get_local_files_mock.assert_called_once_with(Path("local"), {}, [])
+    files_upload_mock.assert_called_once_with({}, {Path("a"): "a"}, {})
+    files_remove_mock.assert_called_once_with({}, {Path("a"): "a"}, {})
+    release_update_mock.assert_called_once_with({}, "a a")
+
+
+def test_release_sync_unchanged(github: GitHub, mocker: MockerFixture) -> None:
+    """
+    must not update release body if it has not been changed
+    """
+    mocker.patch("ahriman.core.upload.github.GitHub.release_get", return_value={"body": "a a"})
+    mocker.patch("ahriman.core.upload.github.GitHub.get_local_files", return_value={Path("a"): "a"})
+    mocker.patch("ahriman.core.upload.github.GitHub.files_upload")
+    mocker.patch("ahriman.core.upload.github.GitHub.files_remove")
+    release_update_mock = mocker.patch("ahriman.core.upload.github.GitHub.release_update")
+
+    github.sync(Path("local"), [])
+    release_update_mock.assert_not_called()
 
 
 def test_release_sync_create_release(github: GitHub, mocker: MockerFixture) -> None:
@@ -222,11 +310,12 @@ def test_release_sync_create_release(github: GitHub, mocker: MockerFixture) -> N
     """
     mocker.patch("ahriman.core.upload.github.GitHub.release_get", return_value=None)
     mocker.patch("ahriman.core.upload.github.GitHub.get_hashes")
-    mocker.patch("ahriman.core.upload.github.GitHub.get_local_files")
     mocker.patch("ahriman.core.upload.github.GitHub.files_upload")
     mocker.patch("ahriman.core.upload.github.GitHub.files_remove")
     mocker.patch("ahriman.core.upload.github.GitHub.release_update")
+    get_local_files_mock = mocker.patch("ahriman.core.upload.github.GitHub.get_local_files")
     release_create_mock = mocker.patch("ahriman.core.upload.github.GitHub.release_create")
 
     github.sync(Path("local"), [])
     release_create_mock.assert_called_once_with()
+    get_local_files_mock.assert_called_once_with(Path("local"), pytest.helpers.anyvar(int), None)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from pytest_mock import MockerFixture
 
 from ahriman.core.upload.http_upload import HttpUpload
 
@@ -19,6 +20,19 @@ def test_calculate_hash_small(resource_path_root: Path) -> None:
     assert HttpUpload.calculate_hash(path) == "7136fc388980dc043f9f869d57c5ce0c"
 
 
+def test_calculate_hash_cached(resource_path_root: Path, mocker: MockerFixture) -> None:
+    """
+    must calculate checksum only once for unchanged file
+    """
+    path = resource_path_root / "models" / "package_ahriman_pkgbuild"
+    HttpUpload._hashes.clear()
+    hash_mock = mocker.patch("ahriman.core.upload.http_upload.HttpUpload.calculate_hash", return_value="hash")
+
+    assert HttpUpload.calculate_hash_cached(path) == "hash"
+    assert HttpUpload.calculate_hash_cached(path) == "hash"
+    hash_mock.assert_called_once_with(path)
+
+
 def test_get_body_get_hashes() -> None:
     """
     must generate readable body
@@ -50,11 +50,11 @@ def test_post_init(aur_package_ahriman: AURPackage) -> None:
         check_depends=["d=4"],
         provides=["e=5"],
     )
-    assert package.depends == ["a"]
-    assert package.make_depends == ["b"]
-    assert package.opt_depends == ["c"]
-    assert package.check_depends == ["d"]
-    assert package.provides == ["e"]
+    assert package.depends == ("a",)
+    assert package.make_depends == ("b",)
+    assert package.opt_depends == ("c",)
+    assert package.check_depends == ("d",)
+    assert package.provides == ("e",)
 
 
 def test_from_json(aur_package_ahriman: AURPackage, resource_path_root: Path) -> None:
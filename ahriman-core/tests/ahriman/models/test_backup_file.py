@@ -0,0 +1,57 @@
+import hashlib
+
+from pathlib import Path
+from pytest_mock import MockerFixture
+
+from ahriman.models.backup_file import BackupFile
+
+
+def test_from_json_view(tmp_path: Path) -> None:
+    """
+    must construct same object from json
+    """
+    path = tmp_path / "file"
+    path.write_text("content")
+
+    descriptor = BackupFile.from_path(path)
+    assert BackupFile.from_json(descriptor.view()) == descriptor
+
+
+def test_from_path(tmp_path: Path) -> None:
+    """
+    must read file descriptor from the filesystem
+    """
+    path = tmp_path / "file"
+    path.write_text("content")
+    stat = path.stat()
+
+    assert BackupFile.from_path(path) == BackupFile(
+        modified=stat.st_mtime_ns,
+        sha256=hashlib.sha256(b"content").hexdigest(),
+        size=stat.st_size,
+    )
+
+
+def test_from_path_previous(tmp_path: Path, mocker: MockerFixture) -> None:
+    """
+    must reuse digest of the previous descriptor if file has not been modified
+    """
+    path = tmp_path / "file"
+    path.write_text("content")
+    previous = BackupFile.from_path(path)
+    open_mock = mocker.patch("pathlib.Path.open")
+
+    assert BackupFile.from_path(path, previous) == previous
+    open_mock.assert_not_called()
+
+
+def test_from_path_previous_modified(tmp_path: Path) -> None:
+    """
+    must calculate digest if file has been modified since the previous backup
+    """
+    path = tmp_path / "file"
+    path.write_text("content")
+    previous = BackupFile.from_path(path)
+    path.write_text("new content")
+
+    assert BackupFile.from_path(path, previous).sha256 == hashlib.sha256(b"new content").hexdigest()
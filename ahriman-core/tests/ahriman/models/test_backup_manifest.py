@@ -0,0 +1,103 @@
+import io
+import tarfile
+
+from ahriman.models.backup_component import BackupComponent
+from ahriman.models.backup_file import BackupFile
+from ahriman.models.backup_manifest import BackupManifest
+
+
+def _manifest() -> BackupManifest:
+    """
+    generate manifest for these test cases
+
+    Returns:
+        BackupManifest: manifest test instance
+    """
+    return BackupManifest(
+        components={
+            BackupComponent.Configuration: ["etc/ahriman.ini"],
+            BackupComponent.Cache: ["var/lib/ahriman/cache"],
+        },
+        files={
+            "etc/ahriman.ini": BackupFile(modified=1, sha256="sha1", size=1),
+            "var/lib/ahriman/cache/ahriman/PKGBUILD": BackupFile(modified=2, sha256="sha2", size=2),
+        },
+    )
+
+
+def test_from_archive() -> None:
+    """
+    must read manifest from the archive
+    """
+    manifest = _manifest()
+    content = io.BytesIO()
+    with tarfile.open(fileobj=content, mode="w") as archive:
+        manifest.write(archive)
+
+    content.seek(0)
+    with tarfile.open(fileobj=content) as archive:
+        assert BackupManifest.from_archive(archive) == manifest
+
+
+def test_from_archive_empty() -> None:
+    """
+    must return None for empty archive
+    """
+    content = io.BytesIO()
+    with tarfile.open(fileobj=content, mode="w"):
+        pass
+
+    content.seek(0)
+    with tarfile.open(fileobj=content) as archive:
+        assert BackupManifest.from_archive(archive) is None
+
+
+def test_from_archive_no_manifest() -> None:
+    """
+    must return None if the first member of the archive is not a manifest
+    """
+    content = io.BytesIO()
+    with tarfile.open(fileobj=content, mode="w") as archive:
+        archive.addfile(tarfile.TarInfo("file"), io.BytesIO())
+
+    content.seek(0)
+    with tarfile.open(fileobj=content) as archive:
+        assert BackupManifest.from_archive(archive) is None
+
+
+def test_from_json_view() -> None:
+    """
+    must construct same object from json
+    """
+    manifest = _manifest()
+    assert BackupManifest.from_json(manifest.view()) == manifest
+
+
+def test_component() -> None:
+    """
+    must find component of the archive member
+    """
+    manifest = _manifest()
+    assert manifest.component("etc/ahriman.ini") == BackupComponent.Configuration
+    assert manifest.component("var/lib/ahriman/cache") == BackupComponent.Cache
+    assert manifest.component("var/lib/ahriman/cache/ahriman/PKGBUILD") == BackupComponent.Cache
+    assert manifest.component("var/lib/ahriman/cache2") is None
+    assert manifest.component("var/lib/ahriman/ahriman.db") is None
+
+
+def test_unchanged() -> None:
+    """
+    must extract files with the same content as in the previous backup
+    """
+    previous = _manifest()
+    manifest = BackupManifest(
+        components=previous.components,
+        files={
+            "etc/ahriman.ini": BackupFile(modified=3, sha256="sha1", size=1),
+            "var/lib/ahriman/cache/ahriman/PKGBUILD": BackupFile(modified=4, sha256="sha3", size=2),
+            "var/lib/ahriman/cache/ahriman/.SRCINFO": BackupFile(modified=5, sha256="sha4", size=2),
+        },
+    )
+
+    assert manifest.unchanged(previous) == {"etc/ahriman.ini"}
+    assert manifest.unchanged(BackupManifest()) == set()
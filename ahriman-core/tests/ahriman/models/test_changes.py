@@ -13,3 +13,6 @@ def test_changes_from_json_view() -> None:
 
     changes = Changes("sha", "change")
     assert Changes.from_json(changes.view()) == changes
+
+    changes = Changes("sha", "change", "pkgbuild", "head")
+    assert Changes.from_json(changes.view()) == changes
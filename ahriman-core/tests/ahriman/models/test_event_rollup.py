@@ -0,0 +1,122 @@
+import pytest
+
+from ahriman.models.event_rollup import EventRollup
+
+
+def test_max() -> None:
+    """
+    must return maximal duration
+    """
+    assert EventRollup(event="event", object_id="object", created=0, took_max=3.0).max == 3.0
+
+
+def test_mean() -> None:
+    """
+    must return mean duration
+    """
+    assert EventRollup(event="event", object_id="object", created=0, took_count=3, took_sum=6.0).mean == 2.0
+
+
+def test_mean_empty() -> None:
+    """
+    must return None as mean duration if there are no durations
+    """
+    assert EventRollup(event="event", object_id="object", created=0).mean is None
+
+
+def test_min() -> None:
+    """
+    must return minimal duration
+    """
+    assert EventRollup(event="event", object_id="object", created=0, took_min=1.0).min == 1.0
+
+
+def test_st_dev() -> None:
+    """
+    must return standard deviation of durations
+    """
+    rollup = EventRollup(event="event", object_id="object", created=0, took_count=3, took_sum=6.0, took_squares=14.0)
+    assert rollup.st_dev == pytest.approx(1.0)
+
+
+def test_st_dev_empty() -> None:
+    """
+    must return None as standard deviation if there are no durations
+    """
+    assert EventRollup(event="event", object_id="object", created=0).st_dev is None
+
+
+def test_st_dev_single() -> None:
+    """
+    must return 0 as standard deviation if there is single duration
+    """
+    rollup = EventRollup(event="event", object_id="object", created=0, took_count=1, took_sum=1.0, took_squares=1.0)
+    assert rollup.st_dev == 0.0
+
+
+def test_total() -> None:
+    """
+    must return amount of durations
+    """
+    assert EventRollup(event="event", object_id="object", created=0, count=3, took_count=2).total == 2
+
+
+def test_from_json_view() -> None:
+    """
+    must construct same object from json
+    """
+    rollup = EventRollup(event="event", object_id="object", created=0, count=2, took_count=1, took_sum=1.0,
+                         took_squares=1.0, took_min=1.0, took_max=1.0)
+    assert EventRollup.from_json(rollup.view()) == rollup
+
+
+def test_bucket() -> None:
+    """
+    must return bucket start
+    """
+    assert EventRollup.bucket(EventRollup.BUCKET + 42) == EventRollup.BUCKET
+    assert EventRollup.bucket(EventRollup.BUCKET - 0.5) == 0
+
+
+def test_is_aligned() -> None:
+    """
+    must check if timestamp is aligned to bucket boundary
+    """
+    assert EventRollup.is_aligned(None)
+    assert EventRollup.is_aligned(EventRollup.BUCKET)
+    assert not EventRollup.is_aligned(EventRollup.BUCKET + 1)
+
+
+def test_merge() -> None:
+    """
+    must merge rollups
+    """
+    left = EventRollup(event="event", object_id="object", created=EventRollup.BUCKET, count=2, took_count=1,
+                       took_sum=2.0, took_squares=4.0, took_min=2.0, took_max=2.0)
+    right = EventRollup(event="event", object_id="object 2", created=0, count=3, took_count=2,
+                        took_sum=4.0, took_squares=10.0, took_min=1.0, took_max=3.0)
+
+    assert left.merge(right) == EventRollup(event="event", object_id="object", created=0, count=5, took_count=3,
+                                            took_sum=6.0, took_squares=14.0, took_min=1.0, took_max=3.0)
+
+
+def test_merge_empty() -> None:
+    """
+    must merge rollups without durations
+    """
+    left = EventRollup(event="event", object_id="object", created=0, count=1)
+    right = EventRollup(event="event", object_id="object", created=0, count=1, took_count=1, took_sum=1.0,
+                        took_squares=1.0, took_min=1.0, took_max=1.0)
+
+    merged = left.merge(right)
+    assert merged.count == 2
+    assert merged.took_min == 1.0
+    assert merged.took_max == 1.0
+
+
+def test_bool() -> None:
+    """
+    must correctly define if rollup contains durations
+    """
+    assert EventRollup(event="event", object_id="object", created=0, took_count=1)
+    assert not EventRollup(event="event", object_id="object", created=0, count=1)
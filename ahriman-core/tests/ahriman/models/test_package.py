@@ -1,7 +1,10 @@
 import copy
+import json
+import tracemalloc
 
 from pathlib import Path
 from pytest_mock import MockerFixture
+from typing import Any
 from unittest.mock import MagicMock, PropertyMock, call as MockCall
 
 from ahriman.core.alpm.pacman import Pacman
@@ -11,6 +14,17 @@ from ahriman.models.package_description import PackageDescription
 from ahriman.models.pkgbuild import Pkgbuild
 
 
+def test_post_init(package_ahriman: Package) -> None:
+    """
+    must intern packager name
+    """
+    first = Package(base=package_ahriman.base, version=package_ahriman.version, remote=package_ahriman.remote,
+                    packages={}, packager="".join(["pack", "ager"]))
+    second = Package(base=package_ahriman.base, version=package_ahriman.version, remote=package_ahriman.remote,
+                     packages={}, packager="".join(["pa", "ckager"]))
+    assert first.packager is second.packager
+
+
 def test_depends(package_python_schedule: Package) -> None:
     """
     must return combined list of dependencies
@@ -280,6 +294,35 @@ def test_from_json_view_3(package_tpacpi_bat_git: Package) -> None:
     assert Package.from_json(package_tpacpi_bat_git.view()) == package_tpacpi_bat_git
 
 
+def test_from_json_memory(package_ahriman: Package) -> None:
+    """
+    must keep repository of 5000 packages in less memory than list-backed representation
+    """
+    def document(index: int) -> str:
+        view = package_ahriman.view()
+        description = view["packages"].pop(package_ahriman.base)
+        # dependencies are repeated across packages like in real repositories
+        description["depends"] = [f"dependency{(index * 7 + shift) % 500}" for shift in range(20)]
+        description["make_depends"] = description["depends"][:5]
+        view["base"] = f"package{index}"
+        view["packages"] = {view["base"]: description}
+        return json.dumps(view)
+
+    def peak(factory: Any) -> int:
+        tracemalloc.start()
+        try:
+            _ = factory()
+            _, result = tracemalloc.get_traced_memory()
+            return result
+        finally:
+            tracemalloc.stop()
+
+    documents = [document(index) for index in range(5000)]
+    baseline = peak(lambda: [json.loads(document) for document in documents])
+    compact = peak(lambda: [Package.from_json(json.loads(document)) for document in documents])
+    assert compact < baseline / 2
+
+
 def test_from_official_include_provides(package_ahriman: Package, aur_package_ahriman: AURPackage, pacman: Pacman,
                                         mocker: MockerFixture) -> None:
     """
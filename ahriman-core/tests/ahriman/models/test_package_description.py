@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock
 
 from ahriman.models.aur_package import AURPackage
+from ahriman.models.package import Package
 from ahriman.models.package_description import PackageDescription
 
 
@@ -17,6 +18,21 @@ def test_post_init() -> None:
     ) == PackageDescription(depends=["a"], make_depends=["b"], opt_depends=["c"], check_depends=["d"], provides=["e"])
 
 
+def test_post_init_compact(package_ahriman: Package) -> None:
+    """
+    must store lists as tuples of interned strings
+    """
+    first = PackageDescription(depends=["".join(["py", "thon"])], licenses=["".join(["GP", "L"])])
+    second = PackageDescription(depends=["python>=3"], licenses=["GPL"])
+
+    assert first.depends == ("python",)
+    assert first.depends[0] is second.depends[0]
+    assert first.licenses[0] is second.licenses[0]
+    assert first.groups == ()
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(package_ahriman, "__dict__")
+
+
 def test_filepath(package_description_ahriman: PackageDescription) -> None:
     """
     must generate correct filepath if set
@@ -21,6 +21,14 @@ def test_post_init(remote_source: RemoteSource) -> None:
     assert remote == remote_source
 
 
+def test_post_init_intern(remote_source: RemoteSource) -> None:
+    """
+    must intern shared string values
+    """
+    remote = RemoteSource(source=remote_source.source, path="".join(["."]), branch="".join(["mas", "ter"]))
+    assert remote.branch is RemoteSource(source=remote_source.source, branch="".join(["ma", "ster"])).branch
+
+
 def test_is_remote() -> None:
     """
     must correctly define if source is remote or not
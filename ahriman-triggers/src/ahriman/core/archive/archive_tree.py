@@ -19,12 +19,12 @@
 #
 import datetime
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from ahriman.core.alpm.repo import Repo
 from ahriman.core.log import LazyLogging
-from ahriman.core.utils import package_like, symlink_relative, utcnow, walk
+from ahriman.core.utils import package_like, symlink_relative, utcnow
 from ahriman.models.package import Package
 from ahriman.models.package_description import PackageDescription
 from ahriman.models.repository_paths import RepositoryPaths
@@ -102,6 +102,17 @@ class ArchiveTree(LazyLogging):
                     continue  # directory is not empty
                 path.rmdir()
 
+    def repositories(self) -> Iterator[Path]:
+        """
+        get all dated repositories of the current repository
+
+        Yields:
+            Path: path to the dated repository root
+        """
+        root = self.paths.archive / "repos"
+        pattern = f"*/*/*/{self.repository_id.name}/{self.repository_id.architecture}"
+        yield from filter(lambda path: path.is_dir(), root.glob(pattern))
+
     def repository_for(self, date: datetime.date | None = None) -> Path:
         """
         get full path to repository at the specified date
@@ -132,8 +143,8 @@ class ArchiveTree(LazyLogging):
             packages(list[Package]): list of packages to be updated
         """
         root = self.repository_for()
-        repo = self._repo(root)
 
+        created = []
         for package in packages:
             archive = self.paths.archive_for(package.base)
 
@@ -143,33 +154,45 @@ class ArchiveTree(LazyLogging):
                     continue
 
                 if self._package_symlinks_create(single, root, archive):
-                    repo.add(root / single.filename)
+                    created.append(root / single.filename)
+
+        self._repo(root).add_packages(created)
 
-    def symlinks_fix(self) -> Iterator[Path]:
+    def symlinks_fix(self, package_names: Iterable[str] | None = None) -> Iterator[Path]:
         """
         remove broken symlinks across repositories for all dates
 
+        Args:
+            package_names(Iterable[str] | None, optional): if set, only symlinks of the specified packages will be
+                checked (Default value = None)
+
         Yields:
             Path: path of the sub-repository with removed symlinks
         """
-        for path in walk(self.paths.archive / "repos"):
-            root = path.parent
-            *_, name, architecture = root.parts
-            if self.repository_id.name != name or self.repository_id.architecture != architecture:
-                continue  # we only process same name repositories
-
-            if not package_like(path):
-                continue
-            if not path.is_symlink():
-                continue  # find symlinks only
-            if path.exists():
-                continue  # filter out not broken symlinks
-
-            # here we don't have access to original archive, so we have to guess name based on archive name
-            # normally it should be fine to do so
-            package_name = path.name.rsplit("-", maxsplit=3)[0]
-            self._repo(root).remove(package_name, path)
-            yield path.parent.relative_to(self.paths.archive / "repos")
+        if package_names is not None:
+            package_names = set(package_names)
+            if not package_names:
+                return  # nothing to check
+
+        for root in self.repositories():
+            broken = []
+            for path in filter(package_like, root.iterdir()):
+                # here we don't have access to original archive, so we have to guess name based on archive name
+                # normally it should be fine to do so
+                package_name = path.name.rsplit("-", maxsplit=3)[0]
+                if package_names is not None and package_name not in package_names:
+                    continue
+
+                if not path.is_symlink():
+                    continue  # find symlinks only
+                if path.exists():
+                    continue  # filter out not broken symlinks
+
+                broken.append((package_name, path))
+
+            if broken:
+                self._repo(root).remove_packages(broken)
+                yield root.relative_to(self.paths.archive / "repos")
 
     def tree_create(self) -> None:
         """
@@ -31,6 +31,8 @@ class ArchiveTrigger(Trigger):
     archive repository extension
 
     Attributes:
+        affected_packages(set[str] | None): list of package names, for which archives might have been removed during
+            this run. If ``None`` is set, no results have been processed and all archives will be checked
         paths(RepositoryPaths): repository paths instance
         tree(ArchiveTree): archive tree wrapper
     """
@@ -45,6 +47,7 @@ class ArchiveTrigger(Trigger):
 
         self.paths = configuration.repository_paths
         self.tree = ArchiveTree(self.paths, GPG(configuration).repository_sign_args)
+        self.affected_packages: set[str] | None = None
 
     def on_result(self, result: Result, packages: list[Package]) -> None:
         """
@@ -56,6 +59,11 @@ class ArchiveTrigger(Trigger):
         """
         self.tree.symlinks_create(packages)
 
+        # archives are rotated for updated packages and removed for removed ones
+        self.affected_packages = self.affected_packages or set()
+        for package in result.success + result.removed:
+            self.affected_packages.update(package.packages)
+
     def on_start(self) -> None:
         """
         trigger action which will be called at the start of the application
@@ -66,5 +74,5 @@ class ArchiveTrigger(Trigger):
         """
         trigger action which will be called before the stop of the application
         """
-        repositories = set(self.tree.symlinks_fix())
+        repositories = set(self.tree.symlinks_fix(self.affected_packages))
         self.tree.directories_fix(repositories)
@@ -29,6 +29,18 @@ def test_repository_for(archive_tree: ArchiveTree) -> None:
     assert set(map("{:02d}".format, utcnow().timetuple()[:3])).issubset(path.parts)
 
 
+def test_repositories(archive_tree: ArchiveTree) -> None:
+    """
+    must return dated repositories of the current repository only
+    """
+    today = archive_tree.repository_for()
+    today.mkdir(parents=True)
+    (today.parent / "i686").mkdir()
+    (today.parent.parent / "another-repository" / today.name).mkdir(parents=True)
+
+    assert list(archive_tree.repositories()) == [today]
+
+
 def test_directories_fix(archive_tree: ArchiveTree, mocker: MockerFixture) -> None:
     """
     must remove empty directories recursively
@@ -56,7 +68,7 @@ def test_symlinks_create(archive_tree: ArchiveTree, package_ahriman: Package, pa
     _original_exists = Path.exists
 
     symlinks_mock = mocker.patch("pathlib.Path.symlink_to", side_effect=(None, FileExistsError, FileExistsError))
-    add_mock = mocker.patch("ahriman.core.alpm.repo.Repo.add")
+    add_mock = mocker.patch("ahriman.core.alpm.repo.Repo.add_packages")
     mocker.patch("pathlib.Path.glob", autospec=True, side_effect=lambda path, name: [path / name[:-1]])
 
     archive_tree.symlinks_create([package_ahriman, package_python_schedule])
@@ -75,9 +87,9 @@ def test_symlinks_create(archive_tree: ArchiveTree, package_ahriman: Package, pa
         for package in (package_ahriman, package_python_schedule)
         for single in package.packages.values()
     ])
-    add_mock.assert_called_once_with(
+    add_mock.assert_called_once_with([
         archive_tree.repository_for() / package_ahriman.packages[package_ahriman.base].filename
-    )
+    ])
 
 
 def test_symlinks_create_empty_filename(archive_tree: ArchiveTree, package_ahriman: Package,
@@ -87,9 +99,11 @@ def test_symlinks_create_empty_filename(archive_tree: ArchiveTree, package_ahrim
     """
     package_ahriman.packages[package_ahriman.base].filename = None
     symlinks_mock = mocker.patch("pathlib.Path.symlink_to")
+    add_mock = mocker.patch("ahriman.core.alpm.repo.Repo.add_packages")
 
     archive_tree.symlinks_create([package_ahriman])
     symlinks_mock.assert_not_called()
+    add_mock.assert_called_once_with([])
 
 
 def test_symlinks_fix(archive_tree: ArchiveTree, mocker: MockerFixture) -> None:
@@ -103,49 +117,72 @@ def test_symlinks_fix(archive_tree: ArchiveTree, mocker: MockerFixture) -> None:
             return True
         return _original_exists(path)
 
-    mocker.patch("pathlib.Path.is_symlink", side_effect=[True, True, False])
+    mocker.patch("pathlib.Path.is_symlink", side_effect=[True, True, True, False])
     mocker.patch("pathlib.Path.exists", autospec=True, side_effect=exists_mock)
-    walk_mock = mocker.patch("ahriman.core.archive.archive_tree.walk", return_value=[
+    mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.repositories",
+                 return_value=[archive_tree.repository_for()])
+    mocker.patch("pathlib.Path.iterdir", return_value=[
         archive_tree.repository_for() / filename
         for filename in (
             "symlink-1.0.0-1-x86_64.pkg.tar.zst",
             "symlink-1.0.0-1-x86_64.pkg.tar.zst.sig",
             "broken_symlink-1.0.0-1-x86_64.pkg.tar.zst",
+            "broken_symlink-1.0.1-1-x86_64.pkg.tar.zst",
             "file-1.0.0-1-x86_64.pkg.tar.zst",
         )
     ])
-    remove_mock = mocker.patch("ahriman.core.alpm.repo.Repo.remove")
+    remove_mock = mocker.patch("ahriman.core.alpm.repo.Repo.remove_packages")
 
     assert list(archive_tree.symlinks_fix()) == [
         archive_tree.repository_for().relative_to(archive_tree.paths.archive / "repos"),
     ]
-    walk_mock.assert_called_once_with(archive_tree.paths.archive / "repos")
-    remove_mock.assert_called_once_with(
-        "broken_symlink", archive_tree.repository_for() / "broken_symlink-1.0.0-1-x86_64.pkg.tar.zst")
+    remove_mock.assert_called_once_with([
+        ("broken_symlink", archive_tree.repository_for() / "broken_symlink-1.0.0-1-x86_64.pkg.tar.zst"),
+        ("broken_symlink", archive_tree.repository_for() / "broken_symlink-1.0.1-1-x86_64.pkg.tar.zst"),
+    ])
 
 
-def test_symlinks_fix_foreign_repository(archive_tree: ArchiveTree, mocker: MockerFixture) -> None:
+def test_symlinks_fix_package_names(archive_tree: ArchiveTree, mocker: MockerFixture) -> None:
     """
-    must skip symlinks check if repository name or architecture doesn't match
+    must check only symlinks of the specified packages
     """
-    _original_exists = Path.exists
-
-    def exists_mock(path: Path) -> bool:
-        if path.name.startswith("symlink"):
-            return True
-        return _original_exists(path)
-
-    mocker.patch("pathlib.Path.is_symlink", side_effect=[True, True, False])
-    mocker.patch("pathlib.Path.exists", autospec=True, side_effect=exists_mock)
-    mocker.patch("ahriman.core.archive.archive_tree.walk", return_value=[
-        archive_tree.repository_for().with_name("i686") / filename
+    mocker.patch("pathlib.Path.is_symlink", return_value=True)
+    mocker.patch("pathlib.Path.exists", return_value=False)
+    mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.repositories",
+                 return_value=[archive_tree.repository_for()])
+    mocker.patch("pathlib.Path.iterdir", return_value=[
+        archive_tree.repository_for() / filename
         for filename in (
-            "symlink-1.0.0-1-x86_64.pkg.tar.zst",
             "broken_symlink-1.0.0-1-x86_64.pkg.tar.zst",
-            "file-1.0.0-1-x86_64.pkg.tar.zst",
+            "another_symlink-1.0.0-1-x86_64.pkg.tar.zst",
         )
     ])
-    remove_mock = mocker.patch("ahriman.core.alpm.repo.Repo.remove")
+    remove_mock = mocker.patch("ahriman.core.alpm.repo.Repo.remove_packages")
+
+    assert list(archive_tree.symlinks_fix(["another_symlink"]))
+    remove_mock.assert_called_once_with([
+        ("another_symlink", archive_tree.repository_for() / "another_symlink-1.0.0-1-x86_64.pkg.tar.zst"),
+    ])
+
+
+def test_symlinks_fix_package_names_empty(archive_tree: ArchiveTree, mocker: MockerFixture) -> None:
+    """
+    must skip symlinks check if empty package list is supplied
+    """
+    repositories_mock = mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.repositories")
+    assert list(archive_tree.symlinks_fix([])) == []
+    repositories_mock.assert_not_called()
+
+
+def test_symlinks_fix_no_broken(archive_tree: ArchiveTree, mocker: MockerFixture) -> None:
+    """
+    must not call repo-remove if there are no broken symlinks
+    """
+    mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.repositories",
+                 return_value=[archive_tree.repository_for()])
+    mocker.patch("pathlib.Path.iterdir", return_value=[archive_tree.repository_for() / "file-1.0.0-1-any.pkg.tar.zst"])
+    mocker.patch("pathlib.Path.is_symlink", return_value=False)
+    remove_mock = mocker.patch("ahriman.core.alpm.repo.Repo.remove_packages")
 
     assert list(archive_tree.symlinks_fix()) == []
     remove_mock.assert_not_called()
@@ -13,6 +13,19 @@ def test_on_result(archive_trigger: ArchiveTrigger, package_ahriman: Package, mo
     symlinks_mock = mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.symlinks_create")
     archive_trigger.on_result(Result(), [package_ahriman])
     symlinks_mock.assert_called_once_with([package_ahriman])
+    assert archive_trigger.affected_packages == set()
+
+
+def test_on_result_affected_packages(archive_trigger: ArchiveTrigger, package_ahriman: Package,
+                                     package_python_schedule: Package, mocker: MockerFixture) -> None:
+    """
+    must collect packages which archives might have been removed
+    """
+    mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.symlinks_create")
+
+    archive_trigger.on_result(Result(updated=[package_ahriman]), [package_ahriman])
+    archive_trigger.on_result(Result(removed=[package_python_schedule]), [package_ahriman])
+    assert archive_trigger.affected_packages == {package_ahriman.base, *package_python_schedule.packages}
 
 
 def test_on_start(archive_trigger: ArchiveTrigger, mocker: MockerFixture) -> None:
@@ -33,5 +46,18 @@ def test_on_stop(archive_trigger: ArchiveTrigger, mocker: MockerFixture) -> None
     directories_mock = mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.directories_fix")
 
     archive_trigger.on_stop()
-    symlinks_mock.assert_called_once_with()
+    symlinks_mock.assert_called_once_with(None)
     directories_mock.assert_called_once_with({local})
+
+
+def test_on_stop_affected_packages(archive_trigger: ArchiveTrigger, package_ahriman: Package,
+                                   mocker: MockerFixture) -> None:
+    """
+    must fix broken symlinks only for affected packages
+    """
+    symlinks_mock = mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.symlinks_fix", return_value=[])
+    mocker.patch("ahriman.core.archive.archive_tree.ArchiveTree.directories_fix")
+    archive_trigger.affected_packages = {package_ahriman.base}
+
+    archive_trigger.on_stop()
+    symlinks_mock.assert_called_once_with({package_ahriman.base})
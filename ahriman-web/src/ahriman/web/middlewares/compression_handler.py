@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from aiohttp import hdrs
+from aiohttp.typedefs import Middleware
+from aiohttp.web import Request, Response, StreamResponse, middleware
+
+from ahriman.web.middlewares import HandlerType
+
+
+__all__ = ["compression_handler"]
+
+
+def compression_handler(minimal_size: int) -> Middleware:
+    """
+    middleware to compress response bodies. Compression method (either gzip or deflate) is negotiated based on
+    ``Accept-Encoding`` header sent by client
+
+    Args:
+        minimal_size(int): minimal size of the response body in bytes to be compressed
+
+    Returns:
+        Middleware: built middleware
+    """
+    @middleware
+    async def handle(request: Request, handler: HandlerType) -> StreamResponse:
+        response = await handler(request)
+
+        if not isinstance(response, Response) or not isinstance(response.body, bytes):
+            return response  # streamed responses enable compression by themselves
+
+        if len(response.body) < minimal_size or hdrs.CONTENT_ENCODING in response.headers:
+            return response
+
+        response.enable_compression()
+        return response
+
+    return handle
@@ -32,7 +32,9 @@ __all__ = ["etag_handler"]
 def etag_handler() -> Middleware:
     """
     middleware to handle ETag header for conditional requests. It computes ETag from the response body
-    and returns 304 Not Modified if the client sends a matching ``If-None-Match`` header
+    and returns 304 Not Modified if the client sends a matching ``If-None-Match`` header. ETag is marked as weak
+    if the response is compressed, because compressed content depends on negotiated encoding. Streamed responses
+    are not processed
 
     Returns:
         Middleware: built middleware
@@ -50,10 +52,11 @@ def etag_handler() -> Middleware:
         if request.method not in ("GET", "HEAD"):
             return response
 
-        etag = ETag(value=hashlib.md5(response.body, usedforsecurity=False).hexdigest())
+        etag = ETag(value=hashlib.md5(response.body, usedforsecurity=False).hexdigest(), is_weak=response.compression)
         response.etag = etag
 
-        if request.if_none_match is not None and etag in request.if_none_match:
+        # If-None-Match uses weak comparison, i.e. only values must be compared
+        if request.if_none_match is not None and any(tag.value == etag.value for tag in request.if_none_match):
             raise HTTPNotModified(headers={"ETag": response.headers["ETag"]})
 
         return response
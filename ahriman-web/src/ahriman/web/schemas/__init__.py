@@ -29,6 +29,8 @@ from ahriman.web.schemas.counters_schema import CountersSchema
 from ahriman.web.schemas.dependencies_schema import DependenciesSchema
 from ahriman.web.schemas.error_schema import ErrorSchema
 from ahriman.web.schemas.event_bus_filter_schema import EventBusFilterSchema
+from ahriman.web.schemas.event_rollup_schema import EventRollupSchema
+from ahriman.web.schemas.event_rollup_search_schema import EventRollupSearchSchema
 from ahriman.web.schemas.event_schema import EventSchema
 from ahriman.web.schemas.event_search_schema import EventSearchSchema
 from ahriman.web.schemas.file_schema import FileSchema
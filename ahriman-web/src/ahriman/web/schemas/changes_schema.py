@@ -28,6 +28,10 @@ class ChangesSchema(Schema):
     changes = fields.String(metadata={
         "description": "Package changes in patch format",
     })
+    head_commit_sha = fields.String(metadata={
+        "description": "Commit hash of the sources HEAD at which changes have been calculated",
+        "example": "2d0ca5b7b0d3d4c4e8a6e8ffc2e2cd6e9b5e0e1f",
+    })
     last_commit_sha = fields.String(metadata={
         "description": "Last recorded commit hash",
         "example": "f1875edca1eb8fc0e55c41d1cae5fa05b6b7c6",
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from ahriman.models.event import EventType
+from ahriman.web.apispec import Schema, fields
+
+
+class EventRollupSchema(Schema):
+    """
+    response daily aggregated events schema
+    """
+
+    count = fields.Integer(required=True, metadata={
+        "description": "Amount of events",
+        "example": 42,
+    })
+    created = fields.Integer(required=True, metadata={
+        "description": "Day start timestamp",
+        "example": 1680480000,
+    })
+    event = fields.String(required=True, metadata={
+        "description": "Event type",
+        "example": EventType.PackageUpdated,
+    })
+    object_id = fields.String(required=True, metadata={
+        "description": "Event object identifier",
+        "example": "ahriman",
+    })
+    took_count = fields.Integer(required=True, metadata={
+        "description": "Amount of events which have duration",
+        "example": 40,
+    })
+    took_max = fields.Float(allow_none=True, metadata={
+        "description": "Maximal event duration if any",
+        "example": 120.5,
+    })
+    took_min = fields.Float(allow_none=True, metadata={
+        "description": "Minimal event duration if any",
+        "example": 10.2,
+    })
+    took_squares = fields.Float(required=True, metadata={
+        "description": "Sum of squared event durations",
+        "example": 145300.5,
+    })
+    took_sum = fields.Float(required=True, metadata={
+        "description": "Sum of event durations",
+        "example": 2012.3,
+    })
@@ -17,15 +17,18 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
+import itertools
+
 from aiohttp.web import HTTPBadRequest, HTTPNotFound, Request, Response, StreamResponse, View, json_response
 from aiohttp_cors import CorsViewMixin
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from typing import Any, ClassVar, TypeVar
 
 from ahriman.core.auth import Auth
 from ahriman.core.configuration import Configuration
 from ahriman.core.distributed import WorkersCache
 from ahriman.core.exceptions import UnknownPackageError
+from ahriman.core.json_serializer import json_dumps
 from ahriman.core.sign.gpg import GPG
 from ahriman.core.spawn import Spawn
 from ahriman.core.status.watcher import Watcher
@@ -43,11 +46,16 @@ class BaseView(View, CorsViewMixin):
     base web view to make things typed
 
     Attributes:
+        JSON_CHUNK_SIZE(int): (class attribute) amount of items serialized at once in streamed responses
         OPTIONS_PERMISSION(UserAccess): (class attribute) options permissions of self
+        RESPONSE_BUFFER_SIZE(int): (class attribute) default size of the streamed response in bytes, which is
+            buffered in memory
         ROUTES(list[str]): (class attribute) list of supported routes
     """
 
+    JSON_CHUNK_SIZE: ClassVar[int] = 100
     OPTIONS_PERMISSION: ClassVar[UserAccess] = UserAccess.Unauthorized
+    RESPONSE_BUFFER_SIZE: ClassVar[int] = 1024 * 1024
     ROUTES: ClassVar[list[str]] = []
 
     @property
@@ -163,6 +171,24 @@ class BaseView(View, CorsViewMixin):
             raise KeyError(f"Key {key} is missing or empty") from None
         return value
 
+    @staticmethod
+    def json_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[bytes]:
+        """
+        lazily serialize items into JSON array
+
+        Args:
+            items(Iterable[Any]): JSON objects to serialize
+            chunk_size(int): amount of items serialized at once
+
+        Yields:
+            bytes: next part of the serialized JSON array
+        """
+        separator = b"["
+        for batch in itertools.batched(items, chunk_size):
+            yield separator + json_dumps(filter_json(list(batch)))[1:-1]  # strip array brackets
+            separator = b","
+        yield b"]" if separator == b"," else b"[]"
+
     @staticmethod
     def json_response(data: dict[str, Any] | list[Any], **kwargs: Any) -> Response:
         """
@@ -175,7 +201,46 @@ class BaseView(View, CorsViewMixin):
         Returns:
             Response: generated response object
         """
-        return json_response(filter_json(data), **kwargs)
+        return json_response(body=json_dumps(filter_json(data)), **kwargs)
+
+    async def json_stream_response(self, items: Iterable[Any]) -> StreamResponse:
+        """
+        convert list of items to JSON array and return response object. Items are serialized lazily and the response
+        is buffered in memory until it reaches ``web.response_buffer_size`` bytes. Buffered responses are returned as
+        usual :class:`aiohttp.web.Response`, so they are processed by ETag and compression middlewares. Otherwise,
+        the response is sent by chunks without ETag header
+
+        Args:
+            items(Iterable[Any]): JSON objects to serialize
+
+        Returns:
+            StreamResponse: generated response object
+        """
+        buffer_size = self.configuration.getint("web", "response_buffer_size", fallback=self.RESPONSE_BUFFER_SIZE)
+
+        chunks = self.json_chunks(items, self.JSON_CHUNK_SIZE)
+        buffer: list[bytes] = []
+        buffered = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered > buffer_size:
+                break
+        else:
+            return Response(body=b"".join(buffer), content_type="application/json", charset="utf-8")
+
+        response = StreamResponse()
+        response.content_type = "application/json"
+        response.charset = "utf-8"
+        response.enable_compression()
+        await response.prepare(self.request)
+
+        if self.request.method != "HEAD":  # HEAD response must not contain body
+            for chunk in itertools.chain(buffer, chunks):
+                await response.write(chunk)
+        await response.write_eof()
+
+        return response
 
     # pylint: disable=not-callable,protected-access
     async def head(self) -> StreamResponse:
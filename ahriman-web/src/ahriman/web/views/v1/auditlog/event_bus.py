@@ -17,13 +17,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
-import json
-
 from aiohttp.web import HTTPBadRequest, Request, Response, StreamResponse
 from aiohttp_sse import EventSourceResponse, sse_response
 from asyncio import Queue, QueueShutDown, wait_for
 from typing import ClassVar
 
+from ahriman.core.json_serializer import json_dumps
 from ahriman.core.status.event_bus import SSEvent
 from ahriman.models.event import EventType
 from ahriman.models.user_access import UserAccess
@@ -93,7 +92,7 @@ class EventBusView(BaseView):
             except QueueShutDown:
                 break
 
-            await response.send(json.dumps(data), event=event_type)
+            await response.send(json_dumps(data).decode("utf8"), event=event_type)
 
     def _topics(self) -> list[EventType] | None:
         """
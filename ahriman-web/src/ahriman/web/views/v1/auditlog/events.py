@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
-from aiohttp.web import HTTPBadRequest, HTTPNoContent, Response
+from aiohttp.web import HTTPBadRequest, HTTPNoContent, StreamResponse
 from typing import ClassVar
 
 from ahriman.models.event import Event
@@ -48,12 +48,12 @@ class EventsView(BaseView):
         schema=EventSchema(many=True),
         query_schema=EventSearchSchema,
     )
-    async def get(self) -> Response:
+    async def get(self) -> StreamResponse:
         """
         get events list
 
         Returns:
-            Response: 200 with workers list on success
+            StreamResponse: 200 with workers list on success
         """
         limit, offset = self.page()
         event = self.request.query.get("event") or None
@@ -68,9 +68,9 @@ class EventsView(BaseView):
             raise HTTPBadRequest(reason=str(ex))
 
         events = await self.service().event_get(event, object_id, from_date, to_date, limit, offset)
-        response = [event.view() for event in events]
+        response = (event.view() for event in events)
 
-        return self.json_response(response)
+        return await self.json_stream_response(response)
 
     @apidocs(
         tags=["Audit log"],
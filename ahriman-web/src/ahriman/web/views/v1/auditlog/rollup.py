@@ -0,0 +1,73 @@
+#
+# Copyright (c) 2021-2026 ahriman team.
+#
+# This file is part of ahriman
+# (see https://github.com/arcan1s/ahriman).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+from aiohttp.web import HTTPBadRequest, Response
+from typing import ClassVar
+
+from ahriman.models.user_access import UserAccess
+from ahriman.web.apispec.decorators import apidocs
+from ahriman.web.schemas import EventRollupSchema, EventRollupSearchSchema
+from ahriman.web.views.base import BaseView
+
+
+class EventRollupView(BaseView):
+    """
+    daily aggregated audit log view
+
+    Attributes:
+        GET_PERMISSION(UserAccess): (class attribute) get permissions of self
+    """
+
+    GET_PERMISSION: ClassVar[UserAccess] = UserAccess.Full
+    ROUTES = ["/api/v1/events/rollup"]
+
+    @apidocs(
+        tags=["Audit log"],
+        summary="Get aggregated events",
+        description="Retrieve events from audit log aggregated by day",
+        permission=GET_PERMISSION,
+        error_400_enabled=True,
+        schema=EventRollupSchema(many=True),
+        query_schema=EventRollupSearchSchema,
+    )
+    async def get(self) -> Response:
+        """
+        get aggregated events list
+
+        Returns:
+            Response: 200 with aggregated events list on success
+
+        Raises:
+            HTTPBadRequest: if bad data is supplied
+        """
+        event = self.request.query.get("event") or None
+        object_id = self.request.query.get("object_id") or None
+        try:
+            from_date = to_date = None
+            if (value := self.request.query.get("from_date")) is not None:
+                from_date = int(value)
+            if (value := self.request.query.get("to_date")) is not None:
+                to_date = int(value)
+        except ValueError as ex:
+            raise HTTPBadRequest(reason=str(ex))
+
+        rollups = await self.service().event_rollup_get(event, object_id, from_date, to_date)
+        response = [rollup.view() for rollup in rollups]
+
+        return self.json_response(response)
@@ -22,7 +22,7 @@ from typing import ClassVar
 
 from ahriman.models.user_access import UserAccess
 from ahriman.web.apispec.decorators import apidocs
-from ahriman.web.schemas import PackageNameSchema, PackageSchema, RepositoryIdSchema
+from ahriman.web.schemas import PackageNameSchema, PackageSchema, PaginationSchema
 from ahriman.web.views.base import BaseView
 from ahriman.web.views.status_view_guard import StatusViewGuard
 
@@ -43,10 +43,11 @@ class Archives(StatusViewGuard, BaseView):
         summary="Get package archives",
         description="Retrieve built package archives for the base",
         permission=GET_PERMISSION,
+        error_400_enabled=True,
         error_404_description="Package base and/or repository are unknown",
         schema=PackageSchema(many=True),
         match_schema=PackageNameSchema,
-        query_schema=RepositoryIdSchema,
+        query_schema=PaginationSchema,
     )
     async def get(self) -> Response:
         """
@@ -56,10 +57,12 @@ class Archives(StatusViewGuard, BaseView):
             Response: 200 with package archives on success
 
         Raises:
+            HTTPBadRequest: if supplied parameters are invalid
             HTTPNotFound: if no package was found
         """
         package_base = self.request.match_info["package"]
+        limit, offset = self.page()
 
-        archives = await self.service(package_base=package_base).package_archives(package_base)
+        archives = await self.service(package_base=package_base).package_archives(package_base, limit, offset)
 
         return self.json_response([archive.view() for archive in archives])
@@ -93,10 +93,11 @@ class ChangesView(StatusViewGuard, BaseView):
             last_commit_sha = data.get("last_commit_sha")  # empty/null meant removal
             change = data.get("changes")
             pkgbuild = data.get("pkgbuild")
+            head_commit_sha = data.get("head_commit_sha")
         except Exception as ex:
             raise HTTPBadRequest(reason=str(ex))
 
-        changes = Changes(last_commit_sha, change, pkgbuild)
+        changes = Changes(last_commit_sha, change, pkgbuild, head_commit_sha)
         await self.service().package_changes_update(package_base, changes)
 
         raise HTTPNoContent
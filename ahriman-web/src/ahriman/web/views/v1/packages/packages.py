@@ -19,7 +19,7 @@
 #
 import itertools
 
-from aiohttp.web import HTTPNoContent, Response
+from aiohttp.web import HTTPNoContent, StreamResponse
 from collections.abc import Callable
 from typing import ClassVar
 
@@ -56,12 +56,12 @@ class PackagesView(StatusViewGuard, BaseView):
         schema=PackageStatusSchema(many=True),
         query_schema=PaginationSchema,
     )
-    async def get(self) -> Response:
+    async def get(self) -> StreamResponse:
         """
         get current packages status
 
         Returns:
-            Response: 200 with package description on success
+            StreamResponse: 200 with package description on success
         """
         limit, offset = self.page()
         stop = offset + limit if limit >= 0 else None
@@ -70,15 +70,15 @@ class PackagesView(StatusViewGuard, BaseView):
         packages = await self.service(repository_id).packages()
 
         comparator: Callable[[tuple[Package, BuildStatus]], Comparable] = lambda items: items[0].base
-        response = [
+        response = (
             {
                 "package": package.view(),
                 "status": status.view(),
                 "repository": repository_id.view(),
             } for package, status in itertools.islice(sorted(packages, key=comparator), offset, stop)
-        ]
+        )
 
-        return self.json_response(response)
+        return await self.json_stream_response(response)
 
     @apidocs(
         tags=["Packages"],
@@ -19,7 +19,7 @@
 #
 import itertools
 
-from aiohttp.web import Response
+from aiohttp.web import StreamResponse
 from dataclasses import replace
 from typing import ClassVar
 
@@ -52,12 +52,12 @@ class LogsView(StatusViewGuard, BaseView):
         match_schema=PackageNameSchema,
         query_schema=LogsSearchSchema,
     )
-    async def get(self) -> Response:
+    async def get(self) -> StreamResponse:
         """
         get last package logs
 
         Returns:
-            Response: 200 with package logs on success
+            StreamResponse: 200 with package logs on success
 
         Raises:
             HTTPNotFound: if package base is unknown
@@ -78,5 +78,5 @@ class LogsView(StatusViewGuard, BaseView):
                 for _, log_records in itertools.groupby(logs, lambda log_record: log_record.log_record_id)
             ]
 
-        response = [log_record.view() for log_record in logs]
-        return self.json_response(response)
+        response = (log_record.view() for log_record in logs)
+        return await self.json_stream_response(response)
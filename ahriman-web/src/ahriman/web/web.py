@@ -39,6 +39,7 @@ from ahriman.models.repository_id import RepositoryId
 from ahriman.web.apispec.info import setup_apispec
 from ahriman.web.cors import setup_cors
 from ahriman.web.keys import AuthKey, ConfigurationKey, SpawnKey, WatcherKey, WorkersKey
+from ahriman.web.middlewares.compression_handler import compression_handler
 from ahriman.web.middlewares.etag_handler import etag_handler
 from ahriman.web.middlewares.exception_handler import exception_handler
 from ahriman.web.middlewares.metrics_handler import metrics_handler
@@ -188,6 +189,8 @@ def setup_server(configuration: Configuration, spawner: Spawn, repositories: lis
     application.middlewares.append(request_id_handler())
     application.middlewares.append(exception_handler(application.logger))
     application.middlewares.append(etag_handler())
+    application.middlewares.append(
+        compression_handler(configuration.getint("web", "compression_min_size", fallback=1024)))
     application.middlewares.append(metrics_handler())
 
     application.logger.info("setup routes")
@@ -0,0 +1,66 @@
+import pytest
+
+from aiohttp.web import Response, StreamResponse
+from unittest.mock import AsyncMock
+
+from ahriman.web.middlewares.compression_handler import compression_handler
+
+
+async def test_compression_handler() -> None:
+    """
+    must enable compression for large responses
+    """
+    request = pytest.helpers.request("", "", "GET")
+    request_handler = AsyncMock(return_value=Response(body=b"hello"))
+
+    handler = compression_handler(5)
+    result = await handler(request, request_handler)
+    assert result.compression
+
+
+async def test_compression_handler_small() -> None:
+    """
+    must skip compression for small responses
+    """
+    request = pytest.helpers.request("", "", "GET")
+    request_handler = AsyncMock(return_value=Response(body=b"hello"))
+
+    handler = compression_handler(6)
+    result = await handler(request, request_handler)
+    assert not result.compression
+
+
+async def test_compression_handler_encoded() -> None:
+    """
+    must skip compression for already encoded responses
+    """
+    request = pytest.helpers.request("", "", "GET")
+    request_handler = AsyncMock(return_value=Response(body=b"hello", headers={"Content-Encoding": "gzip"}))
+
+    handler = compression_handler(0)
+    result = await handler(request, request_handler)
+    assert not result.compression
+
+
+async def test_compression_handler_skip_no_body() -> None:
+    """
+    must skip compression for responses without body
+    """
+    request = pytest.helpers.request("", "", "GET")
+    request_handler = AsyncMock(return_value=Response())
+
+    handler = compression_handler(0)
+    result = await handler(request, request_handler)
+    assert not result.compression
+
+
+async def test_compression_handler_skip_stream() -> None:
+    """
+    must skip streaming responses
+    """
+    request = pytest.helpers.request("", "", "GET")
+    request_handler = AsyncMock(return_value=StreamResponse())
+
+    handler = compression_handler(0)
+    result = await handler(request, request_handler)
+    assert not result.compression
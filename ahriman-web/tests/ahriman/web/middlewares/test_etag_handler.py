@@ -83,3 +83,32 @@ async def test_etag_handler_skip_stream() -> None:
     handler = etag_handler()
     result = await handler(request, request_handler)
     assert "ETag" not in result.headers
+
+
+async def test_etag_handler_weak() -> None:
+    """
+    must set weak ETag for compressed responses
+    """
+    request = pytest.helpers.request("", "", "GET")
+    request.if_none_match = None
+    response = Response(body=b"hello")
+    response.enable_compression()
+    request_handler = AsyncMock(return_value=response)
+
+    handler = etag_handler()
+    result = await handler(request, request_handler)
+    assert result.etag.is_weak
+
+
+async def test_etag_handler_not_modified_weak() -> None:
+    """
+    must use weak comparison for If-None-Match header
+    """
+    body = b"hello"
+    request = pytest.helpers.request("", "", "GET")
+    request.if_none_match = (ETag(value=hashlib.md5(body, usedforsecurity=False).hexdigest(), is_weak=True),)
+    request_handler = AsyncMock(return_value=Response(body=body))
+
+    handler = etag_handler()
+    with pytest.raises(HTTPNotModified):
+        await handler(request, request_handler)
@@ -0,0 +1 @@
+# schema testing goes in view class tests
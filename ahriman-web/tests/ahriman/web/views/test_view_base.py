@@ -1,7 +1,8 @@
+import json
 import pytest
 
 from aiohttp.test_utils import TestClient
-from aiohttp.web import HTTPBadRequest, HTTPNotFound
+from aiohttp.web import Application, HTTPBadRequest, HTTPNotFound, Response
 from multidict import MultiDict
 from pytest_mock import MockerFixture
 from unittest.mock import AsyncMock
@@ -255,3 +256,65 @@ async def test_username_request_exception(base: BaseView) -> None:
     must not fail in case if it cannot read request
     """
     assert await base.username() is None
+
+
+def test_json_chunks() -> None:
+    """
+    must serialize items into JSON array by chunks
+    """
+    items = [{"key": index, "none": None} for index in range(5)]
+    chunks = list(BaseView.json_chunks(items, 2))
+    assert len(chunks) == 4
+    assert json.loads(b"".join(chunks)) == [{"key": index} for index in range(5)]
+
+
+def test_json_chunks_empty() -> None:
+    """
+    must serialize empty array
+    """
+    assert b"".join(BaseView.json_chunks([], 2)) == b"[]"
+
+
+async def test_json_stream_response(base: BaseView) -> None:
+    """
+    must return buffered response if it fits memory budget
+    """
+    response = await base.json_stream_response({"key": index} for index in range(5))
+    assert isinstance(response, Response)
+    assert json.loads(response.body) == [{"key": index} for index in range(5)]
+    assert response.content_type == "application/json"
+
+
+async def test_json_stream_response_streamed(base: BaseView, mocker: MockerFixture) -> None:
+    """
+    must stream response if it doesn't fit memory budget
+    """
+    base.configuration.set_option("web", "response_buffer_size", "0")
+    prepare_mock = mocker.patch("aiohttp.web.StreamResponse.prepare")
+    write_mock = mocker.patch("aiohttp.web.StreamResponse.write")
+    write_eof_mock = mocker.patch("aiohttp.web.StreamResponse.write_eof")
+
+    response = await base.json_stream_response({"key": index} for index in range(5))
+    assert not isinstance(response, Response)
+    assert response.content_type == "application/json"
+    assert response.compression
+    prepare_mock.assert_called_once_with(base.request)
+    assert json.loads(b"".join(call.args[0] for call in write_mock.call_args_list)) == [
+        {"key": index} for index in range(5)
+    ]
+    write_eof_mock.assert_called_once_with()
+
+
+async def test_json_stream_response_streamed_head(application: Application, mocker: MockerFixture) -> None:
+    """
+    must not write body of streamed HEAD response
+    """
+    base = BaseView(pytest.helpers.request(application, "", "HEAD"))
+    base.configuration.set_option("web", "response_buffer_size", "0")
+    mocker.patch("aiohttp.web.StreamResponse.prepare")
+    write_mock = mocker.patch("aiohttp.web.StreamResponse.write")
+    write_eof_mock = mocker.patch("aiohttp.web.StreamResponse.write_eof")
+
+    await base.json_stream_response({"key": index} for index in range(5))
+    write_mock.assert_not_called()
+    write_eof_mock.assert_called_once_with()
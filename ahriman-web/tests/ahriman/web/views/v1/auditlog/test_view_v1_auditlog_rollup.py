@@ -0,0 +1,77 @@
+import pytest
+
+from aiohttp.test_utils import TestClient
+
+from ahriman.models.event import Event
+from ahriman.models.event_rollup import EventRollup
+from ahriman.models.user_access import UserAccess
+from ahriman.web.views.v1.auditlog.rollup import EventRollupView
+
+
+async def test_get_permission() -> None:
+    """
+    must return correct permission for the request
+    """
+    for method in ("GET",):
+        request = pytest.helpers.request("", "", method)
+        assert await EventRollupView.get_permission(request) == UserAccess.Full
+
+
+def test_routes() -> None:
+    """
+    must return correct routes
+    """
+    assert EventRollupView.ROUTES == ["/api/v1/events/rollup"]
+
+
+async def test_get(client: TestClient) -> None:
+    """
+    must return aggregated events
+    """
+    await client.post("/api/v1/events", json=Event("event", "object", created=1, took=2.0).view())
+    await client.post("/api/v1/events", json=Event("event", "object", created=2).view())
+    response_schema = pytest.helpers.schema_response(EventRollupView.get)
+
+    response = await client.get("/api/v1/events/rollup")
+    assert response.ok
+    json = await response.json()
+    assert not response_schema.validate(json, many=True)
+
+    rollups = [EventRollup.from_json(rollup) for rollup in json]
+    assert rollups == [
+        EventRollup(event="event", object_id="object", created=0, count=2, took_count=1, took_sum=2.0,
+                    took_squares=4.0, took_min=2.0, took_max=2.0),
+    ]
+
+
+async def test_get_with_filter(client: TestClient) -> None:
+    """
+    must return aggregated events with filter
+    """
+    await client.post("/api/v1/events", json=Event("event1", "object1", created=1).view())
+    await client.post("/api/v1/events", json=Event("event2", "object2", created=EventRollup.BUCKET).view())
+    request_schema = pytest.helpers.schema_request(EventRollupView.get, location="querystring")
+
+    payload = {
+        "event": "event2",
+        "object_id": "object2",
+        "from_date": EventRollup.BUCKET,
+        "to_date": 2 * EventRollup.BUCKET,
+    }
+    assert not request_schema.validate(payload)
+    response = await client.get("/api/v1/events/rollup", params=payload)
+    assert response.status == 200
+
+    json = await response.json()
+    assert [EventRollup.from_json(rollup).event for rollup in json] == ["event2"]
+
+
+async def test_get_bad_request(client: TestClient) -> None:
+    """
+    must return bad request for invalid query parameters
+    """
+    response_schema = pytest.helpers.schema_response(EventRollupView.get, code=400)
+
+    response = await client.get("/api/v1/events/rollup", params={"from_date": "text"})
+    assert response.status == 400
+    assert not response_schema.validate(await response.json())
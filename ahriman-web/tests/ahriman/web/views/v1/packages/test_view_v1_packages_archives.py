@@ -41,6 +41,33 @@ async def test_get(client: TestClient, package_ahriman: Package, mocker: MockerF
     assert not response_schema.validate(archives)
 
 
+async def test_get_paginated(client: TestClient, package_ahriman: Package, mocker: MockerFixture) -> None:
+    """
+    must get paginated archives for package
+    """
+    await client.post(f"/api/v1/packages/{package_ahriman.base}",
+                      json={"status": BuildStatusEnum.Success.value, "package": package_ahriman.view()})
+    archives_mock = mocker.patch("ahriman.core.status.watcher.Watcher.package_archives", return_value=[])
+
+    response = await client.get(f"/api/v1/packages/{package_ahriman.base}/archives",
+                                params={"limit": 1, "offset": 2})
+    assert response.status == 200
+    archives_mock.assert_called_once_with(package_ahriman.base, 1, 2)
+
+
+async def test_get_bad_request(client: TestClient, package_ahriman: Package) -> None:
+    """
+    must return bad request for invalid query parameters
+    """
+    await client.post(f"/api/v1/packages/{package_ahriman.base}",
+                      json={"status": BuildStatusEnum.Success.value, "package": package_ahriman.view()})
+    response_schema = pytest.helpers.schema_response(Archives.get, code=400)
+
+    response = await client.get(f"/api/v1/packages/{package_ahriman.base}/archives", params={"limit": "limit"})
+    assert response.status == 400
+    assert not response_schema.validate(await response.json())
+
+
 async def test_get_not_found(client: TestClient, package_ahriman: Package) -> None:
     """
     must return not found for missing package
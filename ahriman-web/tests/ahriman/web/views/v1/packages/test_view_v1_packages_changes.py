@@ -64,7 +64,7 @@ async def test_post(client: TestClient, package_ahriman: Package) -> None:
                       json={"status": BuildStatusEnum.Success.value, "package": package_ahriman.view()})
     request_schema = pytest.helpers.schema_request(ChangesView.post)
 
-    changes = Changes("sha", "change")
+    changes = Changes("sha", "change", "pkgbuild", "head")
     assert not request_schema.validate(changes.view())
     response = await client.post(f"/api/v1/packages/{package_ahriman.base}/changes", json=changes.view())
     assert response.status == 204
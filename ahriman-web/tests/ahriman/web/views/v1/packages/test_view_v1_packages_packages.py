@@ -6,6 +6,7 @@ from pytest_mock import MockerFixture
 from ahriman.models.build_status import BuildStatusEnum
 from ahriman.models.package import Package
 from ahriman.models.user_access import UserAccess
+from ahriman.web.keys import ConfigurationKey
 from ahriman.web.views.v1.packages.packages import (PackagesView)
 
 
@@ -48,6 +49,42 @@ async def test_get(client: TestClient, package_ahriman: Package, package_python_
     assert {package.base for package in packages} == {package_ahriman.base, package_python_schedule.base}
 
 
+async def test_get_streamed(client: TestClient, package_ahriman: Package, package_python_schedule: Package) -> None:
+    """
+    must stream packages list if it doesn't fit memory budget
+    """
+    await client.post(f"/api/v1/packages/{package_ahriman.base}",
+                      json={"status": BuildStatusEnum.Success.value, "package": package_ahriman.view()})
+    await client.post(f"/api/v1/packages/{package_python_schedule.base}",
+                      json={"status": BuildStatusEnum.Success.value, "package": package_python_schedule.view()})
+    client.app[ConfigurationKey].set_option("web", "response_buffer_size", "0")
+    response_schema = pytest.helpers.schema_response(PackagesView.get)
+
+    response = await client.get("/api/v1/packages", headers={"Accept-Encoding": "gzip"})
+    assert response.status == 200
+    assert "ETag" not in response.headers
+    json = await response.json()
+    assert not response_schema.validate(json, many=True)
+    assert {item["package"]["base"] for item in json} == {package_ahriman.base, package_python_schedule.base}
+
+
+async def test_get_compressed(client: TestClient, package_ahriman: Package,
+                              package_python_schedule: Package) -> None:
+    """
+    must return compressed response with weak ETag
+    """
+    await client.post(f"/api/v1/packages/{package_ahriman.base}",
+                      json={"status": BuildStatusEnum.Success.value, "package": package_ahriman.view()})
+    await client.post(f"/api/v1/packages/{package_python_schedule.base}",
+                      json={"status": BuildStatusEnum.Success.value, "package": package_python_schedule.view()})
+
+    response = await client.get("/api/v1/packages", headers={"Accept-Encoding": "gzip"})
+    assert response.status == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].startswith("W/")
+    assert await response.json()
+
+
 async def test_get_with_pagination(client: TestClient, package_ahriman: Package,
                                    package_python_schedule: Package) -> None:
     """
@@ -556,16 +556,18 @@ def user() -> User:
 
 
 @pytest.fixture
-def watcher(local_client: Client) -> Watcher:
+def watcher(configuration: Configuration, local_client: Client) -> Watcher:
     """
     package status watcher fixture
 
     Args:
+        configuration(Configuration): configuration fixture
         local_client(Client): local status client fixture
 
     Returns:
         Watcher: package status watcher test instance
     """
     package_info = PackageInfo()
+    package_info.paths = configuration.repository_paths
     event_bus = EventBus(0)
     return Watcher(local_client, package_info, event_bus)